@@ -0,0 +1,91 @@
+"""캐시 값 압축률 / 속도 측정.
+
+Gemini가 생성하는 테스트 코드와 형태가 비슷한 이 저장소의 테스트 파일들을 표본으로,
+CacheService가 저장하는 바이트 수(compress_value)와 압축/복원 시간을 측정합니다.
+zstandard 패키지가 설치되어 있으면 zstd 결과도 함께 출력합니다.
+
+Usage:
+    cd backend && python scripts/benchmark_cache_compression.py
+"""
+
+import os
+import statistics
+import sys
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.config.constants import CacheConstants  # noqa: E402
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def load_samples() -> list[str]:
+    """임계값 이상 크기의 테스트 코드 파일(Python/TS)을 표본으로 읽습니다."""
+    paths = [*ROOT.glob("backend/tests/**/*.py"), *ROOT.glob("frontend/e2e/**/*.ts")]
+    samples = [p.read_text(encoding="utf-8") for p in sorted(paths)]
+    return [s for s in samples if len(s.encode()) >= CacheConstants.COMPRESSION_MIN_BYTES]
+
+
+def measure(name: str, compress, decompress, samples: list[bytes]) -> None:
+    raw_total = stored_total = 0
+    compress_us: list[float] = []
+    decompress_us: list[float] = []
+    for raw in samples:
+        started = time.perf_counter()
+        stored = compress(raw)
+        compress_us.append((time.perf_counter() - started) * 1_000_000)
+
+        started = time.perf_counter()
+        assert decompress(stored) == raw
+        decompress_us.append((time.perf_counter() - started) * 1_000_000)
+
+        raw_total += len(raw)
+        stored_total += len(stored) + 1  # 헤더 1바이트
+
+    print(
+        f"{name:>8} | ratio {raw_total / stored_total:5.2f}x "
+        f"({raw_total / 1024:7.1f}KB -> {stored_total / 1024:6.1f}KB) | "
+        f"compress p50 {statistics.median(compress_us):7.1f}µs | "
+        f"decompress p50 {statistics.median(decompress_us):6.1f}µs"
+    )
+
+
+def main() -> None:
+    samples = [s.encode() for s in load_samples()]
+    sizes = sorted(len(s) for s in samples)
+    print(
+        f"--- Cache value compression ({len(samples)} samples, "
+        f"median {statistics.median(sizes) / 1024:.1f}KB, max {sizes[-1] / 1024:.1f}KB) ---"
+    )
+
+    for level in (1, CacheConstants.ZLIB_LEVEL, 9):
+        measure(
+            f"zlib-{level}",
+            lambda raw, level=level: zlib.compress(raw, level),
+            zlib.decompress,
+            samples,
+        )
+
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=CacheConstants.ZSTD_LEVEL)
+        decompressor = zstandard.ZstdDecompressor()
+        measure(
+            f"zstd-{CacheConstants.ZSTD_LEVEL}",
+            compressor.compress,
+            decompressor.decompress,
+            samples,
+        )
+    else:
+        print("    zstd | skipped (zstandard not installed)")
+
+
+if __name__ == "__main__":
+    main()
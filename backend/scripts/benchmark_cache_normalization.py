@@ -0,0 +1,147 @@
+"""Gemini 캐시 키 정규화 전/후 적중률 측정.
+
+언어별 표본 코드에 사용자가 흔히 만드는 서식 차이(끝 공백, 빈 줄, 주석, 들여쓰기,
+CRLF)를 무작위로 적용한 요청 스트림을 재생하여, 원본 텍스트로 키를 만들 때(raw)와
+`LanguageStrategy.normalize_for_cache` 결과로 키를 만들 때(canonical)의 캐시 적중률과
+정규화 비용을 비교합니다. Python 표본에는 이 저장소의 src/ 모듈도 포함하는데, 여러 줄
+문자열(독스트링, 프롬프트) 내부의 공백 변경은 실제 의미 차이이므로 적중으로 세지 않습니다.
+
+운영 환경의 실제 적중률은 /metrics의 `gemini_cache_requests_total{key=...}`로 확인합니다.
+
+Usage:
+    cd backend && python scripts/benchmark_cache_normalization.py [요청 수]
+"""
+
+import hashlib
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.languages.factory import LanguageFactory  # noqa: E402
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+JS_SAMPLES = [
+    "const add = (a, b) => {\n  return a + b;\n};",
+    "function fizzBuzz(n) {\n  const out = [];\n  for (let i = 1; i <= n; i++) {\n"
+    "    if (i % 15 === 0) out.push('FizzBuzz');\n    else if (i % 3 === 0) out.push('Fizz');\n"
+    "    else if (i % 5 === 0) out.push('Buzz');\n    else out.push(String(i));\n  }\n"
+    "  return out;\n}\n",
+    "class Stack {\n  constructor() {\n    this.items = [];\n  }\n  push(x) {\n"
+    "    this.items.push(x);\n  }\n  pop() {\n    return this.items.pop();\n  }\n}\n",
+    "export function isEmail(s) {\n  return /^[^@\\s]+@[^@\\s]+$/.test(s);\n}\n",
+]
+
+JAVA_SAMPLES = [
+    "public class Calculator {\n    public int add(int a, int b) {\n        return a + b;\n    }\n}",
+    "public class Strings {\n    public static String reverse(String s) {\n"
+    "        return new StringBuilder(s).reverse().toString();\n    }\n\n"
+    "    public static boolean isPalindrome(String s) {\n"
+    "        return s.equals(reverse(s));\n    }\n}\n",
+    "import java.util.*;\n\npublic class Counter {\n"
+    "    private final Map<String, Integer> counts = new HashMap<>();\n\n"
+    "    public void add(String key) {\n        counts.merge(key, 1, Integer::sum);\n    }\n}\n",
+]
+
+
+def load_python_samples() -> list[str]:
+    samples = ["def add(a, b):\n    return a + b"]
+    for path in sorted((BACKEND / "src" / "languages").glob("*.py")):
+        samples.append(path.read_text(encoding="utf-8"))
+    return samples
+
+
+def add_trailing_whitespace(code: str, comment: str, rng: random.Random) -> str:
+    return "\n".join(line + " " * rng.randint(0, 3) for line in code.split("\n"))
+
+
+def add_blank_lines(code: str, comment: str, rng: random.Random) -> str:
+    lines = code.split("\n")
+    lines.insert(rng.randint(0, len(lines)), "")
+    return "\n" + "\n".join(lines) + "\n\n"
+
+
+def add_comment(code: str, comment: str, rng: random.Random) -> str:
+    return f"{comment} TODO: 테스트 필요\n{code}"
+
+
+def add_trailing_comment(code: str, comment: str, rng: random.Random) -> str:
+    lines = code.split("\n")
+    index = rng.randrange(len(lines))
+    if lines[index].strip():
+        lines[index] += f"  {comment} 확인"
+    return "\n".join(lines)
+
+
+def to_crlf(code: str, comment: str, rng: random.Random) -> str:
+    return code.replace("\n", "\r\n")
+
+
+def reindent(code: str, comment: str, rng: random.Random) -> str:
+    # Python은 들여쓰기가 문법이므로 일관되게 바꾼 경우만 의미가 보존됨
+    return code.replace("    ", "  ") if comment == "#" else code.replace("    ", "\t")
+
+
+VARIANTS = [
+    add_trailing_whitespace,
+    add_blank_lines,
+    add_comment,
+    add_trailing_comment,
+    to_crlf,
+    reindent,
+]
+
+
+def make_requests(language: str, samples: list[str], n: int, rng: random.Random) -> list[str]:
+    """표본별 원본 1회 + 서식 변형 요청들로 이루어진 요청 스트림을 생성합니다."""
+    comment = "#" if language == "python" else "//"
+    requests = []
+    for _ in range(n):
+        code = rng.choice(samples)
+        for variant in rng.sample(VARIANTS, rng.randint(0, 2)):
+            code = variant(code, comment, rng)
+        requests.append(code)
+    return requests
+
+
+def replay(requests: list[str], key_fn) -> tuple[float, float]:
+    """요청 스트림을 재생해 (적중률, 요청당 키 생성 시간 µs)를 반환합니다."""
+    cache: set[str] = set()
+    hits = 0
+    started = time.perf_counter()
+    for code in requests:
+        key = hashlib.sha256(key_fn(code).encode()).hexdigest()
+        if key in cache:
+            hits += 1
+        else:
+            cache.add(key)
+    elapsed = time.perf_counter() - started
+    return hits / len(requests), elapsed / len(requests) * 1_000_000
+
+
+def main(n: int) -> None:
+    rng = random.Random(42)
+    corpora = {
+        "python": load_python_samples(),
+        "javascript": JS_SAMPLES,
+        "java": JAVA_SAMPLES,
+    }
+    print(f"--- Gemini cache key hit rate ({n} requests per language) ---")
+    for language, samples in corpora.items():
+        strategy = LanguageFactory.get_strategy(language)
+        requests = make_requests(language, samples, n, rng)
+        raw_rate, raw_us = replay(requests, lambda code: code)
+        canonical_rate, canonical_us = replay(requests, strategy.normalize_for_cache)
+        print(
+            f"{language:>10} | raw {raw_rate:6.1%} ({raw_us:7.1f}µs) | "
+            f"canonical {canonical_rate:6.1%} ({canonical_us:7.1f}µs) | "
+            f"ideal {1 - len(samples) / n:6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,171 @@
+"""요청 미들웨어 구성별 처리량 / SSE 청크 지연 벤치마크.
+
+- legacy: `@app.middleware("http")` 4개를 쌓은 기존 구성 (BaseHTTPMiddleware)
+- asgi: 단일 순수 ASGI 미들웨어 (RequestContextMiddleware)
+
+네트워크 스택의 영향을 배제하기 위해 ASGI 앱을 직접 호출하며, SSE 청크 지연은
+엔드포인트가 청크를 yield한 시점부터 서버의 send 콜백에 도달할 때까지의 시간입니다.
+
+Usage:
+    cd backend && python scripts/benchmark_middleware.py [요청 수]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import AsyncMock, MagicMock  # noqa: E402
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import ORJSONResponse, StreamingResponse  # noqa: E402
+from src.middleware import SECURITY_HEADERS, RequestContextMiddleware  # noqa: E402
+
+SSE_CHUNKS = 200
+
+
+def add_routes(app: FastAPI) -> None:
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            for _ in range(SSE_CHUNKS):
+                yield f"data: {time.perf_counter()}\n\n"
+                await asyncio.sleep(0)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def build_legacy_app() -> FastAPI:
+    """기존 main.py와 같은 순서로 BaseHTTPMiddleware 4개를 등록한 앱."""
+    app = FastAPI()
+    add_routes(app)
+
+    @app.middleware("http")
+    async def trace_id_middleware(request: Request, call_next):
+        trace_id = str(uuid.uuid4())
+        response = await call_next(request)
+        response.headers["X-Trace-ID"] = trace_id
+        return response
+
+    @app.middleware("http")
+    async def limit_content_length(request: Request, call_next):
+        content_length = request.headers.get("content-length")
+        if content_length and int(content_length) > 10 * 1024 * 1024:
+            return ORJSONResponse(status_code=413, content={"detail": "too large"})
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def attach_user_to_state(request: Request, call_next):
+        request.state.user = None
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def security_middleware(request: Request, call_next):
+        response = await call_next(request)
+        for name, value in SECURITY_HEADERS.items():
+            response.headers[name] = value
+        return response
+
+    return app
+
+
+def build_asgi_app(verifier) -> FastAPI:
+    app = FastAPI()
+    add_routes(app)
+    app.add_middleware(RequestContextMiddleware, verifier=verifier)
+    return app
+
+
+def make_scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "root_path": "",
+        "scheme": "http",
+        "server": ("bench", 80),
+        "client": ("bench", 1234),
+        "http_version": "1.1",
+    }
+
+
+async def call(app, path: str, on_body=None) -> None:
+    request_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            if on_body and message.get("body"):
+                on_body(message["body"])
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await app(make_scope(path), receive, send)
+
+
+async def measure_throughput(app, n: int) -> float:
+    """동시성 50으로 n개 요청을 처리한 초당 요청 수를 반환합니다."""
+    semaphore = asyncio.Semaphore(50)
+
+    async def one():
+        async with semaphore:
+            await call(app, "/ping")
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(n)])
+    return n / (time.perf_counter() - started)
+
+
+async def measure_sse_latency(app) -> tuple[float, float]:
+    """SSE 청크 전달 지연의 중앙값과 p99(µs)를 반환합니다."""
+    samples: list[float] = []
+
+    def on_body(body: bytes) -> None:
+        sent_at = float(body.decode()[len("data: ") :].strip())
+        samples.append((time.perf_counter() - sent_at) * 1_000_000)
+
+    await call(app, "/stream", on_body)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+async def main(n: int) -> None:
+    verifier = MagicMock()
+    verifier.verify = AsyncMock(return_value={})
+    apps = {"legacy": build_legacy_app(), "asgi": build_asgi_app(verifier)}
+
+    # 워밍업 (라우트/미들웨어 스택 빌드)
+    for app in apps.values():
+        await measure_throughput(app, 100)
+
+    print(f"--- Benchmarking request middleware ({n} requests, {SSE_CHUNKS} SSE chunks) ---")
+    results = {}
+    for name, app in apps.items():
+        rps = await measure_throughput(app, n)
+        p50, p99 = await measure_sse_latency(app)
+        results[name] = rps
+        print(f"{name:>6} | {rps:9.0f} req/s | SSE chunk p50 {p50:8.1f}µs p99 {p99:8.1f}µs")
+    print(f"Throughput improvement: {results['asgi'] / results['legacy']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,129 @@
+"""생성 SSE 스트림 청크 병합(coalesce_chunks) 전/후 벤치마크.
+
+`generate_stream`과 같은 형식(청크마다 orjson 직렬화 + SSE 프레임)으로 합성 청크를
+내보내는 엔드포인트를 main.py와 같은 미들웨어(RequestContextMiddleware, GZip) 뒤에서
+직접 호출하여, 병합 설정별 전송 프레임 수, 프레임/초, 생성 KB당 CPU 시간, 첫 바이트
+지연을 측정합니다.
+
+- burst: 청크가 쉬지 않고 도착 (다른 레플리카 스트림 재생, 부분 결과 재개 등)
+- paced: 청크가 1ms 간격으로 도착 (빠른 업스트림 스트리밍)
+
+Usage:
+    cd backend && python scripts/benchmark_sse_coalescing.py [청크 수]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import AsyncMock, MagicMock  # noqa: E402
+
+import orjson  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.middleware.gzip import GZipMiddleware  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from src.api.v1.generator_helper import coalesce_chunks  # noqa: E402
+from src.middleware import RequestContextMiddleware  # noqa: E402
+
+CONFIGS = {
+    "off": (0, 0.0),
+    "default": (4096, 0.025),
+    "8KB/50ms": (8192, 0.05),
+}
+
+
+def make_chunks(n: int) -> list[str]:
+    rng = random.Random(42)
+    return [
+        "".join(rng.choice("abcdefghij (){}:\n") for _ in range(rng.randint(8, 64)))
+        for _ in range(n)
+    ]
+
+
+def build_app(chunks: list[str], interval: float, max_bytes: int, max_delay: float) -> FastAPI:
+    app = FastAPI()
+
+    async def upstream():
+        for chunk in chunks:
+            # burst도 네트워크 업스트림처럼 청크마다 이벤트 루프에 양보
+            await asyncio.sleep(interval)
+            yield chunk
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            async for chunk in coalesce_chunks(upstream(), max_bytes, max_delay):
+                data = {"type": "chunk", "content": chunk}
+                yield f"data: {orjson.dumps(data).decode('utf-8')}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    verifier = MagicMock()
+    verifier.verify = AsyncMock(return_value={})
+    app.add_middleware(GZipMiddleware, minimum_size=500)
+    app.add_middleware(RequestContextMiddleware, verifier=verifier)
+    return app
+
+
+async def measure(app: FastAPI, generated_kb: float) -> tuple[int, float, float, float]:
+    """(프레임 수, 프레임/초, KB당 CPU µs, 첫 바이트 지연 ms)를 반환합니다."""
+    frames = 0
+    first_byte = None
+    response_done = asyncio.Event()
+
+    async def receive():
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal frames, first_byte
+        if message["type"] == "http.response.body":
+            if message.get("body"):
+                frames += 1
+                if first_byte is None:
+                    first_byte = time.perf_counter()
+            if not message.get("more_body", False):
+                response_done.set()
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "root_path": "",
+        "scheme": "http",
+        "server": ("bench", 80),
+        "client": ("bench", 1234),
+        "http_version": "1.1",
+    }
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    return frames, frames / elapsed, cpu / generated_kb * 1_000_000, (first_byte - started) * 1000
+
+
+async def main(n: int) -> None:
+    chunks = make_chunks(n)
+    generated_kb = sum(len(c.encode()) for c in chunks) / 1024
+    print(f"--- SSE chunk coalescing ({n} chunks, {generated_kb:.0f}KB generated) ---")
+    for pattern, interval in (("burst", 0.0), ("paced", 0.001)):
+        for name, (max_bytes, max_delay) in CONFIGS.items():
+            app = build_app(chunks, interval, max_bytes, max_delay)
+            await measure(app, generated_kb)  # 워밍업
+            frames, fps, cpu_per_kb, ttfb = await measure(app, generated_kb)
+            print(
+                f"{pattern:>5} | {name:>9} | {frames:6d} frames | {fps:9.0f} frames/s | "
+                f"{cpu_per_kb:8.1f}µs CPU/KB | TTFB {ttfb:6.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -1,11 +1,13 @@
 from fastapi import APIRouter
-from src.api.v1 import execution, generator, health, history, user
+from src.api.v1 import admin, execution, generator, health, history, jobs, user
 
 api_router = APIRouter()
 
 
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
 api_router.include_router(execution.router, prefix="/execution", tags=["execution"])
 api_router.include_router(generator.router, tags=["generator"])
 api_router.include_router(health.router, tags=["health"])
 api_router.include_router(history.router, prefix="/history", tags=["history"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
 api_router.include_router(user.router, prefix="/user", tags=["user"])
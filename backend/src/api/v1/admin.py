@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from src.api.v1.deps import verify_api_key
+from src.exceptions import CacheError
+from src.services.cache_service import CacheService
+from src.utils.logger import get_logger
+
+# 내부 운영용 엔드포인트 (X-TESTER-KEY 필요)
+router = APIRouter(dependencies=[Depends(verify_api_key)])
+logger = get_logger(__name__)
+
+
+class CacheClearResponse(BaseModel):
+    """캐시 삭제 결과."""
+
+    pattern: str
+    scanned: int
+    deleted: int
+
+
+@router.post("/cache/clear", response_model=CacheClearResponse)
+async def clear_cache(
+    pattern: str = Query(..., min_length=1, max_length=256, description="삭제할 키 패턴 (glob)"),
+):
+    """패턴에 맞는 Redis 캐시 키를 SCAN + UNLINK로 삭제합니다.
+
+    Args:
+        pattern: 삭제할 키 패턴 (예: `history:*`).
+
+    Returns:
+        순회한 키 수와 삭제된 키 수.
+
+    Raises:
+        HTTPException: Redis 삭제 실패 시 (503).
+    """
+    progress = {"scanned": 0}
+
+    def report(scanned: int, deleted: int) -> None:
+        progress["scanned"] = scanned
+        logger.info_ctx("캐시 클리어 진행 중", pattern=pattern, scanned=scanned, deleted=deleted)
+
+    try:
+        deleted = await CacheService().clear(pattern, on_progress=report)
+    except CacheError as e:
+        logger.error(f"캐시 클리어 실패: {e}")
+        raise HTTPException(status_code=503, detail="캐시 클리어에 실패했습니다") from e
+
+    return CacheClearResponse(pattern=pattern, scanned=progress["scanned"], deleted=deleted)
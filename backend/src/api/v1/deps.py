@@ -8,8 +8,11 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from src.config.settings import settings
 from src.repositories.generation_repository import GenerationRepository
+from src.services.cache_service import CacheService
 from src.services.execution_service import ExecutionService
 from src.services.gemini_service import GeminiService
+from src.services.generation_jobs import GenerationJobs
+from src.services.resumable_stream import ResumableStreams
 from src.services.supabase_service import SupabaseService
 from src.services.test_generator_service import TestGeneratorService
 
@@ -84,10 +87,22 @@ def get_generation_repository(
     return GenerationRepository(supabase_service=supabase_service)
 
 
+def get_resumable_streams() -> ResumableStreams:
+    """재연결 가능한 생성 SSE 스트림 관리자 의존성을 생성합니다."""
+    return ResumableStreams(CacheService().redis_client)
+
+
+def get_generation_jobs(
+    streams: ResumableStreams = Depends(get_resumable_streams),
+) -> GenerationJobs:
+    """비동기 생성 작업 관리자 의존성을 생성합니다."""
+    return GenerationJobs(streams.redis, streams)
+
+
 def get_token_service(
     supabase_service: SupabaseService = Depends(get_supabase_service),
 ) -> "TokenService":
     """토큰 관리 서비스 의존성을 생성합니다."""
     from src.services.token_service import TokenService
 
-    return TokenService(supabase_service=supabase_service)
+    return TokenService(supabase_service=supabase_service, cache_service=supabase_service.cache)
@@ -1,22 +1,37 @@
 import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Optional
 
 import orjson
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from src.api.v1.deps import (
+    get_execution_service,
     get_generation_repository,
+    get_resumable_streams,
     get_test_generator_service,
     get_token_service,
     limiter,
 )
+from src.api.v1.generator_helper import coalesce_chunks
 from src.auth import get_current_user, validate_turnstile_token
 from src.config.constants import TokenConstants
+from src.config.settings import settings
 from src.exceptions import InsufficientTokensError, ValidationError
 from src.repositories.generation_repository import GenerationRepository
+from src.services.execution_service import ExecutionService
+from src.services.resumable_stream import ResumableStreams
 from src.services.test_generator_service import TestGeneratorService
 from src.services.token_service import TokenService
-from src.types import AuthenticatedUser, GenerateRequest
+from src.types import (
+    AuthenticatedUser,
+    BatchGenerateRequest,
+    GenerateRequest,
+    GenerationOutcome,
+)
 from src.utils.logger import get_logger
+from src.utils.metrics import GENERATION_STREAM_ABORTS
+from starlette.requests import ClientDisconnect
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -35,6 +50,462 @@ def format_sse_event(event_type: str, data: dict) -> str:
     return f"event: {event_type}\ndata: {orjson.dumps(data).decode('utf-8')}\n\n"
 
 
+async def wait_for_disconnect(request: Request) -> None:
+    """ASGI receive 채널에서 http.disconnect 메시지가 올 때까지 기다립니다.
+
+    요청 본문은 이미 모두 읽은 뒤이므로, 이후 receive는 클라이언트 연결이 끊길 때
+    (또는 응답이 끝날 때) 반환됩니다.
+    """
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+async def stream_until_disconnect(
+    request: Request, chunks: AsyncGenerator[str, None]
+) -> AsyncIterator[str]:
+    """클라이언트 연결이 끊기면 즉시 업스트림 스트림을 취소하는 래퍼.
+
+    다음 청크 대기와 연결 종료 감지를 경쟁시키므로, Gemini가 다음 청크를 만드는 중이어도
+    연결 종료 즉시 업스트림 제너레이터에 취소가 전달됩니다.
+
+    Args:
+        request: 연결 상태를 감시할 요청.
+        chunks: 업스트림 청크 스트림.
+
+    Yields:
+        업스트림 청크.
+
+    Raises:
+        ClientDisconnect: 스트리밍 도중 클라이언트 연결이 끊긴 경우.
+    """
+    disconnected = asyncio.create_task(wait_for_disconnect(request))
+    try:
+        while True:
+            next_chunk = asyncio.ensure_future(chunks.__anext__())
+            try:
+                await asyncio.wait({next_chunk, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                next_chunk.cancel()
+                raise
+            if not next_chunk.done():
+                # 업스트림에 취소가 전달되어 제너레이터가 정리될 때까지 기다린 뒤 종료
+                next_chunk.cancel()
+                await asyncio.wait({next_chunk})
+                await chunks.aclose()
+                raise ClientDisconnect()
+            try:
+                yield next_chunk.result()
+            except StopAsyncIteration:
+                return
+    finally:
+        disconnected.cancel()
+
+
+async def relay_until_disconnect(request: Request, frames: AsyncGenerator[str, None]):
+    """클라이언트 연결이 끊길 때까지 SSE 프레임을 전달합니다.
+
+    연결 종료 시에는 이 응답만 끝내며, 생성 자체는 재연결 대기 시간 동안 계속됩니다.
+    """
+    try:
+        async for frame in stream_until_disconnect(request, frames):
+            yield frame
+    except ClientDisconnect:
+        logger.info("클라이언트 연결 종료, 재연결(Last-Event-ID)을 기다립니다")
+
+
+async def generation_frames(
+    data: GenerateRequest,
+    user_id: str,
+    service: TestGeneratorService,
+    repository: GenerationRepository,
+    token_service: TokenService,
+    outcome: Optional[GenerationOutcome] = None,
+    send_done: bool = True,
+) -> AsyncGenerator[str, None]:
+    """토큰 차감, 생성, 이력 저장, 실패 시 환불까지 진행하며 SSE 프레임을 생성합니다.
+
+    생성 SSE 엔드포인트와 비동기 작업(jobs)이 같은 흐름을 사용합니다. 스트림이 취소되면
+    (아무도 읽지 않는 연결 종료) 환불은 GENERATION_REFUND_ON_DISCONNECT 설정을 따릅니다.
+
+    Args:
+        data: 생성 요청 데이터 (코드, 언어, 모델 등).
+        user_id: 요청한 사용자 ID.
+        service: 테스트 생성 서비스.
+        repository: 생성 이력 저장소.
+        token_service: 토큰 관리 서비스.
+        outcome: 생성 결과를 기록할 객체 (호출자가 스트림 종료 후 확인).
+        send_done: 생성 성공 시 완료(done) 이벤트를 보낼지 여부 (호출자가 이어서
+            다른 이벤트를 보낸 뒤 직접 완료 이벤트를 보내는 경우 False).
+
+    Yields:
+        이벤트 id가 없는 SSE 프레임.
+    """
+    outcome = outcome if outcome is not None else GenerationOutcome()
+    # 토큰 차감 (Atomic — 스트리밍 전에 선차감)
+    tokens_deducted = False
+    try:
+        deduct_result = await token_service.deduct_tokens(
+            user_id=user_id,
+            amount=TokenConstants.COST_PER_GENERATION,
+        )
+        tokens_deducted = deduct_result.success
+
+        if not deduct_result.success:
+            error_data = {
+                "type": "error",
+                "code": "INSUFFICIENT_TOKENS",
+                "message": "토큰이 부족합니다.",
+                "required": TokenConstants.COST_PER_GENERATION,
+                "current": deduct_result.current_balance,
+            }
+            outcome.error = error_data
+            yield f"data: {orjson.dumps(error_data).decode('utf-8')}\n\n"
+            return
+
+    except InsufficientTokensError as e:
+        error_data = {
+            "type": "error",
+            "code": "INSUFFICIENT_TOKENS",
+            "message": str(e),
+            "required": e.required,
+            "current": e.current,
+        }
+        outcome.error = error_data
+        yield f"data: {orjson.dumps(error_data).decode('utf-8')}\n\n"
+        return
+    except Exception as e:
+        logger.error(f"토큰 차감 실패: {e}")
+        # Fail-Open 정책: 토큰 차감 실패 시에도 생성은 허용
+        # tokens_deducted=False이므로 finally에서 환불 시도 없음
+
+    logger.info_ctx(
+        "테스트 코드 생성 요청",
+        user_id=user_id,
+        language=data.language,
+        model=data.model,
+    )
+
+    generated_content = []
+    generation_success = False
+    aborted = False
+    try:
+        chunk_count = 0
+        async for chunk in coalesce_chunks(
+            service.generate_test(
+                code=data.input_code,
+                language=data.language,
+                model=data.model,
+                is_regenerate=data.is_regenerate,
+            ),
+            max_bytes=settings.SSE_COALESCE_MAX_BYTES,
+            max_delay=settings.SSE_COALESCE_MAX_DELAY_MS / 1000,
+        ):
+            if chunk:
+                generated_content.append(chunk)
+                chunk_data = {"type": "chunk", "content": chunk}
+                yield f"data: {orjson.dumps(chunk_data).decode('utf-8')}\n\n"
+                chunk_count += 1
+                if chunk_count % 100 == 0:
+                    await asyncio.sleep(0)
+
+        # 생성된 코드 저장
+        full_code = "".join(generated_content)
+        if full_code:
+            generation_success = True
+            outcome.content = full_code
+            yield format_sse_event(
+                "status", {"step": "saving_history", "message": "생성 이력을 저장 중입니다..."}
+            )
+            try:
+                logger.info("생성 이력 저장 중...")
+                saved = await repository.create_history(
+                    user_id=user_id,
+                    input_code=data.input_code,
+                    generated_code=full_code,
+                    language=data.language,
+                    model=data.model,
+                )
+                if saved:
+                    outcome.history_id = str(saved.id)
+                    logger.info_ctx("이력 저장 성공", history_id=saved.id)
+            except Exception as e:
+                logger.error(f"이력 저장 실패: {e}")
+                yield format_sse_event(
+                    "warning",
+                    {
+                        "message": "코드 저장에 실패했습니다. 생성된 코드를 복사하여 별도로 저장해주세요."
+                    },
+                )
+
+        # 완료 이벤트 전송
+        if send_done:
+            yield format_sse_event("message", {"type": "done"})
+
+    except (asyncio.CancelledError, GeneratorExit):
+        # 연결 종료: 재연결 대기 시간 동안 아무도 읽지 않아 생성이 취소된 경우
+        aborted = outcome.aborted = True
+        logger.info_ctx(
+            "클라이언트 연결 종료로 생성 중단",
+            user_id=user_id,
+            received_chunks=len(generated_content),
+        )
+        raise
+
+    except ValidationError as e:
+        logger.warning(f"Validation failed: {e}")
+        outcome.error = {"code": "VALIDATION_ERROR", "message": str(e)}
+        yield format_sse_event("error", outcome.error)
+
+    except Exception as e:
+        logger.error(f"Streaming error: {e}", exc_info=True)
+        error_data = {
+            "type": "error",
+            "code": "GENERATION_ERROR",
+            "message": "An error occurred during generation. Please try again.",
+        }
+        outcome.error = error_data
+        yield format_sse_event("error", error_data)
+
+    finally:
+        # 생성 실패 시 토큰 환불 (연결 종료로 중단된 경우는 설정에 따름)
+        refund = (
+            tokens_deducted
+            and not generation_success
+            and (not aborted or settings.GENERATION_REFUND_ON_DISCONNECT)
+        )
+        if aborted:
+            GENERATION_STREAM_ABORTS.labels(refunded=str(refund).lower()).inc()
+        if refund:
+            logger.info_ctx(
+                "생성 실패로 인한 토큰 환불 시도",
+                user_id=user_id,
+                amount=TokenConstants.COST_PER_GENERATION,
+            )
+            # 응답 태스크가 취소된 경우에도 환불은 끝까지 수행
+            await asyncio.shield(
+                token_service.refund_tokens(
+                    user_id=user_id,
+                    amount=TokenConstants.COST_PER_GENERATION,
+                )
+            )
+
+
+async def pipeline_frames(
+    data: GenerateRequest,
+    user_id: str,
+    service: TestGeneratorService,
+    repository: GenerationRepository,
+    token_service: TokenService,
+    execution: ExecutionService,
+) -> AsyncGenerator[str, None]:
+    """테스트 코드를 생성한 뒤 같은 스트림에서 바로 실행하며 SSE 프레임을 생성합니다.
+
+    생성이 진행되는 동안 Worker에서 소스 코드 보안 검사와 sandbox 예열을 함께 수행하므로,
+    생성이 끝나면 컨테이너 기동을 기다리지 않고 실행합니다. 소스 코드가 보안 검사에
+    실패했으면 실행을 요청하지 않습니다. 생성에 실패하면 실행하지 않으며, 생성 이벤트와
+    토큰 차감·환불은 `generation_frames`와 같습니다.
+
+    Args:
+        data: 생성 요청 데이터 (코드, 언어, 모델 등).
+        user_id: 요청한 사용자 ID.
+        service: 테스트 생성 서비스.
+        repository: 생성 이력 저장소.
+        token_service: 토큰 관리 서비스.
+        execution: 코드 실행 서비스.
+
+    Yields:
+        이벤트 id가 없는 SSE 프레임. 생성 이벤트 뒤에 `execution` 이벤트(실행 결과)와
+        `done` 이벤트가 전달됩니다.
+    """
+    preparation = asyncio.create_task(execution.prepare(data.input_code, data.language))
+    outcome = GenerationOutcome()
+    try:
+        async for frame in generation_frames(
+            data, user_id, service, repository, token_service, outcome, send_done=False
+        ):
+            yield frame
+        if not outcome.content or outcome.error is not None:
+            return
+
+        prepared = await preparation
+        if prepared.get("safe") is False:
+            result = {"success": False, "error": prepared.get("error", ""), "output": ""}
+        else:
+            yield format_sse_event(
+                "status", {"step": "executing", "message": "생성된 테스트를 실행 중입니다..."}
+            )
+            try:
+                result = await execution.execute_code(
+                    input_code=data.input_code,
+                    test_code=outcome.content,
+                    language=data.language,
+                )
+            except Exception as e:
+                logger.error(f"코드 실행 요청 실패: {e}", exc_info=True)
+                result = {
+                    "success": False,
+                    "error": "코드 실행 중 오류가 발생했습니다.",
+                    "output": "",
+                }
+        logger.info_ctx("생성 후 실행 완료", user_id=user_id, success=result.get("success", False))
+        yield format_sse_event("execution", {"type": "execution", **result})
+        yield format_sse_event("message", {"type": "done"})
+    finally:
+        preparation.cancel()
+
+
+async def batch_generation_frames(
+    data: BatchGenerateRequest,
+    user_id: str,
+    service: TestGeneratorService,
+    repository: GenerationRepository,
+    token_service: TokenService,
+) -> AsyncGenerator[str, None]:
+    """여러 파일을 검증, 일괄 차감, 동시 생성, 파일별 이력 저장까지 진행하며 SSE 프레임을 생성합니다.
+
+    모든 파일 이벤트에는 `file`(요청의 파일 경로)이 포함됩니다. 검증에 실패한 파일은
+    차감 대상에서 빠지며, 생성에 실패한 파일의 토큰은 스트림 종료 시 한 번에 환불합니다.
+
+    Args:
+        data: 일괄 생성 요청 데이터.
+        user_id: 요청한 사용자 ID.
+        service: 테스트 생성 서비스.
+        repository: 생성 이력 저장소.
+        token_service: 토큰 관리 서비스.
+
+    Yields:
+        이벤트 id가 없는 SSE 프레임.
+    """
+    results = await service.validate_files(data.files)
+    files = []
+    for file, result in zip(data.files, results):
+        if result.is_valid:
+            files.append(file)
+        else:
+            yield format_sse_event(
+                "error",
+                {
+                    "type": "error",
+                    "file": file.path,
+                    "code": "VALIDATION_ERROR",
+                    "message": result.error_message,
+                },
+            )
+    if not files:
+        yield format_sse_event("message", {"type": "done", "succeeded": 0, "failed": len(results)})
+        return
+
+    # 토큰 차감 (검증을 통과한 파일 수만큼 한 번에 선차감)
+    cost = TokenConstants.COST_PER_GENERATION * len(files)
+    tokens_deducted = False
+    try:
+        deduct_result = await token_service.deduct_tokens(user_id=user_id, amount=cost)
+        tokens_deducted = deduct_result.success
+        if not deduct_result.success:
+            error_data = {
+                "type": "error",
+                "code": "INSUFFICIENT_TOKENS",
+                "message": "토큰이 부족합니다.",
+                "required": cost,
+                "current": deduct_result.current_balance,
+            }
+            yield f"data: {orjson.dumps(error_data).decode('utf-8')}\n\n"
+            return
+    except InsufficientTokensError as e:
+        error_data = {
+            "type": "error",
+            "code": "INSUFFICIENT_TOKENS",
+            "message": str(e),
+            "required": e.required,
+            "current": e.current,
+        }
+        yield f"data: {orjson.dumps(error_data).decode('utf-8')}\n\n"
+        return
+    except Exception as e:
+        logger.error(f"토큰 차감 실패: {e}")
+        # Fail-Open 정책: 토큰 차감 실패 시에도 생성은 허용
+
+    logger.info_ctx(
+        "일괄 테스트 코드 생성 요청", user_id=user_id, files=len(files), model=data.model
+    )
+
+    contents: list[list[str]] = [[] for _ in files]
+    cached: list[bool] = [False] * len(files)
+    succeeded = 0
+    aborted = False
+    try:
+        async for event in service.generate_batch(files, data.model, data.is_regenerate):
+            file = files[event.index]
+            if event.chunk:
+                contents[event.index].append(event.chunk)
+                cached[event.index] = event.cached
+                chunk_data = {"type": "chunk", "file": file.path, "content": event.chunk}
+                yield f"data: {orjson.dumps(chunk_data).decode('utf-8')}\n\n"
+            elif event.error is not None:
+                logger.error(f"파일 생성 실패 ({file.path}): {event.error}")
+                code = (
+                    "VALIDATION_ERROR"
+                    if isinstance(event.error, ValidationError)
+                    else "GENERATION_ERROR"
+                )
+                yield format_sse_event(
+                    "error",
+                    {
+                        "type": "error",
+                        "file": file.path,
+                        "code": code,
+                        "message": "An error occurred during generation. Please try again.",
+                    },
+                )
+            elif event.done:
+                full_code = "".join(contents[event.index])
+                if not full_code:
+                    continue
+                succeeded += 1
+                file_done = {"type": "file_done", "file": file.path, "cached": cached[event.index]}
+                try:
+                    saved = await repository.create_history(
+                        user_id=user_id,
+                        input_code=file.input_code,
+                        generated_code=full_code,
+                        language=file.language,
+                        model=data.model,
+                    )
+                    if saved:
+                        file_done["history_id"] = str(saved.id)
+                except Exception as e:
+                    logger.error(f"이력 저장 실패 ({file.path}): {e}")
+                yield format_sse_event("file", file_done)
+
+        yield format_sse_event(
+            "message",
+            {"type": "done", "succeeded": succeeded, "failed": len(results) - succeeded},
+        )
+
+    except (asyncio.CancelledError, GeneratorExit):
+        aborted = True
+        logger.info_ctx(
+            "클라이언트 연결 종료로 일괄 생성 중단", user_id=user_id, succeeded=succeeded
+        )
+        raise
+
+    finally:
+        # 완료하지 못한 파일의 토큰을 한 번에 환불 (연결 종료로 중단된 경우는 설정에 따름)
+        refund_amount = TokenConstants.COST_PER_GENERATION * (len(files) - succeeded)
+        refund = (
+            tokens_deducted
+            and refund_amount > 0
+            and (not aborted or settings.GENERATION_REFUND_ON_DISCONNECT)
+        )
+        if aborted:
+            GENERATION_STREAM_ABORTS.labels(refunded=str(refund).lower()).inc()
+        if refund:
+            logger.info_ctx(
+                "일괄 생성 실패 파일의 토큰 환불 시도", user_id=user_id, amount=refund_amount
+            )
+            await asyncio.shield(token_service.refund_tokens(user_id=user_id, amount=refund_amount))
+
+
 @router.post("/generate")
 @limiter.limit("5/minute")
 async def generate_test(
@@ -44,6 +515,7 @@ async def generate_test(
     service: TestGeneratorService = Depends(get_test_generator_service),
     repository: GenerationRepository = Depends(get_generation_repository),
     token_service: TokenService = Depends(get_token_service),
+    streams: ResumableStreams = Depends(get_resumable_streams),
 ):
     """테스트 코드 생성 및 스트리밍 반환 (SSE).
 
@@ -51,6 +523,12 @@ async def generate_test(
     Server-Sent Events(SSE)를 통해 청크 단위로 스트리밍합니다.
     생성 전 토큰을 차감하고, 실패 시 자동으로 환불합니다.
 
+    모든 프레임에는 이벤트 id가 붙고 Redis에 잠시 보관되므로, 연결이 끊긴 클라이언트는
+    `GET /generate/resume`에 Last-Event-ID를 보내 다음 프레임부터 이어서 받습니다.
+    재연결 대기 시간(SSE_RESUME_GRACE_SECONDS) 동안 아무도 읽지 않으면 업스트림 생성을
+    취소합니다. 이때 토큰 환불(GENERATION_REFUND_ON_DISCONNECT)과 부분 결과 저장
+    (GENERATION_CACHE_PARTIAL_ON_DISCONNECT)은 설정으로 결정합니다.
+
     Args:
         request: HTTP 요청 객체 (Rate Limiting용).
         data: 생성 요청 데이터 (코드, 언어, 모델 등).
@@ -58,136 +536,152 @@ async def generate_test(
         service: 테스트 생성 서비스 의존성.
         repository: 생성 이력 저장소 의존성.
         token_service: 토큰 관리 서비스 의존성.
+        streams: 재연결 가능한 SSE 스트림 관리자 의존성.
 
     Returns:
-        SSE 스트림 응답.
+        SSE 스트림 응답 (X-Generation-Stream-Id 헤더에 스트림 id 포함).
 
     Raises:
         InsufficientTokensError: 토큰 부족 시 (402).
     """
 
-    # 1. Turnstile 검증
+    # Turnstile 검증
     client_ip = request.client.host if request.client else None
     await validate_turnstile_token(data.turnstile_token, ip=client_ip)
 
-    async def generate_stream():
-        # 2. 토큰 차감 (Atomic — 스트리밍 전에 선차감)
-        tokens_deducted = False
-        try:
-            deduct_result = await token_service.deduct_tokens(
-                user_id=current_user["id"],
-                amount=TokenConstants.COST_PER_GENERATION,
-            )
-            tokens_deducted = deduct_result.success
+    stream_id = streams.start(
+        current_user["id"],
+        generation_frames(data, current_user["id"], service, repository, token_service),
+    )
+    return StreamingResponse(
+        relay_until_disconnect(request, streams.subscribe(stream_id)),
+        media_type="text/event-stream",
+        headers={"X-Generation-Stream-Id": stream_id},
+    )
 
-            if not deduct_result.success:
-                error_data = {
-                    "type": "error",
-                    "code": "INSUFFICIENT_TOKENS",
-                    "message": "토큰이 부족합니다.",
-                    "required": TokenConstants.COST_PER_GENERATION,
-                    "current": deduct_result.current_balance,
-                }
-                yield f"data: {orjson.dumps(error_data).decode('utf-8')}\n\n"
-                return
 
-        except InsufficientTokensError as e:
-            error_data = {
-                "type": "error",
-                "code": "INSUFFICIENT_TOKENS",
-                "message": str(e),
-                "required": e.required,
-                "current": e.current,
-            }
-            yield f"data: {orjson.dumps(error_data).decode('utf-8')}\n\n"
-            return
-        except Exception as e:
-            logger.error(f"토큰 차감 실패: {e}")
-            # Fail-Open 정책: 토큰 차감 실패 시에도 생성은 허용
-            # tokens_deducted=False이므로 finally에서 환불 시도 없음
+@router.post("/generate/execute")
+@limiter.limit("5/minute")
+async def generate_and_execute(
+    request: Request,
+    data: GenerateRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    service: TestGeneratorService = Depends(get_test_generator_service),
+    repository: GenerationRepository = Depends(get_generation_repository),
+    token_service: TokenService = Depends(get_token_service),
+    execution: ExecutionService = Depends(get_execution_service),
+    streams: ResumableStreams = Depends(get_resumable_streams),
+):
+    """테스트 코드 생성과 실행을 한 번의 요청으로 처리하여 스트리밍 반환 (SSE).
 
-        logger.info_ctx(
-            "테스트 코드 생성 요청",
-            user_id=current_user["id"],
-            language=data.language,
-            model=data.model,
-        )
+    `POST /generate`와 같은 생성 이벤트를 보낸 뒤, 생성된 테스트 코드를 곧바로 실행하여
+    결과를 `execution` 이벤트로 같은 스트림에 보냅니다. 생성 중에 Worker의 보안 검사와
+    sandbox 예열을 함께 진행하므로 `/generate` → `/execute`를 차례로 호출할 때보다 인증
+    왕복이 한 번 줄고 실행 대기 시간이 생성 시간과 겹칩니다.
 
-        generated_content = []
-        generation_success = False
-        try:
-            chunk_count = 0
-            async for chunk in service.generate_test(
-                code=data.input_code,
-                language=data.language,
-                model=data.model,
-                is_regenerate=data.is_regenerate,
-            ):
-                if chunk:
-                    generated_content.append(chunk)
-                    chunk_data = {"type": "chunk", "content": chunk}
-                    yield f"data: {orjson.dumps(chunk_data).decode('utf-8')}\n\n"
-                    chunk_count += 1
-                    if chunk_count % 100 == 0:
-                        await asyncio.sleep(0)
-
-            # 생성된 코드 저장
-            full_code = "".join(generated_content)
-            if full_code:
-                generation_success = True
-                yield format_sse_event(
-                    "status", {"step": "saving_history", "message": "생성 이력을 저장 중입니다..."}
-                )
-                try:
-                    logger.info("생성 이력 저장 중...")
-                    saved = await repository.create_history(
-                        user_id=current_user["id"],
-                        input_code=data.input_code,
-                        generated_code=full_code,
-                        language=data.language,
-                        model=data.model,
-                    )
-                    if saved:
-                        logger.info_ctx("이력 저장 성공", history_id=saved.id)
-                except Exception as e:
-                    logger.error(f"이력 저장 실패: {e}")
-                    yield format_sse_event(
-                        "warning",
-                        {
-                            "message": "코드 저장에 실패했습니다. 생성된 코드를 복사하여 별도로 저장해주세요."
-                        },
-                    )
+    재연결(`GET /generate/resume`)은 `POST /generate`와 같은 방식으로 지원합니다.
 
-            # 완료 이벤트 전송
-            yield format_sse_event("message", {"type": "done"})
+    Args:
+        request: HTTP 요청 객체 (Rate Limiting용).
+        data: 생성 요청 데이터 (코드, 언어, 모델 등).
+        current_user: 인증된 사용자 정보.
+        service: 테스트 생성 서비스 의존성.
+        repository: 생성 이력 저장소 의존성.
+        token_service: 토큰 관리 서비스 의존성.
+        execution: 코드 실행 서비스 의존성.
+        streams: 재연결 가능한 SSE 스트림 관리자 의존성.
 
-        except ValidationError as e:
-            logger.warning(f"Validation failed: {e}")
-            yield format_sse_event(
-                "error",
-                {"code": "VALIDATION_ERROR", "message": str(e)},
-            )
+    Returns:
+        SSE 스트림 응답 (X-Generation-Stream-Id 헤더에 스트림 id 포함).
+    """
+    client_ip = request.client.host if request.client else None
+    await validate_turnstile_token(data.turnstile_token, ip=client_ip)
+
+    stream_id = streams.start(
+        current_user["id"],
+        pipeline_frames(data, current_user["id"], service, repository, token_service, execution),
+    )
+    return StreamingResponse(
+        relay_until_disconnect(request, streams.subscribe(stream_id)),
+        media_type="text/event-stream",
+        headers={"X-Generation-Stream-Id": stream_id},
+    )
 
-        except Exception as e:
-            logger.error(f"Streaming error: {e}", exc_info=True)
-            error_data = {
-                "type": "error",
-                "code": "GENERATION_ERROR",
-                "message": "An error occurred during generation. Please try again.",
-            }
-            yield format_sse_event("error", error_data)
-
-        finally:
-            # 생성 실패 시 토큰 환불
-            if tokens_deducted and not generation_success:
-                logger.info_ctx(
-                    "생성 실패로 인한 토큰 환불 시도",
-                    user_id=current_user["id"],
-                    amount=TokenConstants.COST_PER_GENERATION,
-                )
-                await token_service.refund_tokens(
-                    user_id=current_user["id"],
-                    amount=TokenConstants.COST_PER_GENERATION,
-                )
 
-    return StreamingResponse(generate_stream(), media_type="text/event-stream")
+@router.post("/generate/batch")
+@limiter.limit("5/minute")
+async def generate_batch(
+    request: Request,
+    data: BatchGenerateRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    service: TestGeneratorService = Depends(get_test_generator_service),
+    repository: GenerationRepository = Depends(get_generation_repository),
+    token_service: TokenService = Depends(get_token_service),
+    streams: ResumableStreams = Depends(get_resumable_streams),
+):
+    """여러 파일의 테스트 코드를 동시에 생성하여 파일별로 섞어 스트리밍 반환 (SSE).
+
+    파일을 언어별 전략으로 동시에 검증한 뒤, 통과한 파일 수만큼 토큰을 한 번에 차감하고
+    최대 GENERATION_BATCH_CONCURRENCY개씩 Gemini를 호출합니다. 캐시된 파일은 호출 없이
+    즉시 전달됩니다. 모든 이벤트에는 `file` 경로가 포함되며, 파일마다 `file_done` 또는
+    `error` 이벤트가 한 번씩 전달된 뒤 마지막에 `done` 이벤트가 전달됩니다.
+
+    재연결(`GET /generate/resume`)은 `POST /generate`와 같은 방식으로 지원합니다.
+
+    Args:
+        request: HTTP 요청 객체 (Rate Limiting용).
+        data: 일괄 생성 요청 데이터 (파일 목록, 모델 등).
+        current_user: 인증된 사용자 정보.
+        service: 테스트 생성 서비스 의존성.
+        repository: 생성 이력 저장소 의존성.
+        token_service: 토큰 관리 서비스 의존성.
+        streams: 재연결 가능한 SSE 스트림 관리자 의존성.
+
+    Returns:
+        SSE 스트림 응답 (X-Generation-Stream-Id 헤더에 스트림 id 포함).
+    """
+    client_ip = request.client.host if request.client else None
+    await validate_turnstile_token(data.turnstile_token, ip=client_ip)
+
+    stream_id = streams.start(
+        current_user["id"],
+        batch_generation_frames(data, current_user["id"], service, repository, token_service),
+    )
+    return StreamingResponse(
+        relay_until_disconnect(request, streams.subscribe(stream_id)),
+        media_type="text/event-stream",
+        headers={"X-Generation-Stream-Id": stream_id},
+    )
+
+
+@router.get("/generate/resume")
+@limiter.limit("30/minute")
+async def resume_generation(
+    request: Request,
+    last_event_id: str = Header(alias="Last-Event-ID"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    streams: ResumableStreams = Depends(get_resumable_streams),
+):
+    """연결이 끊긴 생성 스트림을 Last-Event-ID 다음 프레임부터 이어서 반환 (SSE).
+
+    생성을 다시 실행하지 않으므로 Turnstile 검증과 토큰 차감이 없습니다. 프레임을 하나도
+    받지 못했다면 생성 응답의 X-Generation-Stream-Id로 `{stream_id}:0`을 보냅니다.
+
+    Args:
+        request: HTTP 요청 객체 (Rate Limiting, 연결 감지용).
+        last_event_id: 클라이언트가 마지막으로 받은 SSE 이벤트 id.
+        current_user: 인증된 사용자 정보.
+        streams: 재연결 가능한 SSE 스트림 관리자 의존성.
+
+    Returns:
+        SSE 스트림 응답.
+
+    Raises:
+        HTTPException: 스트림이 만료되었거나 본인 스트림이 아닌 경우 (404).
+    """
+    frames = await streams.resume(current_user["id"], last_event_id)
+    if frames is None:
+        raise HTTPException(status_code=404, detail="이어서 받을 생성 스트림을 찾을 수 없습니다")
+    return StreamingResponse(
+        relay_until_disconnect(request, frames), media_type="text/event-stream"
+    )
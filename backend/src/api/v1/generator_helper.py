@@ -1,7 +1,11 @@
+import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Optional
 
 from src.repositories.generation_repository import GenerationRepository
-from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +36,7 @@ async def background_save_generation(
             "백그라운드 이력 저장 시작",
             user_id=user_id,
         )
-        saved = await run_in_threadpool(
-            repository.create_history,
+        saved = await repository.create_history(
             user_id=user_id,
             input_code=input_code,
             generated_code=generated_code,
@@ -44,3 +47,104 @@ async def background_save_generation(
             logger.info_ctx("백그라운드 이력 저장 완료", history_id=saved.id)
     except Exception as e:
         logger.error(f"백그라운드 이력 저장 실패: {e}", exc_info=True)
+
+
+async def coalesce_chunks(
+    chunks: AsyncGenerator[str, None], max_bytes: int, max_delay: float
+) -> AsyncIterator[str]:
+    """작은 청크를 모아 크기 또는 시간 기준으로 한 번에 내보냅니다.
+
+    청크마다 SSE 프레임과 JSON 직렬화, send 호출이 발생하므로, 짧은 간격으로 쏟아지는
+    작은 청크(버퍼 재생, 빠른 스트리밍)를 묶어 프레임 수를 줄입니다.
+
+    - 직전 전달 후 max_delay가 지났으면 즉시 전달 (첫 청크 포함, 첫 바이트 지연 없음)
+    - 그 밖의 청크는 모아 두었다가 max_bytes 이상이 되거나 직전 전달 후 max_delay가
+      지나면 전달 (다음 청크를 기다리는 중이어도 시간 기준으로 전달)
+    - max_bytes 또는 max_delay가 0 이하이면 그대로 전달
+
+    업스트림은 별도 태스크가 읽어 버퍼에 쌓으므로, 호출자가 이전 프레임을 전송하는
+    동안 도착한 청크도 다음 프레임에 합쳐집니다. 호출자는 청크마다가 아니라 프레임마다
+    한 번만 깨어납니다. 버퍼가 max_bytes에 도달하면 호출자가 비울 때까지 업스트림을 더
+    읽지 않으므로, 호출자가 느려도 버퍼는 max_bytes와 청크 하나 크기를 넘지 않습니다.
+
+    Args:
+        chunks: 업스트림 청크 스트림.
+        max_bytes: 버퍼를 비우는 크기 기준 (UTF-8 바이트).
+        max_delay: 버퍼를 비우는 시간 기준 (초).
+
+    Yields:
+        합쳐진 청크.
+
+    Raises:
+        Exception: 업스트림에서 발생한 예외 (모인 내용을 먼저 전달한 뒤 전파).
+    """
+    if max_bytes <= 0 or max_delay <= 0:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    loop = asyncio.get_running_loop()
+    buffer: list[str] = []
+    buffered_bytes = 0
+    deadline = 0.0
+    done = False
+    error: Optional[BaseException] = None
+    wake = asyncio.Event()
+    drained = asyncio.Event()
+
+    async def pump() -> None:
+        nonlocal buffered_bytes, done, error
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                buffer.append(chunk)
+                buffered_bytes += len(chunk.encode("utf-8"))
+                if buffered_bytes >= max_bytes:
+                    # 버퍼가 가득 차면 소비자가 비울 때까지 업스트림을 더 읽지 않음
+                    wake.set()
+                    while buffered_bytes >= max_bytes:
+                        drained.clear()
+                        await drained.wait()
+                elif loop.time() >= deadline:
+                    # 소비자가 즉시 전달할 청크를 먼저 내보낼 수 있도록 양보
+                    wake.set()
+                    await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            # 버퍼가 가득 차 기다리는 중처럼 업스트림이 yield에서 멈춰 있어도 정리되도록 닫음
+            await chunks.aclose()
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            done = True
+            wake.set()
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            while not (done or buffered_bytes >= max_bytes or (buffer and loop.time() >= deadline)):
+                timer = loop.call_at(deadline, wake.set) if loop.time() < deadline else None
+                await wake.wait()
+                wake.clear()
+                if timer is not None:
+                    timer.cancel()
+
+            if isinstance(error, ClientDisconnect):
+                raise error  # 받을 클라이언트가 없으므로 남은 내용은 버림
+            if buffer:
+                frame = "".join(buffer)
+                buffer.clear()
+                buffered_bytes = 0
+                drained.set()
+                deadline = loop.time() + max_delay
+                yield frame
+            elif done:
+                if error is not None:
+                    raise error
+                return
+    finally:
+        # 업스트림 제너레이터가 정리될 때까지 기다린 뒤 반환
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
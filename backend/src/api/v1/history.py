@@ -1,11 +1,13 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, ConfigDict
 from src.api.v1.deps import get_generation_repository
 from src.auth import get_current_user
-from src.repositories.generation_repository import GenerationRepository
+from src.config.constants import APIConstants
+from src.repositories.generation_repository import GenerationRepository, InvalidCursorError
 from src.types import AuthenticatedUser
 from src.utils.logger import get_logger
 
@@ -24,34 +26,89 @@ class HistoryItem(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-@router.get("/", response_model=list[HistoryItem])
+class HistorySummary(BaseModel):
+    id: UUID
+    language: str
+    model: str
+    created_at: datetime
+    input_preview: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HistoryPageResponse(BaseModel):
+    items: list[HistorySummary]
+    next_cursor: Optional[str] = None
+
+
+@router.get("/", response_model=HistoryPageResponse)
 async def get_history(
+    limit: int = Query(
+        default=APIConstants.HISTORY_PAGE_SIZE, ge=1, le=APIConstants.HISTORY_MAX_PAGE_SIZE
+    ),
+    cursor: Optional[str] = Query(default=None, max_length=256),
     current_user: AuthenticatedUser = Depends(get_current_user),
     repository: GenerationRepository = Depends(get_generation_repository),
 ):
-    """사용자의 생성 이력 목록을 조회합니다.
+    """사용자의 생성 이력 목록을 페이지 단위로 조회합니다.
 
-    최근 생성된 순서대로 정렬하여 반환하며, 암호화된 코드는 복호화되어 전달됩니다.
+    최근 생성된 순서대로 (created_at, id) 커서 기반으로 페이지를 나누며,
+    본문 대신 메타데이터와 입력 코드 미리보기만 반환합니다.
+    전체 코드는 상세 조회(`GET /history/{history_id}`)로 가져옵니다.
 
     Args:
+        limit: 페이지 크기.
+        cursor: 이전 응답의 next_cursor (첫 페이지는 생략).
         current_user: 인증된 사용자 정보.
         repository: 생성 이력 저장소 의존성.
 
     Returns:
-        HistoryItem 객체의 리스트.
+        HistoryPageResponse: 이력 요약 목록과 다음 페이지 커서.
 
     Raises:
-        HTTPException: 조회 실패 시 (500).
+        HTTPException: 잘못된 커서 (400), 조회 실패 시 (500).
     """
     try:
-        history = await repository.get_user_history(current_user["id"])
+        page = await repository.get_user_history(current_user["id"], limit=limit, cursor=cursor)
 
         logger.info_ctx(
             "생성 이력 조회 성공",
             user_id=current_user["id"],
-            count=len(history),
+            count=len(page.items),
         )
-        return history
+        return page
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error(f"이력 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="이력을 불러오는데 실패했습니다") from e
+
+
+@router.get("/{history_id}", response_model=HistoryItem)
+async def get_history_item(
+    history_id: UUID,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    repository: GenerationRepository = Depends(get_generation_repository),
+):
+    """생성 이력 한 건의 전체 코드를 복호화하여 조회합니다.
+
+    Args:
+        history_id: 이력 ID.
+        current_user: 인증된 사용자 정보.
+        repository: 생성 이력 저장소 의존성.
+
+    Returns:
+        HistoryItem: 입력 코드와 생성된 코드가 포함된 이력.
+
+    Raises:
+        HTTPException: 본인 이력이 아니거나 없는 경우 (404), 조회 실패 시 (500).
+    """
+    try:
+        item = await repository.get_history_item(current_user["id"], history_id)
+    except Exception as e:
+        logger.error(f"이력 상세 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="이력을 불러오는데 실패했습니다") from e
+
+    if item is None:
+        raise HTTPException(status_code=404, detail="이력을 찾을 수 없습니다")
+    return item
@@ -0,0 +1,165 @@
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from src.api.v1.deps import (
+    get_generation_jobs,
+    get_generation_repository,
+    get_resumable_streams,
+    get_test_generator_service,
+    get_token_service,
+    limiter,
+)
+from src.api.v1.generator import generation_frames, relay_until_disconnect
+from src.auth import get_current_user, validate_turnstile_token
+from src.repositories.generation_repository import GenerationRepository
+from src.services.generation_jobs import GenerationJobs
+from src.services.resumable_stream import ResumableStreams, parse_event_id
+from src.services.test_generator_service import TestGeneratorService
+from src.services.token_service import TokenService
+from src.types import AuthenticatedUser, GenerateRequest, GenerationOutcome
+from src.utils.logger import get_logger
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+JobStatus = Literal["queued", "running", "completed", "failed", "cancelled"]
+
+
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    language: str
+    model: str
+    created_at: datetime
+    updated_at: datetime
+    result: Optional[str] = None
+    history_id: Optional[str] = None
+    error: Optional[dict[str, Any]] = None
+
+
+@router.post("", status_code=202, response_model=JobSubmitResponse)
+@limiter.limit("5/minute")
+async def submit_job(
+    request: Request,
+    data: GenerateRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    service: TestGeneratorService = Depends(get_test_generator_service),
+    repository: GenerationRepository = Depends(get_generation_repository),
+    token_service: TokenService = Depends(get_token_service),
+    jobs: GenerationJobs = Depends(get_generation_jobs),
+):
+    """테스트 코드 생성 작업을 등록하고 작업 id를 즉시 반환합니다.
+
+    생성은 레플리카별 작업 풀에서 실행되며, 토큰 차감·이력 저장·실패 시 환불은
+    `POST /generate`와 같은 흐름을 따릅니다. 결과는 `GET /jobs/{job_id}`로 조회하거나
+    `GET /jobs/{job_id}/events`로 진행 상황을 SSE로 구독합니다.
+
+    Args:
+        request: HTTP 요청 객체 (Rate Limiting용).
+        data: 생성 요청 데이터 (코드, 언어, 모델 등).
+        current_user: 인증된 사용자 정보.
+        service: 테스트 생성 서비스 의존성.
+        repository: 생성 이력 저장소 의존성.
+        token_service: 토큰 관리 서비스 의존성.
+        jobs: 생성 작업 관리자 의존성.
+
+    Returns:
+        작업 id와 상태 (202 Accepted).
+
+    Raises:
+        HTTPException: 작업 대기열이 가득 찬 경우 (429), 작업을 등록할 수 없는 경우 (503).
+    """
+    client_ip = request.client.host if request.client else None
+    await validate_turnstile_token(data.turnstile_token, ip=client_ip)
+
+    user_id = current_user["id"]
+
+    def run(outcome: GenerationOutcome):
+        return generation_frames(data, user_id, service, repository, token_service, outcome)
+
+    try:
+        job_id = await jobs.submit(user_id, run, language=data.language, model=data.model)
+    except Exception as e:
+        logger.error(f"생성 작업 등록 실패: {e}")
+        raise HTTPException(status_code=503, detail="생성 작업을 등록할 수 없습니다") from e
+    if job_id is None:
+        raise HTTPException(
+            status_code=429, detail="대기 중인 생성 작업이 많습니다. 잠시 후 다시 시도해주세요"
+        )
+    return JobSubmitResponse(job_id=job_id, status="queued")
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(
+    job_id: str,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    jobs: GenerationJobs = Depends(get_generation_jobs),
+):
+    """생성 작업의 상태와 (완료 시) 결과를 조회합니다.
+
+    Args:
+        job_id: 작업 id.
+        current_user: 인증된 사용자 정보.
+        jobs: 생성 작업 관리자 의존성.
+
+    Returns:
+        작업 상태. 완료 시 생성된 코드(result)와 이력 ID, 실패 시 에러 정보를 포함합니다.
+
+    Raises:
+        HTTPException: 본인 작업이 아니거나 만료된 경우 (404), 조회 실패 시 (503).
+    """
+    try:
+        job = await jobs.get(current_user["id"], job_id)
+    except Exception as e:
+        logger.error(f"생성 작업 조회 실패: {e}")
+        raise HTTPException(status_code=503, detail="생성 작업을 조회할 수 없습니다") from e
+    if job is None:
+        raise HTTPException(status_code=404, detail="생성 작업을 찾을 수 없습니다")
+    return JobStatusResponse(**job)
+
+
+@router.get("/{job_id}/events")
+async def subscribe_job(
+    request: Request,
+    job_id: str,
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    streams: ResumableStreams = Depends(get_resumable_streams),
+):
+    """생성 작업의 진행 상황을 SSE로 구독합니다.
+
+    프레임 형식은 `POST /generate`와 같으며, Last-Event-ID를 보내면 그 다음 프레임부터
+    받습니다. 프레임은 작업 종료 후 SSE_RESUME_TTL 동안만 보관되므로, 이후에는
+    `GET /jobs/{job_id}`로 결과를 조회합니다.
+
+    Args:
+        request: HTTP 요청 객체 (연결 감지용).
+        job_id: 작업 id.
+        last_event_id: 마지막으로 받은 SSE 이벤트 id (없으면 처음부터).
+        current_user: 인증된 사용자 정보.
+        streams: 재연결 가능한 SSE 스트림 관리자 의존성.
+
+    Returns:
+        SSE 스트림 응답.
+
+    Raises:
+        HTTPException: 본인 작업이 아니거나 프레임 보관 기간이 지난 경우 (404).
+    """
+    event_id = last_event_id or f"{job_id}:0"
+    parsed = parse_event_id(event_id)
+    frames = None
+    if parsed is not None and parsed[0] == job_id:
+        frames = await streams.resume(current_user["id"], event_id)
+    if frames is None:
+        raise HTTPException(status_code=404, detail="구독할 생성 작업 스트림을 찾을 수 없습니다")
+    return StreamingResponse(
+        relay_until_disconnect(request, frames), media_type="text/event-stream"
+    )
@@ -1,11 +1,14 @@
 import logging
+import random
 
 import httpx
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from src.config.constants import ErrorMessages, NetworkConstants, SecurityConstants
+from src.config.constants import ErrorMessages, SecurityConstants
 from src.config.settings import settings
 from src.types import AuthenticatedUser
+from src.utils.jwt_verifier import JWKSUnavailableError, JWTVerifier
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +17,28 @@ ACCESS_TOKEN_EXPIRE_MINUTES = SecurityConstants.JWT_EXPIRE_MINUTES
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
+# 로컬 JWT 검증기 (JWKS 캐시와 HTTP 커넥션 풀을 프로세스 전체에서 공유)
+jwt_verifier = JWTVerifier(
+    secret=settings.SUPABASE_JWT_SECRET.get_secret_value(),
+    supabase_url=settings.SUPABASE_URL,
+)
+
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> AuthenticatedUser:
-    """
-    Supabase JWT 검증 및 사용자 식별 (via Remote API)
+    """Supabase JWT를 검증하고 사용자를 식별합니다.
+
+    서명, 만료(exp), 대상(aud), 주체(sub)를 로컬에서 검증하므로 요청마다 인증 서버를
+    호출하지 않습니다. 로그아웃 등으로 폐기된 세션을 잡아내기 위해
+    AUTH_REMOTE_VERIFY_SAMPLE_RATE 비율의 요청만 Supabase Auth 서버로 추가 확인합니다.
+
+    Args:
+        token: Authorization 헤더의 Bearer 토큰.
+
+    Returns:
+        인증된 사용자 정보 (id, email).
+
+    Raises:
+        HTTPException: 토큰 누락/무효 시 401, 인증 서비스 사용 불가 시 500/503.
     """
     if not token:
         raise HTTPException(
@@ -26,35 +47,56 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> Authenticated
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    try:
+        claims = await jwt_verifier.verify(token)
+    except jwt.PyJWTError as e:
+        logger.warning(f"JWT Verification Failed: {type(e).__name__}")
+        raise HTTPException(status_code=401, detail=ErrorMessages.AUTH_INVALID_CREDENTIALS) from e
+    except JWKSUnavailableError as e:
+        logger.error(f"Auth Service Internal Error: {e}")
+        raise HTTPException(status_code=503, detail=ErrorMessages.AUTH_SERVICE_UNAVAILABLE) from e
+
+    if random.random() < settings.AUTH_REMOTE_VERIFY_SAMPLE_RATE:
+        return await _verify_remote(token)
+
+    return {"id": claims["sub"], "email": claims.get("email")}
+
+
+async def _verify_remote(token: str) -> AuthenticatedUser:
+    """Supabase Auth 서버에 토큰을 확인합니다 (세션 폐기 여부 확인).
+
+    Args:
+        token: 로컬 검증을 통과한 Bearer 토큰.
+
+    Returns:
+        인증 서버가 반환한 사용자 정보 (id, email).
+
+    Raises:
+        HTTPException: 세션이 유효하지 않으면 401, 인증 서버 사용 불가 시 500/503.
+    """
     # Supabase URL/Key 미설정 시 500 에러
     if not settings.SUPABASE_URL or not settings.SUPABASE_ANON_KEY.get_secret_value():
         logger.error("SUPABASE_URL or SUPABASE_ANON_KEY is not set!")
         raise HTTPException(status_code=500, detail=ErrorMessages.AUTH_SERVICE_UNAVAILABLE)
 
     try:
-        # Supabase Auth 서버에 직접 토큰 검증 요청
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.SUPABASE_URL}/auth/v1/user",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "apikey": settings.SUPABASE_ANON_KEY.get_secret_value(),
-                },
-                timeout=NetworkConstants.HTTP_TIMEOUT_SECONDS,
-            )
+        # Supabase Auth 서버에 직접 토큰 검증 요청 (커넥션 재사용)
+        response = await jwt_verifier.fetch_remote_user(
+            token, settings.SUPABASE_ANON_KEY.get_secret_value()
+        )
 
-            if response.status_code != 200:
-                logger.warning(f"Supabase Token Verification Failed: Status {response.status_code}")
-                raise HTTPException(status_code=401, detail=ErrorMessages.AUTH_INVALID_CREDENTIALS)
-
-            try:
-                user_data = response.json()
-                return {"id": user_data["id"], "email": user_data.get("email")}
-            except (ValueError, KeyError) as e:
-                logger.error(f"Invalid auth response: {e}")
-                raise HTTPException(
-                    status_code=401, detail=ErrorMessages.AUTH_INVALID_CREDENTIALS
-                ) from e
+        if response.status_code != 200:
+            logger.warning(f"Supabase Token Verification Failed: Status {response.status_code}")
+            raise HTTPException(status_code=401, detail=ErrorMessages.AUTH_INVALID_CREDENTIALS)
+
+        try:
+            user_data = response.json()
+            return {"id": user_data["id"], "email": user_data.get("email")}
+        except (ValueError, KeyError) as e:
+            logger.error(f"Invalid auth response: {e}")
+            raise HTTPException(
+                status_code=401, detail=ErrorMessages.AUTH_INVALID_CREDENTIALS
+            ) from e
 
     except httpx.RequestError as e:
         logger.error(f"Auth Service Internal Error: {e}")
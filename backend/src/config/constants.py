@@ -24,9 +24,21 @@ class APIConstants:
     DEFAULT_HISTORY_LIMIT: Final[int] = 50
     """기본 히스토리 조회 개수"""
 
+    HISTORY_PAGE_SIZE: Final[int] = 20
+    """히스토리 목록 기본 페이지 크기"""
+
+    HISTORY_MAX_PAGE_SIZE: Final[int] = 100
+    """히스토리 목록 최대 페이지 크기"""
+
+    HISTORY_PREVIEW_LENGTH: Final[int] = 80
+    """히스토리 목록에 표시할 입력 코드 미리보기 길이 (문자)"""
+
     CHUNK_YIELD_INTERVAL: Final[int] = 100
     """스트리밍 중 이벤트 루프에 제어를 양보하는 청크 간격"""
 
+    MAX_BATCH_FILES: Final[int] = 20
+    """일괄 생성 요청 1회에 포함할 수 있는 최대 파일 수"""
+
 
 # === 캐싱 레이어 상수 ===
 
@@ -38,6 +50,7 @@ class CacheConstants:
     GEMINI_CACHE_TTL: Final[int] = 7200  # 2시간 (AI 응답은 재활용 가치 높음)
     VALIDATION_CACHE_TTL: Final[int] = 3600  # 1시간 (문법 검증은 변경 적음)
     HISTORY_CACHE_TTL: Final[int] = 600  # 10분 (사용자 이력은 자주 변경됨)
+    EXECUTION_CACHE_TTL: Final[int] = 1800  # 30분 (동일 코드/이미지의 실행 결과는 결정적)
     DEFAULT_TTL: Final[int] = 3600  # 1시간
 
     # TTL 매핑
@@ -45,8 +58,79 @@ class CacheConstants:
         "gemini": GEMINI_CACHE_TTL,
         "validation": VALIDATION_CACHE_TTL,
         "history": HISTORY_CACHE_TTL,
+        "execution": EXECUTION_CACHE_TTL,
     }
 
+    TTL_JITTER_MAPPING: Final[dict[str, float]] = {
+        "gemini": 0.1,
+        "validation": 0.1,
+        "execution": 0.1,
+    }
+    """전략별 TTL 지터 비율. TTL을 [ttl * (1 - 비율), ttl] 범위에서 무작위로 줄여 동시 만료를 분산"""
+
+    XFETCH_BETA: Final[float] = 1.0
+    """XFetch 조기 재계산 강도 (클수록 만료 전에 더 일찍 재계산)"""
+
+    CANONICAL_KEY_VERSION: Final[str] = "canonical:v1"
+    """정규화 코드 기반 Gemini 캐시 키의 형식 버전 (정규화 규칙 변경 시 올려서 기존 항목과 분리)"""
+
+    SINGLE_FLIGHT_LOCK_TTL: Final[int] = 300
+    """동일 요청 생성 병합: 생산자 락 및 진행 중 스트림 유지 시간 (초)"""
+
+    SINGLE_FLIGHT_IDLE_TIMEOUT: Final[int] = 15
+    """다른 레플리카 생산자로부터 신호가 없을 때 생존 여부를 재확인하는 간격 (초)"""
+
+    SINGLE_FLIGHT_RESULT_TTL: Final[int] = 60
+    """생성 완료 후 늦게 합류한 대기자를 위해 스트림(청크와 완료 상태)을 유지하는 시간 (초)"""
+
+    PARTIAL_RESULT_TTL: Final[int] = 600
+    """연결 종료로 중단된 생성의 부분 결과 유지 시간 (초). 이 안에 같은 요청이 오면 이어서 생성"""
+
+    SSE_STREAM_TTL: Final[int] = 300
+    """생성 중인 SSE 프레임 버퍼 유지 시간 (초, 마지막 프레임 기준). 생산자 이탈 시 상한"""
+
+    SSE_RESUME_TTL: Final[int] = 120
+    """생성 종료 후 재연결(Last-Event-ID)을 위해 SSE 프레임 버퍼를 유지하는 시간 (초)"""
+
+    GENERATION_JOB_TTL: Final[int] = 3600
+    """비동기 생성 작업의 상태와 결과를 조회할 수 있는 시간 (초, 마지막 상태 변경 기준)"""
+
+    L1_MAX_ENTRIES: Final[int] = 1024
+    """프로세스 내 L1 캐시 최대 항목 수 (LRU 방출)"""
+
+    L1_MAX_TTL: Final[int] = 30
+    """L1 캐시 항목 최대 유지 시간 (초). 무효화 메시지 유실 시 불일치 허용 상한"""
+
+    L1_MAX_VALUE_BYTES: Final[int] = 64 * 1024
+    """L1 캐시에 보관할 값의 최대 크기 (문자 수 기준, 초과 시 Redis만 사용)"""
+
+    L1_INVALIDATION_CHANNEL: Final[str] = "cache:l1:invalidate"
+    """레플리카 간 L1 캐시 무효화 Pub/Sub 채널"""
+
+    L1_RESUBSCRIBE_DELAY: Final[float] = 1.0
+    """무효화 구독 연결이 끊겼을 때 재구독까지 대기 시간 (초)"""
+
+    COMPRESSION_MIN_BYTES: Final[int] = 1024
+    """이 크기(UTF-8 바이트) 이상인 값만 압축하여 저장 (작은 값은 헤더 없이 원문 저장)"""
+
+    ZSTD_LEVEL: Final[int] = 3
+    """zstd 압축 레벨 (zstandard 패키지가 설치된 경우)"""
+
+    ZLIB_LEVEL: Final[int] = 6
+    """zlib 압축 레벨 (zstd를 사용할 수 없는 경우)"""
+
+    CLEAR_SCAN_BATCH: Final[int] = 500
+    """clear 시 SCAN COUNT 힌트 및 UNLINK 1회당 최대 키 수"""
+
+    IMAGE_DIGEST_REFRESH_SECONDS: Final[int] = 60
+    """Worker sandbox 이미지 digest 로컬 캐시 유지 시간 (초)"""
+
+    IMAGE_DIGEST_RETRY_SECONDS: Final[int] = 15
+    """digest 조회 실패(Worker 장애, 이미지 없음) 결과의 로컬 캐시 유지 시간 (초)"""
+
+    EXECUTION_UNCACHEABLE_EXIT_CODES: Final[frozenset[int]] = frozenset({124, 137})
+    """캐시하지 않는 실행 종료 코드 (timeout/강제 종료는 부하에 따라 달라질 수 있음)"""
+
 
 # === AI 모델 상수 ===
 
@@ -75,6 +159,12 @@ class AIConstants:
     RETRY_MULTIPLIER: Final[int] = 1
     """지수 백오프 승수"""
 
+    CONTINUE_PROMPT: Final[str] = (
+        "응답이 중간에 끊겼습니다. 이미 작성한 내용을 반복하지 말고, "
+        "끊긴 위치의 바로 다음 문자부터 이어서 작성하십시오."
+    )
+    """스트리밍 도중 실패 후 재시도 시, 이미 전달한 응답에 이어서 생성하도록 요청하는 프롬프트"""
+
 
 # === 보안 상수 ===
 
@@ -98,6 +188,18 @@ class SecurityConstants:
     JWT_EXPIRE_MINUTES: Final[int] = 1440
     """JWT 토큰 만료 시간: 24시간"""
 
+    JWT_AUDIENCE: Final[str] = "authenticated"
+    """Supabase 사용자 액세스 토큰의 aud 클레임"""
+
+    JWT_LEEWAY_SECONDS: Final[int] = 30
+    """JWT exp/nbf 검증 시 허용하는 시계 오차 (초)"""
+
+    JWKS_CACHE_TTL: Final[int] = 600
+    """Supabase JWKS(공개 키 목록) 캐시 유지 시간 (초)"""
+
+    JWKS_MIN_REFRESH_INTERVAL: Final[int] = 30
+    """JWKS 재조회 최소 간격 (알 수 없는 kid로 인한 반복 조회 방지, 초)"""
+
     MIN_PASSWORD_LENGTH: Final[int] = 8
     """최소 비밀번호 길이"""
 
@@ -185,6 +287,15 @@ class NetworkConstants:
     GZIP_MIN_SIZE_BYTES: Final[int] = 500
     """GZip 압축 최소 크기"""
 
+    MAX_REQUEST_BODY_BYTES: Final[int] = 10 * 1024 * 1024
+    """요청 본문 최대 크기 (Content-Length 기준, 10MB)"""
+
+    SUPABASE_MAX_CONNECTIONS: Final[int] = 20
+    """비동기 PostgREST 클라이언트 최대 연결 수 (HTTP/2에서는 연결당 다중 스트림)"""
+
+    SUPABASE_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 10
+    """비동기 PostgREST 클라이언트 유지(Keepalive) 연결 수"""
+
     REDIS_MAX_CONNECTIONS: Final[int] = 10
     """Redis 최대 연결 수"""
 
@@ -31,6 +31,45 @@ class Settings(BaseSettings):
     DEFAULT_GEMINI_MODEL: str = Field(
         default="gemini-3-flash-preview", description="기본 Gemini 모델"
     )
+    SSE_COALESCE_MAX_BYTES: int = Field(
+        default=4096,
+        ge=0,
+        description="생성 SSE 스트림에서 작은 청크를 모아 한 프레임으로 보내는 크기 기준 (바이트, 0이면 비활성화)",
+    )
+    SSE_COALESCE_MAX_DELAY_MS: int = Field(
+        default=25,
+        ge=0,
+        description="생성 SSE 스트림에서 청크를 모으는 최대 시간 (밀리초, 0이면 비활성화). 첫 청크는 항상 즉시 전송",
+    )
+    GENERATION_REFUND_ON_DISCONNECT: bool = Field(
+        default=True,
+        description="SSE 클라이언트가 생성 도중 연결을 끊었을 때 차감한 토큰을 환불할지 여부",
+    )
+    GENERATION_CACHE_PARTIAL_ON_DISCONNECT: bool = Field(
+        default=True,
+        description="연결 종료로 중단된 생성의 부분 결과를 저장해 같은 입력의 다음 요청이 이어서 생성할지 여부",
+    )
+    SSE_RESUME_GRACE_SECONDS: int = Field(
+        default=15,
+        ge=0,
+        description="SSE 클라이언트 연결이 끊긴 뒤 재연결(Last-Event-ID)을 기다리며 생성을 계속하는 시간 (초, 0이면 즉시 취소)",
+    )
+    GENERATION_JOB_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="레플리카당 동시에 실행하는 비동기 생성 작업(/jobs) 수",
+    )
+    GENERATION_JOB_MAX_PENDING: int = Field(
+        default=32,
+        ge=1,
+        description="레플리카당 실행 중이거나 대기 중인 비동기 생성 작업 상한 (초과 시 429)",
+    )
+
+    GENERATION_BATCH_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="일괄 생성 요청 1회에서 동시에 Gemini를 호출하는 파일 수",
+    )
 
     # 앱 환경 설정 (Cloud Run: ENV 변수 사용)
     ENV: str = Field(
@@ -51,6 +90,11 @@ class Settings(BaseSettings):
             self.REDIS_URL = f"redis://{host}:{port}"
         return self
 
+    CACHE_L1_ENABLED: bool = Field(
+        default=True,
+        description="Redis 앞단 프로세스 내 L1 캐시 사용 여부 (Pub/Sub 무효화 구독 중에만 사용)",
+    )
+
     # Supabase 설정
     SUPABASE_URL: str = Field(default="", description="Supabase 프로젝트 URL")
     SUPABASE_SERVICE_ROLE_KEY: SecretStr = Field(
@@ -59,6 +103,16 @@ class Settings(BaseSettings):
     SUPABASE_ANON_KEY: SecretStr = Field(
         default="", description="Supabase Anon Key (사용자 검증용)"
     )
+    SUPABASE_ASYNC_CLIENT: bool = Field(
+        default=True,
+        description="비동기 PostgREST 클라이언트(HTTP/2 커넥션 풀) 사용 여부. False면 스레드풀에서 동기 클라이언트 사용",
+    )
+    AUTH_REMOTE_VERIFY_SAMPLE_RATE: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="로컬 JWT 검증 후 Supabase Auth 서버로 세션 폐기 여부를 추가 확인할 요청 비율 (0~1)",
+    )
 
     # 데이터 암호화 키
     DATA_ENCRYPTION_KEY: SecretStr = Field(default="", description="DB 컬럼 암호화용 AES 키")
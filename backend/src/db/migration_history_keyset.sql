@@ -0,0 +1,17 @@
+-- ============================================================
+-- 이력 목록 Keyset 페이지네이션 마이그레이션
+-- ============================================================
+
+-- 1. 목록용 입력 코드 미리보기 컬럼 (암호화 저장, 본문 복호화 없이 목록 표시)
+--    기존 행은 NULL이며 목록에서 미리보기 없이 표시됨
+ALTER TABLE public.generation_history
+    ADD COLUMN IF NOT EXISTS input_preview TEXT;
+
+-- 2. (user_id, created_at, id) 커서 조회용 복합 인덱스
+CREATE INDEX IF NOT EXISTS generation_history_user_keyset_idx
+    ON public.generation_history (user_id, created_at DESC, id DESC);
+
+-- 3. 확인
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'generation_history';
@@ -41,3 +41,8 @@ to authenticated
 using (auth.uid() = user_id);
 
 
+
+-- 이력 목록 Keyset 페이지네이션 / 미리보기 (migration_history_keyset.sql 참고)
+alter table public.generation_history add column if not exists input_preview text;
+create index if not exists generation_history_user_keyset_idx
+  on public.generation_history (user_id, created_at desc, id desc);
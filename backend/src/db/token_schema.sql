@@ -314,3 +314,32 @@ BEGIN
     END IF;
 END;
 $$;
+
+-- 지갑 상태 조회 (지갑 초기화 + 일일 보너스 + 잔액 조회를 단일 트랜잭션/왕복으로 처리)
+CREATE OR REPLACE FUNCTION public.get_wallet_status(
+    p_user_id UUID,
+    p_welcome_amount INTEGER,
+    p_welcome_description TEXT,
+    p_bonus_amount INTEGER DEFAULT 10
+)
+RETURNS JSON
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_wallet JSON;
+    v_bonus JSON;
+BEGIN
+    v_wallet := public.initialize_user_wallet(p_user_id, p_welcome_amount, p_welcome_description);
+    v_bonus := public.claim_daily_bonus(p_user_id, p_bonus_amount);
+
+    -- claim_daily_bonus는 지급 여부와 관계없이 최종 잔액(current_balance)을 반환함
+    RETURN json_build_object(
+        'success', COALESCE((v_bonus->>'success')::BOOLEAN, false),
+        'already_claimed', COALESCE((v_bonus->>'already_claimed')::BOOLEAN, false),
+        'added', COALESCE((v_bonus->>'added')::INTEGER, 0),
+        'current_balance', COALESCE((v_bonus->>'current_balance')::INTEGER, 0),
+        'wallet_created', COALESCE((v_wallet->>'created')::BOOLEAN, false)
+    );
+END;
+$$;
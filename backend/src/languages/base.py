@@ -25,6 +25,171 @@ class LanguagePattern:
     error_message: str
 
 
+# C 계열 연산자 (최장 일치 순). `a - --b`와 `a-- - b`처럼 공백 제거 후 같아지는 코드를
+# 서로 다른 토큰열로 구분하기 위해 다중 문자 연산자를 하나의 토큰으로 취급
+_C_LIKE_OPERATORS: Final[tuple[str, ...]] = (
+    ">>>=",
+    "...",
+    "===",
+    "!==",
+    "**=",
+    "<<=",
+    ">>=",
+    ">>>",
+    "&&=",
+    "||=",
+    "??=",
+    "=>",
+    "==",
+    "!=",
+    "<=",
+    ">=",
+    "&&",
+    "||",
+    "??",
+    "?.",
+    "++",
+    "--",
+    "+=",
+    "-=",
+    "*=",
+    "/=",
+    "%=",
+    "&=",
+    "|=",
+    "^=",
+    "**",
+    "<<",
+    ">>",
+    "::",
+    "->",
+)
+
+_WORD_RE: Final[re.Pattern[str]] = re.compile(r"[\w$]+")
+
+# 이 토큰 뒤의 `/`는 나눗셈이 아니라 정규식 리터럴의 시작 (JavaScript)
+_REGEX_PRECEDING_WORDS: Final[frozenset[str]] = frozenset(
+    {
+        "return",
+        "typeof",
+        "instanceof",
+        "in",
+        "of",
+        "new",
+        "delete",
+        "void",
+        "throw",
+        "case",
+        "do",
+        "else",
+        "yield",
+        "await",
+    }
+)
+
+
+def _scan_quoted(code: str, start: int, quote: str) -> int:
+    """start 위치의 따옴표로 시작하는 리터럴의 끝(닫는 따옴표 다음) 위치를 반환합니다."""
+    i = start + len(quote)
+    while i < len(code):
+        if code[i] == "\\":
+            i += 2
+            continue
+        if code.startswith(quote, i):
+            return i + len(quote)
+        i += 1
+    return len(code)
+
+
+def _scan_regex(code: str, start: int) -> int:
+    """start 위치의 정규식 리터럴(/.../flags)의 끝 위치를 반환합니다."""
+    i, in_class = start + 1, False
+    while i < len(code) and code[i] != "\n":
+        c = code[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            match = _WORD_RE.match(code, i + 1)
+            return match.end() if match else i + 1
+        i += 1
+    return i
+
+
+def c_like_tokens(
+    code: str,
+    quotes: tuple[str, ...],
+    regex_literals: bool = False,
+    significant_newlines: bool = False,
+) -> list[str]:
+    """C 계열 언어 코드를 주석과 공백을 제외한 토큰열로 변환합니다.
+
+    문자열/정규식 리터럴 내부는 그대로 유지합니다.
+
+    Args:
+        code: 소스 코드.
+        quotes: 문자열 리터럴 구분자 (긴 것부터, 예: Java 텍스트 블록 `\"\"\"`).
+        regex_literals: `/.../` 정규식 리터럴 인식 여부 (JavaScript).
+        significant_newlines: 줄바꿈 유무를 하나의 토큰으로 보존할지 여부
+            (JavaScript의 자동 세미콜론 삽입처럼 줄바꿈이 의미를 바꾸는 언어).
+
+    Returns:
+        토큰 목록.
+    """
+    tokens: list[str] = []
+    newline_pending = False
+    i, n = 0, len(code)
+    while i < n:
+        c = code[i]
+        if c == "\n":
+            newline_pending = True
+            i += 1
+            continue
+        if c.isspace():
+            i += 1
+            continue
+        if code.startswith("//", i):
+            end = code.find("\n", i)
+            i = n if end < 0 else end
+            continue
+        if code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            newline_pending = newline_pending or "\n" in code[i:end]
+            i = end
+            continue
+
+        if significant_newlines and newline_pending and tokens:
+            tokens.append("\n")
+        newline_pending = False
+
+        quote = next((q for q in quotes if code.startswith(q, i)), None)
+        if quote is not None:
+            end = _scan_quoted(code, i, quote)
+        elif (
+            regex_literals
+            and c == "/"
+            and (
+                not tokens
+                or tokens[-1] in _REGEX_PRECEDING_WORDS
+                or not (_WORD_RE.fullmatch(tokens[-1]) or tokens[-1] in (")", "]", "}"))
+            )
+        ):
+            end = _scan_regex(code, i)
+        elif match := _WORD_RE.match(code, i):
+            end = match.end()
+        else:
+            operator = next((op for op in _C_LIKE_OPERATORS if code.startswith(op, i)), c)
+            end = i + len(operator)
+        tokens.append(code[i:end])
+        i = end
+    return tokens
+
+
 class LanguageStrategy(ABC):
     """다국어 지원을 위한 추상 기본 클래스.
 
@@ -76,6 +241,23 @@ class LanguageStrategy(ABC):
 
         return ValidationResult(is_valid=True)
 
+    def normalize_for_cache(self, code: str) -> str:
+        """캐시 키 생성을 위해 코드를 의미가 같으면 같은 문자열이 되도록 정규화합니다.
+
+        공백, 주석, 빈 줄처럼 생성 결과에 영향을 주지 않는 차이를 제거하여, 서식만 다른
+        입력이 같은 Gemini 캐시 항목을 공유하게 합니다. 의미가 다른 코드가 같은 결과를
+        내면 잘못된 캐시 응답이 되므로 확신할 수 없는 차이는 보존해야 합니다.
+
+        기본 구현은 줄바꿈 문자 통일과 앞뒤 공백 제거만 수행하며, 언어별 전략이 재정의합니다.
+
+        Args:
+            code: 원본 소스 코드.
+
+        Returns:
+            정규화된 문자열.
+        """
+        return code.replace("\r\n", "\n").strip()
+
     @abstractmethod
     def validate_code(self, code: str) -> ValidationResult:
         """입력된 코드가 해당 언어의 문법에 맞는지 검증합니다.
@@ -7,7 +7,7 @@ import re
 from typing import Final
 
 from src.config.constants import ValidationConstants
-from src.languages.base import LanguageStrategy
+from src.languages.base import LanguageStrategy, c_like_tokens
 from src.types import ValidationResult
 
 
@@ -59,6 +59,10 @@ class JavaStrategy(LanguageStrategy):
 
         return ValidationResult(is_valid=True)
 
+    def normalize_for_cache(self, code: str) -> str:
+        """주석과 공백을 제외한 토큰열로 정규화합니다 (텍스트 블록/문자열 내부는 유지)."""
+        return " ".join(c_like_tokens(code, ('"""', '"', "'")))
+
     def get_system_instruction(self) -> str:
         """Java 테스트 코드 생성을 위한 시스템 프롬프트를 반환합니다.
 
@@ -7,7 +7,7 @@ import re
 from typing import Final
 
 from src.config.constants import ValidationConstants
-from src.languages.base import LanguageStrategy
+from src.languages.base import LanguageStrategy, c_like_tokens
 from src.types import ValidationResult
 
 
@@ -60,6 +60,16 @@ class JavaScriptStrategy(LanguageStrategy):
 
         return ValidationResult(is_valid=True)
 
+    def normalize_for_cache(self, code: str) -> str:
+        """주석과 공백을 제외한 토큰열로 정규화합니다.
+
+        자동 세미콜론 삽입(ASI) 때문에 줄바꿈 유무는 의미를 바꿀 수 있으므로,
+        연속된 줄바꿈/빈 줄은 하나로 합치되 줄바꿈 자체는 보존합니다.
+        """
+        return " ".join(
+            c_like_tokens(code, ("`", '"', "'"), regex_literals=True, significant_newlines=True)
+        )
+
     def get_system_instruction(self) -> str:
         """JavaScript 테스트 코드 생성을 위한 시스템 프롬프트를 반환합니다.
 
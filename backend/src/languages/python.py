@@ -48,6 +48,16 @@ class PythonStrategy(LanguageStrategy):
                 error_message=ValidationConstants.PYTHON_SYNTAX_ERROR,
             )
 
+    def normalize_for_cache(self, code: str) -> str:
+        """AST 덤프로 정규화합니다 (주석, 공백, 빈 줄, 줄바꿈 위치 차이 제거).
+
+        문법 오류로 파싱할 수 없으면 기본 정규화를 사용합니다.
+        """
+        try:
+            return ast.dump(ast.parse(code))
+        except (SyntaxError, ValueError):
+            return super().normalize_for_cache(code)
+
     def get_system_instruction(self) -> str:
         """Python 테스트 코드 생성을 위한 시스템 프롬프트를 반환합니다.
 
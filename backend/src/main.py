@@ -1,11 +1,9 @@
 import logging
 import os
 import time
-import uuid
 from contextlib import asynccontextmanager
 
 import google.generativeai as genai
-import jwt
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,16 +15,16 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from src.api.routers import api_router
 from src.api.v1.deps import limiter, verify_api_key
-from src.auth import ALGORITHM
+from src.auth import jwt_verifier
 from src.config.constants import NetworkConstants
 from src.config.settings import settings
 from src.exceptions import (
     DuplicateTransactionError,
     InsufficientTokensError,
     TurnstileError,
-    ValidationError,
 )
-from src.utils.logger import get_logger, setup_logging, trace_id_ctx
+from src.middleware import RequestContextMiddleware
+from src.utils.logger import get_logger, setup_logging
 
 # 로깅 설정 초기화
 setup_logging(log_level=logging.INFO)
@@ -35,19 +33,6 @@ logger = get_logger(__name__)
 load_dotenv()
 
 
-# Content-Security-Policy
-CSP_POLICY = (
-    "default-src 'self' https://accounts.google.com https://www.gstatic.com https://www.google.com https://challenges.cloudflare.com; "
-    "script-src 'self' 'unsafe-inline' https://accounts.google.com https://www.google.com https://www.gstatic.com https://apis.google.com https://challenges.cloudflare.com https://www.googletagmanager.com; "
-    "style-src 'self' 'unsafe-inline' https://accounts.google.com https://fonts.googleapis.com https://www.gstatic.com; "
-    "img-src 'self' data: https://*.googleusercontent.com https://www.gstatic.com https://www.google.com https://www.googletagmanager.com https://www.google-analytics.com; "
-    "font-src 'self' https://fonts.gstatic.com data:; "
-    "connect-src 'self' https://*.supabase.co https://accounts.google.com https://www.google.com https://challenges.cloudflare.com https://www.google-analytics.com https://analytics.google.com https://www.googletagmanager.com; "
-    "frame-src 'self' https://accounts.google.com https://challenges.cloudflare.com; "
-    "frame-ancestors 'self' https://accounts.google.com;"
-)
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기를 관리합니다 (시작/종료).
@@ -79,13 +64,18 @@ async def lifespan(app: FastAPI):
         logger.error(f"Supabase 연결에 실패했습니다: {e}")
         logger.warning("일부 기능이 정상적으로 작동하지 않을 수 있습니다")
 
-    # Redis 연결 확인
+    # Redis 연결 확인 및 L1 캐시 무효화 구독
+    cache_invalidation = None
     try:
-        from src.services.cache_service import CacheService
+        from src.services.cache_service import CacheInvalidationListener, CacheService
 
         cache_service = CacheService()
         await cache_service.ping()
         logger.info("Redis 연결에 성공했습니다")
+
+        if settings.CACHE_L1_ENABLED:
+            cache_invalidation = CacheInvalidationListener(cache_service.redis_client)
+            cache_invalidation.start()
     except Exception as e:
         logger.error(f"Redis 연결에 실패했습니다: {e}")
         logger.warning("캐싱 기능을 사용할 수 없으며 성능 저하가 발생할 수 있습니다")
@@ -106,8 +96,19 @@ async def lifespan(app: FastAPI):
     # === 종료 (Shutdown) ===
     logger.info("TESTER API 서버를 종료합니다")
 
+    # 생성 작업 취소 (최종 상태를 기록할 수 있도록 Redis 연결을 닫기 전에 실행)
+    try:
+        from src.services.generation_jobs import GenerationJobs
+
+        await GenerationJobs.shutdown()
+    except Exception as e:
+        logger.warning(f"생성 작업 정리 중 오류가 발생했습니다: {e}")
+
     # Redis 연결 정리
     try:
+        if cache_invalidation is not None:
+            await cache_invalidation.stop()
+
         from src.services.cache_service import RedisConnectionManager
 
         await RedisConnectionManager.get_instance().close()
@@ -115,6 +116,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Redis 정리 중 오류가 발생했습니다: {e}")
 
+    # 비동기 PostgREST 커넥션 풀 정리
+    try:
+        from src.services.supabase_service import SupabaseService
+
+        await SupabaseService().close()
+        logger.info("Supabase 커넥션 풀이 종료되었습니다")
+    except Exception as e:
+        logger.warning(f"Supabase 커넥션 풀 정리 중 오류가 발생했습니다: {e}")
+
     # ExecutionService 정리
     try:
         from src.services.execution_service import ExecutionService
@@ -124,6 +134,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"ExecutionService 정리 중 오류가 발생했습니다: {e}")
 
+    # 인증 HTTP 클라이언트 정리
+    try:
+        await jwt_verifier.close()
+    except Exception as e:
+        logger.warning(f"인증 클라이언트 정리 중 오류가 발생했습니다: {e}")
+
     logger.info("서버가 안전하게 종료되었습니다")
 
 
@@ -150,17 +166,6 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
-# 미들웨어: Trace ID 생성 및 주입
-@app.middleware("http")
-async def trace_id_middleware(request: Request, call_next):
-    """요청마다 고유한 Trace ID를 생성하고 컨텍스트에 설정합니다."""
-    trace_id = str(uuid.uuid4())
-    trace_id_ctx.set(trace_id)
-    response = await call_next(request)
-    response.headers["X-Trace-ID"] = trace_id
-    return response
-
-
 @app.exception_handler(TurnstileError)
 async def turnstile_exception_handler(request: Request, exc: TurnstileError):
     return ORJSONResponse(
@@ -223,94 +228,14 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-# 미들웨어: Content-Length 제한 (Slowloris / 대용량 페이로드 방지)
-@app.middleware("http")
-async def limit_content_length(request: Request, call_next):
-    content_length = request.headers.get("content-length")
-    if content_length:
-        limit = 10 * 1024 * 1024  # 10 MB 제한
-        if int(content_length) > limit:
-            return ORJSONResponse(
-                status_code=413,
-                content={"detail": "Request entity too large"},
-            )
-    response = await call_next(request)
-    return response
-
-
 # Prometheus 메트릭 (내부 인증 필요 — 운영 정보 노출 방지)
 Instrumentator().instrument(app).expose(
     app, include_in_schema=False, dependencies=[Depends(verify_api_key)]
 )
 
 
-# 미들웨어: 사용자 상태 주입 (Rate Limiting용)
-@app.middleware("http")
-async def attach_user_to_state(request: Request, call_next):
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        token = auth_header.split(" ")[1]
-        try:
-            # audience 검증을 비활성화하여 python-jose와 동일한 동작 보장
-            payload = jwt.decode(
-                token,
-                settings.SUPABASE_JWT_SECRET.get_secret_value(),
-                algorithms=[ALGORITHM],
-                options={"verify_aud": False},
-            )
-            request.state.user = {"id": payload.get("sub"), "email": payload.get("email")}
-        except jwt.PyJWTError:
-            logger.warning("Invalid JWT token detected")
-            request.state.user = None
-        except Exception as e:
-            logger.error(f"Unexpected error during JWT decoding: {e}")
-            request.state.user = None
-    else:
-        request.state.user = None
-    response = await call_next(request)
-    return response
-
-
-# 미들웨어: 보안 헤더 및 로깅
-@app.middleware("http")
-async def security_middleware(request: Request, call_next):
-    start_time = time.time()
-    try:
-        response = await call_next(request)
-
-        # 보안 헤더 설정
-        response.headers["Strict-Transport-Security"] = (
-            "max-age=31536000; includeSubDomains; preload"
-        )
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "SAMEORIGIN"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Cross-Origin-Opener-Policy"] = "same-origin-allow-popups"
-        response.headers["Cross-Origin-Resource-Policy"] = "cross-origin"
-
-        # Content-Security-Policy
-        response.headers["Content-Security-Policy"] = CSP_POLICY
-
-        # 로깅
-        process_time = time.time() - start_time
-        logger.info_ctx(
-            "HTTP 요청 처리 완료",
-            method=request.method,
-            path=request.url.path,
-            status=response.status_code,
-            duration=f"{process_time:.4f}s",
-        )
-        return response
-    except ValidationError as e:
-        logger.warning(f"유효성 검사 실패: {e.message}")
-        return ORJSONResponse(
-            status_code=400,
-            content={
-                "type": "error",
-                "status": "validation_error",
-                "detail": {"code": e.code, "message": e.message},
-            },
-        )
+# 미들웨어: Trace ID, Content-Length 제한, 사용자 상태 주입, 보안 헤더 및 로깅 (가장 바깥 계층)
+app.add_middleware(RequestContextMiddleware, verifier=jwt_verifier)
 
 
 @app.get("/health", dependencies=[Depends(verify_api_key)])
@@ -0,0 +1,152 @@
+"""요청 공통 처리 ASGI 미들웨어.
+
+Trace ID 주입, Content-Length 제한, 사용자 상태 주입(Rate Limiting용), 보안 헤더 및
+요청 로깅을 하나의 순수 ASGI 미들웨어에서 처리합니다.
+
+`@app.middleware("http")`(BaseHTTPMiddleware)는 미들웨어마다 요청을 별도 태스크와
+메모리 스트림으로 감싸므로, 여러 개를 쌓으면 요청당 오버헤드가 누적되고 SSE 청크가
+계층마다 큐를 거쳐 전달됩니다. 이 미들웨어는 send 콜백만 감싸 응답 메시지를 그대로
+통과시킵니다.
+"""
+
+import time
+import uuid
+from typing import Any, Optional
+
+import jwt
+from fastapi.responses import ORJSONResponse
+from src.config.constants import NetworkConstants
+from src.exceptions import ValidationError
+from src.utils.jwt_verifier import JWKSUnavailableError, JWTVerifier
+from src.utils.logger import get_logger, trace_id_ctx
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = get_logger(__name__)
+
+
+# Content-Security-Policy
+CSP_POLICY = (
+    "default-src 'self' https://accounts.google.com https://www.gstatic.com https://www.google.com https://challenges.cloudflare.com; "
+    "script-src 'self' 'unsafe-inline' https://accounts.google.com https://www.google.com https://www.gstatic.com https://apis.google.com https://challenges.cloudflare.com https://www.googletagmanager.com; "
+    "style-src 'self' 'unsafe-inline' https://accounts.google.com https://fonts.googleapis.com https://www.gstatic.com; "
+    "img-src 'self' data: https://*.googleusercontent.com https://www.gstatic.com https://www.google.com https://www.googletagmanager.com https://www.google-analytics.com; "
+    "font-src 'self' https://fonts.gstatic.com data:; "
+    "connect-src 'self' https://*.supabase.co https://accounts.google.com https://www.google.com https://challenges.cloudflare.com https://www.google-analytics.com https://analytics.google.com https://www.googletagmanager.com; "
+    "frame-src 'self' https://accounts.google.com https://challenges.cloudflare.com; "
+    "frame-ancestors 'self' https://accounts.google.com;"
+)
+
+SECURITY_HEADERS: dict[str, str] = {
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains; preload",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "SAMEORIGIN",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Cross-Origin-Opener-Policy": "same-origin-allow-popups",
+    "Cross-Origin-Resource-Policy": "cross-origin",
+    "Content-Security-Policy": CSP_POLICY,
+}
+
+
+class RequestContextMiddleware:
+    """요청 컨텍스트(Trace ID, 사용자)와 응답 보안 헤더를 처리하는 순수 ASGI 미들웨어."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        verifier: JWTVerifier,
+        max_body_size: int = NetworkConstants.MAX_REQUEST_BODY_BYTES,
+    ) -> None:
+        """RequestContextMiddleware 인스턴스를 초기화합니다.
+
+        Args:
+            app: 감쌀 ASGI 애플리케이션.
+            verifier: Authorization 헤더의 JWT 검증기 (get_current_user와 동일 인스턴스).
+            max_body_size: 허용할 최대 Content-Length (바이트).
+        """
+        self.app = app
+        self.verifier = verifier
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        trace_id = str(uuid.uuid4())
+        trace_id_ctx.set(trace_id)
+        response_status: Optional[int] = None
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal response_status
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Trace-ID"] = trace_id
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+            await send(message)
+
+        request_headers = Headers(scope=scope)
+
+        # Content-Length 제한 (Slowloris / 대용량 페이로드 방지)
+        content_length = request_headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = ORJSONResponse(
+                status_code=413, content={"detail": "Request entity too large"}
+            )
+            await response(scope, receive, send_with_headers)
+            return
+
+        # 사용자 상태 주입 (Rate Limiting용)
+        scope.setdefault("state", {})["user"] = await self._resolve_user(
+            request_headers.get("authorization")
+        )
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        except ValidationError as e:
+            if response_status is not None:
+                raise  # 응답이 이미 시작되어 오류 응답으로 바꿀 수 없음
+            logger.warning(f"유효성 검사 실패: {e.message}")
+            response = ORJSONResponse(
+                status_code=400,
+                content={
+                    "type": "error",
+                    "status": "validation_error",
+                    "detail": {"code": e.code, "message": e.message},
+                },
+            )
+            await response(scope, receive, send_with_headers)
+            return
+
+        logger.info_ctx(
+            "HTTP 요청 처리 완료",
+            method=scope["method"],
+            path=scope["path"],
+            status=response_status,
+            duration=f"{time.perf_counter() - start_time:.4f}s",
+        )
+
+    async def _resolve_user(self, auth_header: Optional[str]) -> Optional[dict[str, Any]]:
+        """Authorization 헤더의 토큰을 검증해 사용자 정보를 반환합니다.
+
+        Args:
+            auth_header: Authorization 헤더 값.
+
+        Returns:
+            {"id", "email"} 딕셔너리. 토큰이 없거나 유효하지 않으면 None.
+        """
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return None
+
+        token = auth_header.split(" ")[1]
+        try:
+            payload = await self.verifier.verify(token)
+            return {"id": payload.get("sub"), "email": payload.get("email")}
+        except (jwt.PyJWTError, JWKSUnavailableError):
+            logger.warning("Invalid JWT token detected")
+        except Exception as e:
+            logger.error(f"Unexpected error during JWT decoding: {e}")
+        return None
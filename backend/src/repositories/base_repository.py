@@ -24,7 +24,8 @@ class BaseRepository(Generic[ModelType]):
             table_name: Supabase 테이블 이름.
         """
         self.table_name = table_name
-        self.client = SupabaseService().client
+        self.supabase = SupabaseService()
+        self.client = self.supabase.client
 
     def create(self, data: dict[str, Any]) -> dict[str, Any] | None:
         """데이터를 테이블에 생성(삽입)합니다.
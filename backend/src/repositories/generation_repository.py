@@ -1,18 +1,22 @@
+import base64
+import binascii
 from datetime import datetime
 from typing import Optional, Union
 from uuid import UUID
 
-import orjson
 from pydantic import BaseModel
+from src.config.constants import APIConstants, CacheConstants
 from src.repositories.base_repository import BaseRepository
 from src.services.cache_service import CacheService
-from src.services.supabase_service import SupabaseService
+from src.services.supabase_service import SupabaseService, run_query
 from src.utils.logger import get_logger
 from src.utils.security import EncryptionService
-from starlette.concurrency import run_in_threadpool
 
 logger = get_logger(__name__)
 
+# 목록 조회 시 가져오는 컬럼 (본문 input_code/generated_code 제외)
+_SUMMARY_COLUMNS = "id,language,model,created_at,input_preview"
+
 
 class GenerationModel(BaseModel):
     id: Optional[UUID] = None
@@ -24,19 +28,69 @@ class GenerationModel(BaseModel):
     created_at: Optional[datetime] = None
 
 
+class GenerationSummary(BaseModel):
+    """이력 목록용 메타데이터 (본문 제외, 입력 코드 미리보기만 포함)."""
+
+    id: UUID
+    language: str
+    model: str
+    created_at: datetime
+    input_preview: Optional[str] = None
+
+
+class HistoryPage(BaseModel):
+    """Keyset 페이지네이션 결과.
+
+    Attributes:
+        items: 최신순 이력 요약 목록.
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 None).
+    """
+
+    items: list[GenerationSummary]
+    next_cursor: Optional[str] = None
+
+
+class InvalidCursorError(ValueError):
+    """이력 페이지 커서를 해석할 수 없는 경우 발생하는 예외."""
+
+
+def encode_cursor(created_at: datetime, history_id: UUID) -> str:
+    """(created_at, id) 위치를 불투명한 커서 문자열로 인코딩합니다."""
+    raw = f"{created_at.isoformat()}|{history_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """커서 문자열을 (created_at, id)로 디코딩합니다.
+
+    값은 PostgREST 필터에 그대로 들어가므로 datetime/UUID로 파싱해 검증합니다.
+
+    Raises:
+        InvalidCursorError: 형식이 올바르지 않은 경우.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, history_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(history_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {cursor[:32]}") from e
+
+
 class GenerationRepository(BaseRepository[GenerationModel]):
     """생성 이력(History) 테이블을 관리하는 레포지토리.
 
     코드 생성 이력의 저장 및 조회를 담당하며, 데이터 암호화/복호화를 처리합니다.
     """
 
+    model_cls = GenerationModel
+
     def __init__(self, supabase_service: SupabaseService):
         """GenerationRepository 인스턴스를 초기화합니다."""
         super().__init__("generation_history")
         self.encryption = EncryptionService()
         self.cache_service = CacheService()
 
-    def _create_history_sync(
+    async def _insert_history(
         self,
         user_id: str,
         input_code: str,
@@ -44,12 +98,17 @@ class GenerationRepository(BaseRepository[GenerationModel]):
         language: str,
         model: str,
     ) -> Union[GenerationModel, None]:
-        """생성 이력을 저장합니다 (동기)."""
+        """생성 이력을 암호화하여 DB에 저장합니다."""
         try:
             # 민감 데이터 암호화
             encrypted_input = self.encryption.encrypt(input_code)
             encrypted_output = self.encryption.encrypt(generated_code)
 
+            # 목록 조회 시 본문을 복호화하지 않도록 짧은 미리보기를 별도 컬럼에 저장
+            encrypted_preview = self.encryption.encrypt(
+                input_code.strip()[: APIConstants.HISTORY_PREVIEW_LENGTH]
+            )
+
             entry = GenerationModel(
                 user_id=user_id,
                 input_code=encrypted_input,
@@ -59,11 +118,15 @@ class GenerationRepository(BaseRepository[GenerationModel]):
             )
             # exclude_none=True: DB 기본값(id, created_at) 사용을 위해 None 제외
             data = entry.model_dump(exclude={"id", "created_at"}, exclude_none=True)
+            data["input_preview"] = encrypted_preview
 
-            response = self.client.table(self.table_name).insert(data).execute()
+            response = await run_query(
+                self.supabase, lambda db: db.table(self.table_name).insert(data)
+            )
             if response.data:
                 # 반환 시에는 복호화된 상태로 반환하도록 객체 생성
-                created_model = self.model_cls(**response.data[0])
+                row = {k: v for k, v in response.data[0].items() if k != "input_preview"}
+                created_model = self.model_cls(**row)
                 created_model.input_code = input_code  # 원본 사용
                 created_model.generated_code = generated_code  # 원본 사용
                 return created_model
@@ -95,8 +158,7 @@ class GenerationRepository(BaseRepository[GenerationModel]):
         Returns:
             저장된 GenerationModel 객체 (실패 시 None).
         """
-        result = await run_in_threadpool(
-            self._create_history_sync,
+        result = await self._insert_history(
             user_id,
             input_code,
             generated_code,
@@ -112,93 +174,149 @@ class GenerationRepository(BaseRepository[GenerationModel]):
 
         return result
 
-    def _get_user_history_sync(self, user_id: str, limit: int = 50) -> list[GenerationModel]:
-        """사용자의 생성 이력을 조회합니다 (동기).
+    async def _fetch_history_page(
+        self, user_id: str, limit: int, cursor: Optional[str]
+    ) -> HistoryPage:
+        """(created_at, id) Keyset 기준으로 이력 요약 한 페이지를 DB에서 조회합니다.
+
+        OFFSET 없이 인덱스 (user_id, created_at desc, id desc)를 그대로 타며,
+        본문 컬럼은 가져오지 않고 미리보기만 복호화합니다.
 
-        최신순으로 정렬하여 조회하며, 저장된 코드는 복호화하여 반환합니다.
+        Raises:
+            InvalidCursorError: 커서 형식이 올바르지 않은 경우.
         """
+
+        def build(db):
+            query = db.table(self.table_name).select(_SUMMARY_COLUMNS).eq("user_id", user_id)
+            if after is not None:
+                created_at, history_id = after
+                ts = created_at.isoformat()
+                query = query.or_(
+                    f'created_at.lt."{ts}",and(created_at.eq."{ts}",id.lt.{history_id})'
+                )
+            # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+            return query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1)
+
+        after = decode_cursor(cursor) if cursor else None
         try:
-            response = (
-                self.client.table(self.table_name)
-                .select("*")
-                .eq("user_id", user_id)
-                .order("created_at", desc=True)
-                .limit(limit)
-                .execute()
-            )
+            response = await run_query(self.supabase, build)
+        except Exception as e:
+            logger.error(f"이력 조회 중 오류 발생: {e}")
+            raise
 
-            history_items = []
-            for item in response.data:
+        rows = response.data[:limit]
+        items = []
+        for row in rows:
+            preview = None
+            if row.get("input_preview"):
                 try:
-                    # 데이터 복호화
-                    decrypted_input = self.encryption.decrypt(item["input_code"])
-                    decrypted_output = self.encryption.decrypt(item["generated_code"])
-
-                    history_items.append(
-                        GenerationModel(
-                            id=item["id"],
-                            user_id=item["user_id"],
-                            input_code=decrypted_input,
-                            generated_code=decrypted_output,
-                            language=item["language"],
-                            model=item["model"],
-                            created_at=item["created_at"],
-                        )
-                    )
+                    preview = self.encryption.decrypt(row["input_preview"])
                 except Exception as e:
-                    logger.warning(
-                        f"이력 데이터 복호화 실패 (건너뜀) - history_id: {item.get('id')}, error: {str(e)}"
-                    )
-                    continue
+                    logger.warning(f"이력 미리보기 복호화 실패 - history_id: {row.get('id')}: {e}")
+            items.append(
+                GenerationSummary(
+                    id=row["id"],
+                    language=row["language"],
+                    model=row["model"],
+                    created_at=row["created_at"],
+                    input_preview=preview,
+                )
+            )
 
-            return history_items
+        next_cursor = None
+        if len(response.data) > limit and items:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return HistoryPage(items=items, next_cursor=next_cursor)
 
-        except Exception as e:
-            logger.error(f"이력 조회 중 오류 발생: {e}")
-            raise
-
-    async def get_user_history(self, user_id: str, limit: int = 50) -> list[GenerationModel]:
-        """사용자의 생성 이력을 조회합니다 (비동기, 캐싱 적용).
+    async def get_user_history(
+        self,
+        user_id: str,
+        limit: int = APIConstants.HISTORY_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> HistoryPage:
+        """사용자의 생성 이력 요약을 페이지 단위로 조회합니다 (비동기, 캐싱 적용).
 
         Redis 캐시를 먼저 확인하고, 없으면 DB에서 조회 후 캐싱합니다.
-        캐시 TTL은 1시간(3600초)입니다.
         버전 기반 캐싱을 사용하여 O(1) invalidation을 지원합니다.
 
         Args:
             user_id: 사용자 ID.
-            limit: 조회할 최대 개수 (기본값: 50).
+            limit: 페이지 크기.
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None).
 
         Returns:
-            GenerationModel 객체 리스트.
+            HistoryPage: 이력 요약 목록과 다음 페이지 커서.
+
+        Raises:
+            InvalidCursorError: 커서 형식이 올바르지 않은 경우.
         """
-        version = 0
-        try:
-            v_str = await self.cache_service.get(f"version:history:{user_id}")
-            if v_str:
-                version = int(v_str)
-        except Exception:
-            pass  # 버전 조회 실패 시 0(기본값) 사용
+        if cursor:
+            decode_cursor(cursor)  # 캐시 조회 전에 형식 검증
 
-        cache_key = f"history:{user_id}:v:{version}:limit:{limit}"
+        key_template = f"history:{user_id}:v:{{version}}:cursor:{cursor or 'first'}:limit:{limit}"
 
-        # 1. 캐시 확인
+        # 1. 캐시 확인 (버전 조회와 버전별 키 조회를 한 번의 왕복으로 처리)
+        version: Optional[int] = None
         try:
-            cached_data = await self.cache_service.get(cache_key)
+            version, cached_data = await self.cache_service.get_versioned(
+                f"version:history:{user_id}", key_template
+            )
             if cached_data:
-                data = orjson.loads(cached_data)
-                return [GenerationModel(**item) for item in data]
+                return HistoryPage.model_validate_json(cached_data)
         except Exception as e:
             logger.warning(f"History Cache Get Failed: {e}")
 
-        # 2. DB 조회 (동기 함수를 스레드풀에서 실행)
-        history = await run_in_threadpool(self._get_user_history_sync, user_id, limit)
+        # 2. DB 조회
+        page = await self._fetch_history_page(user_id, limit, cursor)
+
+        # 3. 캐시 저장 (버전을 알 수 없으면 다른 버전의 키를 덮어쓰지 않도록 생략)
+        if version is not None:
+            try:
+                await self.cache_service.set(
+                    key_template.replace("{version}", str(version)),
+                    page.model_dump_json(),
+                    ttl=CacheConstants.HISTORY_CACHE_TTL,
+                )
+            except Exception as e:
+                logger.warning(f"History Cache Set Failed: {e}")
+
+        return page
+
+    async def get_history_item(self, user_id: str, history_id: UUID) -> Optional[GenerationModel]:
+        """이력 한 건의 전체 내용을 복호화하여 조회합니다.
 
-        # 3. 캐시 저장
+        Args:
+            user_id: 사용자 ID (본인 이력만 조회).
+            history_id: 이력 ID.
+
+        Returns:
+            복호화된 GenerationModel (없으면 None).
+        """
         try:
-            # model_dump(mode='json')이 datetime → ISO 문자열로 자동 변환
-            serialized = orjson.dumps([m.model_dump(mode="json") for m in history]).decode("utf-8")
-            await self.cache_service.set(cache_key, serialized, ttl=3600)
+            response = await run_query(
+                self.supabase,
+                lambda db: (
+                    db.table(self.table_name)
+                    .select("id,user_id,input_code,generated_code,language,model,created_at")
+                    .eq("id", str(history_id))
+                    .eq("user_id", user_id)
+                    .maybe_single()
+                ),
+            )
         except Exception as e:
-            logger.warning(f"History Cache Set Failed: {e}")
+            logger.error(f"이력 상세 조회 중 오류 발생: {e}")
+            raise
 
-        return history
+        if response is None or not response.data:
+            return None
+
+        item = response.data
+        return GenerationModel(
+            id=item["id"],
+            user_id=item["user_id"],
+            input_code=self.encryption.decrypt(item["input_code"]),
+            generated_code=self.encryption.decrypt(item["generated_code"]),
+            language=item["language"],
+            model=item["model"],
+            created_at=item["created_at"],
+        )
@@ -2,21 +2,69 @@
 
 캐시 전략별로 TTL을 관리하며, 연결 풀링을 통해 성능을 최적화합니다.
 모든 설정은 불변이며, 예외는 호출자에게 전파됩니다.
+
+큰 값은 zstd(미설치 시 zlib)로 압축하고 첫 바이트에 코덱 헤더를 붙여 저장합니다.
+압축 값은 UTF-8 문자열이 아니므로 값 조회/저장은 decode_responses=False 클라이언트를 사용합니다.
+
+XFetch(확률적 조기 재계산): 재계산 소요 시간(delta)과 함께 저장된 값은 만료가 가까울수록
+높은 확률로 재계산 대상으로 표시되어, 인기 키가 만료 순간 한꺼번에 재생성되지 않습니다.
+
+Redis(L2) 앞단에는 프로세스 내 LRU/TTL 캐시(L1)가 있으며, 쓰기 시 Pub/Sub으로
+다른 레플리카의 L1 항목을 무효화합니다. L1은 무효화 채널을 구독 중일 때만 사용됩니다.
 """
 
+import asyncio
+import fnmatch
 import hashlib
+import math
+import random
 import socket
-from collections.abc import Mapping
+import struct
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Final, Optional
+from typing import Any, Final, NamedTuple, Optional, Union
 
+import orjson
 import redis.asyncio as redis
 from src.config.constants import CacheConstants
 from src.config.settings import settings
 from src.exceptions import CacheError
 from src.types import CacheKey, CacheMetadata, CacheStrategyType
 from src.utils.logger import get_logger
+from src.utils.metrics import CACHE_REQUESTS, CACHE_VALUE_BYTES
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 zlib으로 압축
+    zstandard = None
+
+logger = get_logger(__name__)
+
+# 압축 값 헤더 (첫 바이트). 원문 저장 값은 헤더가 없으며 텍스트는 제어 문자로 시작하지 않음
+_ZLIB_HEADER: Final[int] = 0x01
+_ZSTD_HEADER: Final[int] = 0x02
+# XFetch 메타데이터 헤더: 0x03 + delta(float64) + expiry(float64, unix time) + 값
+_XFETCH_HEADER: Final[int] = 0x03
+_XFETCH_META: Final[struct.Struct] = struct.Struct("!dd")
+
+# 버전 키를 읽고 그 버전으로 조합한 값 키를 한 번의 왕복으로 조회
+# (값 키를 KEYS로 선언하지 않으므로 Redis Cluster에서는 같은 슬롯이어야 함)
+_GET_VERSIONED_SCRIPT = """
+local version = redis.call('GET', KEYS[1]) or '0'
+return {version, redis.call('GET', ARGV[1] .. version .. ARGV[2])}
+"""
+
+# 키가 있을 때만 증가 (INCR은 키가 없으면 0에서 새로 만듦)
+_INCR_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCR', KEYS[1])
+end
+return false
+"""
 
 
 @dataclass(frozen=True)
@@ -24,12 +72,20 @@ class CacheStrategy:
     """캐시 전략을 나타내는 불변 데이터 구조.
 
     Attributes:
-        name: 전략 이름 ('gemini', 'history', 'validation').
+        name: 전략 이름 ('gemini', 'history', 'validation', 'execution').
         ttl: 캐시 유지 시간 (초).
+        jitter: TTL 지터 비율 (0이면 고정 TTL).
     """
 
     name: CacheStrategyType
     ttl: int
+    jitter: float = 0.0
+
+    def jittered_ttl(self) -> int:
+        """지터를 적용한 TTL을 반환합니다 ([ttl * (1 - jitter), ttl] 범위, 최소 1초)."""
+        if self.jitter <= 0:
+            return self.ttl
+        return max(1, round(self.ttl * (1 - random.uniform(0, self.jitter))))
 
     @staticmethod
     def from_name(name: CacheStrategyType) -> "CacheStrategy":
@@ -42,7 +98,8 @@ class CacheStrategy:
             CacheStrategy: 해당 전략의 인스턴스.
         """
         ttl = CacheConstants.TTL_MAPPING.get(name, CacheConstants.DEFAULT_TTL)
-        return CacheStrategy(name=name, ttl=ttl)
+        jitter = CacheConstants.TTL_JITTER_MAPPING.get(name, 0.0)
+        return CacheStrategy(name=name, ttl=ttl, jitter=jitter)
 
 
 class RedisConnectionManager:
@@ -65,9 +122,36 @@ class RedisConnectionManager:
             cls._instance = cls()
         return cls._instance
 
+    _binary_client: Optional[redis.Redis] = None
+
+    @staticmethod
+    def _create_client(redis_url: str, decode_responses: bool) -> redis.Redis:
+        # 플랫폼별 Keepalive 옵션 설정
+        keepalive_options = {}
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            keepalive_options[socket.TCP_KEEPIDLE] = 60
+        elif hasattr(socket, "TCP_KEEPALIVE"):
+            keepalive_options[socket.TCP_KEEPALIVE] = 60
+
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            keepalive_options[socket.TCP_KEEPINTVL] = 10
+
+        if hasattr(socket, "TCP_KEEPCNT"):
+            keepalive_options[socket.TCP_KEEPCNT] = 3
+
+        return redis.from_url(
+            redis_url,
+            decode_responses=decode_responses,
+            max_connections=10,  # 연결 풀 크기 제한
+            socket_keepalive=True,  # TCP Keepalive 활성화
+            socket_keepalive_options=keepalive_options if keepalive_options else None,
+        )
+
     def get_client(self, redis_url: str) -> redis.Redis:
         """Redis 클라이언트(Connection Pool)를 반환합니다.
 
+        응답을 문자열로 디코딩하는(decode_responses=True) 클라이언트입니다.
+
         Args:
             redis_url: Redis 연결 URL.
 
@@ -75,33 +159,32 @@ class RedisConnectionManager:
             Redis 클라이언트 객체.
         """
         if self._client is None:
-            # 플랫폼별 Keepalive 옵션 설정
-            keepalive_options = {}
-            if hasattr(socket, "TCP_KEEPIDLE"):
-                keepalive_options[socket.TCP_KEEPIDLE] = 60
-            elif hasattr(socket, "TCP_KEEPALIVE"):
-                keepalive_options[socket.TCP_KEEPALIVE] = 60
-
-            if hasattr(socket, "TCP_KEEPINTVL"):
-                keepalive_options[socket.TCP_KEEPINTVL] = 10
-
-            if hasattr(socket, "TCP_KEEPCNT"):
-                keepalive_options[socket.TCP_KEEPCNT] = 3
-
-            self._client = redis.from_url(
-                redis_url,
-                decode_responses=True,
-                max_connections=10,  # 연결 풀 크기 제한
-                socket_keepalive=True,  # TCP Keepalive 활성화
-                socket_keepalive_options=keepalive_options if keepalive_options else None,
-            )
+            self._client = self._create_client(redis_url, decode_responses=True)
         return self._client
 
+    def get_binary_client(self, redis_url: str) -> redis.Redis:
+        """응답을 bytes 그대로 반환하는 Redis 클라이언트(Connection Pool)를 반환합니다.
+
+        압축된 캐시 값처럼 UTF-8로 디코딩할 수 없는 값을 다룰 때 사용합니다.
+
+        Args:
+            redis_url: Redis 연결 URL.
+
+        Returns:
+            Redis 클라이언트 객체.
+        """
+        if self._binary_client is None:
+            self._binary_client = self._create_client(redis_url, decode_responses=False)
+        return self._binary_client
+
     async def close(self) -> None:
         """Redis 연결을 종료하고 리소스를 해제합니다."""
         if self._client:
             await self._client.close()
             self._client = None
+        if self._binary_client:
+            await self._binary_client.close()
+            self._binary_client = None
 
 
 # LRU 캐시를 사용한 키 해싱 (성능 최적화)
@@ -121,6 +204,283 @@ def _compute_cache_key(key_input: str) -> str:
     return hashlib.sha256(key_input.encode()).hexdigest()
 
 
+def compress_value(value: str) -> Union[str, bytes]:
+    """캐시 값을 저장 형식으로 변환합니다.
+
+    COMPRESSION_MIN_BYTES 미만이거나 압축 이득이 없으면 원문 문자열을 그대로 반환하고,
+    그 외에는 코덱 헤더 1바이트 + 압축 데이터를 반환합니다.
+
+    Args:
+        value: 저장할 문자열.
+
+    Returns:
+        원문 문자열 또는 헤더가 붙은 압축 bytes.
+    """
+    raw = value.encode()
+    if len(raw) < CacheConstants.COMPRESSION_MIN_BYTES:
+        return value
+
+    if zstandard is not None:
+        codec = "zstd"
+        stored = bytes([_ZSTD_HEADER]) + zstandard.ZstdCompressor(
+            level=CacheConstants.ZSTD_LEVEL
+        ).compress(raw)
+    else:
+        codec = "zlib"
+        stored = bytes([_ZLIB_HEADER]) + zlib.compress(raw, CacheConstants.ZLIB_LEVEL)
+
+    if len(stored) >= len(raw):
+        return value
+    CACHE_VALUE_BYTES.labels(form="raw", codec=codec).inc(len(raw))
+    CACHE_VALUE_BYTES.labels(form="stored", codec=codec).inc(len(stored))
+    return stored
+
+
+def decompress_value(stored: Union[str, bytes, None]) -> Optional[str]:
+    """compress_value로 저장된 값을 원문 문자열로 복원합니다.
+
+    Args:
+        stored: Redis에서 조회한 값.
+
+    Returns:
+        원문 문자열 (없거나 복원할 수 없으면 None).
+    """
+    if stored is None or isinstance(stored, str):
+        return stored
+    if not stored:
+        return ""
+
+    header = stored[0]
+    try:
+        if header == _ZLIB_HEADER:
+            return zlib.decompress(stored[1:]).decode()
+        if header == _ZSTD_HEADER:
+            if zstandard is None:
+                logger.warning("zstd로 압축된 캐시 값을 읽을 수 없습니다 (zstandard 미설치)")
+                return None
+            return zstandard.ZstdDecompressor().decompress(stored[1:]).decode()
+        return stored.decode()
+    except Exception as e:  # zlib.error, zstandard.ZstdError, UnicodeDecodeError
+        logger.warning(f"캐시 값 복원 실패: {e}")
+        return None
+
+
+class CacheEntry(NamedTuple):
+    """조회된 캐시 값과 XFetch 메타데이터.
+
+    Attributes:
+        value: 캐시 값.
+        delta: 값을 다시 계산하는 데 걸린 시간 (초, 메타데이터 없이 저장된 값은 None).
+        expiry: 만료 시각 (unix time, 메타데이터 없이 저장된 값은 None).
+    """
+
+    value: str
+    delta: Optional[float] = None
+    expiry: Optional[float] = None
+
+    def refresh_due(self, beta: float = CacheConstants.XFETCH_BETA) -> bool:
+        """XFetch 조기 재계산 여부를 판단합니다.
+
+        `now - delta * beta * ln(rand) >= expiry`이면 재계산합니다. 재계산 비용(delta)이
+        클수록, 만료가 가까울수록 확률이 높아집니다.
+        """
+        if self.delta is None or self.expiry is None:
+            return False
+        return time.time() - self.delta * beta * math.log(1.0 - random.random()) >= self.expiry
+
+
+def encode_entry(value: str, delta: float, expiry: float) -> bytes:
+    """값을 XFetch 메타데이터 헤더와 함께 저장 형식으로 변환합니다."""
+    stored = compress_value(value)
+    if isinstance(stored, str):
+        stored = stored.encode()
+    return bytes([_XFETCH_HEADER]) + _XFETCH_META.pack(delta, expiry) + stored
+
+
+def decode_entry(stored: Union[str, bytes, None]) -> Optional[CacheEntry]:
+    """Redis에서 조회한 값을 CacheEntry로 복원합니다 (없거나 복원할 수 없으면 None)."""
+    if isinstance(stored, bytes) and stored[:1] == bytes([_XFETCH_HEADER]):
+        meta_end = 1 + _XFETCH_META.size
+        if len(stored) < meta_end:
+            logger.warning("XFetch 메타데이터가 손상된 캐시 값입니다")
+            return None
+        delta, expiry = _XFETCH_META.unpack(stored[1:meta_end])
+        value = decompress_value(stored[meta_end:])
+        return None if value is None else CacheEntry(value, delta, expiry)
+
+    value = decompress_value(stored)
+    return None if value is None else CacheEntry(value)
+
+
+def _parse_version(value: str) -> int:
+    """버전 카운터 값을 정수로 변환합니다 (손상된 값은 0)."""
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+class LocalCache:
+    """프로세스 내 LRU/TTL 캐시 (L1).
+
+    항목 수가 maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 방출합니다.
+    무효화가 일어날 때마다 epoch가 증가하며, Redis 조회 전에 읽어 둔 epoch가
+    바뀌었다면 조회 결과를 저장하지 않아 무효화 직전의 값이 되살아나지 않습니다.
+
+    Attributes:
+        active: 무효화 채널 구독 중 여부. False면 조회/저장을 하지 않습니다.
+        epoch: 무효화 발생 횟수.
+    """
+
+    def __init__(self, maxsize: int = CacheConstants.L1_MAX_ENTRIES):
+        """LocalCache 인스턴스를 초기화합니다.
+
+        Args:
+            maxsize: 최대 항목 수.
+        """
+        self.maxsize = maxsize
+        self.active = False
+        self.epoch = 0
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Any]:
+        """만료되지 않은 값을 반환합니다 (없으면 None)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any, ttl: float, epoch: int) -> None:
+        """값을 저장합니다. epoch 이후 무효화가 있었거나 비활성 상태면 무시합니다.
+
+        Args:
+            key: 캐시 키.
+            value: 저장할 값.
+            ttl: 유지 시간 (초).
+            epoch: 원본(Redis) 조회 직전에 읽은 epoch.
+        """
+        if not self.active or epoch != self.epoch:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """단일 키를 제거합니다."""
+        self.epoch += 1
+        self._data.pop(key, None)
+
+    def invalidate_pattern(self, pattern: str) -> None:
+        """glob 패턴에 맞는 키를 제거합니다."""
+        self.epoch += 1
+        for key in [k for k in self._data if fnmatch.fnmatchcase(k, pattern)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        self.epoch += 1
+        self._data.clear()
+
+
+class CacheInvalidationListener:
+    """L1 캐시 무효화 채널을 구독하는 백그라운드 작업.
+
+    구독이 확인된 뒤에만 L1을 활성화하고, 연결이 끊기면 메시지 유실 가능성이 있으므로
+    L1을 비우고 비활성화한 뒤 재구독합니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        local_cache: Optional[LocalCache] = None,
+        channel: str = CacheConstants.L1_INVALIDATION_CHANNEL,
+    ):
+        """CacheInvalidationListener 인스턴스를 초기화합니다.
+
+        Args:
+            redis_client: Redis 클라이언트.
+            local_cache: 무효화할 L1 캐시 (기본값: CacheService 공용 L1).
+            channel: 무효화 Pub/Sub 채널.
+        """
+        self.redis_client = redis_client
+        self.local_cache = local_cache if local_cache is not None else CacheService.local_cache
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """구독 작업을 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """구독 작업을 중지하고 L1을 비활성화합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._deactivate()
+
+    def _deactivate(self) -> None:
+        self.local_cache.active = False
+        self.local_cache.clear()
+
+    def apply(self, data: str) -> None:
+        """무효화 메시지를 L1에 적용합니다.
+
+        Args:
+            data: {"k": 키}, {"ks": 키 목록} 또는 {"p": glob 패턴} 형태의 JSON 문자열.
+        """
+        try:
+            message = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.warning(f"잘못된 L1 무효화 메시지: {data!r}")
+            self.local_cache.clear()
+            return
+
+        if "k" in message:
+            self.local_cache.invalidate(message["k"])
+        elif "ks" in message:
+            for key in message["ks"]:
+                self.local_cache.invalidate(key)
+        elif "p" in message:
+            self.local_cache.invalidate_pattern(message["p"])
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        self.local_cache.clear()
+                        self.local_cache.active = True
+                    elif message["type"] == "message":
+                        self.apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"L1 캐시 무효화 구독이 끊어졌습니다: {e}")
+            finally:
+                self._deactivate()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(CacheConstants.L1_RESUBSCRIBE_DELAY)
+
+
 class CacheService:
     """Redis 기반 캐싱 서비스.
 
@@ -131,6 +491,9 @@ class CacheService:
     _TTL_MAPPING: Final[Mapping[str, int]] = CacheConstants.TTL_MAPPING
     """캐시 전략별 TTL 매핑 (불변)"""
 
+    local_cache: LocalCache = LocalCache()
+    """프로세스 공용 L1 캐시 (CacheInvalidationListener가 구독 중일 때만 활성)"""
+
     def __init__(self, redis_url: str = settings.REDIS_URL, ttl: int = CacheConstants.DEFAULT_TTL):
         """CacheService 인스턴스를 초기화합니다.
 
@@ -146,6 +509,93 @@ class CacheService:
 
         manager = RedisConnectionManager.get_instance()
         self.redis_client: Final[redis.Redis] = manager.get_client(redis_url)
+        # 압축 값을 bytes 그대로 주고받기 위한 클라이언트 (get/set 전용)
+        self.binary_client: Final[redis.Redis] = manager.get_binary_client(redis_url)
+
+    def _l1_ttl(self, key: str) -> int:
+        """키 접두사(전략)에 따른 L1 유지 시간을 반환합니다.
+
+        `history:...`, `version:history:...`처럼 전략명으로 시작하는 키는 해당 전략의
+        TTL을, 그 외에는 기본 TTL을 사용하며 CacheConstants.L1_MAX_TTL을 넘지 않습니다.
+        """
+        strategy, _, rest = key.partition(":")
+        if strategy == "version":
+            strategy = rest.partition(":")[0]
+        ttl = self._TTL_MAPPING.get(strategy, self.default_ttl)
+        return min(ttl, CacheConstants.L1_MAX_TTL)
+
+    async def _invalidate(
+        self,
+        key: Optional[str] = None,
+        pattern: Optional[str] = None,
+        keys: Optional[Sequence[str]] = None,
+    ) -> None:
+        """로컬 L1 항목을 제거하고 다른 레플리카에 무효화 메시지를 발행합니다.
+
+        발행 실패는 경고만 남깁니다 (다른 레플리카는 최대 L1_MAX_TTL 동안 이전 값을 볼 수 있음).
+        """
+        if key is not None:
+            self.local_cache.invalidate(key)
+            payload = {"k": key}
+        elif keys is not None:
+            for k in keys:
+                self.local_cache.invalidate(k)
+            payload = {"ks": list(keys)}
+        else:
+            self.local_cache.invalidate_pattern(pattern)
+            payload = {"p": pattern}
+
+        if not settings.CACHE_L1_ENABLED:
+            return
+        try:
+            await self.redis_client.publish(
+                CacheConstants.L1_INVALIDATION_CHANNEL, orjson.dumps(payload).decode()
+            )
+        except redis.RedisError as e:
+            self.logger.warning(f"L1 캐시 무효화 발행 실패: {e}")
+
+    def _l1_enabled(self) -> bool:
+        return settings.CACHE_L1_ENABLED and self.local_cache.active
+
+    def _l1_get(self, key: str) -> Optional[CacheEntry]:
+        """L1에서 항목을 조회하고 적중 여부를 기록합니다."""
+        entry = self.local_cache.get(key)
+        CACHE_REQUESTS.labels(tier="l1", result="miss" if entry is None else "hit").inc()
+        return entry
+
+    def _l1_fill(self, key: str, entry: Optional[CacheEntry], epoch: int) -> None:
+        """Redis에서 조회한 항목을 기록하고 L1에 채웁니다 (너무 큰 값 제외)."""
+        CACHE_REQUESTS.labels(tier="l2", result="miss" if entry is None else "hit").inc()
+        if entry is not None and len(entry.value) <= CacheConstants.L1_MAX_VALUE_BYTES:
+            self.local_cache.put(key, entry, self._l1_ttl(key), epoch)
+
+    async def _lookup(self, key: str) -> Optional[CacheEntry]:
+        """L1(프로세스 내)을 먼저 확인하고, 없으면 Redis에서 조회한 뒤 L1에 채웁니다.
+
+        Raises:
+            CacheError: Redis 조회 실패 시.
+        """
+        epoch = self.local_cache.epoch
+        use_l1 = self._l1_enabled()
+        if use_l1:
+            entry = self._l1_get(key)
+            if entry is not None:
+                return entry
+
+        try:
+            entry = decode_entry(await self.binary_client.get(key))
+        except redis.RedisError as e:
+            raise CacheError(
+                message="캐시 조회 실패",
+                operation="get",
+                key=key,
+            ) from e
+
+        if use_l1:
+            self._l1_fill(key, entry, epoch)
+        else:
+            CACHE_REQUESTS.labels(tier="l2", result="miss" if entry is None else "hit").inc()
+        return entry
 
     async def get(self, key: str) -> Optional[str]:
         """캐시에서 값을 조회합니다.
@@ -159,36 +609,250 @@ class CacheService:
         Raises:
             CacheError: Redis 조회 실패 시.
         """
+        entry = await self._lookup(key)
+        return entry.value if entry is not None else None
+
+    async def get_with_refresh(
+        self, key: str, beta: float = CacheConstants.XFETCH_BETA
+    ) -> tuple[Optional[str], bool]:
+        """캐시 값과 XFetch 조기 재계산 여부를 함께 조회합니다.
+
+        재계산 여부가 True여도 값은 그대로 유효하므로 호출자는 값을 먼저 반환하고,
+        try_lock으로 재계산을 하나만 시작해야 합니다.
+
+        Args:
+            key: 캐시 키.
+            beta: 조기 재계산 강도.
+
+        Returns:
+            (캐시된 값 또는 None, 조기 재계산 필요 여부) 튜플.
+
+        Raises:
+            CacheError: Redis 조회 실패 시.
+        """
+        entry = await self._lookup(key)
+        if entry is None:
+            return None, False
+        return entry.value, entry.refresh_due(beta)
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[str]]:
+        """여러 키를 한 번의 왕복(MGET)으로 조회합니다.
+
+        L1에 있는 키는 Redis에 요청하지 않습니다.
+
+        Args:
+            keys: 캐시 키 목록.
+
+        Returns:
+            keys와 같은 순서의 값 목록 (미스는 None).
+
+        Raises:
+            CacheError: Redis 조회 실패 시.
+        """
+        entries: list[Optional[CacheEntry]] = [None] * len(keys)
+        epoch = self.local_cache.epoch
+        use_l1 = self._l1_enabled()
+        if use_l1:
+            missing = []
+            for i, key in enumerate(keys):
+                entries[i] = self._l1_get(key)
+                if entries[i] is None:
+                    missing.append(i)
+        else:
+            missing = list(range(len(keys)))
+
+        if missing:
+            try:
+                stored_values = await self.binary_client.mget([keys[i] for i in missing])
+            except redis.RedisError as e:
+                raise CacheError(message="캐시 다중 조회 실패", operation="get_many") from e
+
+            for i, stored in zip(missing, stored_values):
+                entries[i] = decode_entry(stored)
+                if use_l1:
+                    self._l1_fill(keys[i], entries[i], epoch)
+                else:
+                    CACHE_REQUESTS.labels(
+                        tier="l2", result="miss" if entries[i] is None else "hit"
+                    ).inc()
+
+        return [entry.value if entry is not None else None for entry in entries]
+
+    async def get_versioned(self, version_key: str, key_template: str) -> tuple[int, Optional[str]]:
+        """버전 키를 읽고, 그 버전으로 만든 키의 값을 한 번의 왕복으로 조회합니다.
+
+        버전 기반 무효화(버전 INCR)를 쓰는 캐시에서 "버전 조회 → 값 조회"를 Lua 스크립트
+        하나로 처리합니다. 버전 키가 L1에 있으면 값만 조회합니다.
+
+        Args:
+            version_key: 버전 카운터 키 (없으면 버전 0).
+            key_template: `{version}` 자리표시자를 포함한 값 키 (예: `history:u1:v:{version}`).
+
+        Returns:
+            (버전, 값 또는 None) 튜플.
+
+        Raises:
+            ValueError: key_template에 `{version}`이 없는 경우.
+            CacheError: Redis 조회 실패 시.
+        """
+        prefix, placeholder, suffix = key_template.partition("{version}")
+        if not placeholder:
+            raise ValueError(f"key_template에 {{version}}이 없습니다: {key_template}")
+
+        epoch = self.local_cache.epoch
+        use_l1 = self._l1_enabled()
+        if use_l1:
+            version_entry = self._l1_get(version_key)
+            if version_entry is not None:
+                version = _parse_version(version_entry.value)
+                return version, await self.get(f"{prefix}{version}{suffix}")
+
         try:
-            return await self.redis_client.get(key)
+            raw_version, stored = await self.binary_client.eval(
+                _GET_VERSIONED_SCRIPT, 1, version_key, prefix, suffix
+            )
         except redis.RedisError as e:
             raise CacheError(
-                message="캐시 조회 실패",
-                operation="get",
-                key=key,
+                message="버전 캐시 조회 실패",
+                operation="get_versioned",
+                key=version_key,
             ) from e
 
-    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        version_value = decompress_value(raw_version) or "0"
+        version = _parse_version(version_value)
+        entry = decode_entry(stored)
+        if use_l1:
+            self._l1_fill(version_key, CacheEntry(version_value), epoch)
+            self._l1_fill(f"{prefix}{version}{suffix}", entry, epoch)
+        else:
+            CACHE_REQUESTS.labels(tier="l2", result="miss" if entry is None else "hit").inc()
+        return version, entry.value if entry is not None else None
+
+    async def set(
+        self, key: str, value: str, ttl: Optional[int] = None, delta: Optional[float] = None
+    ) -> None:
         """캐시에 값을 저장합니다.
 
+        COMPRESSION_MIN_BYTES 이상인 값은 압축하여 저장합니다.
+
         Args:
             key: 캐시 키.
             value: 저장할 값.
             ttl: TTL (초), None일 경우 기본값 사용.
+            delta: 값을 계산하는 데 걸린 시간 (초). 지정하면 XFetch 메타데이터를 함께 저장하여
+                get_with_refresh가 만료 전에 조기 재계산을 알릴 수 있습니다.
 
         Raises:
             CacheError: Redis 저장 실패 시.
         """
         effective_ttl = ttl if ttl is not None else self.default_ttl
+        if delta is not None:
+            stored = encode_entry(value, delta, time.time() + effective_ttl)
+        else:
+            stored = compress_value(value)
 
         try:
-            await self.redis_client.setex(key, effective_ttl, value)
+            await self.binary_client.setex(key, effective_ttl, stored)
         except redis.RedisError as e:
             raise CacheError(
                 message="캐시 저장 실패",
                 operation="set",
                 key=key,
             ) from e
+        await self._invalidate(key=key)
+
+    async def set_many(self, items: Mapping[str, str], ttl: Optional[int] = None) -> None:
+        """여러 값을 하나의 파이프라인으로 저장합니다 (같은 TTL 적용).
+
+        Args:
+            items: 키 → 값 매핑.
+            ttl: TTL (초), None일 경우 기본값 사용.
+
+        Raises:
+            CacheError: Redis 저장 실패 시.
+        """
+        if not items:
+            return
+        effective_ttl = ttl if ttl is not None else self.default_ttl
+
+        try:
+            async with self.binary_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, effective_ttl, compress_value(value))
+                await pipe.execute()
+        except redis.RedisError as e:
+            raise CacheError(message="캐시 다중 저장 실패", operation="set_many") from e
+        await self._invalidate(keys=list(items))
+
+    def pipeline(self, transaction: bool = False) -> "redis.client.Pipeline":
+        """여러 명령을 한 번의 왕복으로 보내는 파이프라인을 반환합니다.
+
+        문자열 응답 클라이언트 기반이며, transaction=True면 MULTI/EXEC로 원자적으로 실행됩니다.
+        값 압축과 L1 무효화는 적용되지 않으므로 get/set으로 다루는 캐시 값이 아닌
+        카운터, 락 등 보조 키에 사용하세요.
+
+        Example:
+            >>> async with cache.pipeline() as pipe:
+            ...     pipe.incr("a").expire("a", 60)
+            ...     await pipe.execute()
+        """
+        return self.redis_client.pipeline(transaction=transaction)
+
+    async def try_lock(self, key: str, ttl: int) -> bool:
+        """키 단위 락 획득을 시도합니다 (SET NX EX).
+
+        Args:
+            key: 락 키.
+            ttl: 락 유지 시간 (초). 보유자가 해제하지 못해도 이 시간 뒤 만료됩니다.
+
+        Returns:
+            획득 여부.
+
+        Raises:
+            CacheError: Redis 명령 실패 시.
+        """
+        try:
+            return bool(await self.redis_client.set(key, "1", nx=True, ex=ttl))
+        except redis.RedisError as e:
+            raise CacheError(
+                message="락 획득 실패",
+                operation="try_lock",
+                key=key,
+            ) from e
+
+    async def unlock(self, key: str) -> None:
+        """try_lock으로 획득한 락을 해제합니다.
+
+        Raises:
+            CacheError: Redis 명령 실패 시.
+        """
+        try:
+            await self.redis_client.delete(key)
+        except redis.RedisError as e:
+            raise CacheError(
+                message="락 해제 실패",
+                operation="unlock",
+                key=key,
+            ) from e
+
+    async def delete(self, key: str) -> None:
+        """캐시 키를 삭제합니다.
+
+        Args:
+            key: 캐시 키.
+
+        Raises:
+            CacheError: Redis 명령 실패 시.
+        """
+        try:
+            await self.redis_client.delete(key)
+        except redis.RedisError as e:
+            raise CacheError(
+                message="캐시 삭제 실패",
+                operation="delete",
+                key=key,
+            ) from e
+        await self._invalidate(key=key)
 
     async def incr(self, key: str) -> int:
         """캐시 키의 값을 1 증가시킵니다.
@@ -203,34 +867,102 @@ class CacheService:
             CacheError: Redis 증가 실패 시.
         """
         try:
-            return await self.redis_client.incr(key)
+            value = await self.redis_client.incr(key)
         except redis.RedisError as e:
             raise CacheError(
                 message="캐시 증가 실패",
                 operation="incr",
                 key=key,
             ) from e
+        await self._invalidate(key=key)
+        return value
+
+    async def incr_if_exists(self, key: str) -> Optional[int]:
+        """키가 있을 때만 값을 1 증가시킵니다 (원자적).
+
+        만료된 카운터를 0부터 새로 만들지 않아, 다음 조회 시 원본에서 다시 채우게 합니다.
+
+        Args:
+            key: 캐시 키.
+
+        Returns:
+            증가된 값 (키가 없으면 None).
+
+        Raises:
+            CacheError: Redis 증가 실패 시.
+        """
+        try:
+            value = await self.redis_client.eval(_INCR_IF_EXISTS_SCRIPT, 1, key)
+        except redis.RedisError as e:
+            raise CacheError(
+                message="캐시 증가 실패",
+                operation="incr_if_exists",
+                key=key,
+            ) from e
+        if value is not None:
+            await self._invalidate(key=key)
+        return value
 
-    async def clear(self, pattern: str = "*") -> None:
+    async def clear(
+        self,
+        pattern: str = "*",
+        batch_size: int = CacheConstants.CLEAR_SCAN_BATCH,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
         """패턴에 맞는 캐시 키를 삭제합니다.
 
-        주의: 프로덕션 환경에서는 신중히 사용해야 합니다.
+        KEYS 대신 SCAN으로 batch_size 단위씩 순회하고 UNLINK(백그라운드 메모리 해제)로
+        삭제하므로 Redis를 장시간 블로킹하지 않습니다. 각 배치의 UNLINK와 다음 SCAN은
+        하나의 파이프라인으로 전송됩니다.
+
+        주의: 프로덕션 환경에서는 신중히 사용해야 합니다. SCAN 도중 생성/삭제된 키는
+        포함되지 않을 수 있습니다.
 
         Args:
             pattern: 삭제할 키 패턴 (glob 스타일).
+            batch_size: SCAN COUNT 힌트.
+            on_progress: 배치마다 (순회한 키 수, 삭제된 키 수)로 호출되는 콜백.
+
+        Returns:
+            삭제된 키 수.
 
         Raises:
             CacheError: Redis 삭제 실패 시.
         """
+        cursor = 0
+        scanned = deleted = 0
+        pending: list[str] = []
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                await self.redis_client.delete(*keys)
+            while True:
+                async with self.pipeline() as pipe:
+                    if pending:
+                        pipe.unlink(*pending)
+                    pipe.scan(cursor, match=pattern, count=batch_size)
+                    results = await pipe.execute()
+
+                if pending:
+                    deleted += results[0]
+                    if on_progress is not None:
+                        on_progress(scanned, deleted)
+                cursor, pending = results[-1]
+                scanned += len(pending)
+
+                if cursor == 0:
+                    if pending:
+                        deleted += await self.redis_client.unlink(*pending)
+                        if on_progress is not None:
+                            on_progress(scanned, deleted)
+                    break
         except redis.RedisError as e:
             raise CacheError(
-                message=f"캐시 클리어 실패: {pattern}",
+                message=f"캐시 클리어 실패: {pattern} ({deleted}개 삭제 후 중단)",
                 operation="clear",
             ) from e
+        finally:
+            await self._invalidate(pattern=pattern)
+
+        self.logger.info_ctx("캐시 클리어 완료", pattern=pattern, deleted=deleted)
+        return deleted
 
     async def ping(self) -> bool:
         """Redis 서버 연결 상태를 확인합니다.
@@ -256,9 +988,12 @@ class CacheService:
     ) -> CacheMetadata:
         """캐시 키와 TTL을 생성합니다.
 
+        TTL에는 전략별 지터(TTL_JITTER_MAPPING)가 적용되어, 같은 시점에 저장된 항목들이
+        동시에 만료되지 않습니다.
+
         Args:
             *args: 키 생성에 사용할 인자들.
-            strategy: 캐시 전략 ('gemini', 'history', 'validation').
+            strategy: 캐시 전략 ('gemini', 'history', 'validation', 'execution').
 
         Returns:
             CacheMetadata: 생성된 캐시 키와 TTL을 포함한 메타데이터.
@@ -266,8 +1001,8 @@ class CacheService:
         Example:
             >>> service = CacheService()
             >>> metadata = service.generate_key("model", "code", strategy="gemini")
-            >>> metadata.ttl
-            7200
+            >>> metadata.ttl  # GEMINI_CACHE_TTL(7200)에서 최대 10% 지터 적용
+            6843
         """
         cache_strategy = CacheStrategy.from_name(strategy)
         key_input = f"{cache_strategy.name}:" + ":".join(str(arg) for arg in args)
@@ -277,5 +1012,5 @@ class CacheService:
 
         return CacheMetadata(
             key=CacheKey(hashed_key),
-            ttl=cache_strategy.ttl,
+            ttl=cache_strategy.jittered_ttl(),
         )
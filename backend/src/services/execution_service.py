@@ -1,8 +1,13 @@
 import os
+import time
 from typing import Any, Optional
 
 import httpx
+import orjson
+from src.config.constants import CacheConstants
 from src.config.settings import settings
+from src.exceptions import CacheError
+from src.services.cache_service import CacheService
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,10 +18,13 @@ class ExecutionService:
 
     안전한 샌드박스 Docker 환경을 갖춘 워커 VM으로 실행 요청을 프록시합니다.
     모든 요청에 대해 단일 httpx.AsyncClient 인스턴스를 재사용하여 성능을 최적화합니다.
+    동일한 (소스, 테스트, 언어, sandbox 이미지 digest) 요청은 Redis에 캐시된 결과를 반환합니다.
     """
 
     _instance: Optional["ExecutionService"] = None
     _client: Optional[httpx.AsyncClient] = None
+    _image_digest: Optional[str] = None
+    _image_digest_fetched_at: Optional[float] = None
 
     def __new__(cls) -> "ExecutionService":
         """Singleton 인스턴스를 반환합니다."""
@@ -41,6 +49,7 @@ class ExecutionService:
         # HTTP 클라이언트 초기화 (Connection Pooling, Keep-Alive)
         # 타임아웃 60초 설정
         self._client = httpx.AsyncClient(timeout=60.0)
+        self.cache = CacheService()
 
         if not self.worker_token:
             logger.warning(
@@ -60,9 +69,50 @@ class ExecutionService:
             self._client = httpx.AsyncClient(timeout=60.0)
         return self._client
 
+    def _auth_headers(self) -> dict[str, str]:
+        """Worker 인증 헤더를 반환합니다."""
+        if self.worker_token:
+            return {"Authorization": f"Bearer {self.worker_token}"}
+        return {}
+
+    async def _get_image_digest(self) -> Optional[str]:
+        """Worker sandbox 이미지 digest를 조회합니다.
+
+        Worker의 /health 응답을 IMAGE_DIGEST_REFRESH_SECONDS 동안 로컬에 보관합니다.
+        조회에 실패하면 None을 반환하며, 이 경우 실행 결과를 캐시하지 않습니다.
+        실패 결과도 IMAGE_DIGEST_RETRY_SECONDS 동안 보관하여, Worker 장애 중에 실행 요청마다
+        /health를 다시 호출하지 않습니다.
+
+        Returns:
+            이미지 digest 문자열 또는 None.
+        """
+        now = time.monotonic()
+        if self._image_digest_fetched_at is not None:
+            max_age = (
+                CacheConstants.IMAGE_DIGEST_REFRESH_SECONDS
+                if self._image_digest
+                else CacheConstants.IMAGE_DIGEST_RETRY_SECONDS
+            )
+            if now - self._image_digest_fetched_at < max_age:
+                return self._image_digest
+
+        try:
+            response = await self.client.get(f"{self.worker_url}/health", timeout=5.0)
+            digest = response.json().get("image_digest") if response.status_code == 200 else None
+        except Exception as e:
+            logger.warning(f"Worker 이미지 digest 조회 실패: {e}")
+            digest = None
+
+        self._image_digest = digest
+        self._image_digest_fetched_at = now
+        return digest
+
     async def execute_code(self, input_code: str, test_code: str, language: str) -> dict[str, Any]:
         """Worker VM에 코드와 테스트 실행을 요청합니다.
 
+        동일한 요청의 실행 결과가 캐시되어 있으면 컨테이너를 기동하지 않고 즉시 반환합니다
+        (이 경우 결과에 cached=True가 포함됩니다).
+
         Args:
             input_code: 테스트 대상 소스 코드.
             test_code: 검증용 테스트 코드.
@@ -74,6 +124,84 @@ class ExecutionService:
         Raises:
             InfrastructureError: Worker 연결 실패 또는 실행 오류 시.
         """
+        # 1. 실행 결과 캐시 확인 (이미지 digest를 알 수 없으면 캐시 사용 안 함)
+        cache_key: Optional[str] = None
+        cache_ttl = CacheConstants.EXECUTION_CACHE_TTL
+        image_digest = await self._get_image_digest()
+        if image_digest:
+            metadata = self.cache.generate_key(
+                image_digest,
+                language,
+                str(len(input_code)),  # 소스/테스트 경계를 키에 고정
+                input_code,
+                test_code,
+                strategy="execution",
+            )
+            cache_key, cache_ttl = metadata.key, metadata.ttl
+            try:
+                cached = await self.cache.get(cache_key)
+                if cached:
+                    logger.info_ctx("캐시된 실행 결과 반환", key=cache_key[:16])
+                    return {**orjson.loads(cached), "cached": True}
+            except CacheError as e:
+                logger.warning(f"Execution Cache Get Failed: {e}")
+
+        result = await self._request_execution(input_code, test_code, language)
+
+        # 2. 결정적인 결과(pytest가 정상 종료)만 캐시
+        if cache_key and self._is_cacheable(result):
+            try:
+                await self.cache.set(cache_key, orjson.dumps(result).decode("utf-8"), ttl=cache_ttl)
+            except CacheError as e:
+                logger.warning(f"Execution Cache Set Failed: {e}")
+
+        return result
+
+    async def prepare(self, input_code: str, language: str) -> dict[str, Any]:
+        """실행 요청 전에 Worker에서 소스 코드 보안 검사와 sandbox 예열을 수행합니다.
+
+        테스트 코드를 생성하는 동안 미리 호출하여, 생성 직후의 실행이 컨테이너 기동을
+        기다리지 않고 보안 위반 코드는 실행 요청 없이 바로 거절할 수 있게 합니다.
+        준비는 최적화일 뿐이므로 실패해도 예외 없이 빈 결과를 반환합니다.
+
+        Args:
+            input_code: 곧 실행할 소스 코드.
+            language: 프로그래밍 언어.
+
+        Returns:
+            Worker 준비 결과 (safe, error, warmed). 준비에 실패하면 빈 딕셔너리.
+        """
+        try:
+            response = await self.client.post(
+                f"{self.worker_url}/prepare",
+                json={"input_code": input_code, "language": language},
+                headers=self._auth_headers(),
+                timeout=5.0,
+            )
+            if response.status_code == 200:
+                return response.json()
+            logger.warning(f"Worker 실행 준비 실패: {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Worker 실행 준비 요청 실패: {e}")
+        return {}
+
+    @staticmethod
+    def _is_cacheable(result: dict[str, Any]) -> bool:
+        """실행 결과를 캐시해도 되는지 판단합니다.
+
+        Worker가 종료 코드를 반환한 경우(pytest가 실제로 끝까지 실행됨)만 캐시하며,
+        타임아웃/강제 종료처럼 부하에 따라 달라질 수 있는 결과는 제외합니다.
+        """
+        exit_code = result.get("exit_code")
+        return (
+            isinstance(exit_code, int)
+            and exit_code not in CacheConstants.EXECUTION_UNCACHEABLE_EXIT_CODES
+        )
+
+    async def _request_execution(
+        self, input_code: str, test_code: str, language: str
+    ) -> dict[str, Any]:
+        """Worker /execute 엔드포인트를 호출하고 응답을 결과 딕셔너리로 변환합니다."""
         try:
             is_token_loaded = bool(self.worker_token)
             logger.info_ctx(
@@ -83,15 +211,11 @@ class ExecutionService:
                 auth_loaded=is_token_loaded,
             )
 
-            headers = {}
-            if self.worker_token:
-                headers["Authorization"] = f"Bearer {self.worker_token}"
-
             # 재사용 가능한 클라이언트 사용 (Connection Reuse)
             response = await self.client.post(
                 f"{self.worker_url}/execute",
                 json={"input_code": input_code, "test_code": test_code, "language": language},
-                headers=headers,
+                headers=self._auth_headers(),
             )
 
             if response.status_code == 200:
@@ -103,6 +227,16 @@ class ExecutionService:
                     "error": "실행 서버 인증에 실패했습니다",
                     "output": "",
                 }
+            elif response.status_code == 429:
+                # 워커 실행 대기열 포화: 컨테이너를 기동하지 않고 즉시 거절됨
+                retry_after = response.headers.get("Retry-After", "")
+                logger.warning_ctx("Worker 실행 대기열 포화", retry_after=retry_after)
+                return {
+                    "success": False,
+                    "error": "실행 요청이 많아 잠시 후 다시 시도해주세요",
+                    "output": "",
+                    "retry_after": int(retry_after) if retry_after.isdigit() else None,
+                }
             else:
                 error_msg = f"Worker API 오류: {response.status_code} - {response.text}"
                 logger.error(error_msg)
@@ -4,17 +4,20 @@ Google Gemini API를 활용하여 소스 코드에 대한 테스트 코드를 
 Redis 캐싱과 재시도 로직을 통해 안정성과 성능을 보장합니다.
 """
 
+import asyncio
+import time
 from collections.abc import AsyncGenerator
-from typing import Final, Optional
+from typing import Any, ClassVar, Final, Optional
 
 import google.generativeai as genai
-from src.config.constants import AIConstants
+from src.config.constants import AIConstants, CacheConstants
 from src.config.settings import settings
 from src.exceptions import GenerationError
 from src.services.cache_service import CacheService
-from src.types import CacheStrategyType, ModelName
+from src.services.single_flight import SingleFlight
+from src.types import CacheMetadata, CacheStrategyType, ModelName
 from src.utils.logger import get_logger
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from src.utils.metrics import GEMINI_CACHE_REQUESTS, GEMINI_UPSTREAM_CANCELLATIONS
 
 
 class GeminiService:
@@ -24,12 +27,17 @@ class GeminiService:
         - 스트리밍 응답 지원
         - 자동 재시도 (최대 3회)
         - Redis 캐싱
+        - 동일 요청 병합 (진행 중인 생성 스트림을 여러 요청이 공유)
+        - 인기 캐시 항목의 만료 전 백그라운드 재생성 (XFetch, 키당 하나만 실행)
         - 재생성 시 창의성(temperature) 자동 조정
     """
 
     _DEFAULT_MODEL: Final[ModelName] = "gemini-2.0-flash-exp"
     """기본 Gemini 모델"""
 
+    _refresh_tasks: ClassVar[set[asyncio.Task]] = set()
+    """진행 중인 백그라운드 재생성 태스크 (GC로 취소되지 않도록 참조 유지)"""
+
     def __init__(self, model_name: Optional[str] = None) -> None:
         """GeminiService 인스턴스를 초기화합니다.
 
@@ -42,6 +50,7 @@ class GeminiService:
         self.logger = get_logger(__name__)
         self.model_name: Final[str] = model_name or settings.DEFAULT_GEMINI_MODEL
         self.cache: Final[CacheService] = CacheService()
+        self.single_flight: Final[SingleFlight] = SingleFlight(self.cache.redis_client)
 
     def _get_model(
         self, model_name: str, system_instruction: Optional[str] = None
@@ -60,21 +69,20 @@ class GeminiService:
             system_instruction=system_instruction,
         )
 
-    @retry(
-        stop=stop_after_attempt(AIConstants.MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
-    )
     async def generate_test_code(
         self,
         source_code: str,
         system_instruction: Optional[str] = None,
         stream: bool = True,
         is_regenerate: bool = False,
+        cache_source: Optional[str] = None,
+        offset: int = 0,
     ) -> AsyncGenerator[str, None]:
         """테스트 코드를 생성합니다.
 
         캐시된 결과가 있으면 반환하고, 없으면 AI API를 호출하여 생성합니다.
+        같은 입력으로 진행 중인 생성이 있으면 새로 호출하지 않고 그 스트림에 합류합니다
+        (재생성 요청은 매번 새 응답이 필요하므로 병합하지 않음).
         스트리밍 방식을 지원합니다.
 
         Args:
@@ -82,6 +90,11 @@ class GeminiService:
             system_instruction: 언어별 시스템 프롬프트.
             stream: 스트리밍 여부 (현재는 항상 True 가정).
             is_regenerate: 재생성 요청 여부 (True면 캐시 무시 및 창의성 증가).
+            cache_source: 캐시 키에 사용할 정규화된 코드
+                (`LanguageStrategy.normalize_for_cache`). 없으면 원본 코드로 키를 생성.
+            offset: 이미 받은 앞부분의 문자 수. 재연결한 클라이언트가 캐시된 결과나
+                진행 중인 생성 스트림을 중단된 위치부터 이어서 받을 때 사용합니다
+                (재생성 요청은 매번 새 응답이므로 적용하지 않음).
 
         Yields:
             생성된 테스트 코드 청크 (문자열).
@@ -93,76 +106,334 @@ class GeminiService:
             yield "# 코드를 입력해주세요."
             return
 
+        cache_metadata = self._cache_metadata(source_code, system_instruction, cache_source)
+
+        # 1. 캐시 확인 (재생성 요청이 아닐 때만)
+        if not is_regenerate:
+            cached_result = await self._lookup(
+                source_code, system_instruction, cache_metadata, cache_source is not None
+            )
+            if cached_result:
+                if cached_result[offset:]:
+                    yield cached_result[offset:]
+                return
+
+        # 2. AI 모델 호출 (동일 키로 진행 중인 생성이 있으면 합류)
+        if is_regenerate:
+            async for chunk in self._generate_and_cache(
+                source_code, system_instruction, stream, is_regenerate, cache_metadata
+            ):
+                yield chunk
+            return
+
+        async for chunk in self.single_flight.run(
+            cache_metadata.key,
+            lambda: self._generate_and_cache(
+                source_code, system_instruction, stream, is_regenerate, cache_metadata
+            ),
+            offset=offset,
+        ):
+            yield chunk
+
+    async def get_cached(
+        self,
+        source_code: str,
+        system_instruction: Optional[str] = None,
+        cache_source: Optional[str] = None,
+    ) -> Optional[str]:
+        """캐시된 생성 결과만 조회합니다 (AI API를 호출하지 않음).
+
+        `generate_test_code`와 같은 캐시 키를 사용하므로, 일괄 생성처럼 호출 전에
+        캐시 적중 여부를 먼저 확인하려는 경우에 사용합니다.
+
+        Args:
+            source_code: 테스트할 소스 코드.
+            system_instruction: 언어별 시스템 프롬프트.
+            cache_source: 캐시 키에 사용할 정규화된 코드.
+
+        Returns:
+            캐시된 테스트 코드. 없으면 None.
+        """
+        cache_metadata = self._cache_metadata(source_code, system_instruction, cache_source)
+        return await self._lookup(
+            source_code, system_instruction, cache_metadata, cache_source is not None
+        )
+
+    def _cache_metadata(
+        self,
+        source_code: str,
+        system_instruction: Optional[str],
+        cache_source: Optional[str],
+    ) -> CacheMetadata:
+        """생성 결과의 캐시 키를 생성합니다."""
         cache_strategy: CacheStrategyType = "gemini"
-        cache_metadata = self.cache.generate_key(
+        # 정규화 형식이 바뀌면 기존 원본 키와 섞이지 않도록 버전 구분자를 포함
+        key_parts = (
+            (CacheConstants.CANONICAL_KEY_VERSION, cache_source)
+            if cache_source is not None
+            else (source_code,)
+        )
+        return self.cache.generate_key(
             self.model_name,
-            source_code,
+            *key_parts,
             system_instruction or "",
             strategy=cache_strategy,
         )
 
-        # 1. 캐시 확인 (재생성 요청이 아닐 때만)
-        if not is_regenerate:
-            cached_result = await self.cache.get(cache_metadata.key)
-            if cached_result:
-                self.logger.info_ctx("캐시된 응답 반환", key=cache_metadata.key[:16])
-                yield cached_result
+    async def _lookup(
+        self,
+        source_code: str,
+        system_instruction: Optional[str],
+        cache_metadata: CacheMetadata,
+        canonical: bool,
+    ) -> Optional[str]:
+        """캐시를 조회하고, 만료가 임박했으면 백그라운드 재생성을 예약합니다."""
+        cached_result, refresh_due = await self.cache.get_with_refresh(cache_metadata.key)
+        GEMINI_CACHE_REQUESTS.labels(
+            key="canonical" if canonical else "raw", result="hit" if cached_result else "miss"
+        ).inc()
+        if not cached_result:
+            return None
+        self.logger.info_ctx("캐시된 응답 반환", key=cache_metadata.key[:16])
+        if refresh_due:
+            await self._schedule_refresh(source_code, system_instruction, cache_metadata)
+        return cached_result
+
+    async def _schedule_refresh(
+        self,
+        source_code: str,
+        system_instruction: Optional[str],
+        cache_metadata: CacheMetadata,
+    ) -> None:
+        """만료가 임박한 캐시 항목의 백그라운드 재생성을 시작합니다.
+
+        레플리카 전체에서 키당 하나의 재생성만 실행되도록 Redis 락을 획득한 경우에만
+        시작하며, 그 동안 다른 요청은 기존 캐시 값을 그대로 받습니다.
+
+        Args:
+            source_code: 테스트할 소스 코드.
+            system_instruction: 언어별 시스템 프롬프트.
+            cache_metadata: 재생성 결과를 저장할 캐시 키와 TTL.
+        """
+        lock_key = f"refresh:{cache_metadata.key}"
+        try:
+            if not await self.cache.try_lock(lock_key, CacheConstants.SINGLE_FLIGHT_LOCK_TTL):
                 return
+        except Exception as e:
+            self.logger.warning(f"캐시 재생성 락 획득 실패: {e}")
+            return
+
+        async def refresh() -> None:
+            try:
+                async for _ in self.single_flight.run(
+                    cache_metadata.key,
+                    lambda: self._generate_and_cache(
+                        source_code, system_instruction, True, False, cache_metadata
+                    ),
+                ):
+                    pass
+                self.logger.info_ctx("캐시 조기 재생성 완료", key=cache_metadata.key[:16])
+            except Exception as e:
+                self.logger.warning(f"캐시 조기 재생성 실패: {e}")
+            finally:
+                try:
+                    await self.cache.unlock(lock_key)
+                except Exception:
+                    pass  # 락은 TTL로 만료됨
 
-        # 2. AI 모델 호출
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _generate_and_cache(
+        self,
+        source_code: str,
+        system_instruction: Optional[str],
+        stream: bool,
+        is_regenerate: bool,
+        cache_metadata: CacheMetadata,
+    ) -> AsyncGenerator[str, None]:
+        """Gemini API를 호출하여 응답을 스트리밍하고, 완료되면 결과를 캐시에 저장합니다.
+
+        호출이 실패하면 지수 백오프 후 최대 MAX_RETRY_ATTEMPTS회까지 재시도합니다.
+        이미 일부를 전달한 뒤 실패한 경우에는 처음부터 다시 생성하지 않고, 지금까지의
+        응답을 모델 턴으로 넘겨 이어서 생성하도록 요청하므로 전달된 청크가 버려지지
+        않습니다.
+
+        받을 클라이언트가 없어 생성이 취소되면 지금까지의 응답을 부분 결과로 저장하고
+        (GENERATION_CACHE_PARTIAL_ON_DISCONNECT), 같은 키의 다음 생성은 처음부터
+        다시 만들지 않고 그 부분 결과에 이어서 생성합니다.
+
+        Args:
+            source_code: 테스트할 소스 코드.
+            system_instruction: 언어별 시스템 프롬프트.
+            stream: 스트리밍 여부.
+            is_regenerate: 재생성 요청 여부 (temperature 결정).
+            cache_metadata: 결과를 저장할 캐시 키와 TTL.
+
+        Yields:
+            생성된 테스트 코드 청크 (문자열).
+
+        Raises:
+            GenerationError: 재시도 후에도 API 호출이 실패한 경우.
+        """
+        started_at = time.perf_counter()
+        model = self._get_model(self.model_name, system_instruction)
+
+        # Temperature 설정: 재생성이면 창의적, 아니면 안정적
+        temperature = (
+            AIConstants.TEMPERATURE_CREATIVE if is_regenerate else AIConstants.TEMPERATURE_STABLE
+        )
+        generation_config = genai.types.GenerationConfig(temperature=temperature)
+
+        self.logger.info_ctx(
+            "Gemini 생성 요청 시작",
+            model=self.model_name,
+            is_regenerate=is_regenerate,
+        )
+
+        partial_key = self._partial_key(cache_metadata.key)
+        full_response_text = ""
+        if not is_regenerate:
+            try:
+                full_response_text = await self.cache.get(partial_key) or ""
+            except Exception as e:
+                self.logger.warning(f"부분 결과 조회 실패: {e}")
+            if full_response_text:
+                self.logger.info_ctx(
+                    "중단된 부분 결과에 이어서 생성",
+                    key=cache_metadata.key[:16],
+                    partial_length=len(full_response_text),
+                )
+                yield full_response_text
+        resumed = bool(full_response_text)
+
+        attempt = 1
         try:
-            model = self._get_model(self.model_name, system_instruction)
+            while True:
+                try:
+                    async for text in self._stream_response(
+                        model, source_code, full_response_text, stream, generation_config
+                    ):
+                        full_response_text += text
+                        yield text
+                    break
+                except Exception as e:
+                    self.logger.error_ctx(
+                        "Gemini API 호출 실패",
+                        error=str(e),
+                        attempt=attempt,
+                        partial_length=len(full_response_text),
+                    )
+                    if attempt >= AIConstants.MAX_RETRY_ATTEMPTS:
+                        raise GenerationError(
+                            "테스트 코드 생성 중 오류가 발생했습니다",
+                            model=self.model_name,
+                        ) from e
+                    await asyncio.sleep(
+                        min(
+                            AIConstants.RETRY_WAIT_MAX,
+                            max(
+                                AIConstants.RETRY_WAIT_MIN,
+                                AIConstants.RETRY_MULTIPLIER * 2**attempt,
+                            ),
+                        )
+                    )
+                    attempt += 1
+        except (asyncio.CancelledError, GeneratorExit):
+            await self._save_partial(cache_metadata, full_response_text)
+            raise
 
-            # Temperature 설정: 재생성이면 창의적, 아니면 안정적
-            temperature = (
-                AIConstants.TEMPERATURE_CREATIVE
-                if is_regenerate
-                else AIConstants.TEMPERATURE_STABLE
+        # 캐시 저장 (생성 소요 시간은 XFetch 조기 재계산 판단에 사용)
+        if full_response_text:
+            await self.cache.set(
+                cache_metadata.key,
+                full_response_text,
+                ttl=cache_metadata.ttl,
+                delta=time.perf_counter() - started_at,
             )
-            generation_config = genai.types.GenerationConfig(temperature=temperature)
-
             self.logger.info_ctx(
-                "Gemini 생성 요청 시작",
-                model=self.model_name,
-                is_regenerate=is_regenerate,
+                "생성 결과 캐싱 완료",
+                key=cache_metadata.key[:16],
+                ttl=cache_metadata.ttl,
             )
+            if resumed:
+                try:
+                    await self.cache.delete(partial_key)
+                except Exception:
+                    pass  # 부분 결과는 TTL로 만료됨
 
-            response = await model.generate_content_async(
-                source_code,
-                stream=stream,
-                generation_config=generation_config,
-            )
+    async def _save_partial(self, cache_metadata: CacheMetadata, partial: str) -> None:
+        """취소된 생성의 부분 결과를 저장합니다 (설정이 켜져 있고 내용이 있을 때만).
 
-            full_response_text = ""
-
-            if stream:
-                async for chunk in response:
-                    if chunk.text:
-                        full_response_text += chunk.text
-                        yield chunk.text
-            else:
-                if not response.text:
-                    yield "# 응답 생성 실패"
-                else:
-                    full_response_text = response.text
-                    yield response.text
-
-            # 캐시 저장
-            if full_response_text:
+        Args:
+            cache_metadata: 생성 결과의 캐시 키.
+            partial: 취소 시점까지 생성된 응답.
+        """
+        cached = False
+        if partial and settings.GENERATION_CACHE_PARTIAL_ON_DISCONNECT:
+            try:
                 await self.cache.set(
-                    cache_metadata.key,
-                    full_response_text,
-                    ttl=cache_metadata.ttl,
-                )
-                self.logger.info_ctx(
-                    "생성 결과 캐싱 완료",
-                    key=cache_metadata.key[:16],
-                    ttl=cache_metadata.ttl,
+                    self._partial_key(cache_metadata.key),
+                    partial,
+                    ttl=CacheConstants.PARTIAL_RESULT_TTL,
                 )
+                cached = True
+            except Exception as e:
+                self.logger.warning(f"부분 결과 저장 실패: {e}")
+        GEMINI_UPSTREAM_CANCELLATIONS.labels(partial_cached=str(cached).lower()).inc()
+        self.logger.info_ctx(
+            "Gemini 생성 취소",
+            key=cache_metadata.key[:16],
+            partial_length=len(partial),
+            partial_cached=cached,
+        )
 
-        except Exception as e:
-            self.logger.error_ctx("Gemini API 호출 실패", error=str(e))
-            raise GenerationError(
-                "테스트 코드 생성 중 오류가 발생했습니다",
-                model=self.model_name,
-            ) from e
+    @staticmethod
+    def _partial_key(key: str) -> str:
+        """부분 결과 캐시 키를 생성합니다."""
+        return f"partial:{key}"
+
+    async def _stream_response(
+        self,
+        model: genai.GenerativeModel,
+        source_code: str,
+        partial: str,
+        stream: bool,
+        generation_config: genai.types.GenerationConfig,
+    ) -> AsyncGenerator[str, None]:
+        """Gemini API를 한 번 호출하여 응답 텍스트를 전달합니다.
+
+        Args:
+            model: GenerativeModel 인스턴스.
+            source_code: 테스트할 소스 코드.
+            partial: 이전 시도에서 이미 전달한 응답 (있으면 이어서 생성 요청).
+            stream: 스트리밍 여부.
+            generation_config: 생성 설정.
+
+        Yields:
+            응답 텍스트 청크.
+        """
+        contents: Any = source_code
+        if partial:
+            contents = [
+                {"role": "user", "parts": [source_code]},
+                {"role": "model", "parts": [partial]},
+                {"role": "user", "parts": [AIConstants.CONTINUE_PROMPT]},
+            ]
+
+        response = await model.generate_content_async(
+            contents,
+            stream=stream,
+            generation_config=generation_config,
+        )
+
+        if stream:
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        elif not response.text:
+            if not partial:
+                yield "# 응답 생성 실패"
+        else:
+            yield response.text
@@ -0,0 +1,207 @@
+"""비동기 생성 작업(Job) 관리.
+
+생성 요청을 작업으로 등록하고 즉시 작업 id를 반환하여, HTTP 요청이 Gemini 스트리밍이
+끝날 때까지 연결(Cloud Run 요청 슬롯)을 붙잡지 않도록 합니다.
+
+- 실행: 레플리카마다 크기가 제한된 작업 풀(GENERATION_JOB_CONCURRENCY)에서 실행하며,
+  실행 중이거나 대기 중인 작업이 GENERATION_JOB_MAX_PENDING을 넘으면 등록을 거절합니다.
+- 진행 상황: 작업의 SSE 프레임은 ResumableStreams로 생산되므로, 생성 엔드포인트의
+  재연결과 같은 방식(Last-Event-ID)으로 어느 레플리카에서든 구독할 수 있습니다.
+  작업은 구독자가 없어도 끝까지 실행됩니다.
+- 상태와 결과: Redis 해시(job:{id})에 저장하여 어느 레플리카에서든 조회하며,
+  마지막 상태 변경 후 GENERATION_JOB_TTL 동안 유지됩니다.
+
+레플리카가 종료되면(`shutdown`) 실행 중이거나 대기 중인 작업을 취소하고 cancelled 상태로
+기록합니다.
+"""
+
+import asyncio
+import secrets
+from collections.abc import AsyncGenerator, Callable
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Optional
+
+import orjson
+import redis.asyncio as redis
+from src.config.constants import CacheConstants
+from src.config.settings import settings
+from src.services.resumable_stream import ResumableStreams
+from src.types import GenerationOutcome
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JobRunner = Callable[[GenerationOutcome], AsyncGenerator[str, None]]
+
+
+class GenerationJobs:
+    """생성 작업을 제한된 풀에서 실행하고 상태를 Redis에 기록하는 관리자.
+
+    작업 풀(세마포어)과 대기 작업 수는 클래스 속성으로 프로세스 전체에서 공유되므로,
+    요청마다 인스턴스를 새로 만들어도 레플리카 단위로 제한됩니다.
+    """
+
+    _slots: ClassVar[Optional[asyncio.Semaphore]] = None
+    _pending: ClassVar[int] = 0
+    _live: ClassVar[dict[str, tuple["GenerationJobs", asyncio.Task]]] = {}
+    _started: ClassVar[set[str]] = set()
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        streams: ResumableStreams,
+        concurrency: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        ttl: int = CacheConstants.GENERATION_JOB_TTL,
+    ) -> None:
+        """GenerationJobs 인스턴스를 초기화합니다.
+
+        Args:
+            redis_client: 작업 상태를 저장할 Redis 클라이언트.
+            streams: 작업의 SSE 프레임을 생산·보관할 스트림 관리자.
+            concurrency: 동시에 실행하는 작업 수 (None이면 설정값, 첫 작업 실행 시 고정).
+            max_pending: 실행 중이거나 대기 중인 작업 상한 (None이면 설정값).
+            ttl: 작업 상태 유지 시간 (초).
+        """
+        self.redis = redis_client
+        self.streams = streams
+        self.concurrency = concurrency or settings.GENERATION_JOB_CONCURRENCY
+        self.max_pending = max_pending or settings.GENERATION_JOB_MAX_PENDING
+        self.ttl = ttl
+
+    async def submit(self, owner: str, run: JobRunner, **metadata: str) -> Optional[str]:
+        """작업을 등록하고 백그라운드에서 실행합니다.
+
+        Args:
+            owner: 작업을 등록한 사용자 ID.
+            run: 생성 결과를 기록할 객체를 받아 SSE 프레임을 생성하는 함수.
+            **metadata: 상태 조회 시 함께 반환할 값 (언어, 모델 등).
+
+        Returns:
+            작업 id. 대기 중인 작업이 상한에 도달했으면 None.
+
+        Raises:
+            Exception: 작업 상태를 Redis에 기록하지 못한 경우 (작업은 실행하지 않음).
+        """
+        cls = type(self)
+        if cls._pending >= self.max_pending:
+            logger.warning_ctx("생성 작업 대기열이 가득 차 등록 거절", pending=cls._pending)
+            return None
+
+        job_id = secrets.token_urlsafe(12)
+        now = _now()
+        key = self._key(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "owner": owner,
+                    "status": "queued",
+                    "created_at": now,
+                    "updated_at": now,
+                    **metadata,
+                },
+            )
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+        cls._pending += 1
+        self.streams.start(owner, self._run(job_id, run), stream_id=job_id, detached=True)
+        # 생성 제너레이터가 시작되기 전에 취소되어도 대기 작업 수가 줄도록 태스크 종료 시 정리
+        task = self.streams.task(job_id)
+        cls._live[job_id] = (self, task)
+        task.add_done_callback(lambda _: cls._release(job_id))
+        logger.info_ctx("생성 작업 등록", job_id=job_id, user_id=owner)
+        return job_id
+
+    async def get(self, owner: str, job_id: str) -> Optional[dict[str, Any]]:
+        """작업 상태를 조회합니다.
+
+        Returns:
+            작업 상태 딕셔너리. 없거나 만료되었거나 다른 사용자의 작업이면 None.
+        """
+        record = await self.redis.hgetall(self._key(job_id))
+        if not record or record.get("owner") != owner:
+            return None
+        record.pop("owner")
+        if "error" in record:
+            record["error"] = orjson.loads(record["error"])
+        return {"job_id": job_id, **record}
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """실행 중이거나 대기 중인 작업을 취소하고 최종 상태가 기록될 때까지 기다립니다.
+
+        최종 상태는 Redis에 기록되므로 Redis 연결을 닫기 전에 호출해야 합니다.
+        """
+        live = list(cls._live.items())
+        if not live:
+            return
+        # 생성 제너레이터가 시작되기 전에 취소되는 작업은 _run이 상태를 기록하지 못함
+        unstarted = [(jobs, job_id) for job_id, (jobs, _) in live if job_id not in cls._started]
+        for _, (_, task) in live:
+            task.cancel()
+        await asyncio.gather(*(task for _, (_, task) in live), return_exceptions=True)
+        await asyncio.gather(
+            *(jobs._update(job_id, status="cancelled") for jobs, job_id in unstarted)
+        )
+        logger.info_ctx("레플리카 종료로 생성 작업 취소", jobs=len(live))
+
+    @classmethod
+    def _release(cls, job_id: str) -> None:
+        """종료된 작업의 대기 슬롯을 반환합니다."""
+        cls._pending -= 1
+        cls._live.pop(job_id, None)
+        cls._started.discard(job_id)
+
+    async def _run(self, job_id: str, run: JobRunner) -> AsyncGenerator[str, None]:
+        """풀의 자리가 날 때까지 기다린 뒤 생성하고 결과를 기록합니다."""
+        type(self)._started.add(job_id)
+        outcome = GenerationOutcome()
+        status = "failed"
+        try:
+            async with self._pool():
+                await self._update(job_id, status="running")
+                async for frame in run(outcome):
+                    yield frame
+            status = "completed" if outcome.content and outcome.error is None else "failed"
+        except (asyncio.CancelledError, GeneratorExit):
+            status = "cancelled"
+            raise
+        finally:
+            fields = {"status": status}
+            if outcome.content:
+                fields["result"] = outcome.content
+            if outcome.history_id:
+                fields["history_id"] = outcome.history_id
+            if outcome.error is not None:
+                fields["error"] = orjson.dumps(outcome.error).decode("utf-8")
+            # 레플리카 종료 등으로 취소된 경우에도 최종 상태는 기록
+            await asyncio.shield(self._update(job_id, **fields))
+            logger.info_ctx("생성 작업 종료", job_id=job_id, status=status)
+
+    def _pool(self) -> asyncio.Semaphore:
+        """프로세스 공용 작업 풀을 반환합니다."""
+        cls = type(self)
+        if cls._slots is None:
+            cls._slots = asyncio.Semaphore(self.concurrency)
+        return cls._slots
+
+    async def _update(self, job_id: str, **fields: str) -> None:
+        """작업 상태를 갱신합니다 (실패 시 로그만 남김)."""
+        key = self._key(job_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={**fields, "updated_at": _now()})
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"생성 작업 상태 기록 실패: {e}")
+
+    def _key(self, job_id: str) -> str:
+        """Redis 키를 생성합니다."""
+        return f"job:{job_id}"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,401 @@
+"""재연결 가능한(Last-Event-ID) 생성 SSE 스트림.
+
+생성 스트림의 모든 SSE 프레임에 `{stream_id}:{seq}` 형식의 이벤트 id를 붙이고,
+프레임을 로컬 버퍼와 Redis Stream에 함께 기록합니다. 연결이 끊긴 클라이언트가 마지막으로
+받은 이벤트 id를 Last-Event-ID로 보내 재연결하면 다음 프레임부터 이어서 받습니다.
+생성(GeminiService 호출과 토큰 차감)은 다시 실행하지 않습니다.
+
+- 같은 프로세스: 로컬 버퍼를 재생한 뒤 이후 프레임을 이어서 수신 (Redis 장애와 무관)
+- 다른 레플리카: Redis Stream을 XREAD BLOCK으로 읽어 재생과 실시간 수신을 같은 경로로 처리
+
+프레임 생산은 요청과 분리된 태스크에서 실행되므로 연결이 끊겨도 바로 멈추지 않습니다.
+마지막 클라이언트가 떠난 시점부터 재연결 대기 시간(SSE_RESUME_GRACE_SECONDS) 동안
+아무도 다시 읽지 않으면 생산 태스크를 취소하여, 연결 종료 시의 업스트림 취소·부분 결과 저장·환불
+정책이 그대로 적용됩니다. 대기 시간이 0이면 마지막 구독자가 떠나는 즉시 취소합니다.
+
+버퍼는 생성 중에는 마지막 프레임 후 SSE_STREAM_TTL, 종료 후에는 SSE_RESUME_TTL 동안
+유지됩니다. 재연결은 스트림을 시작한 사용자만 할 수 있습니다.
+"""
+
+import asyncio
+import secrets
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
+
+import redis.asyncio as redis
+from src.config.constants import CacheConstants
+from src.config.settings import settings
+from src.utils.logger import get_logger
+from src.utils.metrics import GENERATION_STREAM_RESUMES
+
+logger = get_logger(__name__)
+
+# 스트림 항목 필드: SSE 프레임 또는 종료 상태 (done | error | aborted)
+_FRAME_FIELD = "f"
+_END_FIELD = "end"
+
+
+def format_event_id(stream_id: str, seq: int) -> str:
+    """SSE 이벤트 id를 생성합니다."""
+    return f"{stream_id}:{seq}"
+
+
+def parse_event_id(event_id: str) -> Optional[tuple[str, int]]:
+    """SSE 이벤트 id를 (스트림 id, 순번)으로 분리합니다.
+
+    순번 0은 첫 프레임 이전을 뜻하므로, 프레임을 하나도 받지 못한 클라이언트는
+    응답 헤더의 스트림 id로 `{stream_id}:0`을 만들어 처음부터 받을 수 있습니다.
+
+    Returns:
+        형식이 올바르지 않으면 None.
+    """
+    stream_id, _, seq = event_id.strip().rpartition(":")
+    if not stream_id or not seq.isdigit():
+        return None
+    return stream_id, int(seq)
+
+
+@dataclass
+class _Stream:
+    """이 프로세스에서 생산 중인 SSE 스트림과 그 프레임 버퍼.
+
+    Attributes:
+        owner: 스트림을 시작한 사용자 ID.
+        frames: 지금까지 생산된 프레임 (이벤트 id 포함, 순번 = 인덱스 + 1).
+            종료 후에도 resume_ttl 동안 유지되어 같은 프로세스 재연결에 사용됩니다.
+        done: 생산 종료 여부.
+        task: 프레임을 생산하는 백그라운드 태스크.
+        watcher: 재연결 대기 시간을 감시하는 태스크.
+        subscribers: 현재 스트림을 읽고 있는 이 프로세스의 클라이언트 수.
+        idle_since: 읽는 클라이언트가 없어진 시각 (이벤트 루프 시간, 읽는 중이면 None).
+        detached: 읽는 클라이언트가 없어도 취소하지 않는 스트림인지 여부 (비동기 작업).
+    """
+
+    owner: str
+    frames: list[str] = field(default_factory=list)
+    done: bool = False
+    task: Optional[asyncio.Task] = None
+    watcher: Optional[asyncio.Task] = None
+    subscribers: int = 0
+    idle_since: Optional[float] = None
+    detached: bool = False
+    cond: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+    async def push(self, frame: str) -> None:
+        """프레임을 버퍼에 추가하고 구독자를 깨웁니다."""
+        async with self.cond:
+            self.frames.append(frame)
+            self.cond.notify_all()
+
+    async def finish(self) -> None:
+        """생산 종료를 기록하고 구독자를 깨웁니다."""
+        async with self.cond:
+            self.done = True
+            self.cond.notify_all()
+
+    async def subscribe(self, after: int) -> AsyncIterator[str]:
+        """순번 after 이후의 프레임을 재생한 뒤 종료될 때까지 새 프레임을 전달합니다."""
+        index = after
+        while True:
+            async with self.cond:
+                while index >= len(self.frames) and not self.done:
+                    await self.cond.wait()
+                pending = self.frames[index:]
+                index = len(self.frames)
+                done = self.done
+
+            for frame in pending:
+                yield frame
+
+            if done:
+                return
+
+
+class ResumableStreams:
+    """생성 SSE 스트림을 요청과 분리해 실행하고 재연결을 지원하는 관리자.
+
+    스트림 레지스트리는 클래스 속성으로 프로세스 전체에서 공유되므로,
+    요청마다 인스턴스를 새로 만들어도 같은 프로세스의 재연결은 로컬 버퍼를 사용합니다.
+    """
+
+    _streams: ClassVar[dict[str, _Stream]] = {}
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        grace: Optional[float] = None,
+        stream_ttl: int = CacheConstants.SSE_STREAM_TTL,
+        resume_ttl: int = CacheConstants.SSE_RESUME_TTL,
+    ) -> None:
+        """ResumableStreams 인스턴스를 초기화합니다.
+
+        Args:
+            redis_client: 프레임 버퍼를 보관할 Redis 클라이언트.
+            grace: 재연결 대기 시간 (초, None이면 SSE_RESUME_GRACE_SECONDS 설정값).
+            stream_ttl: 생성 중 프레임 버퍼 유지 시간 (초).
+            resume_ttl: 생성 종료 후 프레임 버퍼 유지 시간 (초).
+        """
+        self.redis = redis_client
+        self.grace = settings.SSE_RESUME_GRACE_SECONDS if grace is None else grace
+        self.stream_ttl = stream_ttl
+        self.resume_ttl = resume_ttl
+
+    def start(
+        self,
+        owner: str,
+        frames: AsyncGenerator[str, None],
+        stream_id: Optional[str] = None,
+        detached: bool = False,
+    ) -> str:
+        """프레임 생산을 백그라운드 태스크로 시작합니다.
+
+        Args:
+            owner: 스트림을 시작한 사용자 ID (재연결 권한 확인용).
+            frames: 이벤트 id가 없는 SSE 프레임 스트림.
+            stream_id: 사용할 스트림 id (None이면 새로 생성).
+            detached: True이면 읽는 클라이언트가 없어도 끝까지 생산합니다.
+
+        Returns:
+            스트림 id. 클라이언트는 `subscribe` 또는 재연결 시 이 id를 사용합니다.
+        """
+        stream_id = stream_id or secrets.token_urlsafe(12)
+        stream = _Stream(
+            owner=owner, detached=detached, idle_since=asyncio.get_running_loop().time()
+        )
+        self._streams[stream_id] = stream
+        stream.task = asyncio.create_task(self._drive(stream_id, stream, frames))
+        if self.grace > 0 and not detached:
+            stream.watcher = asyncio.create_task(self._watch(stream_id, stream))
+        return stream_id
+
+    async def subscribe(self, stream_id: str, after: int = 0) -> AsyncIterator[str]:
+        """이 프로세스에서 생산 중인 스트림을 읽습니다.
+
+        Args:
+            stream_id: `start`가 반환한 스트림 id.
+            after: 이미 받은 마지막 프레임 순번.
+
+        Yields:
+            이벤트 id가 붙은 SSE 프레임.
+        """
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            return
+        stream.subscribers += 1
+        stream.idle_since = None
+        try:
+            async for frame in stream.subscribe(after):
+                yield frame
+        finally:
+            stream.subscribers -= 1
+            if stream.subscribers == 0:
+                stream.idle_since = asyncio.get_running_loop().time()
+            if (
+                stream.subscribers == 0
+                and not stream.done
+                and not stream.detached
+                and self.grace <= 0
+            ):
+                logger.info_ctx("구독자가 모두 떠나 생성 스트림을 취소", stream_id=stream_id)
+                stream.task.cancel()
+
+    def task(self, stream_id: str) -> Optional[asyncio.Task]:
+        """이 프로세스에서 스트림을 생산하는 태스크를 반환합니다 (없으면 None)."""
+        stream = self._streams.get(stream_id)
+        return stream.task if stream is not None else None
+
+    async def resume(self, owner: str, last_event_id: str) -> Optional[AsyncIterator[str]]:
+        """Last-Event-ID 다음 프레임부터 스트림을 이어서 읽습니다.
+
+        Args:
+            owner: 재연결한 사용자 ID.
+            last_event_id: 클라이언트가 마지막으로 받은 이벤트 id.
+
+        Returns:
+            SSE 프레임 스트림. 형식이 잘못되었거나, 만료되었거나, 다른 사용자의
+            스트림이면 None.
+        """
+        parsed = parse_event_id(last_event_id)
+        if parsed is None:
+            GENERATION_STREAM_RESUMES.labels(source="not_found").inc()
+            return None
+        stream_id, after = parsed
+
+        stream = self._streams.get(stream_id)
+        if stream is not None:
+            if stream.owner != owner:
+                GENERATION_STREAM_RESUMES.labels(source="not_found").inc()
+                return None
+            GENERATION_STREAM_RESUMES.labels(source="local").inc()
+            return self.subscribe(stream_id, after)
+
+        try:
+            stored_owner = await self.redis.get(self._key(stream_id, "owner"))
+        except Exception as e:
+            logger.warning(f"SSE 스트림 소유자 조회 실패: {e}")
+            stored_owner = None
+        if stored_owner != owner:
+            GENERATION_STREAM_RESUMES.labels(source="not_found").inc()
+            return None
+        GENERATION_STREAM_RESUMES.labels(source="redis").inc()
+        return self._follow(stream_id, after)
+
+    async def _drive(
+        self, stream_id: str, stream: _Stream, frames: AsyncGenerator[str, None]
+    ) -> None:
+        """프레임에 이벤트 id를 붙여 로컬 버퍼와 Redis Stream에 기록합니다."""
+        publish = False
+        seq = 0
+        status = "error"
+        try:
+            publish = await self._open(stream_id, stream.owner)
+            async for frame in frames:
+                seq += 1
+                framed = f"id: {format_event_id(stream_id, seq)}\n{frame}"
+                await stream.push(framed)
+                if publish:
+                    publish = await self._publish(stream_id, seq, framed)
+            status = "done"
+        except asyncio.CancelledError:
+            status = "aborted"
+            # 프레임 기록 중 취소되면 생산 제너레이터가 yield에 멈춰 있으므로 직접 정리
+            await frames.aclose()
+            raise
+        except Exception as e:
+            logger.error(f"SSE 스트림 생산 실패: {e}", exc_info=True)
+        finally:
+            await stream.finish()
+            if publish:
+                await self._close(stream_id, seq + 1, status)
+            # 응답이 아직 읽기 전에 끝난 스트림과 같은 프로세스 재연결을 위해 잠시 유지
+            asyncio.get_running_loop().call_later(self.resume_ttl, self._forget, stream_id, stream)
+            if stream.watcher is not None:
+                stream.watcher.cancel()
+
+    @classmethod
+    def _forget(cls, stream_id: str, stream: _Stream) -> None:
+        """종료된 스트림을 레지스트리에서 제거합니다."""
+        if cls._streams.get(stream_id) is stream:
+            del cls._streams[stream_id]
+
+    async def _watch(self, stream_id: str, stream: _Stream) -> None:
+        """마지막 클라이언트가 떠난 뒤 재연결 대기 시간 동안 아무도 읽지 않으면 생산을 취소합니다.
+
+        대기 시간은 idle_since(연결이 끊긴 시각)부터 계산합니다. 다른 레플리카로 재연결한
+        클라이언트는 `_follow`에서 attached 키를 갱신하므로, 이 프로세스에 구독자가 없어도
+        attached 키가 남아 있는 동안은 생성이 계속되고 키가 사라진 시점부터 다시 계산합니다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            if stream.done:
+                return
+            if stream.subscribers or await self._is_attached(stream_id):
+                if not stream.subscribers:
+                    stream.idle_since = None
+                await asyncio.sleep(self.grace)
+                continue
+            now = loop.time()
+            if stream.idle_since is None:
+                stream.idle_since = now
+            remaining = stream.idle_since + self.grace - now
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+            logger.info_ctx(
+                "재연결 대기 시간 내에 재연결이 없어 생성 스트림을 취소", stream_id=stream_id
+            )
+            stream.task.cancel()
+            return
+
+    async def _follow(self, stream_id: str, after: int) -> AsyncIterator[str]:
+        """다른 레플리카가 생산 중인(또는 마친) 스트림을 Redis에서 이어서 읽습니다.
+
+        XREAD BLOCK은 이미 기록된 프레임을 즉시 반환하고 이후 프레임은 도착할 때까지
+        기다립니다. 읽는 동안 attached 키를 갱신해 생산자가 생성을 취소하지 않도록 합니다.
+        """
+        frames_key = self._key(stream_id, "frames")
+        last_id = f"{after}-0"
+        loop = asyncio.get_running_loop()
+        heartbeat = max(1.0, self.grace / 2)
+        next_heartbeat = 0.0
+
+        while True:
+            if self.grace > 0 and loop.time() >= next_heartbeat:
+                await self._attach(stream_id)
+                next_heartbeat = loop.time() + heartbeat
+            response = await self.redis.xread({frames_key: last_id}, block=int(heartbeat * 1000))
+            if not response:
+                # 소유자 키는 프레임과 함께 갱신되므로, 없으면 생산자가 사라진 뒤 만료된 것
+                if not await self.redis.exists(self._key(stream_id, "owner")):
+                    return
+                continue
+
+            for entry_id, fields in response[0][1]:
+                last_id = entry_id
+                if _FRAME_FIELD not in fields:
+                    return
+                yield fields[_FRAME_FIELD]
+
+    async def _open(self, stream_id: str, owner: str) -> bool:
+        """스트림 소유자를 기록합니다.
+
+        Returns:
+            Redis에 프레임을 기록할지 여부 (Redis 장애 시 False, 같은 프로세스 재연결만 지원).
+        """
+        try:
+            await self.redis.set(self._key(stream_id, "owner"), owner, ex=self.stream_ttl)
+            return True
+        except Exception as e:
+            logger.warning(f"SSE 스트림 버퍼 생성 실패, 같은 프로세스에서만 재연결됩니다: {e}")
+            return False
+
+    async def _publish(self, stream_id: str, seq: int, frame: str) -> bool:
+        """프레임을 순번을 항목 id로 하여 Redis Stream에 추가합니다.
+
+        Returns:
+            계속 기록할지 여부 (Redis 장애 시 False).
+        """
+        frames_key = self._key(stream_id, "frames")
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.xadd(frames_key, {_FRAME_FIELD: frame}, id=f"{seq}-0")
+                pipe.expire(frames_key, self.stream_ttl)
+                pipe.expire(self._key(stream_id, "owner"), self.stream_ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"SSE 프레임 기록 실패, 이후 프레임은 로컬에만 전달합니다: {e}")
+            return False
+
+    async def _close(self, stream_id: str, seq: int, status: str) -> None:
+        """종료 상태를 기록하고 버퍼 유지 시간을 재연결 대기용으로 줄입니다."""
+        frames_key = self._key(stream_id, "frames")
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.xadd(frames_key, {_END_FIELD: status}, id=f"{seq}-0")
+                pipe.expire(frames_key, self.resume_ttl)
+                pipe.expire(self._key(stream_id, "owner"), self.resume_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"SSE 스트림 종료 기록 실패: {e}")
+
+    async def _attach(self, stream_id: str) -> None:
+        """다른 레플리카에서 스트림을 읽고 있음을 알립니다."""
+        try:
+            await self.redis.set(
+                self._key(stream_id, "attached"), "1", ex=max(1, int(self.grace) + 1)
+            )
+        except Exception as e:
+            logger.warning(f"SSE 스트림 재연결 표시 실패: {e}")
+
+    async def _is_attached(self, stream_id: str) -> bool:
+        """다른 레플리카에서 스트림을 읽고 있는지 확인합니다."""
+        try:
+            return bool(await self.redis.exists(self._key(stream_id, "attached")))
+        except Exception:
+            return False
+
+    def _key(self, stream_id: str, suffix: str) -> str:
+        """Redis 키를 생성합니다."""
+        return f"sse:{stream_id}:{suffix}"
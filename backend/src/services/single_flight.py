@@ -0,0 +1,360 @@
+"""동일 요청 중복 실행 방지(Single-flight) 스트림 병합.
+
+같은 캐시 키로 동시에 들어온 생성 요청이 모두 캐시 미스를 내고 업스트림(Gemini)을
+N번 호출하는 것을 막습니다. 키마다 하나의 생산자만 업스트림 스트림을 열고,
+나머지 대기자는 같은 청크를 실시간으로 전달받습니다.
+
+- 같은 프로세스: 진행 중인 Flight의 버퍼를 재생한 뒤 이후 청크를 이어서 수신
+- 다른 레플리카: Redis SET NX 락으로 생산자를 하나로 제한하고, 생산자가 청크마다
+  Redis Stream에 항목을 추가(XADD)합니다. 대기자는 처음 항목부터 XREAD BLOCK으로
+  읽으므로 재생과 실시간 수신이 같은 경로로 처리되고, 늦게 합류하거나 재연결한
+  대기자도 이미 생성된 부분부터 이어서 받을 수 있습니다.
+
+락과 스트림은 청크를 추가할 때마다 락 TTL만큼 연장되므로 생성 중에는 유지되고,
+완료(또는 실패) 후 스트림은 SINGLE_FLIGHT_RESULT_TTL 동안 유지됩니다. 완료된 결과 전체는 생산자(GeminiService)가 캐시에 따로 저장합니다.
+
+이 프로세스의 대기자가 모두 떠나면(클라이언트 연결 종료) 업스트림 생성을 취소하고
+스트림에 aborted 상태를 기록합니다. 아직 아무 청크도 받지 못한 다른 레플리카의
+대기자는 이를 생산자 이탈로 보고 직접 생성을 이어받습니다.
+"""
+
+import asyncio
+import secrets
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
+
+import redis.asyncio as redis
+from src.config.constants import CacheConstants
+from src.exceptions import GenerationError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ChunkProducer = Callable[[], AsyncIterator[str]]
+
+# 락 획득과 동시에 이전 Flight의 스트림을 지워, 늦게 합류한 대기자가
+# 지난 결과를 재생하지 않도록 함
+_ACQUIRE_LOCK_SCRIPT = """
+if redis.call('set', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    redis.call('del', KEYS[2])
+    return 1
+end
+return 0
+"""
+
+# 스트림 항목 필드: 청크 데이터 또는 완료 상태 (done | error | aborted)
+_CHUNK_FIELD = "d"
+_STATUS_FIELD = "s"
+
+# 락 소유자일 때만 청크를 추가하고 락과 스트림의 TTL을 함께 연장. 생성이 락 TTL보다
+# 오래 걸려도 락이 만료되지 않으며, 락을 잃은 생산자는 새 생산자의 스트림에 쓰지 않음
+_PUBLISH_CHUNK_SCRIPT = """
+if redis.call('get', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('xadd', KEYS[2], '*', ARGV[3], ARGV[4])
+redis.call('expire', KEYS[2], ARGV[2])
+redis.call('expire', KEYS[1], ARGV[2])
+return 1
+"""
+
+# 락 소유자일 때만 완료 상태를 기록하고 락을 해제 (다른 레플리카가 재획득한 락과
+# 스트림을 건드리지 않도록)
+_COMPLETE_SCRIPT = """
+if redis.call('get', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('xadd', KEYS[2], '*', ARGV[3], ARGV[4])
+redis.call('expire', KEYS[2], ARGV[2])
+return redis.call('del', KEYS[1])
+"""
+
+
+class _LeaderLostError(Exception):
+    """다른 레플리카의 생산자가 완료 신호 없이 사라진 경우 발생하는 내부 예외."""
+
+
+@dataclass
+class _Flight:
+    """진행 중인 단일 생성 작업과 그 출력 버퍼.
+
+    Attributes:
+        chunks: 지금까지 생성된 청크 (늦게 합류한 대기자에게 재생).
+        done: 생성 종료 여부.
+        error: 생성 실패 시 대기자에게 전파할 예외.
+        task: 버퍼를 채우는 백그라운드 태스크.
+        subscribers: 현재 스트림을 읽고 있는 대기자 수.
+    """
+
+    chunks: list[str] = field(default_factory=list)
+    done: bool = False
+    error: Optional[BaseException] = None
+    task: Optional[asyncio.Task] = None
+    subscribers: int = 0
+    cond: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+    async def push(self, chunk: str) -> None:
+        """청크를 버퍼에 추가하고 대기자를 깨웁니다."""
+        async with self.cond:
+            self.chunks.append(chunk)
+            self.cond.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None) -> None:
+        """생성 종료를 기록하고 대기자를 깨웁니다."""
+        async with self.cond:
+            self.done = True
+            self.error = error
+            self.cond.notify_all()
+
+    async def subscribe(self, offset: int = 0) -> AsyncIterator[str]:
+        """버퍼된 청크를 재생한 뒤 종료될 때까지 새 청크를 전달합니다.
+
+        Args:
+            offset: 건너뛸 앞부분의 문자 수 (재연결한 대기자가 이미 받은 길이).
+
+        Raises:
+            BaseException: 생성이 실패한 경우 생산자의 예외를 그대로 전파합니다.
+        """
+        index = 0
+        while True:
+            async with self.cond:
+                while index >= len(self.chunks) and not self.done:
+                    await self.cond.wait()
+                pending = self.chunks[index:]
+                index = len(self.chunks)
+                done, error = self.done, self.error
+
+            for chunk in pending:
+                if offset >= len(chunk):
+                    offset -= len(chunk)
+                    continue
+                yield chunk[offset:]
+                offset = 0
+
+            if done:
+                if error is not None:
+                    raise error
+                return
+
+
+class SingleFlight:
+    """캐시 키 단위로 진행 중인 생성 스트림을 공유하는 병합기.
+
+    Flight 레지스트리는 클래스 속성으로 프로세스 전체에서 공유되므로,
+    요청마다 서비스 인스턴스를 새로 만들어도 같은 키는 하나로 병합됩니다.
+    """
+
+    _flights: ClassVar[dict[str, _Flight]] = {}
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        namespace: str = "gemini",
+        lock_ttl: int = CacheConstants.SINGLE_FLIGHT_LOCK_TTL,
+        idle_timeout: float = CacheConstants.SINGLE_FLIGHT_IDLE_TIMEOUT,
+    ) -> None:
+        """SingleFlight 인스턴스를 초기화합니다.
+
+        Args:
+            redis_client: 레플리카 간 조정에 사용할 Redis 클라이언트.
+            namespace: Redis 키 접두사.
+            lock_ttl: 생산자 락 및 진행 중 버퍼 유지 시간 (초).
+            idle_timeout: 다른 레플리카의 생산자로부터 아무 신호가 없을 때
+                생산자 생존 여부를 다시 확인하기까지의 시간 (초).
+        """
+        self.redis = redis_client
+        self.namespace = namespace
+        self.lock_ttl = lock_ttl
+        self.idle_timeout = idle_timeout
+
+    async def run(self, key: str, producer: ChunkProducer, offset: int = 0) -> AsyncIterator[str]:
+        """키에 해당하는 생성 스트림에 합류하거나, 없으면 새로 시작합니다.
+
+        Args:
+            key: 병합 기준 키 (보통 캐시 키).
+            producer: 업스트림 스트림을 여는 함수. 생산자로 선출된 경우에만 호출됩니다.
+            offset: 이미 받은 앞부분의 문자 수. 재연결한 클라이언트가 중단된 위치부터
+                이어서 받을 때 사용합니다.
+
+        Yields:
+            생성된 청크. 모든 대기자는 동일한 순서로 동일한 내용을 받습니다.
+            이 프로세스의 마지막 대기자가 중간에 떠나면 업스트림 생성은 취소됩니다.
+        """
+        flight_key = f"{self.namespace}:{key}"
+        flight = self._flights.get(flight_key)
+
+        if flight is None:
+            # await 전에 등록하여 같은 프로세스의 동시 요청이 모두 이 Flight에 합류하도록 함
+            flight = _Flight()
+            self._flights[flight_key] = flight
+            flight.task = asyncio.create_task(self._drive(flight_key, key, flight, producer))
+        else:
+            logger.info_ctx("진행 중인 생성 스트림에 합류", key=key[:16])
+
+        flight.subscribers += 1
+        try:
+            async for chunk in flight.subscribe(offset):
+                yield chunk
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done and flight.task is not None:
+                # 받을 대기자가 없으므로 업스트림 생성 중단. 새 요청이 취소 중인 Flight에
+                # 합류하지 않도록 레지스트리에서 먼저 제거
+                logger.info_ctx("대기자가 모두 떠나 생성 스트림을 취소", key=key[:16])
+                if self._flights.get(flight_key) is flight:
+                    del self._flights[flight_key]
+                flight.task.cancel()
+
+    async def _drive(
+        self, flight_key: str, key: str, flight: _Flight, producer: ChunkProducer
+    ) -> None:
+        """Flight 버퍼를 채웁니다 (생산자 또는 다른 레플리카 스트림 중계)."""
+        try:
+            token = await self._try_lock(key)
+            relayed = False
+            if token is None:
+                try:
+                    await self._relay(key, flight)
+                    relayed = True
+                except _LeaderLostError:
+                    if flight.chunks:
+                        raise GenerationError("동일한 요청의 생성이 중단되었습니다") from None
+                    logger.warning_ctx("다른 레플리카의 생성이 중단되어 직접 생성", key=key[:16])
+                    token = await self._try_lock(key)
+
+            if not relayed:
+                await self._produce(key, flight, producer, token)
+        except BaseException as e:
+            await flight.finish(error=e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        else:
+            await flight.finish()
+        finally:
+            if self._flights.get(flight_key) is flight:
+                del self._flights[flight_key]
+
+    async def _produce(
+        self, key: str, flight: _Flight, producer: ChunkProducer, token: Optional[str]
+    ) -> None:
+        """업스트림 스트림을 열고 청크를 로컬 대기자와 다른 레플리카에 전달합니다."""
+        publish = bool(token)
+        status = "error"
+        try:
+            async for chunk in producer():
+                await flight.push(chunk)
+                if publish:
+                    publish = await self._publish_chunk(key, token, chunk)
+            status = "done"
+        except asyncio.CancelledError:
+            status = "aborted"
+            raise
+        finally:
+            if token is not None:
+                await self._complete(key, token, status)
+
+    async def _relay(self, key: str, flight: _Flight) -> None:
+        """다른 레플리카가 생성 중인 스트림을 처음 항목부터 읽어 중계합니다.
+
+        XREAD BLOCK은 이미 기록된 항목을 즉시 반환하고 이후 항목은 도착할 때까지
+        기다리므로, 합류 시점과 관계없이 모든 청크를 순서대로 한 번씩 전달합니다.
+
+        Raises:
+            GenerationError: 생산자가 실패를 알린 경우.
+            _LeaderLostError: 생산자가 완료 신호 없이 사라지거나 생성을 취소한 경우.
+        """
+        stream = self._key(key, "stream")
+        last_id = "0-0"
+        block_ms = max(1, int(self.idle_timeout * 1000))
+
+        while True:
+            response = await self.redis.xread({stream: last_id}, block=block_ms)
+            if not response:
+                # 오래 조용하면 생산자 생존 여부 확인. 락 해제 전에 완료 항목이 먼저
+                # 기록되므로, 락이 없으면 남은 항목을 한 번 더 읽은 뒤 판단
+                if await self.redis.exists(self._key(key, "lock")):
+                    continue
+                response = await self.redis.xread({stream: last_id})
+                if not response:
+                    raise _LeaderLostError(key)
+
+            for entry_id, fields in response[0][1]:
+                last_id = entry_id
+                if _CHUNK_FIELD in fields:
+                    await flight.push(fields[_CHUNK_FIELD])
+                    continue
+                status = fields.get(_STATUS_FIELD)
+                if status == "aborted":
+                    raise _LeaderLostError(key)
+                if status == "error":
+                    raise GenerationError("동일한 요청의 생성이 실패했습니다")
+                return
+
+    async def _try_lock(self, key: str) -> Optional[str]:
+        """생산자 락 획득을 시도합니다.
+
+        Returns:
+            획득 시 소유자 토큰, 다른 레플리카가 보유 중이면 None.
+            Redis 장애 시에는 병합을 포기하고 로컬 생산자로 동작하도록 빈 토큰을 반환합니다.
+        """
+        token = secrets.token_hex(8)
+        try:
+            acquired = await self.redis.eval(
+                _ACQUIRE_LOCK_SCRIPT,
+                2,
+                self._key(key, "lock"),
+                self._key(key, "stream"),
+                token,
+                self.lock_ttl,
+            )
+        except Exception as e:
+            logger.warning(f"Single-flight 락 획득 실패, 로컬에서만 병합합니다: {e}")
+            return ""
+        return token if acquired else None
+
+    async def _publish_chunk(self, key: str, token: str, chunk: str) -> bool:
+        """청크를 스트림 항목으로 추가하고 생산자 락을 연장합니다.
+
+        Returns:
+            계속 발행할지 여부 (Redis 장애 또는 락을 잃은 경우 False).
+        """
+        try:
+            owned = await self.redis.eval(
+                _PUBLISH_CHUNK_SCRIPT,
+                2,
+                self._key(key, "lock"),
+                self._key(key, "stream"),
+                token,
+                self.lock_ttl,
+                _CHUNK_FIELD,
+                chunk,
+            )
+        except Exception as e:
+            logger.warning(f"Single-flight 청크 발행 실패, 이후 청크는 로컬에만 전달합니다: {e}")
+            return False
+        if not owned:
+            logger.warning_ctx("Single-flight 생산자 락을 잃어 청크 발행 중단", key=key[:16])
+        return bool(owned)
+
+    async def _complete(self, key: str, token: str, status: str) -> None:
+        """완료 상태를 스트림에 기록하고 생산자 락을 해제합니다."""
+        if not token:
+            return
+        try:
+            await self.redis.eval(
+                _COMPLETE_SCRIPT,
+                2,
+                self._key(key, "lock"),
+                self._key(key, "stream"),
+                token,
+                CacheConstants.SINGLE_FLIGHT_RESULT_TTL,
+                _STATUS_FIELD,
+                status,
+            )
+        except Exception as e:
+            logger.warning(f"Single-flight 완료 처리 실패: {e}")
+
+    def _key(self, key: str, suffix: str) -> str:
+        """Redis 키를 생성합니다."""
+        return f"singleflight:{self.namespace}:{key}:{suffix}"
@@ -1,7 +1,11 @@
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
+import httpx
+from postgrest import AsyncPostgrestClient
 from postgrest.exceptions import APIError
+from src.config.constants import NetworkConstants
 from src.config.settings import settings
 from src.exceptions import ConfigurationError
 from src.services.cache_service import CacheService
@@ -22,6 +26,7 @@ class SupabaseService:
     _instance: Optional["SupabaseService"] = None
     _client: Optional[Client] = None
     _cache: Optional[CacheService] = None
+    _async_client: Optional[AsyncPostgrestClient] = None
 
     def __new__(cls) -> "SupabaseService":
         """Singleton 인스턴스를 반환합니다."""
@@ -77,6 +82,64 @@ class SupabaseService:
             raise RuntimeError("Cache service is not initialized")
         return self._cache
 
+    @property
+    def async_client(self) -> Optional[AsyncPostgrestClient]:
+        """비동기 PostgREST 클라이언트를 반환합니다 (최초 사용 시 생성).
+
+        하나의 HTTP/2 커넥션 풀을 모든 요청이 공유하여, 스레드풀을 거치지 않고
+        이벤트 루프에서 직접 DB 요청을 처리합니다.
+
+        Returns:
+            AsyncPostgrestClient 또는 None (비활성화 또는 생성 실패 시).
+        """
+        if not settings.SUPABASE_ASYNC_CLIENT:
+            return None
+        if SupabaseService._async_client is None:
+            try:
+                SupabaseService._async_client = self._create_async_client()
+                logger.info("비동기 PostgREST 클라이언트 초기화 성공")
+            except Exception as e:
+                logger.warning(f"비동기 PostgREST 클라이언트 생성 실패 (스레드풀로 대체): {e}")
+                return None
+        return SupabaseService._async_client
+
+    @staticmethod
+    def _create_async_client() -> AsyncPostgrestClient:
+        """공유 HTTP/2 커넥션 풀을 사용하는 AsyncPostgrestClient를 생성합니다."""
+        rest_url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1"
+        service_key = settings.SUPABASE_SERVICE_ROLE_KEY.get_secret_value()
+        client_options: dict[str, Any] = {
+            "base_url": rest_url,
+            "timeout": NetworkConstants.HTTP_TIMEOUT_SECONDS,
+            "follow_redirects": True,
+            "limits": httpx.Limits(
+                max_connections=NetworkConstants.SUPABASE_MAX_CONNECTIONS,
+                max_keepalive_connections=NetworkConstants.SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        }
+        try:
+            http_client = httpx.AsyncClient(http2=True, **client_options)
+        except ImportError:
+            # h2 패키지가 없으면 HTTP/1.1 Keepalive 풀 사용
+            http_client = httpx.AsyncClient(**client_options)
+
+        return AsyncPostgrestClient(
+            rest_url,
+            headers={
+                "apikey": service_key,
+                "Authorization": f"Bearer {service_key}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            http_client=http_client,
+        )
+
+    async def close(self) -> None:
+        """비동기 PostgREST 클라이언트의 커넥션 풀을 종료합니다."""
+        if SupabaseService._async_client is not None:
+            await SupabaseService._async_client.aclose()
+            SupabaseService._async_client = None
+
     def get_connection_status(self) -> dict:
         """상세 연결 상태 반환"""
         if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_ROLE_KEY.get_secret_value():
@@ -167,8 +230,8 @@ class SupabaseService:
         start_date = self._get_week_start().date().isoformat()
         return f"quota:weekly:{user_id}:{start_date}"
 
-    def _fetch_weekly_quota_from_db(self, user_id: str) -> int:
-        """DB에서 사용자의 이번 주 생성 횟수를 직접 조회합니다 (동기).
+    async def _fetch_weekly_quota_from_db(self, user_id: str) -> int:
+        """DB에서 사용자의 이번 주 생성 횟수를 직접 조회합니다.
 
         이번 주 월요일부터 현재까지의 'generation_history' 테이블 레코드 수를 카운트합니다.
 
@@ -185,12 +248,14 @@ class SupabaseService:
             start_of_week = self._get_week_start()
 
             # count='exact', head=True로 실제 데이터는 가져오지 않고 개수만 확인
-            response = (
-                self.client.table("generation_history")
-                .select("id", count="exact", head=True)
-                .eq("user_id", user_id)
-                .gte("created_at", start_of_week.isoformat())
-                .execute()
+            response = await run_query(
+                self,
+                lambda db: (
+                    db.table("generation_history")
+                    .select("id", count="exact", head=True)
+                    .eq("user_id", user_id)
+                    .gte("created_at", start_of_week.isoformat())
+                ),
             )
             return response.count if response.count is not None else 0
 
@@ -220,8 +285,8 @@ class SupabaseService:
         if cached_count is not None:
             return int(cached_count)
 
-        # 2. DB 조회 (동기 함수를 스레드풀에서 실행)
-        count = await run_in_threadpool(self._fetch_weekly_quota_from_db, user_id)
+        # 2. DB 조회
+        count = await self._fetch_weekly_quota_from_db(user_id)
 
         # 3. 캐시 저장 (TTL: 1시간 = 3600초)
         await self.cache.set(cache_key, str(count), ttl=3600)
@@ -241,25 +306,35 @@ class SupabaseService:
         cache_key = self._get_quota_cache_key(user_id)
 
         try:
-            # 키 존재 여부 확인 후 증가 (Race Condition 최소화를 위해 Lua 스크립트 사용 가능하지만,
-            # 여기서는 단순히 존재 여부만 체크하고 진행하거나,
-            # Redis INCR의 특성(없으면 생성)을 피하기 위해 exists 체크 후 진행)
-            # 가장 안전한 방법: 캐시를 삭제하여 다음 요청 시 강제 갱신
-            # 또는 exists -> incr (약간의 race condition 존재하나 허용 가능 범위)
-
-            # 여기서는 캐시 삭제 전략을 선택: 가장 안전하고 구현이 간단함.
-            # 하지만 빈번한 삭제는 캐시 효율을 떨어뜨리므로,
-            # "키가 있으면 증가, 없으면 무시"가 베스트.
-            # python redis client의 incr은 키가 없으면 생성해버림.
-
-            lua_script = """
-            if redis.call("EXISTS", KEYS[1]) == 1 then
-                return redis.call("INCR", KEYS[1])
-            else
-                return nil
-            end
-            """
-            await self.cache.redis_client.eval(lua_script, 1, cache_key)
-
+            # INCR은 키가 없으면 새로 만들므로, 키가 있을 때만 증가 (원자적 Lua 스크립트)
+            await self.cache.incr_if_exists(cache_key)
         except Exception as e:
             logger.warning(f"쿼터 캐시 증가 실패 (DB 데이터는 안전함): {e}")
+
+
+async def run_query(supabase: SupabaseService, build: Callable[[Any], Any]) -> Any:
+    """PostgREST 쿼리를 실행합니다.
+
+    비동기 클라이언트를 사용할 수 있으면 이벤트 루프에서 직접 실행하고,
+    비활성화(SUPABASE_ASYNC_CLIENT=false)되었거나 생성에 실패한 경우
+    동기 supabase-py 클라이언트를 스레드풀에서 실행합니다.
+    두 클라이언트의 쿼리 빌더 API(table, rpc, select, eq, ...)는 동일합니다.
+
+    Args:
+        supabase: SupabaseService 인스턴스.
+        build: 클라이언트를 받아 execute() 직전의 쿼리 빌더를 반환하는 함수.
+
+    Returns:
+        APIResponse: 쿼리 결과.
+
+    Raises:
+        APIError: PostgREST 오류 시.
+
+    Example:
+        >>> await run_query(supabase, lambda db: db.table("user_tokens").select("*"))
+    """
+    if settings.SUPABASE_ASYNC_CLIENT:
+        async_client = supabase.async_client
+        if async_client is not None:
+            return await build(async_client).execute()
+    return await run_in_threadpool(lambda: build(supabase.client).execute())
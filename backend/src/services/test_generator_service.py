@@ -1,8 +1,31 @@
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Sequence
+from typing import NamedTuple, Optional
 
+from src.config.settings import settings
 from src.exceptions import ValidationError
-from src.languages.factory import LanguageFactory
+from src.languages.factory import LanguageFactory, UnsupportedLanguageError
 from src.services.gemini_service import GeminiService
+from src.types import SourceCode, ValidationResult
+from starlette.concurrency import run_in_threadpool
+
+
+class BatchEvent(NamedTuple):
+    """일괄 생성 스트림에서 파일 하나에 대한 이벤트.
+
+    Attributes:
+        index: 요청 파일 목록에서의 위치.
+        chunk: 생성된 테스트 코드 청크 (완료·실패 이벤트는 빈 문자열).
+        cached: 캐시된 결과를 그대로 전달한 청크인지 여부.
+        done: 해당 파일의 생성이 끝났는지 여부.
+        error: 해당 파일의 생성이 실패한 경우의 예외.
+    """
+
+    index: int
+    chunk: str = ""
+    cached: bool = False
+    done: bool = False
+    error: Optional[Exception] = None
 
 
 class TestGeneratorService:
@@ -55,5 +78,106 @@ class TestGeneratorService:
             system_instruction=system_instruction,
             stream=True,
             is_regenerate=is_regenerate,
+            cache_source=strategy.normalize_for_cache(code),
         ):
             yield chunk
+
+    async def validate_files(self, files: Sequence[SourceCode]) -> list[ValidationResult]:
+        """여러 파일을 언어별 전략으로 동시에 검증합니다.
+
+        검증(AST 파싱, 토큰화)은 CPU 작업이므로 스레드풀에서 실행하여 파일이 많아도
+        이벤트 루프를 막지 않습니다.
+
+        Args:
+            files: 검증할 파일 목록.
+
+        Returns:
+            파일 순서대로의 검증 결과.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    run_in_threadpool(self._validate, file.input_code, file.language)
+                    for file in files
+                )
+            )
+        )
+
+    async def generate_batch(
+        self,
+        files: Sequence[SourceCode],
+        model: str,
+        is_regenerate: bool = False,
+        concurrency: Optional[int] = None,
+    ) -> AsyncGenerator[BatchEvent, None]:
+        """검증을 통과한 여러 파일의 테스트 코드를 동시에 생성합니다.
+
+        캐시에 결과가 있는 파일은 즉시 전달하고, 나머지는 최대 concurrency개씩 Gemini를
+        호출합니다. 파일별 청크는 도착하는 순서대로 섞여 전달되며, 파일마다 완료 또는
+        실패 이벤트가 정확히 한 번 전달됩니다. 한 파일의 실패는 다른 파일에 영향을 주지
+        않습니다.
+
+        Args:
+            files: 생성할 파일 목록 (`validate_files`를 통과한 파일).
+            model: 사용할 AI 모델명.
+            is_regenerate: 재생성 요청 여부 (True면 캐시 무시).
+            concurrency: 동시에 Gemini를 호출하는 파일 수 (None이면 설정값).
+
+        Yields:
+            파일별 생성 이벤트.
+        """
+        concurrency = concurrency or settings.GENERATION_BATCH_CONCURRENCY
+        gemini_service = GeminiService(model_name=model)
+        slots = asyncio.Semaphore(concurrency)
+        # 소비가 느리면 생성 태스크도 멈추도록 대기열 크기를 제한
+        events: asyncio.Queue[BatchEvent] = asyncio.Queue(maxsize=concurrency)
+
+        async def produce(index: int, file: SourceCode) -> None:
+            try:
+                strategy = LanguageFactory.get_strategy(file.language)
+                system_instruction = strategy.get_system_instruction()
+                cache_source = strategy.normalize_for_cache(file.input_code)
+                cached = None
+                if not is_regenerate:
+                    cached = await gemini_service.get_cached(
+                        file.input_code, system_instruction, cache_source
+                    )
+                if cached:
+                    await events.put(BatchEvent(index, chunk=cached, cached=True))
+                else:
+                    async with slots:
+                        async for chunk in gemini_service.generate_test_code(
+                            source_code=file.input_code,
+                            system_instruction=system_instruction,
+                            stream=True,
+                            is_regenerate=is_regenerate,
+                            cache_source=cache_source,
+                        ):
+                            await events.put(BatchEvent(index, chunk=chunk))
+            except Exception as e:
+                await events.put(BatchEvent(index, error=e))
+                return
+            await events.put(BatchEvent(index, done=True))
+
+        tasks = [asyncio.create_task(produce(index, file)) for index, file in enumerate(files)]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                event = await events.get()
+                if event.done or event.error is not None:
+                    remaining -= 1
+                yield event
+        finally:
+            # 소비자가 중단되면 진행 중인 생성을 모두 취소하고 정리될 때까지 대기
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _validate(code: str, language: str) -> ValidationResult:
+        """언어 전략으로 코드 하나를 검증합니다."""
+        try:
+            strategy = LanguageFactory.get_strategy(language)
+        except UnsupportedLanguageError as e:
+            return ValidationResult(is_valid=False, error_message=str(e))
+        return strategy.validate_code(code)
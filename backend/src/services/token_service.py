@@ -4,18 +4,42 @@
 모든 토큰 변동은 Supabase RPC를 통해 Atomic하게 처리됩니다.
 """
 
+from datetime import datetime, timezone
+from typing import Optional
+
+from postgrest.exceptions import APIError
 from src.config.constants import TokenConstants
 from src.exceptions import (
     DuplicateTransactionError,
     InsufficientTokensError,
 )
-from src.services.supabase_service import SupabaseService
+from src.services.cache_service import CacheService
+from src.services.supabase_service import SupabaseService, run_query
 from src.types import TokenDeductResult, TokenInfo
 from src.utils.logger import get_logger
-from starlette.concurrency import run_in_threadpool
+from src.utils.metrics import TOKEN_BALANCE_CACHE_REQUESTS
 
 logger = get_logger(__name__)
 
+# 잔액 캐시 전체 기록 (상태 조회 결과: 잔액 + 일일 보너스 수령일).
+# 조회 RPC 이전에 읽은 무효화 버전이 그대로일 때만 기록 (그 사이 잔액이 바뀌었으면 건너뜀)
+_STORE_BALANCE_SCRIPT = """
+if (redis.call("GET", KEYS[2]) or "") ~= ARGV[4] then
+    return 0
+end
+redis.call("HSET", KEYS[1], "balance", ARGV[1], "bonus_date", ARGV[2])
+redis.call("EXPIRE", KEYS[1], ARGV[3])
+return 1
+"""
+
+# 잔액 캐시 삭제 + 무효화 버전 증가 (진행 중인 조회가 오래된 잔액을 기록하지 못하게 함)
+_INVALIDATE_BALANCE_SCRIPT = """
+redis.call("DEL", KEYS[1])
+redis.call("INCR", KEYS[2])
+redis.call("EXPIRE", KEYS[2], ARGV[1])
+return 1
+"""
+
 
 class TokenService:
     """토큰 관련 비즈니스 로직을 처리하는 서비스.
@@ -23,17 +47,38 @@ class TokenService:
     Supabase RPC 함수를 호출하여 토큰 잔액의 원자적(Atomic) 변경을 보장합니다.
     Redis 캐싱은 조회 성능 최적화를 위해 선택적으로 적용됩니다.
 
+    잔액은 Redis 해시(tokens:balance:{user_id})에 캐싱하며, 상태 조회 시 DB 결과로
+    채웁니다. 차감/환불/적립 후에는 RPC가 반환한 잔액을 쓰지 않고 캐시를 삭제합니다.
+    동시에 실행된 RPC의 캐시 쓰기 순서는 DB 커밋 순서와 다를 수 있어, 덮어쓰면 먼저
+    커밋된 오래된 잔액이 TTL 동안 남을 수 있기 때문입니다. 삭제할 때마다 사용자별 무효화
+    버전(tokens:balance_version:{user_id})을 올리고, 상태 조회는 RPC 전에 읽은 버전이
+    그대로일 때만 캐시를 채우므로 조회 도중 커밋된 변동을 덮어쓰지 않습니다.
+    Redis 장애 시에는 캐시 없이 DB로 처리합니다.
+
     Attributes:
         _supabase: Supabase 서비스 인스턴스.
+        _cache: 잔액 캐시용 CacheService (None이면 캐싱 비활성화).
     """
 
-    def __init__(self, supabase_service: SupabaseService) -> None:
+    _RPC_NOT_FOUND_CODE = "PGRST202"
+    """PostgREST: 호출한 RPC 함수가 스키마에 없음"""
+
+    _wallet_status_rpc_available: bool = True
+    """get_wallet_status RPC 사용 가능 여부 (미배포 확인 시 프로세스 단위로 비활성화)"""
+
+    def __init__(
+        self,
+        supabase_service: SupabaseService,
+        cache_service: Optional[CacheService] = None,
+    ) -> None:
         """TokenService를 초기화합니다.
 
         Args:
             supabase_service: Supabase 서비스 의존성.
+            cache_service: 잔액 캐시용 CacheService (선택).
         """
         self._supabase = supabase_service
+        self._cache = cache_service
 
     async def get_token_info(self, user_id: str) -> TokenInfo:
         """사용자의 토큰 상태를 조회합니다.
@@ -41,6 +86,45 @@ class TokenService:
         user_tokens 레코드가 없으면 자동으로 생성(웰컴 보너스 지급)합니다.
         일일 보너스 미수령 시 자동으로 지급 처리합니다.
 
+        오늘 일일 보너스 처리가 끝난 잔액이 캐시에 있으면 DB를 조회하지 않습니다.
+        그 외에는 `get_wallet_status` RPC 한 번(DB 왕복 1회, 스레드풀 1회)으로 처리하며,
+        RPC가 배포되지 않았거나 실패하면 개별 RPC 3회 호출 방식으로 대체합니다.
+
+        Args:
+            user_id: 사용자 ID.
+
+        Returns:
+            TokenInfo: 현재 토큰 상태 정보.
+        """
+        cached = await self._get_cached_balance(user_id)
+        if cached is not None and cached.get("bonus_date") == self._today():
+            return TokenInfo(
+                current_tokens=int(cached["balance"]),
+                daily_bonus_claimed=True,
+                cost_per_generation=TokenConstants.COST_PER_GENERATION,
+            )
+
+        if TokenService._wallet_status_rpc_available:
+            try:
+                version = await self._get_balance_version(user_id)
+                result = await self._call_wallet_status_rpc(user_id)
+                token_info = self._build_token_info(result)
+                if token_info.daily_bonus_claimed:
+                    await self._store_balance(user_id, token_info.current_tokens, version)
+                return token_info
+            except APIError as e:
+                if e.code == self._RPC_NOT_FOUND_CODE:
+                    # 스키마 미적용 환경: 이후 요청은 바로 기존 방식 사용
+                    TokenService._wallet_status_rpc_available = False
+                logger.warning(f"지갑 상태 RPC 실패, 개별 RPC로 대체합니다: {e.message}")
+            except Exception as e:
+                logger.warning(f"지갑 상태 RPC 실패, 개별 RPC로 대체합니다: {e}")
+
+        return await self._get_token_info_legacy(user_id)
+
+    async def _get_token_info_legacy(self, user_id: str) -> TokenInfo:
+        """지갑 초기화, 일일 보너스, 잔액 조회를 개별 RPC로 처리합니다.
+
         Args:
             user_id: 사용자 ID.
 
@@ -53,8 +137,8 @@ class TokenService:
         # 2. 일일 보너스 처리 (Atomic Check & Add)
         bonus_result = await self._claim_daily_bonus_internal(user_id)
 
-        # 3. 최종 상태 조회
-        token_data = await run_in_threadpool(self._fetch_user_tokens, user_id)
+        # 3. 최종 상태 조회 (보너스 처리 결과로 갱신된 캐시 우선)
+        token_data = await self._get_user_tokens(user_id)
 
         daily_bonus_claimed = bonus_result.get("already_claimed", False) or bonus_result.get(
             "success", False
@@ -66,6 +150,22 @@ class TokenService:
             cost_per_generation=TokenConstants.COST_PER_GENERATION,
         )
 
+    def _build_token_info(self, result: dict) -> TokenInfo:
+        """get_wallet_status RPC 결과를 TokenInfo로 변환합니다.
+
+        Args:
+            result: RPC 결과 (success, already_claimed, added, current_balance, wallet_created).
+
+        Returns:
+            TokenInfo: 현재 토큰 상태 정보.
+        """
+        return TokenInfo(
+            current_tokens=result.get("current_balance", 0),
+            daily_bonus_claimed=result.get("already_claimed", False)
+            or result.get("success", False),
+            cost_per_generation=TokenConstants.COST_PER_GENERATION,
+        )
+
     async def deduct_tokens(self, user_id: str, amount: int) -> TokenDeductResult:
         """테스트 생성 시 토큰을 차감합니다.
 
@@ -83,13 +183,14 @@ class TokenService:
             InsufficientTokensError: 토큰 잔액 부족 시.
         """
         try:
-            result = await run_in_threadpool(self._call_deduct_rpc, user_id, amount)
+            result = await self._call_deduct_rpc(user_id, amount)
 
             if not result.get("success", False):
                 error_code = result.get("error", "")
                 current_balance = result.get("current_balance", 0)
 
                 if error_code == "INSUFFICIENT_TOKENS":
+                    await self._invalidate_balance(user_id)
                     raise InsufficientTokensError(
                         current=current_balance,
                         required=amount,
@@ -102,6 +203,7 @@ class TokenService:
                     error=error_code,
                 )
 
+            await self._invalidate_balance(user_id)
             logger.info_ctx(
                 "토큰 차감 완료",
                 user_id=user_id,
@@ -118,6 +220,7 @@ class TokenService:
             raise
         except Exception as e:
             logger.error(f"토큰 차감 중 예외 발생: {e}")
+            await self._invalidate_balance(user_id)
             raise
 
     async def refund_tokens(self, user_id: str, amount: int) -> bool:
@@ -131,9 +234,10 @@ class TokenService:
             bool: 환불 성공 여부.
         """
         try:
-            result = await run_in_threadpool(self._call_refund_rpc, user_id, amount)
+            result = await self._call_refund_rpc(user_id, amount)
             success = result.get("success", False)
             if success:
+                await self._invalidate_balance(user_id)
                 logger.info_ctx(
                     "토큰 환불 완료",
                     user_id=user_id,
@@ -142,6 +246,7 @@ class TokenService:
             return success
         except Exception as e:
             logger.error(f"토큰 환불 실패: {e}")
+            await self._invalidate_balance(user_id)
             return False
 
     async def add_tokens(
@@ -168,8 +273,7 @@ class TokenService:
             DuplicateTransactionError: 중복 보상 요청 시.
         """
         try:
-            result = await run_in_threadpool(
-                self._call_add_rpc,
+            result = await self._call_add_rpc(
                 user_id,
                 amount,
                 token_type,
@@ -184,6 +288,7 @@ class TokenService:
                 logger.error(f"토큰 적립 실패: {error_code}")
                 return result
 
+            await self._invalidate_balance(user_id)
             logger.info_ctx(
                 "토큰 적립 완료",
                 user_id=user_id,
@@ -195,12 +300,141 @@ class TokenService:
             raise
         except Exception as e:
             logger.error(f"토큰 적립 중 예외 발생: {e}")
+            await self._invalidate_balance(user_id)
             raise
 
-    # === Private: Supabase RPC Wrappers ===
+    # === Private: Balance Cache ===
+
+    @staticmethod
+    def _today() -> str:
+        """일일 보너스 기준 날짜를 반환합니다 (DB CURRENT_DATE와 같은 UTC 기준)."""
+        return datetime.now(timezone.utc).date().isoformat()
+
+    @staticmethod
+    def _balance_cache_key(user_id: str) -> str:
+        """사용자별 잔액 캐시 키를 생성합니다.
+
+        키 형식: tokens:balance:{user_id} (Hash: balance, bonus_date)
+        """
+        return f"tokens:balance:{user_id}"
+
+    @staticmethod
+    def _balance_version_key(user_id: str) -> str:
+        """사용자별 잔액 캐시 무효화 버전 키를 생성합니다.
+
+        키 형식: tokens:balance_version:{user_id} (String: 무효화 횟수)
+        """
+        return f"tokens:balance_version:{user_id}"
+
+    async def _get_cached_balance(self, user_id: str) -> dict | None:
+        """캐시된 잔액 정보를 조회합니다.
+
+        Args:
+            user_id: 사용자 ID.
+
+        Returns:
+            dict | None: {"balance", "bonus_date"} 또는 None (캐시 미스/비활성화/장애).
+        """
+        if self._cache is None:
+            return None
+        try:
+            cached = await self._cache.redis_client.hgetall(self._balance_cache_key(user_id))
+        except Exception as e:
+            TOKEN_BALANCE_CACHE_REQUESTS.labels(result="error").inc()
+            logger.warning(f"잔액 캐시 조회 실패 (DB로 대체): {e}")
+            return None
 
-    def _fetch_user_tokens(self, user_id: str) -> dict | None:
-        """user_tokens 테이블에서 사용자 토큰 데이터를 조회합니다 (동기).
+        if cached and "balance" in cached:
+            TOKEN_BALANCE_CACHE_REQUESTS.labels(result="hit").inc()
+            return cached
+        TOKEN_BALANCE_CACHE_REQUESTS.labels(result="miss").inc()
+        return None
+
+    async def _get_user_tokens(self, user_id: str) -> dict | None:
+        """잔액을 캐시에서 조회하고, 없으면 user_tokens 테이블에서 조회합니다.
+
+        Args:
+            user_id: 사용자 ID.
+
+        Returns:
+            dict | None: 토큰 데이터 또는 None.
+        """
+        cached = await self._get_cached_balance(user_id)
+        if cached is not None:
+            return {"balance": int(cached["balance"])}
+        return await self._fetch_user_tokens(user_id)
+
+    async def _get_balance_version(self, user_id: str) -> str | None:
+        """잔액 캐시 무효화 버전을 조회합니다 (잔액 조회 RPC 호출 전에 사용).
+
+        Args:
+            user_id: 사용자 ID.
+
+        Returns:
+            str | None: 무효화 버전 (무효화된 적이 없으면 빈 문자열).
+                캐시 비활성화/장애 시 None이며, 이 경우 조회 결과를 캐시에 기록하지 않습니다.
+        """
+        if self._cache is None:
+            return None
+        try:
+            version = await self._cache.redis_client.get(self._balance_version_key(user_id))
+        except Exception as e:
+            logger.warning(f"잔액 캐시 버전 조회 실패 (캐시에 기록하지 않음): {e}")
+            return None
+        return version or ""
+
+    async def _store_balance(self, user_id: str, balance: int, version: str | None) -> None:
+        """오늘 일일 보너스 처리가 끝난 잔액을 캐시에 기록합니다.
+
+        RPC 호출 후 잔액 변동으로 무효화 버전이 바뀌었으면 기록하지 않습니다.
+
+        Args:
+            user_id: 사용자 ID.
+            balance: RPC가 반환한 최신 잔액.
+            version: RPC 호출 전에 읽은 무효화 버전 (`_get_balance_version`).
+        """
+        if self._cache is None or version is None:
+            return
+        try:
+            await self._cache.redis_client.eval(
+                _STORE_BALANCE_SCRIPT,
+                2,
+                self._balance_cache_key(user_id),
+                self._balance_version_key(user_id),
+                balance,
+                self._today(),
+                TokenConstants.CACHE_TTL,
+                version,
+            )
+        except Exception as e:
+            logger.warning(f"잔액 캐시 저장 실패 (DB 데이터는 안전함): {e}")
+
+    async def _invalidate_balance(self, user_id: str) -> None:
+        """캐시된 잔액을 삭제하고 무효화 버전을 올립니다.
+
+        잔액이 바뀌었거나 RPC 결과를 알 수 없는 경우 호출합니다. 버전 키는 진행 중인
+        조회가 끝날 때까지 남도록 잔액 캐시와 같은 TTL로 유지합니다.
+
+        Args:
+            user_id: 사용자 ID.
+        """
+        if self._cache is None:
+            return
+        try:
+            await self._cache.redis_client.eval(
+                _INVALIDATE_BALANCE_SCRIPT,
+                2,
+                self._balance_cache_key(user_id),
+                self._balance_version_key(user_id),
+                TokenConstants.CACHE_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"잔액 캐시 삭제 실패: {e}")
+
+    # === Private: Supabase RPC Wrappers (비동기 PostgREST, 스레드풀 대체) ===
+
+    async def _fetch_user_tokens(self, user_id: str) -> dict | None:
+        """user_tokens 테이블에서 사용자 토큰 데이터를 조회합니다.
 
         Args:
             user_id: 사용자 ID.
@@ -209,20 +443,55 @@ class TokenService:
             dict | None: 토큰 데이터 또는 None.
         """
         try:
-            response = (
-                self._supabase.client.table("user_tokens")
-                .select("*")
-                .eq("user_id", user_id)
-                .maybe_single()
-                .execute()
+            response = await run_query(
+                self._supabase,
+                lambda db: (
+                    db.table("user_tokens").select("*").eq("user_id", user_id).maybe_single()
+                ),
             )
+            if response is None:
+                return None  # maybe_single: 행이 없으면 응답 자체가 None
             return response.data
         except Exception as e:
             logger.error(f"토큰 데이터 조회 실패: {e}")
             return None
 
-    def _call_deduct_rpc(self, user_id: str, amount: int) -> dict:
-        """deduct_tokens RPC를 호출합니다 (동기).
+    async def _call_wallet_status_rpc(self, user_id: str) -> dict:
+        """get_wallet_status RPC를 호출합니다.
+
+        지갑 초기화(웰컴 보너스), 일일 보너스 지급, 잔액 조회를 한 트랜잭션에서 처리합니다.
+
+        Args:
+            user_id: 사용자 ID.
+
+        Returns:
+            dict: RPC 결과.
+        """
+        response = await run_query(
+            self._supabase,
+            lambda db: db.rpc(
+                "get_wallet_status",
+                {
+                    "p_user_id": user_id,
+                    "p_welcome_amount": TokenConstants.WELCOME_BONUS,
+                    "p_welcome_description": "신규 가입 웰컴 보너스",
+                    "p_bonus_amount": TokenConstants.DAILY_BONUS,
+                },
+            ),
+        )
+        result = response.data
+        if result.get("wallet_created"):
+            logger.info_ctx(
+                "웰컴 보너스 지급 완료", user_id=user_id, amount=TokenConstants.WELCOME_BONUS
+            )
+        if result.get("success"):
+            logger.info_ctx(
+                "일일 보너스 지급 완료", user_id=user_id, amount=TokenConstants.DAILY_BONUS
+            )
+        return result
+
+    async def _call_deduct_rpc(self, user_id: str, amount: int) -> dict:
+        """deduct_tokens RPC를 호출합니다.
 
         Args:
             user_id: 사용자 ID.
@@ -231,13 +500,16 @@ class TokenService:
         Returns:
             dict: RPC 결과.
         """
-        response = self._supabase.client.rpc(
-            "deduct_tokens",
-            {"p_user_id": user_id, "p_amount": amount},
-        ).execute()
+        response = await run_query(
+            self._supabase,
+            lambda db: db.rpc(
+                "deduct_tokens",
+                {"p_user_id": user_id, "p_amount": amount},
+            ),
+        )
         return response.data
 
-    def _call_add_rpc(
+    async def _call_add_rpc(
         self,
         user_id: str,
         amount: int,
@@ -245,7 +517,7 @@ class TokenService:
         description: str | None,
         reference_id: str | None,
     ) -> dict:
-        """add_tokens RPC를 호출합니다 (동기).
+        """add_tokens RPC를 호출합니다.
 
         Args:
             user_id: 사용자 ID.
@@ -257,20 +529,23 @@ class TokenService:
         Returns:
             dict: RPC 결과.
         """
-        response = self._supabase.client.rpc(
-            "add_tokens",
-            {
-                "p_user_id": user_id,
-                "p_amount": amount,
-                "p_type": token_type,
-                "p_description": description,
-                "p_reference_id": reference_id,
-            },
-        ).execute()
+        response = await run_query(
+            self._supabase,
+            lambda db: db.rpc(
+                "add_tokens",
+                {
+                    "p_user_id": user_id,
+                    "p_amount": amount,
+                    "p_type": token_type,
+                    "p_description": description,
+                    "p_reference_id": reference_id,
+                },
+            ),
+        )
         return response.data
 
-    def _call_refund_rpc(self, user_id: str, amount: int) -> dict:
-        """refund_tokens RPC를 호출합니다 (동기).
+    async def _call_refund_rpc(self, user_id: str, amount: int) -> dict:
+        """refund_tokens RPC를 호출합니다.
 
         Args:
             user_id: 사용자 ID.
@@ -279,14 +554,17 @@ class TokenService:
         Returns:
             dict: RPC 결과.
         """
-        response = self._supabase.client.rpc(
-            "refund_tokens",
-            {"p_user_id": user_id, "p_amount": amount},
-        ).execute()
+        response = await run_query(
+            self._supabase,
+            lambda db: db.rpc(
+                "refund_tokens",
+                {"p_user_id": user_id, "p_amount": amount},
+            ),
+        )
         return response.data
 
-    def _call_daily_bonus_rpc(self, user_id: str) -> dict:
-        """claim_daily_bonus RPC를 호출합니다 (동기).
+    async def _call_daily_bonus_rpc(self, user_id: str) -> dict:
+        """claim_daily_bonus RPC를 호출합니다.
 
         Args:
             user_id: 사용자 ID.
@@ -294,13 +572,16 @@ class TokenService:
         Returns:
             dict: RPC 결과.
         """
-        response = self._supabase.client.rpc(
-            "claim_daily_bonus",
-            {
-                "p_user_id": user_id,
-                "p_bonus_amount": TokenConstants.DAILY_BONUS,
-            },
-        ).execute()
+        response = await run_query(
+            self._supabase,
+            lambda db: db.rpc(
+                "claim_daily_bonus",
+                {
+                    "p_user_id": user_id,
+                    "p_bonus_amount": TokenConstants.DAILY_BONUS,
+                },
+            ),
+        )
         return response.data
 
     async def _claim_daily_bonus_internal(self, user_id: str) -> dict:
@@ -313,13 +594,16 @@ class TokenService:
             dict: RPC 결과.
         """
         try:
-            result = await run_in_threadpool(self._call_daily_bonus_rpc, user_id)
+            version = await self._get_balance_version(user_id)
+            result = await self._call_daily_bonus_rpc(user_id)
             if result.get("success", False):
                 logger.info_ctx(
                     "일일 보너스 지급 완료",
                     user_id=user_id,
                     amount=TokenConstants.DAILY_BONUS,
                 )
+            if result.get("success", False) or result.get("already_claimed", False):
+                await self._store_balance(user_id, result.get("current_balance", 0), version)
             return result
         except Exception as e:
             logger.error(f"일일 보너스 처리 실패: {e}")
@@ -332,16 +616,15 @@ class TokenService:
             user_id: 사용자 ID.
         """
         try:
-            await run_in_threadpool(
-                self._call_initialize_wallet_rpc,
+            await self._call_initialize_wallet_rpc(
                 user_id,
                 TokenConstants.WELCOME_BONUS,
             )
         except Exception as e:
             logger.error(f"지갑 초기화 실패: {e}")
 
-    def _call_initialize_wallet_rpc(self, user_id: str, amount: int) -> dict:
-        """initialize_user_wallet RPC를 호출합니다 (동기).
+    async def _call_initialize_wallet_rpc(self, user_id: str, amount: int) -> dict:
+        """initialize_user_wallet RPC를 호출합니다.
 
         Args:
             user_id: 사용자 ID.
@@ -350,12 +633,15 @@ class TokenService:
         Returns:
             dict: RPC 결과.
         """
-        response = self._supabase.client.rpc(
-            "initialize_user_wallet",
-            {
-                "p_user_id": user_id,
-                "p_default_amount": amount,
-                "p_description": "신규 가입 웰컴 보너스",
-            },
-        ).execute()
+        response = await run_query(
+            self._supabase,
+            lambda db: db.rpc(
+                "initialize_user_wallet",
+                {
+                    "p_user_id": user_id,
+                    "p_default_amount": amount,
+                    "p_description": "신규 가입 웰컴 보너스",
+                },
+            ),
+        )
         return response.data
@@ -5,9 +5,10 @@
 """
 
 from dataclasses import dataclass
-from typing import Literal, NewType, TypedDict
+from typing import Any, Literal, NewType, Optional, TypedDict
 
 from pydantic import BaseModel, Field, field_validator
+from src.config.constants import APIConstants
 from src.config.settings import settings
 
 # === 도메인 타입 정의 ===
@@ -48,26 +49,20 @@ ModelName = Literal[
 ]
 """사용 가능한 AI 모델 이름."""
 
-CacheStrategyType = Literal["gemini", "history", "validation"]
+CacheStrategyType = Literal["gemini", "history", "validation", "execution"]
 """캐시 전략 타입."""
 
 
-class GenerateRequest(BaseModel):
-    """테스트 코드 생성 요청 모델.
+class SourceCode(BaseModel):
+    """테스트를 생성할 소스 코드와 언어.
 
     Attributes:
         input_code: 테스트를 생성할 원본 소스 코드.
         language: 프로그래밍 언어 (python, java, javascript 등).
-        model: 사용할 AI 모델 (기본값 설정됨).
-        turnstile_token: Cloudflare Turnstile 검증 토큰.
-        is_regenerate: 재생성 요청 여부 (기본값: False).
     """
 
     input_code: str
     language: str
-    model: str = settings.DEFAULT_GEMINI_MODEL
-    turnstile_token: str = Field(..., description="Cloudflare Turnstile 검증 토큰")
-    is_regenerate: bool = False
 
     @field_validator("input_code")
     @classmethod
@@ -89,6 +84,58 @@ class GenerateRequest(BaseModel):
         return v.lower()
 
 
+class GenerateRequest(SourceCode):
+    """테스트 코드 생성 요청 모델.
+
+    Attributes:
+        input_code: 테스트를 생성할 원본 소스 코드.
+        language: 프로그래밍 언어 (python, java, javascript 등).
+        model: 사용할 AI 모델 (기본값 설정됨).
+        turnstile_token: Cloudflare Turnstile 검증 토큰.
+        is_regenerate: 재생성 요청 여부 (기본값: False).
+    """
+
+    model: str = settings.DEFAULT_GEMINI_MODEL
+    turnstile_token: str = Field(..., description="Cloudflare Turnstile 검증 토큰")
+    is_regenerate: bool = False
+
+
+class BatchFile(SourceCode):
+    """일괄 생성 요청에 포함된 파일 하나.
+
+    Attributes:
+        path: 파일 경로 (SSE 이벤트에서 파일을 구분하는 식별자).
+        input_code: 테스트를 생성할 원본 소스 코드.
+        language: 프로그래밍 언어.
+    """
+
+    path: str = Field(..., min_length=1, max_length=255)
+
+
+class BatchGenerateRequest(BaseModel):
+    """여러 파일의 테스트 코드 일괄 생성 요청 모델.
+
+    Attributes:
+        files: 생성할 파일 목록 (경로는 중복 불가).
+        model: 사용할 AI 모델 (기본값 설정됨).
+        turnstile_token: Cloudflare Turnstile 검증 토큰.
+        is_regenerate: 재생성 요청 여부 (기본값: False).
+    """
+
+    files: list[BatchFile] = Field(..., min_length=1, max_length=APIConstants.MAX_BATCH_FILES)
+    model: str = settings.DEFAULT_GEMINI_MODEL
+    turnstile_token: str = Field(..., description="Cloudflare Turnstile 검증 토큰")
+    is_regenerate: bool = False
+
+    @field_validator("files")
+    @classmethod
+    def validate_unique_paths(cls, v: list[BatchFile]) -> list[BatchFile]:
+        """파일 경로 중복 검증."""
+        if len({file.path for file in v}) != len(v):
+            raise ValueError("파일 경로가 중복되었습니다")
+        return v
+
+
 # === 불변 데이터 구조 ===
 
 
@@ -133,6 +180,23 @@ class CacheMetadata:
             raise ValueError(f"TTL은 양수여야 합니다: {self.ttl}")
 
 
+@dataclass
+class GenerationOutcome:
+    """생성 스트림이 끝난 뒤 호출자가 확인하는 생성 결과.
+
+    Attributes:
+        content: 생성된 테스트 코드 (성공 시).
+        history_id: 저장된 생성 이력 ID (저장 성공 시).
+        error: 실패 시 클라이언트에 전달한 에러 정보 (code, message 등).
+        aborted: 읽는 클라이언트가 없어 생성이 취소되었는지 여부.
+    """
+
+    content: str = ""
+    history_id: Optional[str] = None
+    error: Optional[dict[str, Any]] = None
+    aborted: bool = False
+
+
 # === 토큰 시스템 모델 ===
 
 
@@ -0,0 +1,180 @@
+"""Supabase 액세스 토큰(JWT) 로컬 검증.
+
+요청마다 Supabase Auth 서버(/auth/v1/user)를 호출하면 모든 API 요청에 네트워크 왕복과
+TLS 핸드셰이크가 추가됩니다. 이 모듈은 서명, 만료(exp), 대상(aud), 주체(sub)를 로컬에서
+검증합니다.
+
+- HS256: SUPABASE_JWT_SECRET (레거시 공유 시크릿)
+- RS256/ES256: Supabase JWKS 엔드포인트의 공개 키 (TTL 캐시, 알 수 없는 kid면 1회 재조회)
+"""
+
+import asyncio
+import time
+from typing import Any, Final, Optional
+
+import httpx
+import jwt
+from src.config.constants import NetworkConstants, SecurityConstants
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class JWKSUnavailableError(Exception):
+    """JWKS(공개 키 목록)를 가져오지 못해 비대칭 토큰을 검증할 수 없는 경우 발생하는 예외."""
+
+
+class JWTVerifier:
+    """Supabase JWT를 로컬에서 검증하는 검증기.
+
+    JWKS 조회와 원격 사용자 확인에 하나의 httpx.AsyncClient(커넥션 풀)를 재사용합니다.
+    """
+
+    _SYMMETRIC_ALGORITHMS: Final[frozenset[str]] = frozenset({SecurityConstants.JWT_ALGORITHM})
+    _ASYMMETRIC_ALGORITHMS: Final[frozenset[str]] = frozenset({"RS256", "ES256"})
+
+    def __init__(
+        self,
+        secret: str,
+        supabase_url: str,
+        audience: str = SecurityConstants.JWT_AUDIENCE,
+        jwks_ttl: int = SecurityConstants.JWKS_CACHE_TTL,
+        leeway: int = SecurityConstants.JWT_LEEWAY_SECONDS,
+    ) -> None:
+        """JWTVerifier 인스턴스를 초기화합니다.
+
+        Args:
+            secret: HS256 서명 검증용 공유 시크릿.
+            supabase_url: Supabase 프로젝트 URL (JWKS 및 원격 검증 엔드포인트 기준).
+            audience: 허용할 aud 클레임 값.
+            jwks_ttl: JWKS 캐시 유지 시간 (초).
+            leeway: exp/nbf 검증 시 허용할 시계 오차 (초).
+        """
+        self.secret = secret
+        self.supabase_url = supabase_url.rstrip("/")
+        self.audience = audience
+        self.jwks_ttl = jwks_ttl
+        self.leeway = leeway
+
+        self._keys: dict[str, Any] = {}
+        self._keys_fetched_at = float("-inf")
+        self._last_refresh_attempt = float("-inf")
+        self._jwks_lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """재사용 HTTP 클라이언트를 반환합니다 (최초 사용 시 생성)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=NetworkConstants.HTTP_TIMEOUT_SECONDS)
+        return self._client
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        """토큰의 서명과 클레임을 검증하고 페이로드를 반환합니다.
+
+        Args:
+            token: Bearer 토큰 문자열.
+
+        Returns:
+            검증된 JWT 클레임.
+
+        Raises:
+            jwt.PyJWTError: 서명/만료/대상/필수 클레임 검증 실패 또는 지원하지 않는 알고리즘.
+            JWKSUnavailableError: 비대칭 토큰 검증에 필요한 JWKS를 가져오지 못한 경우.
+        """
+        header = jwt.get_unverified_header(token)
+        algorithm = header.get("alg", "")
+
+        if algorithm in self._SYMMETRIC_ALGORITHMS:
+            key: Any = self.secret
+        elif algorithm in self._ASYMMETRIC_ALGORITHMS:
+            key = await self._get_signing_key(header.get("kid"))
+        else:
+            raise jwt.InvalidAlgorithmError(f"Unsupported JWT algorithm: {algorithm}")
+
+        return jwt.decode(
+            token,
+            key,
+            algorithms=[algorithm],
+            audience=self.audience,
+            leeway=self.leeway,
+            options={"require": ["exp", "sub"]},
+        )
+
+    async def fetch_remote_user(self, token: str, api_key: str) -> httpx.Response:
+        """Supabase Auth 서버에 토큰을 확인합니다 (세션 폐기 여부 확인용).
+
+        Args:
+            token: Bearer 토큰 문자열.
+            api_key: Supabase anon key.
+
+        Returns:
+            /auth/v1/user 응답.
+
+        Raises:
+            httpx.RequestError: 인증 서버 연결 실패 시.
+        """
+        return await self.client.get(
+            f"{self.supabase_url}/auth/v1/user",
+            headers={"Authorization": f"Bearer {token}", "apikey": api_key},
+        )
+
+    async def close(self) -> None:
+        """HTTP 클라이언트를 종료합니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_signing_key(self, kid: Optional[str]) -> Any:
+        """kid에 해당하는 공개 키를 반환합니다.
+
+        캐시가 만료되었거나 kid를 찾지 못하면(키 회전) JWKS를 다시 조회합니다.
+
+        Raises:
+            jwt.InvalidKeyError: 재조회 후에도 kid에 해당하는 키가 없는 경우.
+            JWKSUnavailableError: JWKS 조회 실패 시.
+        """
+        expired = time.monotonic() - self._keys_fetched_at > self.jwks_ttl
+        if expired or kid not in self._keys:
+            await self._refresh_jwks(force=not expired)
+
+        if not self._keys:
+            raise JWKSUnavailableError("사용 가능한 JWKS 키가 없습니다")
+        try:
+            return self._keys[kid]
+        except KeyError:
+            raise jwt.InvalidKeyError(f"Unknown signing key id: {kid}") from None
+
+    async def _refresh_jwks(self, force: bool) -> None:
+        """JWKS를 조회하여 키 캐시를 갱신합니다.
+
+        동시 요청이 몰려도 한 번만 조회하며, 조회 시도(성공/실패 무관)는
+        JWKS_MIN_REFRESH_INTERVAL 안에 반복되지 않도록 제한합니다.
+
+        Args:
+            force: 캐시가 유효하더라도 재조회할지 여부 (알 수 없는 kid).
+        """
+        async with self._jwks_lock:
+            now = time.monotonic()
+            if now - self._last_refresh_attempt < SecurityConstants.JWKS_MIN_REFRESH_INTERVAL:
+                return  # 대기 중 다른 요청이 이미 조회했거나, 최근 시도가 있었음
+            if not force and now - self._keys_fetched_at <= self.jwks_ttl:
+                return
+            self._last_refresh_attempt = now
+
+            try:
+                response = await self.client.get(
+                    f"{self.supabase_url}/auth/v1/.well-known/jwks.json"
+                )
+                response.raise_for_status()
+                jwks = jwt.PyJWKSet.from_dict(response.json())
+            except (httpx.HTTPError, ValueError, jwt.PyJWTError) as e:
+                if self._keys:
+                    # 기존 키로 계속 검증 (다음 요청에서 재시도)
+                    logger.warning(f"JWKS 갱신 실패, 캐시된 키를 계속 사용합니다: {e}")
+                    return
+                raise JWKSUnavailableError(f"JWKS 조회 실패: {e}") from e
+
+            self._keys = {jwk.key_id: jwk.key for jwk in jwks.keys}
+            self._keys_fetched_at = time.monotonic()
+            logger.info(f"JWKS 갱신 완료: {len(self._keys)}개 키")
@@ -0,0 +1,49 @@
+"""애플리케이션 Prometheus 메트릭.
+
+prometheus_client 기본 레지스트리에 등록되므로 Instrumentator가 노출하는
+/metrics 엔드포인트에 함께 포함됩니다.
+"""
+
+from prometheus_client import Counter
+
+TOKEN_BALANCE_CACHE_REQUESTS = Counter(
+    "token_balance_cache_requests_total",
+    "Token balance cache lookups by result",
+    ["result"],  # hit | miss | error
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "CacheService lookups by tier and result",
+    ["tier", "result"],  # tier: l1 | l2, result: hit | miss
+)
+
+CACHE_VALUE_BYTES = Counter(
+    "cache_value_bytes_total",
+    "Bytes of compressed cache values before and after compression",
+    ["form", "codec"],  # form: raw | stored, codec: zstd | zlib
+)
+
+GEMINI_CACHE_REQUESTS = Counter(
+    "gemini_cache_requests_total",
+    "Gemini response cache lookups by key form and result",
+    ["key", "result"],  # key: canonical | raw, result: hit | miss
+)
+
+GENERATION_STREAM_ABORTS = Counter(
+    "generation_stream_aborts_total",
+    "SSE generation streams aborted by client disconnect",
+    ["refunded"],  # true | false
+)
+
+GENERATION_STREAM_RESUMES = Counter(
+    "generation_stream_resumes_total",
+    "SSE generation stream reconnects by Last-Event-ID and where the frames were found",
+    ["source"],  # local | redis | not_found
+)
+
+GEMINI_UPSTREAM_CANCELLATIONS = Counter(
+    "gemini_upstream_cancellations_total",
+    "Gemini upstream streams cancelled before completion because no client was listening",
+    ["partial_cached"],  # true | false
+)
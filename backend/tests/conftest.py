@@ -10,6 +10,8 @@ os.environ.setdefault("SUPABASE_JWT_SECRET", "test_jwt_secret_min_32_chars_len!"
 os.environ.setdefault("DATA_ENCRYPTION_KEY", "6J5FNvK8aF2hq0rP3xZ9yWcN7dB1mT4vL8jG2kH5sX0=")
 os.environ.setdefault("TESTER_INTERNAL_SECRET", "test_internal_secret")
 os.environ.setdefault("DISABLE_WORKER_AUTH", "true")
+# 단위 테스트는 동기 Supabase 클라이언트 Mock을 사용하므로 스레드풀 경로로 실행
+os.environ.setdefault("SUPABASE_ASYNC_CLIENT", "false")
 
 import pytest  # noqa: E402
 from fastapi.testclient import TestClient  # noqa: E402
@@ -92,6 +94,21 @@ def mock_turnstile_success():
         yield mock
 
 
+@pytest.fixture
+def local_resumable_streams():
+    """생성 SSE 스트림이 Redis 없이 같은 프로세스 버퍼만 사용하도록 오버라이드합니다.
+
+    전역 Redis Mock(AsyncMock)으로 프레임을 기록하면 파이프라인 명령 코루틴이 대기되지 않아
+    경고가 발생하므로, `/generate`를 호출하는 테스트에서 사용합니다.
+    """
+    from src.api.v1.deps import get_resumable_streams
+    from tests.helpers import local_streams
+
+    app.dependency_overrides[get_resumable_streams] = lambda: local_streams()
+    yield
+    app.dependency_overrides.pop(get_resumable_streams, None)
+
+
 @pytest.fixture(autouse=True)
 def disable_rate_limit():
     """테스트를 위해 속도 제한(Rate Limiting)을 비활성화합니다."""
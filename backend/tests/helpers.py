@@ -0,0 +1,107 @@
+"""여러 단위 테스트에서 공유하는 테스트 더블과 헬퍼."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+from src.services.resumable_stream import ResumableStreams
+
+
+class FakePipeline:
+    """명령을 모아 두었다가 execute 시 순서대로 실행하는 가짜 파이프라인."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.ops: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class FakeRedis:
+    """문자열·해시·Stream 명령과 파이프라인만 구현한 인메모리 Redis."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.streams: dict[str, list[tuple[str, dict]]] = {}
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def xadd(self, key, fields, id="*"):
+        entries = self.streams.setdefault(key, [])
+        if id == "*":
+            id = f"{len(entries) + 1}-0"
+        entries.append((id, fields))
+        return id
+
+    async def xread(self, streams, count=None, block=None):
+        ((key, last_id),) = streams.items()
+        last = int(last_id.split("-")[0])
+        deadline = asyncio.get_running_loop().time() + (block or 0) / 1000
+        while True:
+            entries = [e for e in self.streams.get(key, []) if int(e[0].split("-")[0]) > last]
+            if entries or block is None or asyncio.get_running_loop().time() >= deadline:
+                return [[key, entries]] if entries else []
+            await asyncio.sleep(0.005)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeRequest:
+    """disconnect 이벤트가 설정되면 http.disconnect를 반환하는 요청."""
+
+    def __init__(self):
+        self.disconnect = asyncio.Event()
+        self.client = None
+
+    async def receive(self):
+        await self.disconnect.wait()
+        return {"type": "http.disconnect"}
+
+
+def local_streams(grace: float = 0) -> ResumableStreams:
+    """Redis를 사용할 수 없어 같은 프로세스 버퍼만 사용하는 스트림 관리자."""
+    redis = MagicMock()
+    redis.set = AsyncMock(side_effect=ConnectionError("redis down"))
+    return ResumableStreams(redis, grace=grace)
+
+
+def parse_frames(frames: list[str]) -> list[dict]:
+    """SSE 프레임의 data 필드를 JSON으로 파싱합니다."""
+    return [
+        orjson.loads(line[len("data: ") :])
+        for frame in frames
+        for line in frame.splitlines()
+        if line.startswith("data: ")
+    ]
@@ -5,7 +5,7 @@ def test_health_check(client):
     assert response.json()["status"] == "ok"
 
 
-def test_generate_code_api(client, mock_user_auth, mock_turnstile_success):
+def test_generate_code_api(client, mock_user_auth, mock_turnstile_success, local_resumable_streams):
     """스트리밍 API가 정상 작동하며 원시 텍스트(Raw Text)를 반환하는지 검증합니다."""
     from unittest.mock import MagicMock
 
@@ -38,7 +38,7 @@ def test_generate_code_api(client, mock_user_auth, mock_turnstile_success):
         assert 'data: {"type":"chunk","content":"Test {}"}' in content
 
 
-def test_validation_error(client, mock_user_auth, mock_turnstile_success):
+def test_validation_error(client, mock_user_auth, mock_turnstile_success, local_resumable_streams):
     """유효하지 않은 코드가 입력되었을 때 에러 메시지를 반환하는지 검증합니다."""
     from unittest.mock import MagicMock
 
@@ -69,3 +69,31 @@ def test_validation_error(client, mock_user_auth, mock_turnstile_success):
         assert response.status_code == 200
         content = response.read().decode()
         assert "error" in content.lower()
+
+
+def test_admin_cache_clear_requires_api_key(client):
+    """캐시 삭제 관리자 엔드포인트는 내부 API 키 없이 접근할 수 없어야 합니다."""
+    response = client.post("/api/admin/cache/clear", params={"pattern": "history:*"})
+    assert response.status_code == 401
+
+
+def test_admin_cache_clear_reports_deleted_count(client):
+    """유효한 API 키로 호출하면 삭제된 키 수를 반환해야 합니다."""
+    from unittest.mock import AsyncMock, patch
+
+    from src.config.settings import settings
+
+    async def fake_clear(pattern, on_progress=None):
+        on_progress(3, 3)
+        return 3
+
+    with patch("src.api.v1.admin.CacheService") as MockCache:
+        MockCache.return_value.clear = AsyncMock(side_effect=fake_clear)
+        response = client.post(
+            "/api/admin/cache/clear",
+            params={"pattern": "history:*"},
+            headers={"X-TESTER-KEY": settings.TESTER_INTERNAL_SECRET.get_secret_value()},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"pattern": "history:*", "scanned": 3, "deleted": 3}
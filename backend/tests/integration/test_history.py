@@ -3,35 +3,39 @@ from unittest.mock import MagicMock, PropertyMock, patch
 from uuid import uuid4
 
 
+def _patch_supabase_client():
+    patcher = patch("src.repositories.base_repository.SupabaseService")
+    MockSupabaseService = patcher.start()
+    mock_instance = MockSupabaseService.return_value
+    mock_client = MagicMock()
+    type(mock_instance).client = (
+        PropertyMock(return_value=mock_client)
+        if isinstance(mock_instance, MagicMock)
+        else mock_client
+    )
+    mock_instance.client = mock_client
+    return patcher, mock_client
+
+
 def test_get_history_integration_success(client, mock_user_auth):
     """
     /api/history 엔드포인트가 모의(Mock) SupabaseService와 함께 정상 작동하는지 검증합니다.
-    BaseRepository가 self.client를 올바르게 사용하는지 확인합니다.
+    목록은 본문 없이 메타데이터와 복호화된 미리보기만 반환해야 합니다.
     """
-    with patch("src.repositories.base_repository.SupabaseService") as MockSupabaseService:
-        mock_instance = MockSupabaseService.return_value
-        mock_client = MagicMock()
-        type(mock_instance).client = (
-            PropertyMock(return_value=mock_client)
-            if isinstance(mock_instance, MagicMock)
-            else mock_client
-        )
-        mock_instance.client = mock_client
-
+    patcher, mock_client = _patch_supabase_client()
+    try:
         mock_response = MagicMock()
         mock_response.data = [
             {
                 "id": str(uuid4()),
-                "user_id": "test_user_id",
-                "input_code": "encrypted_input",
-                "generated_code": "encrypted_output",
                 "language": "python",
                 "model": "gemini-pro",
                 "created_at": datetime.now(timezone.utc).isoformat(),
+                "input_preview": "encrypted_def foo(): pass",
             }
         ]
 
-        mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
+        mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
 
         with patch("src.repositories.generation_repository.EncryptionService") as MockEncryption:
             MockEncryption.return_value.decrypt.side_effect = lambda x: x.replace("encrypted_", "")
@@ -40,8 +44,59 @@ def test_get_history_integration_success(client, mock_user_auth):
 
             assert response.status_code == 200, f"Response 500: {response.text}"
             data = response.json()
-            assert len(data) == 1
-            assert data[0]["input_code"] == "input"
-            assert data[0]["language"] == "python"
+            assert data["next_cursor"] is None
+            assert len(data["items"]) == 1
+            assert data["items"][0]["input_preview"] == "def foo(): pass"
+            assert data["items"][0]["language"] == "python"
+            assert "input_code" not in data["items"][0]
 
             mock_client.table.assert_called_with("generation_history")
+            select_columns = mock_client.table.return_value.select.call_args.args[0]
+            assert "input_code" not in select_columns
+            assert "generated_code" not in select_columns
+    finally:
+        patcher.stop()
+
+
+def test_get_history_rejects_invalid_cursor(client, mock_user_auth):
+    """형식이 잘못된 커서는 400을 반환해야 합니다."""
+    patcher, _ = _patch_supabase_client()
+    try:
+        response = client.get("/api/history/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+    finally:
+        patcher.stop()
+
+
+def test_get_history_item_returns_decrypted_code(client, mock_user_auth):
+    """상세 조회는 본인 이력의 전체 코드를 복호화하여 반환해야 합니다."""
+    patcher, mock_client = _patch_supabase_client()
+    try:
+        history_id = str(uuid4())
+        mock_response = MagicMock()
+        mock_response.data = {
+            "id": history_id,
+            "user_id": "test_user_id",
+            "input_code": "encrypted_input",
+            "generated_code": "encrypted_output",
+            "language": "python",
+            "model": "gemini-pro",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        query = mock_client.table.return_value.select.return_value.eq.return_value.eq.return_value
+        query.maybe_single.return_value.execute.return_value = mock_response
+
+        with patch("src.repositories.generation_repository.EncryptionService") as MockEncryption:
+            MockEncryption.return_value.decrypt.side_effect = lambda x: x.replace("encrypted_", "")
+
+            response = client.get(f"/api/history/{history_id}")
+
+        assert response.status_code == 200
+        assert response.json()["input_code"] == "input"
+        assert response.json()["generated_code"] == "output"
+
+        query.maybe_single.return_value.execute.return_value = None
+        response = client.get(f"/api/history/{uuid4()}")
+        assert response.status_code == 404
+    finally:
+        patcher.stop()
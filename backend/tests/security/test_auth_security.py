@@ -32,7 +32,7 @@ def test_turnstile_failure(client, mock_user_auth):
         assert response.status_code == 400
 
 
-def test_rate_limiting(client, mock_user_auth, mock_turnstile_success):
+def test_rate_limiting(client, mock_user_auth, mock_turnstile_success, local_resumable_streams):
     """짧은 시간 내 5회 초과 요청 시 429 에러가 발생하는지 확인."""
     payload = {
         "input_code": "def foo(): pass",
@@ -40,7 +40,9 @@ def test_global_exception_handler_does_not_leak_details(mock_user_auth, mock_tur
             del app.dependency_overrides[get_test_generator_service]
 
 
-def test_streaming_error_does_not_leak_details(mock_user_auth, mock_turnstile_success):
+def test_streaming_error_does_not_leak_details(
+    mock_user_auth, mock_turnstile_success, local_resumable_streams
+):
     """
     스트리밍 중에 예외가 발생해도 민감한 정보가 노출되지 않는지 확인합니다.
     """
@@ -0,0 +1,171 @@
+"""일괄(다중 파일) 테스트 코드 생성 단위 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import ValidationError as PydanticValidationError
+from src.api.v1.generator import batch_generation_frames
+from src.config.constants import TokenConstants
+from src.services.test_generator_service import TestGeneratorService
+from src.types import BatchFile, BatchGenerateRequest
+from tests.helpers import parse_frames
+
+PYTHON_CODE = "def add(a, b):\n    return a + b\n"
+CACHED_CODE = "def sub(a, b):\n    return a - b\n"
+FAILING_CODE = "def boom(a, b):\n    return a / b\n"
+
+
+class FakeGemini:
+    """동시 호출 수를 기록하고, 입력 코드에 따라 캐시 적중·실패를 흉내 내는 GeminiService."""
+
+    active = 0
+    peak = 0
+    generated: list[str] = []
+
+    def __init__(self, model_name=None):
+        pass
+
+    async def get_cached(self, source_code, system_instruction=None, cache_source=None):
+        return "cached tests" if source_code == CACHED_CODE else None
+
+    async def generate_test_code(self, source_code, **kwargs):
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            await asyncio.sleep(0.01)
+            if source_code == FAILING_CODE:
+                raise RuntimeError("upstream failed")
+            cls.generated.append(source_code)
+            yield "def test_"
+            yield "ok(): pass"
+        finally:
+            cls.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def fake_gemini():
+    FakeGemini.active = FakeGemini.peak = 0
+    FakeGemini.generated = []
+    with patch("src.services.test_generator_service.GeminiService", FakeGemini):
+        yield
+
+
+def make_file(path: str, code: str = PYTHON_CODE, language: str = "python") -> BatchFile:
+    return BatchFile(path=path, input_code=code, language=language)
+
+
+def test_batch_request_rejects_duplicate_paths():
+    """같은 경로의 파일이 두 번 포함되면 요청을 거절해야 함."""
+    with pytest.raises(PydanticValidationError):
+        BatchGenerateRequest(files=[make_file("a.py"), make_file("a.py")], turnstile_token="t")
+
+
+@pytest.mark.asyncio
+async def test_validate_files_returns_result_per_file():
+    """파일마다 언어 전략으로 검증한 결과를 순서대로 반환해야 함."""
+    service = TestGeneratorService(MagicMock())
+
+    results = await service.validate_files(
+        [
+            make_file("a.py"),
+            make_file("b.py", "def broken(:\n    pass"),
+            make_file("c.ts", "const a = 1; export {a};", "typescript"),
+        ]
+    )
+
+    assert [result.is_valid for result in results] == [True, False, False]
+    assert "Unsupported language" in results[2].error_message
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_bounds_concurrency_and_serves_cache_hits():
+    """Gemini 호출은 동시 실행 수를 넘지 않고, 캐시된 파일은 호출 없이 전달해야 함."""
+    service = TestGeneratorService(MagicMock())
+    files = [make_file(f"m{i}.py", PYTHON_CODE + f"# {i}\n") for i in range(5)]
+    files.append(make_file("cached.py", CACHED_CODE))
+
+    events = [event async for event in service.generate_batch(files, "m", concurrency=2)]
+
+    assert FakeGemini.peak == 2
+    assert len(FakeGemini.generated) == 5
+    assert sum(event.done for event in events) == 6
+    cached = [event for event in events if event.index == 5 and event.chunk]
+    assert cached == [cached[0]._replace(chunk="cached tests", cached=True)]
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_isolates_failing_file():
+    """한 파일의 생성 실패는 해당 파일의 에러 이벤트로만 전달되어야 함."""
+    service = TestGeneratorService(MagicMock())
+    files = [make_file("ok.py"), make_file("boom.py", FAILING_CODE)]
+
+    events = [event async for event in service.generate_batch(files, "m")]
+
+    assert [event.index for event in events if event.done] == [0]
+    assert [event.index for event in events if event.error is not None] == [1]
+
+
+@pytest.mark.asyncio
+async def test_batch_frames_deduct_once_and_refund_failed_files():
+    """검증을 통과한 파일 수만큼 한 번에 차감하고, 실패한 파일만큼 한 번에 환불해야 함."""
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(return_value=MagicMock(success=True))
+    token_service.refund_tokens = AsyncMock()
+    repository = MagicMock()
+    repository.create_history = AsyncMock(return_value=MagicMock(id="history-1"))
+    data = BatchGenerateRequest(
+        files=[
+            make_file("ok.py"),
+            make_file("cached.py", CACHED_CODE),
+            make_file("boom.py", FAILING_CODE),
+            make_file("bad.py", "def broken(:\n    pass"),
+        ],
+        turnstile_token="t",
+    )
+    service = TestGeneratorService(MagicMock())
+
+    frames = [
+        frame
+        async for frame in batch_generation_frames(
+            data, "user-1", service, repository, token_service
+        )
+    ]
+    events = parse_frames(frames)
+
+    cost = TokenConstants.COST_PER_GENERATION
+    token_service.deduct_tokens.assert_awaited_once_with(user_id="user-1", amount=3 * cost)
+    token_service.refund_tokens.assert_awaited_once_with(user_id="user-1", amount=cost)
+    assert repository.create_history.await_count == 2
+    errors = {event["file"]: event["code"] for event in events if event["type"] == "error"}
+    assert errors == {"bad.py": "VALIDATION_ERROR", "boom.py": "GENERATION_ERROR"}
+    done_files = {event["file"]: event for event in events if event["type"] == "file_done"}
+    assert done_files["cached.py"]["cached"] is True
+    assert done_files["ok.py"]["cached"] is False
+    assert done_files["ok.py"]["history_id"] == "history-1"
+    assert events[-1] == {"type": "done", "succeeded": 2, "failed": 2}
+
+
+@pytest.mark.asyncio
+async def test_batch_frames_stop_when_tokens_insufficient():
+    """토큰이 부족하면 생성하지 않고 필요한 총 토큰 수를 알려야 함."""
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(
+        return_value=MagicMock(success=False, current_balance=5)
+    )
+    token_service.refund_tokens = AsyncMock()
+    data = BatchGenerateRequest(files=[make_file("a.py"), make_file("b.py")], turnstile_token="t")
+
+    frames = [
+        frame
+        async for frame in batch_generation_frames(
+            data, "user-1", TestGeneratorService(MagicMock()), MagicMock(), token_service
+        )
+    ]
+
+    (event,) = parse_frames(frames)
+    assert event["code"] == "INSUFFICIENT_TOKENS"
+    assert event["required"] == 2 * TokenConstants.COST_PER_GENERATION
+    assert FakeGemini.generated == []
+    token_service.refund_tokens.assert_not_awaited()
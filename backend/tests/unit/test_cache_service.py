@@ -1,9 +1,22 @@
-from unittest.mock import AsyncMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 import redis.asyncio as redis
+from src.config.constants import CacheConstants
 from src.exceptions import CacheError
-from src.services.cache_service import CacheService, RedisConnectionManager
+from src.services.cache_service import (
+    CacheEntry,
+    CacheInvalidationListener,
+    CacheService,
+    LocalCache,
+    RedisConnectionManager,
+    compress_value,
+    decode_entry,
+    decompress_value,
+    encode_entry,
+)
 from src.types import CacheMetadata
 
 
@@ -11,6 +24,7 @@ from src.types import CacheMetadata
 def mock_redis():
     RedisConnectionManager._instance = None
     RedisConnectionManager._client = None
+    RedisConnectionManager._binary_client = None
 
     with patch("redis.asyncio.from_url") as mock_from_url:
         mock_client = AsyncMock()
@@ -19,6 +33,17 @@ def mock_redis():
 
     RedisConnectionManager._instance = None
     RedisConnectionManager._client = None
+    RedisConnectionManager._binary_client = None
+    CacheService.local_cache = LocalCache()
+
+
+@pytest.fixture
+def active_l1():
+    """무효화 채널 구독 중인 상태의 L1 캐시를 주입합니다."""
+    local_cache = LocalCache(maxsize=2)
+    local_cache.active = True
+    CacheService.local_cache = local_cache
+    return local_cache
 
 
 def test_cache_service_init(mock_redis):
@@ -57,15 +82,49 @@ async def test_set_success(mock_redis):
     mock_redis.setex.assert_awaited_with("test_key", 100, "value")
 
 
+def mock_pipeline(mock_redis, results):
+    """pipeline() 컨텍스트가 execute 호출마다 results를 순서대로 반환하도록 설정합니다."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=results)
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__.return_value = pipe
+    return pipe
+
+
 @pytest.mark.asyncio
 async def test_clear_success(mock_redis):
+    """SCAN으로 순회하며 이전 배치의 UNLINK와 다음 SCAN을 한 파이프라인으로 보내야 함."""
     service = CacheService()
-    mock_redis.keys.return_value = ["key1", "key2"]
+    pipe = mock_pipeline(
+        mock_redis,
+        [
+            [(7, ["key1", "key2"])],  # SCAN 0
+            [2, (0, ["key3"])],  # UNLINK key1 key2 + SCAN 7
+        ],
+    )
+    mock_redis.unlink.return_value = 1
+    progress = []
+
+    deleted = await service.clear(
+        "pattern*", batch_size=2, on_progress=lambda *p: progress.append(p)
+    )
+
+    assert deleted == 3
+    assert progress == [(2, 2), (3, 3)]
+    pipe.scan.assert_any_call(0, match="pattern*", count=2)
+    pipe.scan.assert_any_call(7, match="pattern*", count=2)
+    pipe.unlink.assert_called_once_with("key1", "key2")
+    mock_redis.unlink.assert_awaited_once_with("key3")
+    mock_redis.keys.assert_not_called()
+
 
-    await service.clear("pattern*")
+@pytest.mark.asyncio
+async def test_clear_failure_raises_cache_error(mock_redis):
+    service = CacheService()
+    mock_pipeline(mock_redis, redis.RedisError("Redis error"))
 
-    mock_redis.keys.assert_awaited_with("pattern*")
-    mock_redis.delete.assert_awaited_with("key1", "key2")
+    with pytest.raises(CacheError):
+        await service.clear("pattern*")
 
 
 @pytest.mark.asyncio
@@ -94,3 +153,253 @@ def test_generate_key(mock_redis):
     assert metadata1.key != metadata3.key
 
     assert metadata1.ttl > 0
+
+
+# === L1 (프로세스 내) 캐시 ===
+
+
+def test_local_cache_evicts_least_recently_used(active_l1):
+    """최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목이 방출되어야 함."""
+    active_l1.put("a", "1", 10, active_l1.epoch)
+    active_l1.put("b", "2", 10, active_l1.epoch)
+    active_l1.get("a")
+    active_l1.put("c", "3", 10, active_l1.epoch)
+
+    assert active_l1.get("a") == "1"
+    assert active_l1.get("b") is None
+    assert active_l1.get("c") == "3"
+
+
+def test_local_cache_expires_entries(active_l1):
+    """TTL이 지난 항목은 반환되지 않아야 함."""
+    with patch("src.services.cache_service.time.monotonic", return_value=100.0):
+        active_l1.put("a", "1", 5, active_l1.epoch)
+    with patch("src.services.cache_service.time.monotonic", return_value=105.0):
+        assert active_l1.get("a") is None
+
+
+def test_local_cache_ignores_fill_after_invalidation(active_l1):
+    """조회 도중 무효화가 일어나면 이전 값으로 채우지 않아야 함."""
+    epoch = active_l1.epoch
+    active_l1.invalidate("a")
+
+    active_l1.put("a", "stale", 10, epoch)
+
+    assert active_l1.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_get_serves_repeated_reads_from_l1(mock_redis, active_l1):
+    """L1이 활성화되면 두 번째 조회는 Redis를 거치지 않아야 함."""
+    service = CacheService()
+    mock_redis.get.return_value = "v1"
+
+    assert await service.get("version:history:u1") == "v1"
+    assert await service.get("version:history:u1") == "v1"
+
+    mock_redis.get.assert_awaited_once_with("version:history:u1")
+
+
+@pytest.mark.asyncio
+async def test_get_bypasses_l1_when_not_subscribed(mock_redis):
+    """무효화 채널을 구독하지 않은 상태에서는 매번 Redis를 조회해야 함."""
+    service = CacheService()
+    mock_redis.get.return_value = "v1"
+
+    await service.get("key")
+    await service.get("key")
+
+    assert mock_redis.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_incr_invalidates_locally_and_publishes(mock_redis, active_l1):
+    """쓰기 시 로컬 L1 항목을 제거하고 다른 레플리카에 무효화를 발행해야 함."""
+    service = CacheService()
+    mock_redis.get.return_value = "5"
+    mock_redis.incr.return_value = 6
+    await service.get("version:history:u1")
+
+    assert await service.incr("version:history:u1") == 6
+
+    assert active_l1.get("version:history:u1") is None
+    mock_redis.publish.assert_awaited_once_with(
+        CacheConstants.L1_INVALIDATION_CHANNEL, '{"k":"version:history:u1"}'
+    )
+
+
+def test_listener_applies_key_and_pattern_messages(active_l1):
+    """무효화 메시지는 키 또는 패턴 단위로 L1 항목을 제거해야 함."""
+    for key in ("history:u1:a", "history:u2:b"):
+        active_l1.put(key, "v", 10, active_l1.epoch)
+    listener = CacheInvalidationListener(AsyncMock(), active_l1)
+
+    listener.apply(orjson.dumps({"p": "history:u1:*"}).decode())
+    assert active_l1.get("history:u1:a") is None
+    assert active_l1.get("history:u2:b") == "v"
+
+    listener.apply(orjson.dumps({"k": "history:u2:b"}).decode())
+    assert len(active_l1) == 0
+
+
+# === 값 압축 ===
+
+LARGE_VALUE = "def test_example():\n    assert add(1, 2) == 3\n\n" * 100
+
+
+def test_compress_value_keeps_small_values_as_plain_text():
+    """임계값 미만의 값은 헤더 없이 원문 그대로 저장되어야 함."""
+    assert compress_value("short") == "short"
+
+
+@pytest.mark.parametrize("codec", ["zlib", "zstd"])
+def test_compress_value_round_trip(codec):
+    """큰 값은 헤더가 붙은 압축 bytes로 저장되고 원문으로 복원되어야 함."""
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+        stored = compress_value(LARGE_VALUE)
+    else:
+        with patch("src.services.cache_service.zstandard", None):
+            stored = compress_value(LARGE_VALUE)
+
+    assert isinstance(stored, bytes)
+    assert stored[0] == (0x02 if codec == "zstd" else 0x01)
+    assert len(stored) < len(LARGE_VALUE) // 10
+    assert decompress_value(stored) == LARGE_VALUE
+
+
+def test_decompress_value_reads_plain_and_rejects_corrupt_values():
+    """헤더 없는 값은 UTF-8 원문으로, 손상된 압축 값은 미스(None)로 처리되어야 함."""
+    assert decompress_value("기존 값".encode()) == "기존 값"
+    assert decompress_value(b"\x01not-zlib") is None
+    assert decompress_value(None) is None
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_large_value_use_binary_client(mock_redis):
+    """큰 값은 압축 bytes로 저장되고 조회 시 원문으로 복원되어야 함."""
+    service = CacheService()
+
+    await service.set("gemini_key", LARGE_VALUE, ttl=100)
+    key, ttl, stored = mock_redis.setex.await_args.args
+    assert (key, ttl) == ("gemini_key", 100)
+    assert isinstance(stored, bytes) and len(stored) < len(LARGE_VALUE)
+
+    mock_redis.get.return_value = stored
+    assert await service.get("gemini_key") == LARGE_VALUE
+
+
+# === 캐시 스탬피드 방지 (TTL 지터 / XFetch) ===
+
+
+def test_generate_key_applies_strategy_jitter(mock_redis):
+    """지터가 설정된 전략은 TTL을 [ttl * (1 - 비율), ttl] 범위에서 분산해야 함."""
+    service = CacheService()
+    ttls = {service.generate_key("code", strategy="gemini").ttl for _ in range(50)}
+
+    assert all(7200 * 0.9 <= ttl <= 7200 for ttl in ttls)
+    assert len(ttls) > 1
+    assert service.generate_key("u1", strategy="history").ttl == CacheConstants.HISTORY_CACHE_TTL
+
+
+@pytest.mark.parametrize("value", ["short", LARGE_VALUE])
+def test_entry_round_trip_keeps_xfetch_metadata(value):
+    """XFetch 메타데이터와 함께 저장한 값은 delta/expiry와 함께 복원되어야 함."""
+    entry = decode_entry(encode_entry(value, 2.5, 1_000.0))
+
+    assert entry == CacheEntry(value, 2.5, 1_000.0)
+
+
+def test_refresh_due_depends_on_remaining_ttl():
+    """만료가 멀면 재계산하지 않고, 만료 시각이 지나면 항상 재계산해야 함."""
+    now = time.time()
+
+    assert not CacheEntry("v", delta=1.0, expiry=now + 3600).refresh_due()
+    assert CacheEntry("v", delta=1.0, expiry=now - 1).refresh_due()
+    assert not CacheEntry("v").refresh_due()
+
+
+@pytest.mark.asyncio
+async def test_get_with_refresh_reads_entry_stored_with_delta(mock_redis):
+    """delta와 함께 저장한 값은 get/get_with_refresh 모두 원문을 반환해야 함."""
+    service = CacheService()
+    await service.set("key", "value", ttl=100, delta=3.0)
+    mock_redis.get.return_value = mock_redis.setex.await_args.args[2]
+
+    assert await service.get("key") == "value"
+    assert await service.get_with_refresh("key") == ("value", False)
+
+
+# === 다중 키 / 버전 조회 ===
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_single_mget_for_l1_misses(mock_redis, active_l1):
+    """L1에 없는 키만 한 번의 MGET으로 조회하고 결과 순서를 유지해야 함."""
+    service = CacheService()
+    active_l1.put("a", CacheEntry("cached-a"), 10, active_l1.epoch)
+    mock_redis.mget.return_value = [b"value-b", None]
+
+    assert await service.get_many(["a", "b", "c"]) == ["cached-a", "value-b", None]
+
+    mock_redis.mget.assert_awaited_once_with(["b", "c"])
+    mock_redis.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_many_pipelines_writes_and_invalidates(mock_redis, active_l1):
+    """여러 값은 하나의 파이프라인으로 저장하고 한 번의 메시지로 무효화해야 함."""
+    service = CacheService()
+    pipe = mock_pipeline(mock_redis, [[True, True]])
+    active_l1.put("a", CacheEntry("old"), 10, active_l1.epoch)
+
+    await service.set_many({"a": "1", "b": "2"}, ttl=60)
+
+    pipe.setex.assert_any_call("a", 60, "1")
+    pipe.setex.assert_any_call("b", 60, "2")
+    pipe.execute.assert_awaited_once()
+    assert active_l1.get("a") is None
+    mock_redis.publish.assert_awaited_once_with(
+        CacheConstants.L1_INVALIDATION_CHANNEL, '{"ks":["a","b"]}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_reads_version_and_value_in_one_round_trip(mock_redis):
+    """버전 키와 버전별 값 키를 Lua 스크립트 한 번으로 조회해야 함."""
+    service = CacheService()
+    mock_redis.eval.return_value = [b"5", b"payload"]
+
+    result = await service.get_versioned("version:history:u1", "history:u1:v:{version}:limit:20")
+
+    assert result == (5, "payload")
+    args = mock_redis.eval.await_args.args
+    assert args[1:] == (1, "version:history:u1", "history:u1:v:", ":limit:20")
+    mock_redis.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_uses_l1_version(mock_redis, active_l1):
+    """버전 키가 L1에 있으면 스크립트 없이 버전별 키만 조회해야 함."""
+    service = CacheService()
+    active_l1.put("version:history:u1", CacheEntry("7"), 10, active_l1.epoch)
+    mock_redis.get.return_value = None
+
+    assert await service.get_versioned("version:history:u1", "history:u1:v:{version}") == (7, None)
+
+    mock_redis.eval.assert_not_called()
+    mock_redis.get.assert_awaited_once_with("history:u1:v:7")
+
+
+@pytest.mark.asyncio
+async def test_incr_if_exists_only_invalidates_existing_keys(mock_redis):
+    """키가 있을 때만 증가 및 무효화하고, 없으면 None을 반환해야 함."""
+    service = CacheService()
+    mock_redis.eval.side_effect = [3, None]
+
+    assert await service.incr_if_exists("quota:u1") == 3
+    assert await service.incr_if_exists("quota:u2") is None
+
+    mock_redis.publish.assert_awaited_once_with(
+        CacheConstants.L1_INVALIDATION_CHANNEL, '{"k":"quota:u1"}'
+    )
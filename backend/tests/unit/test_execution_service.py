@@ -172,6 +172,20 @@ class TestExecutionService:
         assert "실행 서버가 오류를 반환했습니다" in result["error"]
         assert "500" in result["output"]
 
+    @pytest.mark.asyncio
+    async def test_execute_code_worker_queue_full_429(self, service, mock_httpx_client):
+        """Worker 실행 대기열 포화 (429) 시 Retry-After를 전달하는지 테스트."""
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "4"}
+        mock_httpx_client.post.return_value = mock_response
+
+        result = await service.execute_code("code", "test", "python")
+
+        assert result["success"] is False
+        assert "잠시 후 다시 시도" in result["error"]
+        assert result["retry_after"] == 4
+
     @pytest.mark.asyncio
     async def test_execute_code_connection_error(self, service, mock_httpx_client):
         """Worker 연결 실패 처리 테스트."""
@@ -253,3 +267,111 @@ class TestExecutionService:
         # URL 확인
         call_args = mock_httpx_client.post.call_args
         assert call_args[0][0] == "http://test-worker:5000/execute"
+
+    # === 실행 결과 캐시 테스트 ===
+
+    @pytest.fixture
+    def worker_with_digest(self, mock_httpx_client):
+        """/health가 이미지 digest를 반환하는 Worker."""
+        health_response = MagicMock()
+        health_response.status_code = 200
+        health_response.json.return_value = {"status": "ok", "image_digest": "sha256:abc"}
+        mock_httpx_client.get.return_value = health_response
+        return mock_httpx_client
+
+    @pytest.mark.asyncio
+    async def test_execute_code_returns_cached_result(self, service, worker_with_digest):
+        """캐시 히트 시 Worker를 호출하지 않고 cached=True 결과를 반환해야 함."""
+        service.cache.get = AsyncMock(
+            return_value='{"success": true, "output": "1 passed", "error": "", "exit_code": 0}'
+        )
+
+        result = await service.execute_code("code", "test", "python")
+
+        assert result["cached"] is True
+        assert result["output"] == "1 passed"
+        worker_with_digest.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_code_caches_completed_run(self, service, worker_with_digest):
+        """pytest가 정상 종료한 결과는 실행 전략 TTL로 캐시되어야 함."""
+        service.cache.get = AsyncMock(return_value=None)
+        service.cache.set = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": False, "output": "1 failed", "exit_code": 1}
+        worker_with_digest.post.return_value = mock_response
+
+        result = await service.execute_code("code", "test", "python")
+
+        assert "cached" not in result
+        service.cache.set.assert_awaited_once()
+        # EXECUTION_CACHE_TTL(1800)에서 최대 10% 지터 적용
+        assert 1620 <= service.cache.set.call_args[1]["ttl"] <= 1800
+
+    @pytest.mark.asyncio
+    async def test_execute_code_does_not_cache_timeout(self, service, worker_with_digest):
+        """타임아웃 종료 코드나 종료 코드가 없는 결과는 캐시하지 않아야 함."""
+        service.cache.get = AsyncMock(return_value=None)
+        service.cache.set = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.side_effect = [
+            {"success": False, "output": "", "exit_code": 124},
+            {"success": False, "error": "코드 주입에 실패했습니다.", "output": ""},
+        ]
+        worker_with_digest.post.return_value = mock_response
+
+        await service.execute_code("code", "test", "python")
+        await service.execute_code("code", "test", "python")
+
+        service.cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execution_cache_key_includes_image_digest(self, service, worker_with_digest):
+        """이미지 digest가 바뀌면 다른 캐시 키를 사용해야 함."""
+        service.cache.get = AsyncMock(return_value=None)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True, "output": "ok"}
+        worker_with_digest.post.return_value = mock_response
+
+        await service.execute_code("code", "test", "python")
+        first_key = service.cache.get.call_args[0][0]
+
+        service._image_digest = "sha256:rebuilt"
+        await service.execute_code("code", "test", "python")
+        second_key = service.cache.get.call_args[0][0]
+
+        assert first_key != second_key
+
+    @pytest.mark.asyncio
+    async def test_execute_code_skips_cache_without_digest(self, service, mock_httpx_client):
+        """이미지 digest를 알 수 없으면 캐시를 조회하지 않아야 함."""
+        mock_httpx_client.get.side_effect = httpx.RequestError("down")
+        service.cache.get = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True, "output": "ok", "exit_code": 0}
+        mock_httpx_client.post.return_value = mock_response
+
+        result = await service.execute_code("code", "test", "python")
+
+        assert result["success"] is True
+        service.cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_digest_lookup_is_not_retried_per_request(
+        self, service, mock_httpx_client
+    ):
+        """digest 조회 실패 결과도 잠시 보관하여 실행마다 /health를 호출하지 않아야 함."""
+        mock_httpx_client.get.side_effect = httpx.RequestError("down")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True, "output": "ok", "exit_code": 0}
+        mock_httpx_client.post.return_value = mock_response
+
+        await service.execute_code("code", "test", "python")
+        await service.execute_code("code", "test", "python")
+
+        assert mock_httpx_client.get.call_count == 1
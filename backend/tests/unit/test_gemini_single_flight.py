@@ -0,0 +1,193 @@
+"""GeminiService 동일 요청 병합 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.config.constants import AIConstants
+from src.services.gemini_service import GeminiService
+from src.services.single_flight import SingleFlight
+
+
+class FakeStreamResponse:
+    """Gemini 스트리밍 응답을 흉내 내는 비동기 이터레이터."""
+
+    def __init__(self, texts):
+        self.texts = texts
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for text in self.texts:
+            await asyncio.sleep(0.01)
+            yield MagicMock(text=text)
+
+
+@pytest.fixture
+def gemini_service():
+    SingleFlight._flights.clear()
+    service = GeminiService(model_name="test-model")
+    # 레플리카 간 조정용 Redis 명령(파이프라인)은 성공한 것으로 처리
+    redis_client = AsyncMock()
+    redis_client.pipeline = MagicMock()
+    redis_client.pipeline.return_value.__aenter__.return_value = MagicMock(
+        execute=AsyncMock(return_value=[])
+    )
+    service.single_flight.redis = redis_client
+    model = MagicMock()
+    calls = []
+
+    async def generate_content_async(*args, **kwargs):
+        calls.append(1)
+        return FakeStreamResponse(["def test_", "a(): pass"])
+
+    model.generate_content_async = generate_content_async
+    service._get_model = MagicMock(return_value=model)
+    return service, calls
+
+
+async def collect(service: GeminiService, **kwargs) -> str:
+    return "".join([chunk async for chunk in service.generate_test_code("def a(): pass", **kwargs)])
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_generations_call_gemini_once(gemini_service):
+    """같은 입력의 동시 생성 요청은 Gemini를 한 번만 호출해야 함."""
+    service, calls = gemini_service
+
+    results = await asyncio.gather(collect(service), collect(service), collect(service))
+
+    assert results == ["def test_a(): pass"] * 3
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_regenerate_requests_are_not_coalesced(gemini_service):
+    """재생성 요청은 매번 새로운 응답이 필요하므로 병합하지 않아야 함."""
+    service, calls = gemini_service
+
+    await asyncio.gather(collect(service, is_regenerate=True), collect(service, is_regenerate=True))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_due_entry_is_served_and_regenerated_once(gemini_service):
+    """만료 임박 캐시는 즉시 반환하고, 락을 얻은 요청 하나만 백그라운드 재생성해야 함."""
+    service, calls = gemini_service
+    service.cache.get_with_refresh = AsyncMock(return_value=("cached", True))
+    service.cache.try_lock = AsyncMock(side_effect=[True, False])
+    service.cache.unlock = AsyncMock()
+    service.cache.set = AsyncMock()
+
+    results = await asyncio.gather(collect(service), collect(service))
+    await asyncio.gather(*GeminiService._refresh_tasks)
+
+    assert results == ["cached", "cached"]
+    assert len(calls) == 1
+    service.cache.set.assert_awaited_once()
+    assert service.cache.set.await_args.kwargs["delta"] > 0
+    service.cache.unlock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_key_uses_normalized_source_when_given(gemini_service):
+    """cache_source가 같으면 원본 코드의 서식이 달라도 같은 캐시 키를 조회해야 함."""
+    service, _ = gemini_service
+    service.cache.get_with_refresh = AsyncMock(return_value=("cached", False))
+
+    await collect(service, cache_source="canonical")
+    async for _ in service.generate_test_code("def a():  pass  # 주석", cache_source="canonical"):
+        pass
+    await collect(service)
+
+    keys = [call.args[0] for call in service.cache.get_with_refresh.await_args_list]
+    assert keys[0] == keys[1]
+    assert keys[2] != keys[0]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_partial_output_continues_instead_of_restarting(
+    gemini_service, monkeypatch
+):
+    """스트리밍 도중 실패하면 이미 전달한 청크를 버리지 않고 이어서 생성해야 함."""
+    service, _ = gemini_service
+    monkeypatch.setattr(AIConstants, "RETRY_WAIT_MAX", 0)
+    service.cache.get_with_refresh = AsyncMock(return_value=(None, False))
+    service.cache.set = AsyncMock()
+    requests = []
+
+    class BrokenStream(FakeStreamResponse):
+        async def _iterate(self):
+            yield MagicMock(text="def test_")
+            raise ConnectionError("stream reset")
+
+    async def generate_content_async(contents, **kwargs):
+        requests.append(contents)
+        return BrokenStream([]) if len(requests) == 1 else FakeStreamResponse(["a(): pass"])
+
+    service._get_model.return_value.generate_content_async = generate_content_async
+
+    result = await collect(service)
+
+    assert result == "def test_a(): pass"
+    assert requests[0] == "def a(): pass"
+    assert requests[1][1] == {"role": "model", "parts": ["def test_"]}
+    service.cache.set.assert_awaited_once()
+    assert service.cache.set.await_args.args[1] == "def test_a(): pass"
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_resumed_from_offset(gemini_service):
+    """재연결한 클라이언트는 캐시된 결과도 offset 이후 부분만 받아야 함."""
+    service, _ = gemini_service
+    service.cache.get_with_refresh = AsyncMock(return_value=("def test_a(): pass", False))
+
+    assert await collect(service, offset=9) == "a(): pass"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_generation_saves_partial_and_next_request_continues(gemini_service):
+    """클라이언트가 모두 떠나 취소된 생성은 부분 결과를 저장하고, 다음 요청은 이어서 생성해야 함."""
+    service, _ = gemini_service
+    service.cache.get_with_refresh = AsyncMock(return_value=(None, False))
+    stored: dict[str, str] = {}
+
+    async def cache_set(key, value, ttl=None, delta=None):
+        stored[key] = value
+
+    async def cache_get(key):
+        return stored.get(key)
+
+    async def cache_delete(key):
+        stored.pop(key, None)
+
+    service.cache.set = AsyncMock(side_effect=cache_set)
+    service.cache.get = AsyncMock(side_effect=cache_get)
+    service.cache.delete = AsyncMock(side_effect=cache_delete)
+    requests = []
+
+    class StalledStream(FakeStreamResponse):
+        async def _iterate(self):
+            yield MagicMock(text="def test_")
+            await asyncio.Event().wait()
+
+    async def generate_content_async(contents, **kwargs):
+        requests.append(contents)
+        return StalledStream([]) if len(requests) == 1 else FakeStreamResponse(["a(): pass"])
+
+    service._get_model.return_value.generate_content_async = generate_content_async
+
+    first = asyncio.create_task(collect(service))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0.01)
+
+    partial_keys = [key for key in stored if key.startswith("partial:")]
+    assert len(partial_keys) == 1
+    assert stored[partial_keys[0]] == "def test_"
+
+    assert await collect(service) == "def test_a(): pass"
+    assert requests[1][1] == {"role": "model", "parts": ["def test_"]}
+    assert list(stored.values()) == ["def test_a(): pass"]
@@ -0,0 +1,227 @@
+"""비동기 생성 작업(/jobs) 단위 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from src.api.v1 import jobs as jobs_api
+from src.api.v1.jobs import get_job, submit_job, subscribe_job
+from src.services.generation_jobs import GenerationJobs
+from src.services.resumable_stream import ResumableStreams
+from src.types import GenerateRequest
+from tests.helpers import FakeRedis
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    GenerationJobs._slots = None
+    GenerationJobs._pending = 0
+    GenerationJobs._live.clear()
+    GenerationJobs._started.clear()
+    ResumableStreams._streams.clear()
+    yield
+
+
+def make_jobs(concurrency: int = 4, max_pending: int = 32) -> GenerationJobs:
+    redis = FakeRedis()
+    return GenerationJobs(
+        redis, ResumableStreams(redis), concurrency=concurrency, max_pending=max_pending
+    )
+
+
+def make_runner(content: str, gate: asyncio.Event = None, error: dict = None):
+    async def frames(outcome):
+        if gate is not None:
+            await gate.wait()
+        yield f'data: {{"type":"chunk","content":"{content}"}}\n\n'
+        if error is not None:
+            outcome.error = error
+        else:
+            outcome.content = content
+            outcome.history_id = "history-1"
+        yield 'event: message\ndata: {"type":"done"}\n\n'
+
+    return frames
+
+
+async def wait_for_status(jobs: GenerationJobs, job_id: str, status: str) -> dict:
+    for _ in range(100):
+        job = await jobs.get("user-1", job_id)
+        if job["status"] == status:
+            return job
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"작업 상태가 {status}가 되지 않음: {job}")
+
+
+@pytest.mark.asyncio
+async def test_job_completes_with_result():
+    """등록한 작업은 백그라운드에서 실행되고 결과를 조회할 수 있어야 함."""
+    jobs = make_jobs()
+    job_id = await jobs.submit("user-1", make_runner("code"), language="python", model="m")
+
+    job = await wait_for_status(jobs, job_id, "completed")
+
+    assert job["result"] == "code"
+    assert job["history_id"] == "history-1"
+    assert job["language"] == "python"
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_records_error():
+    """생성이 실패하면 failed 상태와 에러 정보를 기록해야 함."""
+    jobs = make_jobs()
+    error = {"code": "GENERATION_ERROR", "message": "failed"}
+    job_id = await jobs.submit(
+        "user-1", make_runner("x", error=error), language="python", model="m"
+    )
+
+    job = await wait_for_status(jobs, job_id, "failed")
+
+    assert job["error"] == error
+    assert "result" not in job
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrent_jobs():
+    """작업 풀 크기를 넘는 작업은 앞선 작업이 끝날 때까지 대기해야 함."""
+    jobs = make_jobs(concurrency=1)
+    gate = asyncio.Event()
+    first = await jobs.submit("user-1", make_runner("a", gate), language="python", model="m")
+    second = await jobs.submit("user-1", make_runner("b"), language="python", model="m")
+
+    await wait_for_status(jobs, first, "running")
+    await asyncio.sleep(0.02)
+    assert (await jobs.get("user-1", second))["status"] == "queued"
+
+    gate.set()
+    await wait_for_status(jobs, second, "completed")
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_pending_limit_reached():
+    """실행 중이거나 대기 중인 작업이 상한에 도달하면 등록을 거절해야 함."""
+    jobs = make_jobs(concurrency=1, max_pending=1)
+    gate = asyncio.Event()
+    await jobs.submit("user-1", make_runner("a", gate), language="python", model="m")
+
+    assert await jobs.submit("user-1", make_runner("b"), language="python", model="m") is None
+
+    gate.set()
+    await asyncio.sleep(0.02)
+    assert GenerationJobs._pending == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_generation_starts_releases_pending_slot():
+    """스트림 준비 중에 취소되어 생성이 시작되지 않아도 대기 슬롯을 반환하고 스트림을 닫아야 함."""
+    jobs = make_jobs()
+    opened = asyncio.Event()
+
+    async def slow_set(key, value, ex=None):
+        opened.set()
+        await asyncio.Event().wait()
+
+    jobs.redis.set = slow_set
+    job_id = await jobs.submit("user-1", make_runner("a"), language="python", model="m")
+    await opened.wait()
+
+    jobs.streams.task(job_id).cancel()
+    await asyncio.sleep(0.01)
+
+    assert GenerationJobs._pending == 0
+    assert ResumableStreams._streams[job_id].done
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_running_and_queued_jobs():
+    """레플리카 종료 시 실행 중인 작업과 대기 중인 작업을 모두 cancelled로 기록해야 함."""
+    jobs = make_jobs(concurrency=1)
+    gate = asyncio.Event()
+    running = await jobs.submit("user-1", make_runner("a", gate), language="python", model="m")
+    queued = await jobs.submit("user-1", make_runner("b"), language="python", model="m")
+    await wait_for_status(jobs, running, "running")
+
+    await GenerationJobs.shutdown()
+
+    assert (await jobs.get("user-1", running))["status"] == "cancelled"
+    assert (await jobs.get("user-1", queued))["status"] == "cancelled"
+    assert GenerationJobs._pending == 0
+    assert GenerationJobs._live == {}
+
+
+@pytest.mark.asyncio
+async def test_job_endpoints_submit_poll_and_subscribe():
+    """등록 즉시 작업 id를 반환하고, 상태 조회와 SSE 구독으로 결과를 받아야 함."""
+
+    async def upstream():
+        yield "def test(): pass"
+
+    service = MagicMock()
+    service.generate_test.side_effect = lambda **kwargs: upstream()
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(return_value=MagicMock(success=True))
+    token_service.refund_tokens = AsyncMock()
+    repository = MagicMock()
+    repository.create_history = AsyncMock(return_value=MagicMock(id="history-1"))
+    jobs = make_jobs()
+    user = {"id": "user-1"}
+    data = GenerateRequest(input_code="def a(): pass", language="python", turnstile_token="token")
+    request = MagicMock(client=None)
+
+    with patch.object(jobs_api, "validate_turnstile_token", AsyncMock()):
+        submitted = await submit_job.__wrapped__(
+            request, data, user, service, repository, token_service, jobs
+        )
+    assert submitted.status == "queued"
+
+    await wait_for_status(jobs, submitted.job_id, "completed")
+    job = await get_job(submitted.job_id, user, jobs)
+    response = await subscribe_job(request, submitted.job_id, None, user, jobs.streams)
+    events = "".join([frame async for frame in response.body_iterator])
+
+    assert job.result == "def test(): pass"
+    assert job.history_id == "history-1"
+    assert '"content":"def test(): pass"' in events
+    assert '"type":"done"' in events
+    token_service.deduct_tokens.assert_awaited_once()
+    token_service.refund_tokens.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_job_endpoints_hide_other_users_jobs():
+    """다른 사용자의 작업은 조회하거나 구독할 수 없어야 함."""
+    jobs = make_jobs()
+    job_id = await jobs.submit("user-1", make_runner("a"), language="python", model="m")
+    await wait_for_status(jobs, job_id, "completed")
+    other = {"id": "user-2"}
+
+    with pytest.raises(HTTPException) as status_error:
+        await get_job(job_id, other, jobs)
+    with pytest.raises(HTTPException) as events_error:
+        await subscribe_job(MagicMock(), job_id, None, other, jobs.streams)
+
+    assert status_error.value.status_code == 404
+    assert events_error.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_submit_endpoint_returns_429_when_queue_full():
+    """대기열이 가득 차면 429를 반환해야 함."""
+    jobs = make_jobs(max_pending=1)
+    GenerationJobs._pending = 1
+    data = GenerateRequest(input_code="def a(): pass", language="python", turnstile_token="token")
+
+    with patch.object(jobs_api, "validate_turnstile_token", AsyncMock()):
+        with pytest.raises(HTTPException) as error:
+            await submit_job.__wrapped__(
+                MagicMock(client=None),
+                data,
+                {"id": "user-1"},
+                MagicMock(),
+                MagicMock(),
+                MagicMock(),
+                jobs,
+            )
+
+    assert error.value.status_code == 429
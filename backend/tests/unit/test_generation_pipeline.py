@@ -0,0 +1,152 @@
+"""생성 후 실행 파이프라인(/generate/execute) 단위 테스트."""
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.api.v1.generator import pipeline_frames
+from src.types import GenerateRequest
+from tests.helpers import parse_frames
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../worker"))
+
+import main as worker_main  # noqa: E402
+from pool import ContainerPool  # noqa: E402
+
+GENERATED = "def test_add():\n    assert add(1, 2) == 3\n"
+
+
+def make_request() -> GenerateRequest:
+    return GenerateRequest(
+        input_code="def add(a, b):\n    return a + b\n", language="python", turnstile_token="t"
+    )
+
+
+def make_dependencies(chunks: list[str]):
+    events: list[str] = []
+
+    async def upstream(**kwargs):
+        for chunk in chunks:
+            await asyncio.sleep(0.01)
+            events.append("chunk")
+            yield chunk
+
+    service = MagicMock()
+    service.generate_test.side_effect = lambda **kwargs: upstream(**kwargs)
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(return_value=MagicMock(success=True))
+    token_service.refund_tokens = AsyncMock()
+    repository = MagicMock()
+    repository.create_history = AsyncMock(return_value=MagicMock(id="history-1"))
+
+    async def prepare(input_code, language):
+        events.append("prepare")
+        return {"safe": True, "error": "", "warmed": True}
+
+    execution = MagicMock()
+    execution.prepare = AsyncMock(side_effect=prepare)
+    execution.execute_code = AsyncMock(
+        return_value={"success": True, "output": "1 passed", "error": "", "exit_code": 0}
+    )
+    return events, service, repository, token_service, execution
+
+
+@pytest.mark.asyncio
+async def test_pipeline_prepares_during_generation_and_executes_result():
+    """생성 중에 실행 준비를 시작하고, 생성된 코드의 실행 결과를 같은 스트림으로 보내야 함."""
+    events, service, repository, token_service, execution = make_dependencies(
+        ["def test_add():\n", "    assert add(1, 2) == 3\n"]
+    )
+
+    frames = [
+        frame
+        async for frame in pipeline_frames(
+            make_request(), "user-1", service, repository, token_service, execution
+        )
+    ]
+    payloads = parse_frames(frames)
+
+    assert events.index("prepare") < events.index("chunk")
+    execution.execute_code.assert_awaited_once_with(
+        input_code=make_request().input_code, test_code=GENERATED, language="python"
+    )
+    types = [payload.get("type") for payload in payloads]
+    assert types.count("done") == 1
+    assert types.index("execution") < types.index("done") == len(types) - 1
+    assert payloads[types.index("execution")]["output"] == "1 passed"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_execution_when_source_is_unsafe():
+    """소스 코드가 보안 검사에 실패하면 실행을 요청하지 않고 위반 내용을 보내야 함."""
+    _, service, repository, token_service, execution = make_dependencies(["def test_a(): pass"])
+    execution.prepare = AsyncMock(
+        return_value={"safe": False, "error": "금지된 모듈 임포트: os", "warmed": False}
+    )
+
+    frames = [
+        frame
+        async for frame in pipeline_frames(
+            make_request(), "user-1", service, repository, token_service, execution
+        )
+    ]
+    (result,) = [payload for payload in parse_frames(frames) if payload.get("type") == "execution"]
+
+    execution.execute_code.assert_not_awaited()
+    assert result["success"] is False
+    assert "os" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_does_not_execute_failed_generation():
+    """생성에 실패하면 실행하지 않고 준비 요청을 취소해야 함."""
+    _, service, repository, token_service, execution = make_dependencies([])
+    prepare_started = asyncio.Event()
+
+    async def slow_prepare(input_code, language):
+        prepare_started.set()
+        await asyncio.Event().wait()
+
+    execution.prepare = AsyncMock(side_effect=slow_prepare)
+
+    frames = [
+        frame
+        async for frame in pipeline_frames(
+            make_request(), "user-1", service, repository, token_service, execution
+        )
+    ]
+
+    assert prepare_started.is_set()
+    execution.execute_code.assert_not_awaited()
+    assert all(payload.get("type") != "execution" for payload in parse_frames(frames))
+    token_service.refund_tokens.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_prepare_checks_source_and_prewarms(monkeypatch):
+    """Worker 실행 준비는 보안 검사를 통과한 코드에 대해서만 sandbox를 예열해야 함."""
+    created: list[int] = []
+
+    async def create():
+        created.append(len(created) + 1)
+        return created[-1]
+
+    pool = ContainerPool(
+        create=create, destroy=AsyncMock(), reset=AsyncMock(), min_size=0, max_size=2
+    )
+    monkeypatch.setattr(worker_main, "container_pool", pool)
+
+    unsafe = await worker_main.prepare_execution(
+        worker_main.PrepareRequest(input_code="import os", language="python")
+    )
+    safe = await worker_main.prepare_execution(
+        worker_main.PrepareRequest(input_code="def f(): return 1", language="python")
+    )
+    await asyncio.sleep(0.01)
+
+    assert unsafe["safe"] is False and unsafe["warmed"] is False
+    assert safe == {"safe": True, "error": "", "warmed": True}
+    assert pool.idle_count == 1
+    await pool.close()
@@ -1,7 +1,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from src.repositories.generation_repository import GenerationRepository
+from src.repositories.generation_repository import GenerationRepository, HistoryPage
 
 
 @pytest.fixture
@@ -19,6 +19,7 @@ def mock_cache_service():
         instance.set = AsyncMock()
         instance.clear = AsyncMock()
         instance.incr = AsyncMock(return_value=1)
+        instance.get_versioned = AsyncMock(return_value=(0, None))
         yield instance
 
 @pytest.fixture
@@ -41,24 +42,21 @@ async def test_get_user_history_uses_versioned_key(repo, mock_cache_service):
     # Setup
     user_id = "test_user"
 
-    async def get_side_effect(key):
-        if key.startswith("version:"):
-            return "5"
-        return None
+    mock_cache_service.get_versioned.return_value = (5, None)
 
-    mock_cache_service.get.side_effect = get_side_effect
-
-    # Mock run_in_threadpool to avoid DB call for history retrieval
-    with patch("src.repositories.generation_repository.run_in_threadpool", new_callable=AsyncMock) as mock_run:
-        mock_run.return_value = [] # Return empty list
+    # Mock the DB fetch to avoid DB call for history retrieval
+    with patch.object(repo, "_fetch_history_page", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = HistoryPage(items=[]) # Return empty page
 
         # Act
         await repo.get_user_history(user_id)
 
-    # Assert
-    # This assertion expects the NEW behavior
-    mock_cache_service.get.assert_any_call(f"version:history:{user_id}")
-    mock_cache_service.get.assert_any_call(f"history:{user_id}:v:5:limit:50")
+    # Assert: 버전과 버전별 키를 한 번에 조회하고, 같은 버전 키로 저장
+    mock_cache_service.get_versioned.assert_awaited_once_with(
+        f"version:history:{user_id}", f"history:{user_id}:v:{{version}}:cursor:first:limit:20"
+    )
+    mock_cache_service.get.assert_not_called()
+    assert mock_cache_service.set.call_args.args[0] == f"history:{user_id}:v:5:cursor:first:limit:20"
 
 @pytest.mark.asyncio
 async def test_create_history_increments_version(repo, mock_cache_service):
@@ -66,8 +64,8 @@ async def test_create_history_increments_version(repo, mock_cache_service):
     user_id = "test_user"
 
     # Act
-    with patch("src.repositories.generation_repository.run_in_threadpool", new_callable=AsyncMock) as mock_run:
-        mock_run.return_value = MagicMock()
+    with patch.object(repo, "_insert_history", new_callable=AsyncMock) as mock_insert:
+        mock_insert.return_value = MagicMock()
         await repo.create_history(user_id, "input", "output", "python", "model")
 
     # Assert
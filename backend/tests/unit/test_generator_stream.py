@@ -0,0 +1,270 @@
+"""생성 SSE 스트림의 클라이언트 연결 종료 처리 및 청크 병합 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from src.api.v1 import generator
+from src.api.v1.generator import generate_test, stream_until_disconnect
+from src.api.v1.generator_helper import coalesce_chunks
+from src.types import GenerateRequest
+from starlette.requests import ClientDisconnect
+from tests.helpers import FakeRequest, local_streams
+
+
+async def drain(iterator) -> None:
+    async for _ in iterator:
+        pass
+
+
+def make_upstream(events: list[str]):
+    async def upstream():
+        try:
+            yield "a"
+            yield "b"
+            await asyncio.Event().wait()  # Gemini가 다음 청크를 만드는 중
+            yield "never"
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    return upstream()
+
+
+@pytest.mark.asyncio
+async def test_stream_passes_chunks_through():
+    """연결이 유지되면 업스트림 청크를 그대로 전달해야 함."""
+
+    async def upstream():
+        yield "a"
+        yield "b"
+
+    chunks = [chunk async for chunk in stream_until_disconnect(FakeRequest(), upstream())]
+
+    assert chunks == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_upstream_while_waiting_for_next_chunk():
+    """다음 청크를 기다리는 중 연결이 끊기면 업스트림을 즉시 취소해야 함."""
+    request = FakeRequest()
+    events: list[str] = []
+    received: list[str] = []
+
+    async def consume():
+        async for chunk in stream_until_disconnect(request, make_upstream(events)):
+            received.append(chunk)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    request.disconnect.set()
+
+    with pytest.raises(ClientDisconnect):
+        await asyncio.wait_for(task, timeout=1)
+    await asyncio.sleep(0)
+    assert received == ["a", "b"]
+    assert events == ["cancelled"]
+
+
+async def run_generate_until_disconnect(refund_setting: bool):
+    request = FakeRequest()
+    service = MagicMock()
+    service.generate_test.side_effect = lambda **kwargs: make_upstream([])
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(return_value=MagicMock(success=True))
+    token_service.refund_tokens = AsyncMock()
+    data = GenerateRequest(
+        input_code="def a(): pass",
+        language="python",
+        model="gemini-3-flash-preview",
+        turnstile_token="token",
+    )
+
+    with (
+        patch.object(generator, "validate_turnstile_token", AsyncMock()),
+        patch.object(generator.settings, "GENERATION_REFUND_ON_DISCONNECT", refund_setting),
+    ):
+        response = await generate_test.__wrapped__(
+            request, data, {"id": "user-1"}, service, MagicMock(), token_service, local_streams()
+        )
+        frames = []
+        async for frame in response.body_iterator:
+            frames.append(frame)
+            if len(frames) == 2:
+                request.disconnect.set()
+        await asyncio.sleep(0.01)  # 백그라운드 생성 태스크의 취소 처리 대기
+
+    return frames, token_service
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("refund_setting", [True, False])
+async def test_disconnect_refund_follows_setting(refund_setting):
+    """연결 종료로 중단된 생성의 토큰 환불 여부는 설정을 따라야 함."""
+    frames, token_service = await run_generate_until_disconnect(refund_setting)
+
+    assert len(frames) == 2
+    assert not any("done" in frame for frame in frames)
+    assert token_service.refund_tokens.await_count == (1 if refund_setting else 0)
+
+
+@pytest.mark.asyncio
+async def test_server_cancellation_still_refunds():
+    """서버가 응답 태스크를 취소해도(연결 종료 감지) 환불은 끝까지 수행되어야 함."""
+    request = FakeRequest()
+    service = MagicMock()
+    service.generate_test.side_effect = lambda **kwargs: make_upstream([])
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(return_value=MagicMock(success=True))
+    token_service.refund_tokens = AsyncMock()
+    data = GenerateRequest(input_code="def a(): pass", language="python", turnstile_token="token")
+
+    with patch.object(generator, "validate_turnstile_token", AsyncMock()):
+        response = await generate_test.__wrapped__(
+            request, data, {"id": "user-1"}, service, MagicMock(), token_service, local_streams()
+        )
+        task = asyncio.create_task(drain(response.body_iterator))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.01)
+
+    token_service.refund_tokens.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_and_refunds_after_resume_grace():
+    """재연결 대기 시간이 지나도록 재연결이 없으면 업스트림을 취소하고 환불해야 함."""
+    request = FakeRequest()
+    events: list[str] = []
+    service = MagicMock()
+    service.generate_test.side_effect = lambda **kwargs: make_upstream(events)
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(return_value=MagicMock(success=True))
+    token_service.refund_tokens = AsyncMock()
+    data = GenerateRequest(input_code="def a(): pass", language="python", turnstile_token="token")
+
+    with patch.object(generator, "validate_turnstile_token", AsyncMock()):
+        response = await generate_test.__wrapped__(
+            request,
+            data,
+            {"id": "user-1"},
+            service,
+            MagicMock(),
+            token_service,
+            local_streams(0.05),
+        )
+        await response.body_iterator.__anext__()
+        request.disconnect.set()
+        await drain(response.body_iterator)
+
+    await asyncio.sleep(0.02)
+    assert events == []  # 재연결 대기 중에는 생성 유지
+    token_service.refund_tokens.assert_not_awaited()
+
+    await asyncio.sleep(0.15)
+    assert events == ["cancelled"]
+    token_service.refund_tokens.assert_awaited_once()
+
+
+async def burst(chunks, stall: bool = False, error: Exception = None):
+    """네트워크 업스트림처럼 청크마다 이벤트 루프에 양보하며 연달아 청크를 내보냄."""
+    for chunk in chunks:
+        yield chunk
+        await asyncio.sleep(0)
+    if error:
+        raise error
+    if stall:
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_burst_after_immediate_first_chunk():
+    """첫 청크는 즉시 전달하고, 연달아 도착한 작은 청크는 하나로 합쳐야 함."""
+    frames = [c async for c in coalesce_chunks(burst(["a"] * 100), 4096, 0.05)]
+
+    assert frames == ["a", "a" * 99]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_on_size():
+    """모인 크기가 기준 이상이면 시간 기준을 기다리지 않고 전달해야 함."""
+    frames = [c async for c in coalesce_chunks(burst(["가나"] * 10), 12, 1.0)]
+
+    # "가나"는 UTF-8로 6바이트
+    assert frames[0] == "가나"
+    assert "".join(frames) == "가나" * 10
+    assert all(len(frame.encode("utf-8")) <= 12 for frame in frames)
+    assert len(frames) <= 6
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_on_time_while_upstream_stalls():
+    """업스트림이 멈춰 있어도 모인 내용은 시간 기준이 지나면 전달해야 함."""
+    frames: list[str] = []
+
+    async def consume():
+        async for frame in coalesce_chunks(burst(["a", "b", "c"], stall=True), 4096, 0.02):
+            frames.append(frame)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.005)
+    assert frames == ["a"]  # 첫 청크는 지연 없이 전달
+    await asyncio.sleep(0.05)
+    assert frames == ["a", "bc"]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_buffer_before_upstream_error():
+    """업스트림 오류 전에 모인 내용은 먼저 전달한 뒤 오류를 전파해야 함."""
+    frames: list[str] = []
+
+    with pytest.raises(RuntimeError):
+        async for frame in coalesce_chunks(burst(["a", "b", "c"], error=RuntimeError()), 4096, 1):
+            frames.append(frame)
+
+    assert frames == ["a", "bc"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_disabled_passes_chunks_through():
+    """크기 또는 시간 기준이 0이면 청크를 그대로 전달해야 함."""
+    frames = [c async for c in coalesce_chunks(burst(["a", "b"]), 0, 0.05)]
+
+    assert frames == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_stops_reading_upstream_while_buffer_is_full():
+    """소비자가 느리면 버퍼가 기준 크기에 도달한 뒤 업스트림을 더 읽지 않아야 함."""
+    read: list[str] = []
+
+    async def upstream():
+        for _ in range(100):
+            read.append("a")
+            yield "a"
+
+    frames = coalesce_chunks(upstream(), 4, 1.0)
+    assert await frames.__anext__() == "a"
+    await asyncio.sleep(0.01)  # 소비자가 이전 프레임을 전송하는 중
+
+    assert len(read) <= 1 + 4
+    await frames.aclose()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_close_waits_for_upstream_cleanup():
+    """소비를 중단하면 업스트림 제너레이터가 정리된 뒤 반환해야 함."""
+    events: list[str] = []
+    frames = coalesce_chunks(make_upstream(events), 4096, 1.0)
+
+    assert await frames.__anext__() == "a"
+    await asyncio.sleep(0.01)  # 업스트림이 다음 청크를 만드는 중
+    await frames.aclose()
+
+    assert events == ["cancelled"]
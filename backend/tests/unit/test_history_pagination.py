@@ -0,0 +1,121 @@
+"""이력 Keyset 페이지네이션 단위 테스트."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from src.repositories.generation_repository import (
+    GenerationRepository,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def _row(created_at: str) -> dict:
+    return {
+        "id": str(uuid4()),
+        "language": "python",
+        "model": "gemini",
+        "created_at": created_at,
+        "input_preview": "enc:preview",
+    }
+
+
+@pytest.fixture
+def postgrest_rows():
+    """MockTransport로 응답하는 실제 SyncPostgrestClient를 주입하고 요청을 기록합니다."""
+    import httpx
+    from postgrest import SyncPostgrestClient
+
+    state = {"rows": [], "requests": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(request)
+        return httpx.Response(200, json=state["rows"])
+
+    http_client = httpx.Client(
+        base_url="http://test.com/rest/v1", transport=httpx.MockTransport(handler)
+    )
+    client = SyncPostgrestClient("http://test.com/rest/v1", http_client=http_client)
+    with (
+        patch("src.repositories.base_repository.SupabaseService") as MockSupabase,
+        patch("src.repositories.generation_repository.EncryptionService") as MockEncryption,
+        patch("src.repositories.generation_repository.CacheService"),
+    ):
+        MockSupabase.return_value.client = client
+        MockEncryption.return_value.decrypt.side_effect = lambda x: x.removeprefix("enc:")
+        yield state
+
+
+def test_cursor_round_trip():
+    """인코딩한 커서는 같은 (created_at, id)로 디코딩되어야 함."""
+    created_at = datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    history_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, history_id)) == (created_at, history_id)
+
+
+# 마지막 값은 "2025-01-01|not-a-uuid"를 인코딩한 커서
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "!!!", "MjAyNS0wMS0wMXxub3QtYS11dWlk"])
+def test_decode_cursor_rejects_malformed(cursor):
+    """형식이 잘못된 커서는 InvalidCursorError를 발생시켜야 함."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_first_page_sets_next_cursor_when_more_rows(postgrest_rows):
+    """limit+1건이 조회되면 limit건만 반환하고 마지막 항목 기준 next_cursor를 설정해야 함."""
+    postgrest_rows["rows"] = [
+        _row("2025-01-03T00:00:00+00:00"),
+        _row("2025-01-02T00:00:00+00:00"),
+        _row("2025-01-01T00:00:00+00:00"),
+    ]
+    repo = GenerationRepository(MagicMock())
+
+    page = await repo._fetch_history_page("user-1", limit=2, cursor=None)
+
+    assert len(page.items) == 2
+    assert page.items[0].input_preview == "preview"
+    assert decode_cursor(page.next_cursor) == (page.items[-1].created_at, page.items[-1].id)
+
+    params = postgrest_rows["requests"][0].url.params
+    assert params["select"] == "id,language,model,created_at,input_preview"
+    assert params["user_id"] == "eq.user-1"
+    assert params["order"] == "created_at.desc,id.desc"
+    assert params["limit"] == "3"
+    assert "or" not in params
+
+
+@pytest.mark.asyncio
+async def test_next_page_uses_keyset_filter(postgrest_rows):
+    """커서가 주어지면 OFFSET 없이 (created_at, id) 튜플 비교 필터를 사용해야 함."""
+    postgrest_rows["rows"] = [_row("2025-01-01T00:00:00+00:00")]
+    created_at = datetime(2025, 1, 2, tzinfo=timezone.utc)
+    history_id = uuid4()
+    repo = GenerationRepository(MagicMock())
+
+    page = await repo._fetch_history_page(
+        "user-1", limit=2, cursor=encode_cursor(created_at, history_id)
+    )
+
+    assert page.next_cursor is None
+    params = postgrest_rows["requests"][0].url.params
+    ts = created_at.isoformat()
+    assert params["or"] == (f'(created_at.lt."{ts}",and(created_at.eq."{ts}",id.lt.{history_id}))')
+    assert "offset" not in params
+
+
+@pytest.mark.asyncio
+async def test_get_user_history_rejects_invalid_cursor_before_cache(postgrest_rows):
+    """잘못된 커서는 캐시/DB 조회 전에 거부되어야 함."""
+    repo = GenerationRepository(MagicMock())
+    repo.cache_service.get = AsyncMock()
+
+    with pytest.raises(InvalidCursorError):
+        await repo.get_user_history("user-1", cursor="bogus")
+
+    repo.cache_service.get.assert_not_called()
+    assert postgrest_rows["requests"] == []
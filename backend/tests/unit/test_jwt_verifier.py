@@ -0,0 +1,156 @@
+"""JWTVerifier(로컬 JWT 검증) 및 get_current_user 단위 테스트."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from src import auth
+from src.utils.jwt_verifier import JWKSUnavailableError, JWTVerifier
+
+SECRET = "test-jwt-secret-with-enough-length-1234"
+
+
+def make_token(key=SECRET, algorithm="HS256", headers=None, **overrides) -> str:
+    claims = {
+        "sub": "user-1",
+        "email": "user@example.com",
+        "aud": "authenticated",
+        "exp": int(time.time()) + 3600,
+    }
+    claims.update(overrides)
+    claims = {k: v for k, v in claims.items() if v is not None}
+    return jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+
+@pytest.fixture
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def jwks_response(private_key, kid: str) -> MagicMock:
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    response = MagicMock()
+    response.json.return_value = {"keys": [jwk]}
+    response.raise_for_status.return_value = None
+    return response
+
+
+def make_verifier(get_mock=None) -> JWTVerifier:
+    verifier = JWTVerifier(secret=SECRET, supabase_url="https://project.supabase.co")
+    verifier._client = MagicMock()
+    verifier._client.get = get_mock or AsyncMock()
+    return verifier
+
+
+@pytest.mark.asyncio
+async def test_verify_hs256_token_locally():
+    """HS256 토큰은 네트워크 호출 없이 검증되어야 함."""
+    verifier = make_verifier()
+
+    claims = await verifier.verify(make_token())
+
+    assert claims["sub"] == "user-1"
+    verifier._client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overrides, error",
+    [
+        ({"exp": int(time.time()) - 3600}, jwt.ExpiredSignatureError),
+        ({"aud": "anon"}, jwt.InvalidAudienceError),
+        ({"sub": None}, jwt.MissingRequiredClaimError),
+        ({"key": "wrong-secret-with-enough-length-123456"}, jwt.InvalidSignatureError),
+    ],
+)
+async def test_verify_rejects_invalid_claims(overrides, error):
+    """만료, 잘못된 aud, sub 누락, 잘못된 서명은 거부되어야 함."""
+    verifier = make_verifier()
+
+    with pytest.raises(error):
+        await verifier.verify(make_token(**overrides))
+
+
+@pytest.mark.asyncio
+async def test_verify_rejects_unsupported_algorithm():
+    """허용되지 않은 알고리즘(none 등)은 거부되어야 함."""
+    verifier = make_verifier()
+    token = jwt.encode({"sub": "u", "exp": int(time.time()) + 60}, None, algorithm="none")
+
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        await verifier.verify(token)
+
+
+@pytest.mark.asyncio
+async def test_verify_rs256_with_cached_jwks(rsa_key):
+    """RS256 토큰은 JWKS 공개 키로 검증하고, JWKS는 캐시되어야 함."""
+    get_mock = AsyncMock(return_value=jwks_response(rsa_key, "key-1"))
+    verifier = make_verifier(get_mock)
+    token = make_token(key=rsa_key, algorithm="RS256", headers={"kid": "key-1"})
+
+    assert (await verifier.verify(token))["sub"] == "user-1"
+    assert (await verifier.verify(token))["sub"] == "user-1"
+    get_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_is_rejected(rsa_key):
+    """JWKS에 없는 kid로 서명된 토큰은 거부되어야 함."""
+    verifier = make_verifier(AsyncMock(return_value=jwks_response(rsa_key, "key-1")))
+    token = make_token(key=rsa_key, algorithm="RS256", headers={"kid": "rotated"})
+
+    with pytest.raises(jwt.InvalidKeyError):
+        await verifier.verify(token)
+
+
+@pytest.mark.asyncio
+async def test_jwks_unavailable_raises(rsa_key):
+    """JWKS 조회에 실패하고 캐시된 키도 없으면 JWKSUnavailableError가 발생해야 함."""
+    verifier = make_verifier(AsyncMock(side_effect=httpx.ConnectError("down")))
+    token = make_token(key=rsa_key, algorithm="RS256", headers={"kid": "key-1"})
+
+    with pytest.raises(JWKSUnavailableError):
+        await verifier.verify(token)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_skips_remote_check_by_default():
+    """샘플링 비율이 0이면 원격 검증 없이 로컬 클레임으로 사용자를 반환해야 함."""
+    with (
+        patch.object(auth, "jwt_verifier", make_verifier()) as verifier,
+        patch.object(auth.settings, "AUTH_REMOTE_VERIFY_SAMPLE_RATE", 0.0),
+    ):
+        user = await auth.get_current_user(make_token())
+
+    assert user == {"id": "user-1", "email": "user@example.com"}
+    verifier._client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_sampled_remote_check_detects_revoked_session():
+    """샘플링된 요청에서 인증 서버가 세션을 거부하면 401이어야 함."""
+    revoked = MagicMock(status_code=401)
+    with (
+        patch.object(auth, "jwt_verifier", make_verifier(AsyncMock(return_value=revoked))),
+        patch.object(auth.settings, "AUTH_REMOTE_VERIFY_SAMPLE_RATE", 1.0),
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_user(make_token())
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_invalid_token():
+    """로컬 검증에 실패한 토큰은 401이어야 함."""
+    with patch.object(auth, "jwt_verifier", make_verifier()):
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_user("not-a-jwt")
+
+    assert exc_info.value.status_code == 401
@@ -1,3 +1,4 @@
+import pytest
 from src.languages.java import JavaStrategy
 from src.languages.javascript import JavaScriptStrategy
 from src.languages.python import PythonStrategy
@@ -34,3 +35,54 @@ class TestLanguageStrategies:
         instruction = strategy.get_system_instruction()
 
         assert "Jest" in instruction
+
+
+class TestNormalizeForCache:
+    """캐시 키용 코드 정규화: 서식 차이는 제거하고 의미 차이는 보존해야 함."""
+
+    @pytest.mark.parametrize(
+        ("strategy", "original", "variant"),
+        [
+            (
+                PythonStrategy(),
+                "def add(a, b):\n    return a + b\n",
+                "# 덧셈\ndef add(a,b):  \n\n\n  return (a + b)  # 합\n",
+            ),
+            (
+                JavaScriptStrategy(),
+                "function add(a, b) {\n  return a + b;\n}\n",
+                "/* 덧셈 */\nfunction add(a,b){ // 합\n\n\treturn a+b;   \n}",
+            ),
+            (
+                JavaStrategy(),
+                "public class A { int add(int a, int b) { return a + b; } }",
+                "/** 덧셈 */\npublic class A {\n    int add(int a,int b){\n        return a+b; // 합\n    }\n}\n",
+            ),
+        ],
+    )
+    def test_formatting_variants_normalize_equal(self, strategy, original, variant):
+        assert strategy.normalize_for_cache(original) == strategy.normalize_for_cache(variant)
+
+    @pytest.mark.parametrize(
+        ("strategy", "first", "second"),
+        [
+            (PythonStrategy(), "x = 'a  b'", "x = 'a b'"),
+            (PythonStrategy(), "if a:\n    b()\nc()", "if a:\n    b()\n    c()"),
+            (JavaScriptStrategy(), "a - --b", "a---b"),
+            (JavaScriptStrategy(), "const s = 'a // b';", "const s = 'a';"),
+            (JavaScriptStrategy(), "return\nx", "return x"),
+            (JavaScriptStrategy(), "x = a / b / g", "x = /b/g"),
+            (JavaStrategy(), 'String s = "a  b";', 'String s = "a b";'),
+            (JavaStrategy(), "i++ + j", "i + ++j"),
+        ],
+    )
+    def test_semantic_differences_are_preserved(self, strategy, first, second):
+        assert strategy.normalize_for_cache(first) != strategy.normalize_for_cache(second)
+
+    def test_python_syntax_error_falls_back_to_text(self):
+        strategy = PythonStrategy()
+        assert strategy.normalize_for_cache("  def broken(:\r\n") == "def broken(:"
+
+    def test_javascript_regex_literal_is_kept_intact(self):
+        normalized = JavaScriptStrategy().normalize_for_cache("const r = /a \\/ b[/]/g; // 주석")
+        assert normalized == "const r = /a \\/ b[/]/g ;"
@@ -0,0 +1,134 @@
+"""RequestContextMiddleware(순수 ASGI 요청 미들웨어) 단위 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import jwt
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from src.exceptions import ValidationError
+from src.middleware import SECURITY_HEADERS, RequestContextMiddleware
+from src.utils.logger import trace_id_ctx
+
+
+def make_app(verifier=None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/user")
+    async def user(request: Request):
+        return {"user": request.state.user, "trace_id": trace_id_ctx.get()}
+
+    @app.post("/upload")
+    async def upload():
+        return {"ok": True}
+
+    @app.get("/invalid")
+    async def invalid():
+        raise ValidationError("bad input")
+
+    if verifier is None:
+        verifier = MagicMock()
+        verifier.verify = AsyncMock(side_effect=jwt.InvalidTokenError("bad"))
+    app.add_middleware(RequestContextMiddleware, verifier=verifier, max_body_size=1024)
+    return app
+
+
+def test_adds_trace_id_and_security_headers():
+    """모든 응답에 X-Trace-ID와 보안 헤더가 추가되어야 함."""
+    response = TestClient(make_app()).get("/user")
+
+    assert response.status_code == 200
+    assert response.headers["X-Trace-ID"] == response.json()["trace_id"]
+    for name, value in SECURITY_HEADERS.items():
+        assert response.headers[name] == value
+
+
+def test_attaches_verified_user_to_state():
+    """유효한 Bearer 토큰이면 request.state.user에 사용자 정보가 주입되어야 함."""
+    verifier = MagicMock()
+    verifier.verify = AsyncMock(return_value={"sub": "user-1", "email": "a@b.c"})
+
+    response = TestClient(make_app(verifier)).get(
+        "/user", headers={"Authorization": "Bearer token"}
+    )
+
+    assert response.json()["user"] == {"id": "user-1", "email": "a@b.c"}
+    verifier.verify.assert_awaited_once_with("token")
+
+
+@pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer invalid"}])
+def test_user_is_none_without_valid_token(headers):
+    """토큰이 없거나 유효하지 않으면 request.state.user는 None이어야 함."""
+    response = TestClient(make_app()).get("/user", headers=headers)
+
+    assert response.json()["user"] is None
+
+
+def test_rejects_oversized_body_with_security_headers():
+    """Content-Length가 제한을 넘으면 앱을 호출하지 않고 413을 반환해야 함."""
+    response = TestClient(make_app()).post("/upload", headers={"Content-Length": "2048"})
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request entity too large"}
+    assert "X-Trace-ID" in response.headers
+
+
+def test_validation_error_is_converted_to_400():
+    """처리되지 않은 ValidationError는 400 응답으로 변환되어야 함."""
+    response = TestClient(make_app()).get("/invalid")
+
+    assert response.status_code == 400
+    assert response.json()["status"] == "validation_error"
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+
+@pytest.mark.asyncio
+async def test_streaming_chunks_are_forwarded_without_buffering():
+    """SSE 청크는 다음 청크를 기다리지 않고 즉시 전달되어야 함."""
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            yield "data: first\n\n"
+            await release.wait()
+            yield "data: second\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    middleware = RequestContextMiddleware(app, verifier=MagicMock())
+    first_chunk = asyncio.Event()
+    bodies: list[bytes] = []
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            bodies.append(message["body"])
+            first_chunk.set()
+
+    async def receive():
+        await asyncio.Event().wait()
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "headers": [],
+        "root_path": "",
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("test", 1234),
+        "http_version": "1.1",
+    }
+    task = asyncio.create_task(middleware(scope, receive, send))
+
+    await asyncio.wait_for(first_chunk.wait(), timeout=1)
+    assert bodies == [b"data: first\n\n"]
+
+    release.set()
+    await asyncio.wait_for(task, timeout=1)
+    assert bodies == [b"data: first\n\n", b"data: second\n\n"]
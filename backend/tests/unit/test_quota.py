@@ -80,3 +80,63 @@ async def test_get_weekly_quota_db_error(
 
     with pytest.raises(Exception, match="DB Error"):
         await supabase_service.get_weekly_quota("user_123")
+
+
+# === 비동기 PostgREST 경로 ===
+
+
+@pytest.fixture
+def async_postgrest(supabase_service):
+    """MockTransport로 응답하는 실제 AsyncPostgrestClient를 주입합니다."""
+    import httpx
+    from postgrest import AsyncPostgrestClient
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[], headers={"Content-Range": "*/7"})
+
+    http_client = httpx.AsyncClient(
+        base_url="http://test.com/rest/v1", transport=httpx.MockTransport(handler)
+    )
+    SupabaseService._async_client = AsyncPostgrestClient(
+        "http://test.com/rest/v1", http_client=http_client
+    )
+    with patch("src.config.settings.settings.SUPABASE_ASYNC_CLIENT", True):
+        yield requests
+    SupabaseService._async_client = None
+
+
+@pytest.mark.asyncio
+async def test_get_weekly_quota_uses_async_client(
+    supabase_service, mock_cache_service, mock_supabase_client, async_postgrest
+):
+    """비동기 클라이언트가 활성화되면 스레드풀/동기 클라이언트 없이 조회해야 함"""
+    with patch("src.services.supabase_service.run_in_threadpool") as mock_threadpool:
+        count = await supabase_service.get_weekly_quota("user_123")
+
+    assert count == 7
+    assert async_postgrest[0].url.path == "/rest/v1/generation_history"
+    assert async_postgrest[0].url.params["user_id"] == "eq.user_123"
+    mock_threadpool.assert_not_called()
+    mock_supabase_client.table.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_creation_failure_falls_back_to_threadpool(
+    supabase_service, mock_cache_service, mock_supabase_client
+):
+    """비동기 클라이언트 생성에 실패하면 동기 클라이언트(스레드풀)로 조회해야 함"""
+    mock_response = MagicMock()
+    mock_response.count = 3
+    mock_supabase_client.table.return_value.select.return_value.eq.return_value.gte.return_value.execute.return_value = mock_response
+
+    with (
+        patch("src.config.settings.settings.SUPABASE_ASYNC_CLIENT", True),
+        patch.object(SupabaseService, "_create_async_client", side_effect=RuntimeError("boom")),
+    ):
+        count = await supabase_service.get_weekly_quota("user_123")
+
+    assert count == 3
+    mock_supabase_client.table.assert_called_with("generation_history")
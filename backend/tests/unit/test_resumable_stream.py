@@ -0,0 +1,201 @@
+"""재연결 가능한(Last-Event-ID) 생성 SSE 스트림 단위 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from src.api.v1 import generator
+from src.api.v1.generator import generate_test, resume_generation
+from src.services.resumable_stream import ResumableStreams, parse_event_id
+from src.types import GenerateRequest
+from tests.helpers import FakeRedis, FakeRequest
+
+
+class OtherReplica(ResumableStreams):
+    """다른 프로세스를 흉내 내기 위해 스트림 레지스트리를 분리한 ResumableStreams."""
+
+    _streams: dict = {}
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    ResumableStreams._streams.clear()
+    OtherReplica._streams.clear()
+    yield
+
+
+async def frames(items: list[str], gate: asyncio.Event = None):
+    for i, item in enumerate(items):
+        if gate is not None and i == 2:
+            await gate.wait()  # 생성 도중 (클라이언트가 끊긴 사이 계속 생산)
+        yield f"data: {item}\n\n"
+
+
+def event_id(frame: str) -> str:
+    return frame.split("\n", 1)[0].removeprefix("id: ")
+
+
+def test_parse_event_id():
+    """이벤트 id는 스트림 id와 순번으로 분리되고, 잘못된 형식은 거부해야 함."""
+    assert parse_event_id("abc-_1:3") == ("abc-_1", 3)
+    assert parse_event_id("abc:0") == ("abc", 0)
+    assert parse_event_id("abc") is None
+    assert parse_event_id(":3") is None
+    assert parse_event_id("abc:x") is None
+
+
+@pytest.mark.asyncio
+async def test_frames_carry_sequential_event_ids():
+    """모든 프레임에 스트림 id와 순번으로 된 이벤트 id가 붙어야 함."""
+    streams = ResumableStreams(FakeRedis(), grace=0)
+    stream_id = streams.start("user-1", frames(["a", "b"]))
+
+    received = [frame async for frame in streams.subscribe(stream_id)]
+
+    assert received == [f"id: {stream_id}:1\ndata: a\n\n", f"id: {stream_id}:2\ndata: b\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_resume_on_same_process_continues_from_next_frame():
+    """같은 프로세스 재연결은 Last-Event-ID 다음 프레임부터 이어서 받아야 함."""
+    streams = ResumableStreams(FakeRedis(), grace=5)
+    gate = asyncio.Event()
+    stream_id = streams.start("user-1", frames(["a", "b", "c", "d"], gate))
+
+    first = streams.subscribe(stream_id)
+    received = [await first.__anext__(), await first.__anext__()]
+    await first.aclose()  # 연결 종료
+
+    resumed = await streams.resume("user-1", event_id(received[-1]))
+    gate.set()
+    rest = [frame async for frame in resumed]
+
+    assert [f.split("data: ")[1].strip() for f in received + rest] == ["a", "b", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_resume_on_other_replica_reads_redis_buffer():
+    """다른 레플리카 재연결은 Redis에 보관된 프레임을 이어서 받아야 함."""
+    redis = FakeRedis()
+    streams = ResumableStreams(redis, grace=5)
+    gate = asyncio.Event()
+    stream_id = streams.start("user-1", frames(["a", "b", "c"], gate))
+
+    first = streams.subscribe(stream_id)
+    await first.__anext__()
+    await first.aclose()
+
+    resumed = await OtherReplica(redis, grace=5).resume("user-1", f"{stream_id}:1")
+    gate.set()
+    rest = [frame async for frame in resumed]
+
+    assert rest == [f"id: {stream_id}:2\ndata: b\n\n", f"id: {stream_id}:3\ndata: c\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_resume_rejects_other_user_and_unknown_stream():
+    """다른 사용자의 스트림이나 만료된 스트림은 재연결할 수 없어야 함."""
+    redis = FakeRedis()
+    streams = ResumableStreams(redis, grace=0)
+    stream_id = streams.start("user-1", frames(["a"]))
+    await asyncio.sleep(0.01)
+
+    assert await streams.resume("user-2", f"{stream_id}:0") is None
+    assert await OtherReplica(redis).resume("user-2", f"{stream_id}:0") is None
+    assert await streams.resume("user-1", "unknown:0") is None
+    assert await streams.resume("user-1", "not-an-event-id") is None
+
+
+@pytest.mark.asyncio
+async def test_no_reconnect_within_grace_cancels_producer():
+    """재연결 대기 시간 안에 아무도 읽지 않으면 생산을 취소해야 함."""
+    events: list[str] = []
+
+    async def producer():
+        try:
+            yield "data: a\n\n"
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    streams = ResumableStreams(FakeRedis(), grace=0.02)
+    stream_id = streams.start("user-1", producer())
+    subscription = streams.subscribe(stream_id)
+    await subscription.__anext__()
+    await subscription.aclose()
+
+    await asyncio.sleep(0.01)
+    assert events == []  # 대기 시간 동안은 생성 계속
+    await asyncio.sleep(0.05)
+    assert events == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_grace_is_measured_from_disconnect():
+    """대기 시간 확인 직전에 연결이 끊겨도 끊긴 시점부터 대기 시간 전체를 보장해야 함."""
+    events: list[str] = []
+
+    async def producer():
+        try:
+            yield "data: a\n\n"
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    streams = ResumableStreams(FakeRedis(), grace=0.2)
+    stream_id = streams.start("user-1", producer())
+    subscription = streams.subscribe(stream_id)
+    await subscription.__anext__()
+    await asyncio.sleep(0.18)  # 첫 확인(0.2초) 직전에 연결 종료
+    await subscription.aclose()
+
+    await asyncio.sleep(0.1)
+    assert events == []  # 끊긴 지 0.1초: 아직 재연결 가능
+    await asyncio.sleep(0.15)
+    assert events == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resumes_without_regenerating_or_recharging():
+    """재연결 엔드포인트는 생성과 토큰 차감을 다시 하지 않고 남은 프레임을 전달해야 함."""
+    upstream_gate = asyncio.Event()
+
+    async def upstream():
+        yield "a"
+        await upstream_gate.wait()
+        yield "b"
+
+    service = MagicMock()
+    service.generate_test.side_effect = lambda **kwargs: upstream()
+    token_service = MagicMock()
+    token_service.deduct_tokens = AsyncMock(return_value=MagicMock(success=True))
+    token_service.refund_tokens = AsyncMock()
+    repository = MagicMock()
+    repository.create_history = AsyncMock(return_value=None)
+    streams = ResumableStreams(FakeRedis(), grace=5)
+    data = GenerateRequest(input_code="def a(): pass", language="python", turnstile_token="token")
+    user = {"id": "user-1"}
+
+    request = FakeRequest()
+    with patch.object(generator, "validate_turnstile_token", AsyncMock()):
+        response = await generate_test.__wrapped__(
+            request, data, user, service, repository, token_service, streams
+        )
+        first = await response.body_iterator.__anext__()
+        request.disconnect.set()
+        async for _ in response.body_iterator:
+            pass
+
+    resumed = await resume_generation.__wrapped__(FakeRequest(), event_id(first), user, streams)
+    upstream_gate.set()
+    rest = "".join([frame async for frame in resumed.body_iterator])
+
+    assert response.headers["X-Generation-Stream-Id"] == event_id(first).split(":")[0]
+    assert '"content":"a"' in first
+    assert '"content":"b"' in rest and '"type":"done"' in rest
+    assert '"content":"a"' not in rest
+    service.generate_test.assert_called_once()
+    token_service.deduct_tokens.assert_awaited_once()
+    token_service.refund_tokens.assert_not_awaited()
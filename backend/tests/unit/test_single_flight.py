@@ -0,0 +1,311 @@
+"""SingleFlight(동일 요청 생성 병합) 단위 테스트."""
+
+import asyncio
+
+import pytest
+from src.exceptions import GenerationError
+from src.services import single_flight as sf
+from src.services.single_flight import SingleFlight
+from tests import helpers
+
+
+class FakeRedis(helpers.FakeRedis):
+    """Single-flight Lua 스크립트를 흉내 내는 인메모리 Redis."""
+
+    def __init__(self):
+        super().__init__()
+        self.expirations: dict[str, int] = {}
+
+    async def eval(self, script, numkeys, *args):
+        keys, argv = args[:numkeys], args[numkeys:]
+        if script == sf._ACQUIRE_LOCK_SCRIPT:
+            if keys[0] in self.data:
+                return 0
+            self.data[keys[0]] = argv[0]
+            for key in keys[1:]:
+                self.streams.pop(key, None)
+            return 1
+        if self.data.get(keys[0]) != argv[0]:
+            return 0
+        self.expirations[keys[0]] = argv[1]
+        await self.xadd(keys[1], {argv[2]: argv[3]})
+        if script == sf._COMPLETE_SCRIPT:
+            del self.data[keys[0]]
+        return 1
+
+
+class OtherReplica(SingleFlight):
+    """다른 프로세스를 흉내 내기 위해 Flight 레지스트리를 분리한 SingleFlight."""
+
+    _flights: dict = {}
+
+
+def make_producer(chunks, calls, delay=0.0, error=None):
+    async def producer():
+        calls.append(1)
+        for chunk in chunks:
+            await asyncio.sleep(delay)
+            yield chunk
+        if error:
+            raise error
+
+    return producer
+
+
+async def collect(flight: SingleFlight, key: str, producer, offset: int = 0) -> str:
+    return "".join([chunk async for chunk in flight.run(key, producer, offset)])
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    SingleFlight._flights.clear()
+    OtherReplica._flights.clear()
+    yield
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_upstream_stream():
+    """동시에 들어온 같은 키의 요청은 업스트림을 한 번만 호출하고 같은 결과를 받아야 함."""
+    single_flight = SingleFlight(FakeRedis())
+    calls: list[int] = []
+    producer = make_producer(["a", "b", "c"], calls, delay=0.01)
+
+    results = await asyncio.gather(*[collect(single_flight, "k", producer) for _ in range(5)])
+
+    assert results == ["abc"] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_late_joiner_replays_buffered_chunks():
+    """생성 도중 합류한 요청도 처음 청크부터 모두 받아야 함."""
+    single_flight = SingleFlight(FakeRedis())
+    calls: list[int] = []
+    producer = make_producer(["a", "b", "c"], calls, delay=0.02)
+
+    first = asyncio.create_task(collect(single_flight, "k", producer))
+    await asyncio.sleep(0.03)
+    late = await collect(single_flight, "k", producer)
+
+    assert late == "abc"
+    assert await first == "abc"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_producer_error_propagates_to_all_waiters():
+    """생산자가 실패하면 모든 대기자에게 같은 예외가 전달되어야 함."""
+    redis = FakeRedis()
+    single_flight = SingleFlight(redis)
+    producer = make_producer(["a"], [], delay=0.01, error=GenerationError("boom"))
+
+    results = await asyncio.gather(
+        collect(single_flight, "k", producer),
+        collect(single_flight, "k", producer),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, GenerationError) for r in results)
+    assert redis.streams["singleflight:gemini:k:stream"][-1][1] == {"s": "error"}
+    assert "singleflight:gemini:k:lock" not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_other_replica_follows_without_calling_upstream():
+    """다른 레플리카의 요청은 락을 얻지 못하고 생산자의 스트림을 중계받아야 함."""
+    redis = FakeRedis()
+    leader = SingleFlight(redis)
+    follower = OtherReplica(redis)
+    leader_calls: list[int] = []
+    follower_calls: list[int] = []
+
+    leading = asyncio.create_task(
+        collect(leader, "k", make_producer(["a", "b", "c", "d"], leader_calls, delay=0.02))
+    )
+    await asyncio.sleep(0.03)
+    followed = await collect(follower, "k", make_producer(["x"], follower_calls))
+
+    assert followed == "abcd"
+    assert await leading == "abcd"
+    assert follower_calls == []
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_when_leader_disappears():
+    """생산자가 완료 신호 없이 사라지면(락 만료) 대기자가 직접 생성해야 함."""
+    redis = FakeRedis()
+    redis.data["singleflight:gemini:k:lock"] = "dead-leader"
+    follower = SingleFlight(redis, idle_timeout=0.05)
+    calls: list[int] = []
+
+    async def expire_lock():
+        await asyncio.sleep(0.02)
+        del redis.data["singleflight:gemini:k:lock"]
+
+    asyncio.create_task(expire_lock())
+    result = await collect(follower, "k", make_producer(["x", "y"], calls))
+
+    assert result == "xy"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_works_without_redis_coordination():
+    """Redis 장애 시에도 로컬 병합과 생성은 정상 동작해야 함."""
+
+    class BrokenRedis(FakeRedis):
+        async def eval(self, *args):
+            raise ConnectionError("redis down")
+
+    single_flight = SingleFlight(BrokenRedis())
+    calls: list[int] = []
+    producer = make_producer(["a", "b"], calls, delay=0.01)
+
+    results = await asyncio.gather(
+        collect(single_flight, "k", producer), collect(single_flight, "k", producer)
+    )
+
+    assert results == ["ab", "ab"]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_recorded_in_redis_stream():
+    """생산자는 청크마다 스트림 항목을 추가하고, 마지막에 완료 상태를 기록해야 함."""
+    redis = FakeRedis()
+
+    await collect(SingleFlight(redis), "k", make_producer(["a", "b"], []))
+
+    assert redis.streams["singleflight:gemini:k:stream"] == [
+        ("1-0", {"d": "a"}),
+        ("2-0", {"d": "b"}),
+        ("3-0", {"s": "done"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_client_resumes_from_offset():
+    """offset을 지정하면 이미 받은 앞부분을 건너뛰고 이어서 받아야 함 (청크 중간 포함)."""
+    redis = FakeRedis()
+    leader = SingleFlight(redis)
+    follower = OtherReplica(redis)
+    calls: list[int] = []
+    producer = make_producer(["ab", "cd", "ef"], calls, delay=0.02)
+
+    leading = asyncio.create_task(collect(leader, "k", producer))
+    await asyncio.sleep(0.03)
+    local, remote = await asyncio.gather(
+        collect(leader, "k", producer, offset=3), collect(follower, "k", producer, offset=1)
+    )
+
+    assert local == "def"
+    assert remote == "bcdef"
+    assert await leading == "abcdef"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_follower_receives_partial_output_before_producer_error():
+    """다른 레플리카의 생산자가 실패해도 그 전까지 생성된 청크는 전달된 뒤 오류가 나야 함."""
+    redis = FakeRedis()
+    leader = SingleFlight(redis)
+    follower = OtherReplica(redis)
+    producer = make_producer(["a", "b"], [], delay=0.02, error=GenerationError("boom"))
+
+    leading = asyncio.create_task(collect(leader, "k", producer))
+    await asyncio.sleep(0.01)
+    received: list[str] = []
+    with pytest.raises(GenerationError):
+        async for chunk in follower.run("k", producer):
+            received.append(chunk)
+
+    assert received == ["a", "b"]
+    with pytest.raises(GenerationError):
+        await leading
+
+
+@pytest.mark.asyncio
+async def test_last_subscriber_leaving_cancels_upstream():
+    """모든 대기자가 떠나면 업스트림 생성을 취소하고 스트림에 aborted를 기록해야 함."""
+    redis = FakeRedis()
+    single_flight = SingleFlight(redis)
+    cancelled = asyncio.Event()
+
+    async def producer():
+        try:
+            yield "a"
+            await asyncio.Event().wait()
+            yield "b"
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    consumers = [asyncio.create_task(collect(single_flight, "k", producer)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    consumers[0].cancel()
+    await asyncio.sleep(0.01)
+    assert not cancelled.is_set()  # 아직 한 명이 남아 있음
+
+    consumers[1].cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert redis.streams["singleflight:gemini:k:stream"][-1][1] == {"s": "aborted"}
+    assert "singleflight:gemini:k:lock" not in redis.data
+    assert SingleFlight._flights == {}
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_aborted_generation_before_first_chunk():
+    """생산자가 첫 청크 전에 취소되면 다른 레플리카 대기자가 직접 생성해야 함."""
+    redis = FakeRedis()
+    redis.data["singleflight:gemini:k:lock"] = "leader"
+    follower = SingleFlight(redis)
+    calls: list[int] = []
+
+    async def abort_leader():
+        await asyncio.sleep(0.02)
+        await redis.xadd("singleflight:gemini:k:stream", {"s": "aborted"})
+        del redis.data["singleflight:gemini:k:lock"]
+
+    asyncio.create_task(abort_leader())
+    result = await collect(follower, "k", make_producer(["x"], calls))
+
+    assert result == "x"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_producer_refreshes_lock_on_each_chunk():
+    """생산자는 청크를 추가할 때마다 락 TTL을 연장해 긴 생성 중에도 락을 유지해야 함."""
+    redis = FakeRedis()
+    refreshed: list[str] = []
+
+    async def producer():
+        for chunk in ["a", "b"]:
+            redis.expirations.pop("singleflight:gemini:k:lock", None)
+            yield chunk
+            await asyncio.sleep(0)
+            refreshed.append(redis.expirations.get("singleflight:gemini:k:lock"))
+
+    await collect(SingleFlight(redis, lock_ttl=30), "k", producer)
+
+    assert refreshed == [30, 30]
+
+
+@pytest.mark.asyncio
+async def test_producer_that_lost_lock_stops_writing_to_stream():
+    """락을 잃은 생산자는 새 생산자의 스트림에 청크나 완료 상태를 쓰지 않아야 함."""
+    redis = FakeRedis()
+    lock = "singleflight:gemini:k:lock"
+
+    async def producer():
+        yield "a"
+        redis.data[lock] = "new-leader"  # 락 만료 후 다른 레플리카가 재획득
+        yield "b"
+
+    result = await collect(SingleFlight(redis), "k", producer)
+
+    assert result == "ab"
+    assert redis.streams["singleflight:gemini:k:stream"] == [("1-0", {"d": "a"})]
+    assert redis.data[lock] == "new-leader"
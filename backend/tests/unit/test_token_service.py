@@ -4,7 +4,7 @@
 모든 외부 의존성(Supabase)은 Mock 처리합니다.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from src.config.constants import TokenConstants
@@ -26,6 +26,7 @@ def mock_supabase_service():
 @pytest.fixture
 def token_service(mock_supabase_service):
     """테스트용 TokenService 인스턴스를 생성합니다."""
+    TokenService._wallet_status_rpc_available = True
     return TokenService(supabase_service=mock_supabase_service)
 
 
@@ -183,11 +184,42 @@ async def test_get_token_info_existing_user(token_service, mock_supabase_service
     assert result.cost_per_generation == TokenConstants.COST_PER_GENERATION
 
 
+@pytest.mark.asyncio
+async def test_get_token_info_uses_single_wallet_status_rpc(token_service, mock_supabase_service):
+    """지갑 초기화, 일일 보너스, 잔액 조회를 get_wallet_status RPC 한 번으로 처리해야 함."""
+    mock_response = MagicMock()
+    mock_response.data = {
+        "success": True,
+        "already_claimed": False,
+        "added": 30,
+        "current_balance": 80,
+        "wallet_created": True,
+    }
+    mock_supabase_service.client.rpc.return_value.execute.return_value = mock_response
+
+    result = await token_service.get_token_info("new_user_123")
+
+    assert result.current_tokens == 80  # Welcome(50) + Daily(30)
+    assert result.daily_bonus_claimed is True
+    mock_supabase_service.client.rpc.assert_called_once_with(
+        "get_wallet_status",
+        {
+            "p_user_id": "new_user_123",
+            "p_welcome_amount": TokenConstants.WELCOME_BONUS,
+            "p_welcome_description": "신규 가입 웰컴 보너스",
+            "p_bonus_amount": TokenConstants.DAILY_BONUS,
+        },
+    )
+    mock_supabase_service.client.table.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_token_info_new_user(token_service, mock_supabase_service):
-    """신규 사용자에게 웰컴 보너스와 일일 보너스를 모두 지급해야 함."""
+    """get_wallet_status RPC가 없으면 개별 RPC로 웰컴/일일 보너스를 모두 지급해야 함."""
     from datetime import date
 
+    from postgrest.exceptions import APIError
+
     # 1. Mock RPC calls
     mock_init_response = MagicMock()
     mock_init_response.data = {"success": True, "created": True, "balance": 50}
@@ -196,6 +228,8 @@ async def test_get_token_info_new_user(token_service, mock_supabase_service):
     mock_bonus_response.data = {"success": True, "added": 30, "current_balance": 80}
 
     def rpc_side_effect(func_name, params):
+        if func_name == "get_wallet_status":
+            raise APIError({"code": "PGRST202", "message": "function not found"})
         if func_name == "initialize_user_wallet":
             return MagicMock(execute=MagicMock(return_value=mock_init_response))
         if func_name == "claim_daily_bonus":
@@ -216,6 +250,13 @@ async def test_get_token_info_new_user(token_service, mock_supabase_service):
     result = await token_service.get_token_info("new_user_123")
 
     assert result.current_tokens == 80  # 50 + 30
+    assert TokenService._wallet_status_rpc_available is False
+
+    # 이후 요청은 get_wallet_status를 다시 시도하지 않아야 함
+    mock_supabase_service.client.rpc.reset_mock()
+    await token_service.get_token_info("new_user_123")
+    called = [c.args[0] for c in mock_supabase_service.client.rpc.call_args_list]
+    assert called == ["initialize_user_wallet", "claim_daily_bonus"]
 
 
 # === 에러 메시지 검증 테스트 ===
@@ -237,3 +278,185 @@ def test_duplicate_transaction_error_truncation():
     error = DuplicateTransactionError(long_id)
 
     assert len(error.context["transaction_id"]) == 16
+
+
+# === 잔액 캐시 테스트 ===
+
+
+class FakeBalanceRedis:
+    """잔액 캐시가 사용하는 명령만 구현한 인메모리 Redis."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.data: dict[str, str] = {}
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def eval(self, script, numkeys, key, version_key, *argv):
+        from src.services import token_service as ts
+
+        if script == ts._INVALIDATE_BALANCE_SCRIPT:
+            self.hashes.pop(key, None)
+            self.data[version_key] = str(int(self.data.get(version_key, 0)) + 1)
+            return 1
+        if self.data.get(version_key, "") != argv[3]:
+            return 0
+        self.hashes[key] = {"balance": str(argv[0]), "bonus_date": argv[1]}
+        return 1
+
+
+@pytest.fixture
+def cached_token_service(mock_supabase_service):
+    TokenService._wallet_status_rpc_available = True
+    cache = MagicMock()
+    cache.redis_client = FakeBalanceRedis()
+    return TokenService(supabase_service=mock_supabase_service, cache_service=cache)
+
+
+def set_rpc_result(mock_supabase_service, data):
+    mock_supabase_service.client.rpc.return_value.execute.return_value = MagicMock(data=data)
+
+
+@pytest.mark.asyncio
+async def test_token_info_served_from_cache_after_first_lookup(
+    cached_token_service, mock_supabase_service
+):
+    """보너스 처리 후 잔액이 캐시되면 다음 조회는 DB를 호출하지 않아야 함."""
+    set_rpc_result(
+        mock_supabase_service, {"success": False, "already_claimed": True, "current_balance": 40}
+    )
+
+    first = await cached_token_service.get_token_info("user_123")
+    mock_supabase_service.client.rpc.reset_mock()
+    second = await cached_token_service.get_token_info("user_123")
+
+    assert first == second
+    assert second.current_tokens == 40
+    assert second.daily_bonus_claimed is True
+    mock_supabase_service.client.rpc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stale_bonus_date_bypasses_cache(cached_token_service, mock_supabase_service):
+    """전날 캐시된 잔액은 사용하지 않고 일일 보너스를 다시 처리해야 함."""
+    key = cached_token_service._balance_cache_key("user_123")
+    cached_token_service._cache.redis_client.hashes[key] = {
+        "balance": "10",
+        "bonus_date": "2000-01-01",
+    }
+    set_rpc_result(
+        mock_supabase_service,
+        {"success": True, "already_claimed": False, "added": 30, "current_balance": 40},
+    )
+
+    result = await cached_token_service.get_token_info("user_123")
+
+    assert result.current_tokens == 40
+    mock_supabase_service.client.rpc.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_deduct_and_refund_invalidate_balance(cached_token_service, mock_supabase_service):
+    """차감/환불 후에는 캐시를 삭제하고, 다음 조회는 DB 잔액을 읽어야 함."""
+    key = cached_token_service._balance_cache_key("user_123")
+    set_rpc_result(
+        mock_supabase_service, {"success": False, "already_claimed": True, "current_balance": 40}
+    )
+    await cached_token_service.get_token_info("user_123")
+
+    set_rpc_result(mock_supabase_service, {"success": True, "current_balance": 30})
+    await cached_token_service.deduct_tokens("user_123", 10)
+    assert key not in cached_token_service._cache.redis_client.hashes
+
+    set_rpc_result(
+        mock_supabase_service, {"success": False, "already_claimed": True, "current_balance": 30}
+    )
+    assert (await cached_token_service.get_token_info("user_123")).current_tokens == 30
+
+    set_rpc_result(mock_supabase_service, {"success": True, "current_balance": 40})
+    await cached_token_service.refund_tokens("user_123", 10)
+    assert key not in cached_token_service._cache.redis_client.hashes
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_rpc_results_leave_no_stale_balance(
+    cached_token_service, mock_supabase_service
+):
+    """동시 차감·환불 결과가 커밋 순서와 다르게 도착해도 오래된 잔액이 캐시에 남지 않아야 함."""
+    key = cached_token_service._balance_cache_key("user_123")
+    set_rpc_result(
+        mock_supabase_service, {"success": False, "already_claimed": True, "current_balance": 40}
+    )
+    await cached_token_service.get_token_info("user_123")
+
+    # 환불(40)이 나중에 커밋됐지만, 먼저 커밋된 차감(30) 결과가 늦게 도착
+    set_rpc_result(mock_supabase_service, {"success": True, "current_balance": 40})
+    await cached_token_service.refund_tokens("user_123", 10)
+    set_rpc_result(mock_supabase_service, {"success": True, "current_balance": 30})
+    await cached_token_service.deduct_tokens("user_123", 10)
+
+    assert key not in cached_token_service._cache.redis_client.hashes
+
+
+@pytest.mark.asyncio
+async def test_deduct_during_status_lookup_is_not_overwritten(
+    cached_token_service, mock_supabase_service
+):
+    """상태 조회 RPC와 캐시 기록 사이에 차감이 커밋되면 조회한 잔액을 캐시에 쓰지 않아야 함."""
+    key = cached_token_service._balance_cache_key("user_123")
+
+    async def status_rpc(user_id):
+        # 잔액 40을 읽은 뒤, 캐시에 기록하기 전에 다른 요청의 차감이 커밋됨
+        await cached_token_service.deduct_tokens(user_id, 10)
+        return {"success": False, "already_claimed": True, "current_balance": 40}
+
+    with (
+        patch.object(cached_token_service, "_call_wallet_status_rpc", side_effect=status_rpc),
+        patch.object(
+            cached_token_service,
+            "_call_deduct_rpc",
+            AsyncMock(return_value={"success": True, "current_balance": 30}),
+        ),
+    ):
+        result = await cached_token_service.get_token_info("user_123")
+
+    assert result.current_tokens == 40
+    assert key not in cached_token_service._cache.redis_client.hashes
+
+
+@pytest.mark.asyncio
+async def test_failed_deduct_invalidates_cache(cached_token_service, mock_supabase_service):
+    """결과를 알 수 없는 RPC 실패 시 캐시를 삭제해야 함."""
+    key = cached_token_service._balance_cache_key("user_123")
+    cached_token_service._cache.redis_client.hashes[key] = {
+        "balance": "40",
+        "bonus_date": cached_token_service._today(),
+    }
+    mock_supabase_service.client.rpc.return_value.execute.side_effect = Exception("timeout")
+
+    with pytest.raises(Exception, match="timeout"):
+        await cached_token_service.deduct_tokens("user_123", 10)
+
+    assert key not in cached_token_service._cache.redis_client.hashes
+
+
+@pytest.mark.asyncio
+async def test_cache_failure_falls_back_to_db(cached_token_service, mock_supabase_service):
+    """Redis 장애 시에도 DB 결과로 응답해야 함."""
+
+    async def broken(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    cached_token_service._cache.redis_client.hgetall = broken
+    cached_token_service._cache.redis_client.eval = broken
+    set_rpc_result(
+        mock_supabase_service, {"success": False, "already_claimed": True, "current_balance": 40}
+    )
+
+    result = await cached_token_service.get_token_info("user_123")
+
+    assert result.current_tokens == 40
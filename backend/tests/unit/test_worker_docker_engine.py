@@ -0,0 +1,127 @@
+"""Worker 비동기 Docker Engine 클라이언트(AsyncDockerClient) 단위 테스트."""
+
+import os
+import struct
+import sys
+
+import httpx
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../worker"))
+
+from docker_engine import (  # noqa: E402
+    STDERR,
+    STDOUT,
+    AsyncDockerClient,
+    DockerEngineError,
+    ImageNotFoundError,
+)
+
+
+def frame(stream_type: int, payload: bytes) -> bytes:
+    """Docker exec 멀티플렉스 스트림 프레임을 생성합니다."""
+    return struct.pack(">BxxxL", stream_type, len(payload)) + payload
+
+
+def make_client(handler) -> AsyncDockerClient:
+    client = AsyncDockerClient(docker_host="tcp://localhost:2375")
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://docker/v1.41"
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_exec_stream_demultiplexes_split_frames():
+    """여러 청크로 나뉘어 도착한 프레임도 stdout/stderr로 올바르게 분리해야 함."""
+    body = frame(STDOUT, b"hello ") + frame(STDERR, b"oops") + frame(STDOUT, b"world")
+
+    async def chunks():
+        for i in range(0, len(body), 5):
+            yield body[i : i + 5]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1.41/exec/abc/start"
+        return httpx.Response(200, content=chunks())
+
+    client = make_client(handler)
+    frames = [item async for item in client.exec_stream("abc")]
+    await client.close()
+
+    assert frames == [(STDOUT, b"hello "), (STDERR, b"oops"), (STDOUT, b"world")]
+
+
+@pytest.mark.asyncio
+async def test_exec_run_collects_output_and_exit_code():
+    """exec_run은 출력을 모두 모은 뒤 종료 코드를 함께 반환해야 함."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1.41/containers/c1/exec":
+            return httpx.Response(201, json={"Id": "e1"})
+        if path == "/v1.41/exec/e1/start":
+            return httpx.Response(200, content=frame(STDOUT, b"1 passed"))
+        if path == "/v1.41/exec/e1/json":
+            return httpx.Response(200, json={"ExitCode": 0, "Running": False})
+        return httpx.Response(404)
+
+    client = make_client(handler)
+    result = await client.exec_run("c1", ["pytest"], workdir="/app")
+    await client.close()
+
+    assert result.exit_code == 0
+    assert result.output == b"1 passed"
+
+
+@pytest.mark.asyncio
+async def test_inspect_missing_image_raises_image_not_found():
+    """존재하지 않는 이미지는 ImageNotFoundError로 변환되어야 함."""
+    client = make_client(lambda request: httpx.Response(404, json={"message": "No such image"}))
+
+    with pytest.raises(ImageNotFoundError):
+        await client.inspect_image("tester-sandbox")
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_error_response_raises_docker_engine_error():
+    """허용되지 않은 오류 응답은 데몬 메시지를 담은 DockerEngineError로 변환되어야 함."""
+    client = make_client(lambda request: httpx.Response(500, json={"message": "daemon down"}))
+
+    with pytest.raises(DockerEngineError, match="daemon down") as exc_info:
+        await client.info()
+    assert exc_info.value.status_code == 500
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_kill_ignores_already_stopped_container():
+    """이미 종료된 컨테이너(409)에 대한 kill은 예외 없이 무시되어야 함."""
+    client = make_client(lambda request: httpx.Response(409, json={"message": "not running"}))
+
+    await client.kill("c1")
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_put_archive_sends_tar_to_target_path():
+    """put_archive는 tar 본문을 대상 경로의 archive 엔드포인트로 PUT 해야 함."""
+    captured = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["method"] = request.method
+        captured["path"] = request.url.path
+        captured["params"] = dict(request.url.params)
+        captured["body"] = request.content
+        return httpx.Response(200)
+
+    client = make_client(handler)
+    await client.put_archive("c1", "/app", b"tar-bytes")
+    await client.close()
+
+    assert captured == {
+        "method": "PUT",
+        "path": "/v1.41/containers/c1/archive",
+        "params": {"path": "/app"},
+        "body": b"tar-bytes",
+    }
@@ -0,0 +1,43 @@
+"""Worker 코드 주입(tar 아카이브, 파일 레이아웃) 단위 테스트."""
+
+import io
+import os
+import sys
+import tarfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../worker"))
+
+import main as worker_main  # noqa: E402
+
+
+def test_create_tar_archive_contains_all_files_owned_by_sandbox():
+    """여러 파일이 sandbox 유저(UID 1000) 소유로 아카이브에 포함되어야 함."""
+    data = worker_main.create_tar_archive({"solution.py": "x = 1", "test_solution.py": "ê"})
+
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        members = {m.name: m for m in tar.getmembers()}
+        assert set(members) == {"solution.py", "test_solution.py"}
+        assert all(m.uid == 1000 and m.gid == 1000 for m in members.values())
+        assert tar.extractfile(members["test_solution.py"]).read() == "ê".encode()
+
+
+def test_build_sandbox_files_combined_layout(monkeypatch):
+    """combined 레이아웃은 소스와 테스트를 test_run.py 하나로 합쳐야 함."""
+    monkeypatch.setattr(worker_main, "SANDBOX_FILE_LAYOUT", "combined")
+
+    files, entrypoint = worker_main.build_sandbox_files("def f(): pass", "def test_f(): f()")
+
+    assert entrypoint == "test_run.py"
+    assert list(files) == ["test_run.py"]
+    assert files["test_run.py"].index("def f()") < files["test_run.py"].index("def test_f()")
+
+
+def test_build_sandbox_files_split_layout(monkeypatch):
+    """split 레이아웃은 소스를 별도 모듈로 두고 테스트가 이를 import해야 함."""
+    monkeypatch.setattr(worker_main, "SANDBOX_FILE_LAYOUT", "split")
+
+    files, entrypoint = worker_main.build_sandbox_files("def f(): pass", "def test_f(): f()")
+
+    assert entrypoint == "test_solution.py"
+    assert files["solution.py"] == "def f(): pass"
+    assert files["test_solution.py"].startswith("from solution import *")
@@ -0,0 +1,217 @@
+"""Worker sandbox 웜 풀(ContainerPool) 단위 테스트."""
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../worker"))
+
+import main as worker_main  # noqa: E402
+from docker_engine import ExecResult  # noqa: E402
+from pool import ContainerPool, PoolExhaustedError  # noqa: E402
+
+
+class FakeDocker:
+    """컨테이너 생성/삭제/초기화 호출을 기록하는 가짜 드라이버."""
+
+    def __init__(self, fail_reset: bool = False):
+        self.created = 0
+        self.destroyed: list[int] = []
+        self.reset_calls: list[int] = []
+        self.fail_reset = fail_reset
+
+    async def create(self):
+        self.created += 1
+        return self.created
+
+    async def destroy(self, container):
+        self.destroyed.append(container)
+
+    async def reset(self, container):
+        self.reset_calls.append(container)
+        if self.fail_reset:
+            raise RuntimeError("reset failed")
+
+
+def make_pool(fake: FakeDocker, **kwargs) -> ContainerPool:
+    options = {"min_size": 0, "max_size": 2, "max_uses": 3, "checkout_timeout": 0.1}
+    options.update(kwargs)
+    return ContainerPool(create=fake.create, destroy=fake.destroy, reset=fake.reset, **options)
+
+
+@pytest.mark.asyncio
+async def test_start_prefills_min_size():
+    """start() 후 min_size만큼 컨테이너가 미리 기동되어야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake, min_size=2, max_size=4)
+
+    await pool.start()
+    await asyncio.sleep(0.01)
+
+    assert fake.created == 2
+    assert pool.idle_count == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_released_container_is_reset_and_reused():
+    """반납된 컨테이너는 초기화 후 다음 대여에 재사용되어야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake)
+
+    async with pool.acquire() as first:
+        container = first.container
+
+    async with pool.acquire() as second:
+        assert second.container == container
+
+    assert fake.created == 1
+    assert fake.reset_calls == [container, container]
+
+
+@pytest.mark.asyncio
+async def test_discarded_container_is_destroyed():
+    """discard 표시된 컨테이너는 반납 시 폐기되어야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake)
+
+    async with pool.acquire() as item:
+        item.discard = True
+
+    assert fake.destroyed == [item.container]
+    assert fake.reset_calls == []
+    assert pool.total_count == 0
+
+
+@pytest.mark.asyncio
+async def test_exception_inside_acquire_discards_container():
+    """대여 중 예외가 발생하면 컨테이너 상태를 신뢰할 수 없으므로 폐기해야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake)
+
+    with pytest.raises(ValueError):
+        async with pool.acquire():
+            raise ValueError("boom")
+
+    assert fake.destroyed == [1]
+
+
+@pytest.mark.asyncio
+async def test_container_recycled_after_max_uses():
+    """max_uses에 도달한 컨테이너는 폐기되고 새 컨테이너가 생성되어야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake, max_uses=2)
+
+    for _ in range(3):
+        async with pool.acquire():
+            pass
+
+    assert fake.destroyed == [1]
+    assert fake.created == 2
+
+
+@pytest.mark.asyncio
+async def test_reset_failure_destroys_container():
+    """초기화에 실패한 컨테이너는 풀로 돌아가지 않아야 함."""
+    fake = FakeDocker(fail_reset=True)
+    pool = make_pool(fake)
+
+    async with pool.acquire():
+        pass
+
+    assert fake.destroyed == [1]
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_checkout_times_out_when_exhausted():
+    """max_size만큼 대여된 상태에서는 대기 시간 초과 시 PoolExhaustedError가 발생해야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake, max_size=1, checkout_timeout=0.05)
+
+    held = await pool.checkout()
+    with pytest.raises(PoolExhaustedError):
+        await pool.checkout()
+
+    await pool.release(held)
+
+
+@pytest.mark.asyncio
+async def test_waiter_receives_released_container():
+    """대기 중인 요청은 다른 요청이 반납한 컨테이너를 받아야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake, max_size=1, checkout_timeout=1.0)
+
+    held = await pool.checkout()
+    waiter = asyncio.create_task(pool.checkout())
+    await asyncio.sleep(0.01)
+    await pool.release(held)
+
+    item = await waiter
+    assert item.container == held.container
+    assert fake.created == 1
+
+
+@pytest.mark.asyncio
+async def test_prewarm_starts_one_container_only_when_no_idle():
+    """예열은 유휴 컨테이너가 없고 여유 용량이 있을 때만 하나를 기동해야 함."""
+    fake = FakeDocker()
+    pool = make_pool(fake, max_size=1)
+
+    assert await pool.prewarm() is True
+    await asyncio.sleep(0.01)
+    assert pool.idle_count == 1
+
+    assert await pool.prewarm() is False  # 유휴 컨테이너 있음
+    item = await pool.checkout()
+    assert await pool.prewarm() is False  # max_size 도달
+    assert fake.created == 1
+
+    await pool.release(item)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_checkout_releases_reserved_slot():
+    """컨테이너 생성 중 대여가 취소되어도 예약한 슬롯은 반환되어야 함."""
+    fake = FakeDocker()
+    started = asyncio.Event()
+
+    async def slow_create():
+        started.set()
+        await asyncio.Event().wait()
+
+    pool = ContainerPool(
+        create=slow_create, destroy=fake.destroy, reset=fake.reset, min_size=0, max_size=1
+    )
+    task = asyncio.create_task(pool.checkout())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert pool.total_count == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sandbox_reset_kills_processes_and_clears_writable_paths(monkeypatch):
+    """컨테이너 정리는 PID 1 외 프로세스를 종료하고 홈 디렉토리까지 비워야 하며, 실패하면 예외."""
+    docker = MagicMock()
+    docker.exec_run = AsyncMock(
+        side_effect=[ExecResult(exit_code=0, output=b""), ExecResult(1, b"leftover processes")]
+    )
+    monkeypatch.setattr(worker_main, "docker_client", docker)
+
+    await worker_main._reset_sandbox_container("c1")
+    with pytest.raises(RuntimeError, match="leftover"):
+        await worker_main._reset_sandbox_container("c1")
+
+    cmd = docker.exec_run.call_args_list[0].args[1]
+    assert cmd[:2] == ["python3", "-c"]
+    compile(cmd[2], "<reset>", "exec")
+    assert "os.kill(-1, signal.SIGKILL)" in cmd[2]
+    assert 'os.path.expanduser("~")' in cmd[2]
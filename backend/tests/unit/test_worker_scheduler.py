@@ -0,0 +1,98 @@
+"""Worker 실행 스케줄러(ExecutionScheduler) 단위 테스트."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../worker"))
+
+from scheduler import ExecutionScheduler, QueueFullError  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_slot_acquired_immediately_under_limit():
+    """동시 실행 한도 미만이면 대기 없이 슬롯을 얻어야 함."""
+    scheduler = ExecutionScheduler(max_concurrent=2, max_queue_depth=1)
+
+    async with scheduler.slot():
+        async with scheduler.slot():
+            assert scheduler.running == 2
+            assert scheduler.queued == 0
+
+    assert scheduler.running == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_full_rejects_with_retry_after():
+    """대기열이 가득 차면 즉시 QueueFullError와 Retry-After 추정치를 반환해야 함."""
+    scheduler = ExecutionScheduler(max_concurrent=1, max_queue_depth=1, initial_run_estimate=3.0)
+
+    await scheduler.acquire()
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(QueueFullError) as exc_info:
+        await scheduler.acquire()
+    # 실행 중 1 + 대기 1 = 2건 x 3초 / 동시성 1
+    assert exc_info.value.retry_after == 6
+
+    scheduler.release()
+    await waiter
+    scheduler.release()
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_runs_first():
+    """대기 중인 요청은 우선순위가 높은 순, 같은 우선순위는 도착 순으로 실행되어야 함."""
+    scheduler = ExecutionScheduler(max_concurrent=1, max_queue_depth=3)
+    order: list[str] = []
+
+    async def job(name: str, priority: int) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+
+    await scheduler.acquire()
+    tasks = [
+        asyncio.create_task(job("low", 0)),
+        asyncio.create_task(job("high", 5)),
+        asyncio.create_task(job("low-2", 0)),
+    ]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["high", "low", "low-2"]
+    assert scheduler.running == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_removes_waiter():
+    """대기 시간이 초과된 요청은 거절되고 대기열에서 제거되어야 함."""
+    scheduler = ExecutionScheduler(max_concurrent=1, max_queue_depth=1, queue_timeout=0.05)
+
+    await scheduler.acquire()
+    with pytest.raises(QueueFullError):
+        await scheduler.acquire()
+
+    assert scheduler.queued == 0
+    scheduler.release()
+    assert scheduler.running == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """대기 중 취소된 요청은 슬롯을 점유하지 않아야 함."""
+    scheduler = ExecutionScheduler(max_concurrent=1, max_queue_depth=1)
+
+    await scheduler.acquire()
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    scheduler.release()
+    assert scheduler.running == 0
+    assert scheduler.queued == 0
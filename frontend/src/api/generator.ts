@@ -49,9 +49,53 @@ export async function generateTestCode(
         }
     }
 
-    const reader = response.body?.getReader()
-    if (!reader) throw new Error('No stream available')
+    if (!response.body) throw new Error('No stream available')
 
+    // 연결이 끊기면 마지막으로 받은 이벤트 id(Last-Event-ID)로 재연결하여 이어서 받음
+    const streamId = response.headers.get('X-Generation-Stream-Id')
+    let lastEventId = streamId ? `${streamId}:0` : null
+    let body: ReadableStream<Uint8Array> = response.body
+
+    for (let attempt = 0; ; attempt++) {
+        try {
+            await readGenerationStream(body, onChunk, onError, (id) => {
+                lastEventId = id
+            })
+            return
+        } catch (e) {
+            if (!lastEventId || attempt >= MAX_RESUME_ATTEMPTS) throw e
+            await new Promise((resolve) => setTimeout(resolve, RESUME_BACKOFF_MS * (attempt + 1)))
+            const resumed = await fetch('/api/generate/resume', {
+                headers: {
+                    'Authorization': `Bearer ${token}`,
+                    'Last-Event-ID': lastEventId
+                }
+            }).catch(() => null)
+            if (!resumed?.ok || !resumed.body) throw e
+            body = resumed.body
+        }
+    }
+}
+
+const MAX_RESUME_ATTEMPTS = 3
+const RESUME_BACKOFF_MS = 500
+
+/**
+ * 생성 SSE 스트림을 읽어 이벤트별 콜백을 호출합니다.
+ *
+ * @param body 응답 본문 스트림.
+ * @param onChunk 청크 수신 시 호출될 콜백 함수.
+ * @param onError 에러 이벤트 수신 시 호출될 콜백 함수.
+ * @param onEventId 이벤트 id 수신 시 호출될 콜백 함수 (재연결 위치 기록).
+ * @throws Error 네트워크 오류로 스트림 읽기가 중단된 경우.
+ */
+async function readGenerationStream(
+    body: ReadableStream<Uint8Array>,
+    onChunk: (chunk: string) => void,
+    onError: (error: string) => void,
+    onEventId: (id: string) => void
+): Promise<void> {
+    const reader = body.getReader()
     const decoder = new TextDecoder()
     let buffer = ''
     let currentEventType = 'message'
@@ -65,6 +109,11 @@ export async function generateTestCode(
         buffer = lines.pop() || ''
 
         for (const line of lines) {
+            if (line.startsWith('id:')) {
+                onEventId(line.substring(3).trim())
+                continue
+            }
+
             if (line.startsWith('event:')) {
                 currentEventType = line.substring(6).trim()
                 continue
@@ -123,20 +172,53 @@ export async function executeTestCode(inputCode: string, testCode: string, langu
 }
 
 /**
- * 사용자의 생성 이력을 조회합니다.
+ * 사용자의 생성 이력 요약을 최신순으로 한 페이지 조회합니다.
+ * 목록에는 본문 대신 입력 코드 미리보기(input_preview)만 포함됩니다.
+ *
+ * @param token 인증 토큰.
+ * @param limit 페이지 크기.
+ * @param cursor 이전 페이지의 next_cursor (첫 페이지는 생략).
+ * @returns 이력 요약 목록과 다음 페이지 커서.
+ */
+export async function fetchHistory(
+    token: string,
+    limit?: number,
+    cursor?: string
+): Promise<{ items: any[]; next_cursor: string | null }> {
+    const params = new URLSearchParams()
+    if (limit) params.set('limit', String(limit))
+    if (cursor) params.set('cursor', cursor)
+    const query = params.toString()
+
+    const response = await fetch(`/api/history/${query ? `?${query}` : ''}`, {
+        headers: {
+            'Authorization': `Bearer ${token}`
+        }
+    })
+
+    if (!response.ok) {
+        return { items: [], next_cursor: null }
+    }
+
+    return await response.json()
+}
+
+/**
+ * 생성 이력 한 건의 전체 내용(입력 코드, 생성 코드)을 조회합니다.
  *
+ * @param historyId 이력 ID.
  * @param token 인증 토큰.
- * @returns 생성 이력 목록.
+ * @returns 이력 상세 (조회 실패 시 null).
  */
-export async function fetchHistory(token: string): Promise<any[]> {
-    const response = await fetch('/api/history/', {
+export async function fetchHistoryItem(historyId: string, token: string): Promise<any | null> {
+    const response = await fetch(`/api/history/${encodeURIComponent(historyId)}`, {
         headers: {
             'Authorization': `Bearer ${token}`
         }
     })
 
     if (!response.ok) {
-        return []
+        return null
     }
 
     return await response.json()
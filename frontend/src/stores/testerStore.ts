@@ -156,19 +156,20 @@ export const useTesterStore = defineStore('tester', () => {
         if (!isLoggedIn.value) return
 
         try {
-            const historyData = await generatorApi.fetchHistory(userToken.value)
-            if (Array.isArray(historyData)) {
+            const page = await generatorApi.fetchHistory(userToken.value, MAX_HISTORY_ITEMS)
+            if (Array.isArray(page.items)) {
                 // 병합 대신 단순 교체 (요구사항 단순화)
-                history.value = historyData.map((item: any) => ({
+                // 목록은 미리보기만 포함하므로 본문은 복원 시 상세 조회로 가져옴
+                history.value = page.items.map((item: any) => ({
                     id: item.id,
-                    input_code: item.input_code,
-                    generated_code: item.generated_code,
+                    input_code: item.input_preview ?? '',
+                    generated_code: '',
                     language: item.language,
                     created_at: item.created_at,
                     // 뷰 헬퍼 속성
                     timestamp: new Date(item.created_at).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }),
-                    inputCode: item.input_code, // 뷰 호환성 유지
-                    result: item.generated_code // 뷰 호환성 유지
+                    inputCode: item.input_preview ?? '', // 뷰 호환성 유지
+                    result: '' // 뷰 호환성 유지
                 }))
             }
         } catch (e) {
@@ -207,7 +208,19 @@ export const useTesterStore = defineStore('tester', () => {
         }
     }
 
-    const restoreHistory = (item: any) => {
+    const restoreHistory = async (item: any) => {
+        // 서버 이력은 목록에 본문이 없으므로 처음 복원할 때 상세를 조회해 채움
+        if (!item.result && !String(item.id).startsWith('temp-') && isLoggedIn.value) {
+            try {
+                const detail = await generatorApi.fetchHistoryItem(item.id, userToken.value)
+                if (detail) {
+                    item.input_code = item.inputCode = detail.input_code
+                    item.generated_code = item.result = detail.generated_code
+                }
+            } catch (e) {
+                console.error('히스토리 상세 조회 실패:', e)
+            }
+        }
         inputCode.value = item.inputCode
         generatedCode.value = item.result
         selectedLanguage.value = item.language
@@ -0,0 +1,293 @@
+"""asyncio 기반 Docker Engine API 클라이언트.
+
+docker-py는 동기 라이브러리라 스레드 풀에서 실행해야 하고, 멈춘 컨테이너가 스레드를
+점유하면 동시 실행 수가 기본 스레드 풀 크기에 묶입니다. 이 모듈은 Docker 유닉스 소켓으로
+Engine REST API를 직접 호출하여 생성/실행/스트리밍/종료를 모두 논블로킹으로 처리합니다.
+"""
+
+import logging
+import os
+import struct
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOCKER_HOST = "unix:///var/run/docker.sock"
+DEFAULT_API_VERSION = "v1.41"
+
+# exec 스트림 프레임 헤더: [stream_type(1), padding(3), payload_size(4, big-endian)]
+_FRAME_HEADER = struct.Struct(">BxxxL")
+
+STDOUT = 1
+STDERR = 2
+
+
+class DockerEngineError(Exception):
+    """Docker Engine API 호출이 실패했을 때 발생하는 예외.
+
+    Attributes:
+        status_code: Engine API 응답 상태 코드 (연결 실패 시 None).
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        self.status_code = status_code
+        super().__init__(message)
+
+
+class ImageNotFoundError(DockerEngineError):
+    """요청한 이미지가 로컬에 없을 때 발생하는 예외."""
+
+
+@dataclass(frozen=True)
+class ExecResult:
+    """컨테이너 내부 명령 실행 결과.
+
+    Attributes:
+        exit_code: 명령의 종료 코드.
+        output: stdout/stderr가 도착 순서대로 합쳐진 출력.
+    """
+
+    exit_code: int
+    output: bytes
+
+
+class AsyncDockerClient:
+    """Docker 유닉스 소켓을 사용하는 비동기 Engine API 클라이언트.
+
+    하나의 httpx.AsyncClient(커넥션 풀)를 재사용하며, 모든 메서드는 이벤트 루프를
+    차단하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        docker_host: Optional[str] = None,
+        api_version: str = DEFAULT_API_VERSION,
+        timeout: float = 30.0,
+    ) -> None:
+        """AsyncDockerClient 인스턴스를 초기화합니다.
+
+        Args:
+            docker_host: Docker 데몬 주소 (unix:// 또는 tcp://). None이면 DOCKER_HOST 환경 변수 사용.
+            api_version: 사용할 Engine API 버전 접두사.
+            timeout: 일반 API 호출의 기본 타임아웃 (초).
+        """
+        host = docker_host or os.getenv("DOCKER_HOST", DEFAULT_DOCKER_HOST)
+        if host.startswith("unix://"):
+            transport = httpx.AsyncHTTPTransport(uds=host[len("unix://") :])
+            base_url = "http://docker"
+        else:
+            transport = httpx.AsyncHTTPTransport()
+            base_url = host.replace("tcp://", "http://", 1)
+
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            base_url=f"{base_url}/{api_version}",
+            timeout=timeout,
+        )
+
+    async def close(self) -> None:
+        """HTTP 커넥션 풀을 닫습니다."""
+        await self._client.aclose()
+
+    async def ping(self) -> bool:
+        """Docker 데몬 응답 여부를 확인합니다."""
+        response = await self._request("GET", "/_ping")
+        return response.text == "OK"
+
+    async def info(self) -> dict[str, Any]:
+        """데몬 정보(사용 가능한 런타임 등)를 반환합니다."""
+        response = await self._request("GET", "/info")
+        return response.json()
+
+    async def inspect_image(self, image: str) -> dict[str, Any]:
+        """이미지 메타데이터를 조회합니다.
+
+        Raises:
+            ImageNotFoundError: 이미지가 존재하지 않는 경우.
+        """
+        response = await self._request("GET", f"/images/{image}/json", allow_status={404})
+        if response.status_code == 404:
+            raise ImageNotFoundError(f"No such image: {image}", status_code=404)
+        return response.json()
+
+    async def run_container(
+        self,
+        image: str,
+        command: list[str],
+        host_config: Optional[dict[str, Any]] = None,
+        **config: Any,
+    ) -> str:
+        """컨테이너를 생성하고 시작합니다 (detach 모드).
+
+        Args:
+            image: 이미지 이름.
+            command: 컨테이너 메인 프로세스 명령.
+            host_config: Engine API HostConfig (리소스 제한, 런타임 등).
+            **config: 그 밖의 컨테이너 생성 옵션 (NetworkDisabled 등).
+
+        Returns:
+            생성된 컨테이너 ID.
+
+        Raises:
+            ImageNotFoundError: 이미지가 존재하지 않는 경우.
+        """
+        body = {"Image": image, "Cmd": command, "HostConfig": host_config or {}, **config}
+        response = await self._request("POST", "/containers/create", json=body, allow_status={404})
+        if response.status_code == 404:
+            raise ImageNotFoundError(f"No such image: {image}", status_code=404)
+
+        container_id = response.json()["Id"]
+        await self._request("POST", f"/containers/{container_id}/start", allow_status={304})
+        return container_id
+
+    async def exec_create(
+        self,
+        container_id: str,
+        cmd: list[str],
+        workdir: Optional[str] = None,
+    ) -> str:
+        """컨테이너 안에 실행할 명령(exec 인스턴스)을 생성합니다.
+
+        Returns:
+            exec 인스턴스 ID.
+        """
+        body: dict[str, Any] = {"Cmd": cmd, "AttachStdout": True, "AttachStderr": True}
+        if workdir:
+            body["WorkingDir"] = workdir
+        response = await self._request("POST", f"/containers/{container_id}/exec", json=body)
+        return response.json()["Id"]
+
+    async def exec_stream(self, exec_id: str) -> AsyncIterator[tuple[int, bytes]]:
+        """exec 인스턴스를 시작하고 출력을 도착하는 대로 스트리밍합니다.
+
+        Args:
+            exec_id: exec_create로 생성한 인스턴스 ID.
+
+        Yields:
+            (스트림 종류(STDOUT/STDERR), 출력 바이트) 튜플.
+        """
+        buffer = b""
+        async with self._client.stream(
+            "POST",
+            f"/exec/{exec_id}/start",
+            json={"Detach": False, "Tty": False},
+            timeout=httpx.Timeout(self._client.timeout.connect, read=None),
+        ) as response:
+            if response.status_code >= 400:
+                body = await response.aread()
+                raise DockerEngineError(
+                    f"exec start 실패: {body.decode('utf-8', errors='replace')}",
+                    status_code=response.status_code,
+                )
+
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
+                while len(buffer) >= _FRAME_HEADER.size:
+                    stream_type, size = _FRAME_HEADER.unpack_from(buffer)
+                    end = _FRAME_HEADER.size + size
+                    if len(buffer) < end:
+                        break
+                    yield stream_type, buffer[_FRAME_HEADER.size : end]
+                    buffer = buffer[end:]
+
+    async def exec_inspect(self, exec_id: str) -> dict[str, Any]:
+        """exec 인스턴스 상태(종료 코드 등)를 조회합니다."""
+        response = await self._request("GET", f"/exec/{exec_id}/json")
+        return response.json()
+
+    async def exec_run(
+        self,
+        container_id: str,
+        cmd: list[str],
+        workdir: Optional[str] = None,
+    ) -> ExecResult:
+        """컨테이너 안에서 명령을 실행하고 종료될 때까지 출력을 수집합니다.
+
+        Args:
+            container_id: 대상 컨테이너 ID.
+            cmd: 실행할 명령.
+            workdir: 작업 디렉토리.
+
+        Returns:
+            ExecResult: 종료 코드와 합쳐진 출력.
+        """
+        exec_id = await self.exec_create(container_id, cmd, workdir=workdir)
+        output = bytearray()
+        async for _, data in self.exec_stream(exec_id):
+            output.extend(data)
+
+        state = await self.exec_inspect(exec_id)
+        exit_code = state.get("ExitCode")
+        return ExecResult(
+            exit_code=exit_code if exit_code is not None else -1, output=bytes(output)
+        )
+
+    async def put_archive(self, container_id: str, path: str, data: bytes) -> None:
+        """tar 아카이브를 컨테이너 내부 디렉토리에 압축 해제합니다.
+
+        컨테이너 안에서 별도 프로세스를 띄우지 않고 데몬이 직접 파일을 씁니다.
+        (데몬은 tmpfs 마운트 내부로는 압축 해제하지 못하므로 path는 컨테이너 레이어여야 합니다.)
+
+        Args:
+            container_id: 대상 컨테이너 ID.
+            path: 압축을 해제할 디렉토리 경로 (이미 존재해야 함).
+            data: tar 아카이브 바이트.
+        """
+        await self._request(
+            "PUT",
+            f"/containers/{container_id}/archive",
+            params={"path": path},
+            content=data,
+            headers={"Content-Type": "application/x-tar"},
+        )
+
+    async def kill(self, container_id: str) -> None:
+        """컨테이너를 강제 종료합니다. 이미 종료/삭제된 경우는 무시합니다."""
+        await self._request("POST", f"/containers/{container_id}/kill", allow_status={404, 409})
+
+    async def remove(self, container_id: str) -> None:
+        """컨테이너를 강제로 삭제합니다. 이미 삭제된 경우는 무시합니다."""
+        await self._request(
+            "DELETE",
+            f"/containers/{container_id}",
+            params={"force": "true"},
+            allow_status={404, 409},
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        allow_status: frozenset[int] | set[int] = frozenset(),
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Engine API를 호출하고 오류 응답을 DockerEngineError로 변환합니다.
+
+        Args:
+            method: HTTP 메서드.
+            path: API 경로 (버전 접두사 제외).
+            allow_status: 예외 없이 그대로 반환할 오류 상태 코드.
+            **kwargs: httpx 요청 옵션.
+
+        Returns:
+            httpx.Response 객체.
+
+        Raises:
+            DockerEngineError: 연결 실패 또는 허용되지 않은 오류 응답 시.
+        """
+        try:
+            response = await self._client.request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            raise DockerEngineError(f"Docker 데몬 연결 실패: {e}") from e
+
+        if response.status_code >= 400 and response.status_code not in allow_status:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise DockerEngineError(message, status_code=response.status_code)
+        return response
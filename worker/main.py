@@ -8,12 +8,13 @@ import time
 from contextlib import asynccontextmanager
 from typing import Optional
 
-import docker
-from docker.client import DockerClient
-from docker.errors import ImageNotFound
+from docker_engine import AsyncDockerClient, DockerEngineError, ImageNotFoundError
 from fastapi import Depends, FastAPI, Header, HTTPException
-from fastapi.responses import ORJSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, Response
+from pool import ContainerPool, PooledContainer, PoolExhaustedError
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from pydantic import BaseModel, Field
+from scheduler import ExecutionScheduler, QueueFullError
 from security import SecurityChecker, SecurityViolation
 
 # 기본 로깅 설정
@@ -28,8 +29,80 @@ DISABLE_WORKER_AUTH = os.getenv("DISABLE_WORKER_AUTH", "false").lower() == "true
 DOCKER_RUNTIME = os.getenv("DOCKER_RUNTIME", "runc")
 DOCKER_IMAGE = "tester-sandbox"
 
-# Docker 클라이언트 전역 변수
-docker_client: Optional[DockerClient] = None
+# 웜 풀 설정: 미리 기동해 둘 최소/최대 컨테이너 수, 재사용 한도, 대여 대기 시간
+SANDBOX_POOL_MIN_SIZE = int(os.getenv("SANDBOX_POOL_MIN_SIZE", "2"))
+SANDBOX_POOL_MAX_SIZE = int(os.getenv("SANDBOX_POOL_MAX_SIZE", "8"))
+SANDBOX_POOL_MAX_USES = int(os.getenv("SANDBOX_POOL_MAX_USES", "20"))
+SANDBOX_POOL_CHECKOUT_TIMEOUT = float(os.getenv("SANDBOX_POOL_CHECKOUT_TIMEOUT", "10"))
+
+# 동시에 코드를 실행할 수 있는 sandbox 수 (스레드 풀 크기와 무관하게 명시적으로 제한)
+MAX_CONCURRENT_SANDBOXES = int(os.getenv("MAX_CONCURRENT_SANDBOXES", str(SANDBOX_POOL_MAX_SIZE)))
+# 실행 슬롯을 기다릴 수 있는 최대 요청 수 / 대기 시간 (초과 시 429)
+EXECUTION_QUEUE_MAX_DEPTH = int(os.getenv("EXECUTION_QUEUE_MAX_DEPTH", "32"))
+EXECUTION_QUEUE_TIMEOUT = float(os.getenv("EXECUTION_QUEUE_TIMEOUT", "30"))
+# 코드 주입부터 pytest 종료까지 허용하는 최대 시간 (초). 초과 시 컨테이너를 강제 종료.
+EXECUTION_HARD_TIMEOUT = float(os.getenv("EXECUTION_HARD_TIMEOUT", "30"))
+
+# 코드 주입 방식: archive(put_archive, 기본) 또는 exec(컨테이너 내부 Python으로 쓰기, 폴백)
+INJECTION_MODE = os.getenv("INJECTION_MODE", "archive").lower()
+# 실행 파일 구성: combined(test_run.py 단일 파일) 또는 split(solution.py + test_solution.py)
+SANDBOX_FILE_LAYOUT = os.getenv("SANDBOX_FILE_LAYOUT", "combined").lower()
+# Dockerfile.sandbox에서 생성한 sandbox 유저의 UID/GID
+SANDBOX_UID = 1000
+
+# timeout(1)이 제한 시간 초과로 프로세스를 종료했을 때의 종료 코드
+TIMEOUT_EXIT_CODES = {124, 137}
+
+# 컨테이너 재사용 전 정리 스크립트 (sandbox 유저로 실행):
+# PID 1을 제외한 프로세스 종료 후 sandbox 유저가 쓸 수 있는 경로를 비우고 홈 디렉토리를 복원
+_RESET_SCRIPT = """
+import os, shutil, signal, sys, time
+
+try:
+    os.kill(-1, signal.SIGKILL)
+except ProcessLookupError:
+    pass
+
+home = os.path.expanduser("~")
+for path in ("/app", "/tmp", "/var/tmp", "/dev/shm", home):
+    if not os.path.isdir(path):
+        continue
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+shutil.copytree("/etc/skel", home, dirs_exist_ok=True)
+
+own = {1, os.getpid()}
+for _ in range(20):
+    left = [p for p in os.listdir("/proc") if p.isdigit() and int(p) not in own]
+    if not left:
+        sys.exit(0)
+    time.sleep(0.05)
+sys.exit(f"leftover processes: {left}")
+"""
+
+SANDBOX_HOST_CONFIG = {
+    "Memory": 128 * 1024 * 1024,
+    "NanoCpus": 500000000,  # 0.5 CPU
+    "NetworkMode": "none",  # 네트워크 완전 차단
+    "PidsLimit": 50,
+    "SecurityOpt": ["no-new-privileges"],
+    "CapDrop": ["ALL"],
+    "AutoRemove": True,
+}
+
+# Docker 클라이언트, 컨테이너 풀, 실행 스케줄러 전역 변수
+docker_client: Optional[AsyncDockerClient] = None
+# sandbox 이미지 digest: 백엔드 실행 결과 캐시 키에 포함되어, 이미지 재빌드 시 캐시가 무효화됨
+sandbox_image_digest: Optional[str] = None
+container_pool: Optional[ContainerPool] = None
+execution_scheduler = ExecutionScheduler(
+    max_concurrent=MAX_CONCURRENT_SANDBOXES,
+    max_queue_depth=EXECUTION_QUEUE_MAX_DEPTH,
+    queue_timeout=EXECUTION_QUEUE_TIMEOUT,
+)
 
 if not WORKER_AUTH_TOKEN and not DISABLE_WORKER_AUTH:
     logger.critical(
@@ -56,16 +129,18 @@ async def lifespan(app: FastAPI):
     Args:
         app: FastAPI 애플리케이션 인스턴스.
     """
-    global docker_client, DOCKER_RUNTIME
+    global docker_client, container_pool, sandbox_image_digest, DOCKER_RUNTIME
     try:
-        docker_client = docker.from_env()
+        docker_client = AsyncDockerClient()
+        await docker_client.ping()
         logger.info("Docker client initialized successfully.")
 
         # 이미지 존재 여부 사전 확인
         try:
-            docker_client.images.get(DOCKER_IMAGE)
-            logger.info(f"Docker image '{DOCKER_IMAGE}' found.")
-        except ImageNotFound:
+            image = await docker_client.inspect_image(DOCKER_IMAGE)
+            sandbox_image_digest = image.get("Id")
+            logger.info(f"Docker image '{DOCKER_IMAGE}' found ({sandbox_image_digest}).")
+        except ImageNotFoundError:
             logger.warning(
                 f"Docker image '{DOCKER_IMAGE}' not found. "
                 "Requests will fail until 'docker build -t tester-sandbox -f Dockerfile.sandbox .' is run."
@@ -74,23 +149,47 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Failed to check Docker image: {e}")
 
         # 설정된 런타임 사용 가능 여부 확인 후, 불가 시 runc로 자동 폴백
-        _verify_and_fallback_runtime()
+        await _verify_and_fallback_runtime()
+
+        # 런타임이 확정된 뒤 웜 풀 기동 (min_size까지 백그라운드에서 채움)
+        container_pool = ContainerPool(
+            create=_create_sandbox_container,
+            destroy=_destroy_sandbox_container,
+            reset=_reset_sandbox_container,
+            min_size=SANDBOX_POOL_MIN_SIZE,
+            max_size=SANDBOX_POOL_MAX_SIZE,
+            max_uses=SANDBOX_POOL_MAX_USES,
+            checkout_timeout=SANDBOX_POOL_CHECKOUT_TIMEOUT,
+        )
+        await container_pool.start()
+        logger.info(
+            f"Sandbox pool started (min={SANDBOX_POOL_MIN_SIZE}, max={SANDBOX_POOL_MAX_SIZE})"
+        )
 
     except Exception as e:
         logger.error(f"Failed to initialize Docker client: {e}")
+        if docker_client:
+            await docker_client.close()
         docker_client = None
 
     yield
 
+    if container_pool:
+        try:
+            await container_pool.close()
+            logger.info("Sandbox pool closed.")
+        except Exception as e:
+            logger.error(f"Error closing sandbox pool: {e}")
+
     if docker_client:
         try:
-            docker_client.close()
+            await docker_client.close()
             logger.info("Docker client closed.")
         except Exception as e:
             logger.error(f"Error closing Docker client: {e}")
 
 
-def _verify_and_fallback_runtime() -> None:
+async def _verify_and_fallback_runtime() -> None:
     """설정된 Docker 런타임이 사용 가능한지 검증하고, 불가 시 runc로 폴백합니다.
 
     gVisor(runsc)이 설정되어 있지만 서버에 미설치된 경우,
@@ -102,12 +201,10 @@ def _verify_and_fallback_runtime() -> None:
         return
 
     try:
-        # 경량 테스트 컨테이너로 지정된 런타임 사용 가능 여부 검증
-        docker_client.containers.run(
-            "hello-world",
-            remove=True,
-            runtime=DOCKER_RUNTIME,
-        )
+        # 데몬에 등록된 런타임 목록으로 사용 가능 여부 검증 (테스트 컨테이너 기동 불필요)
+        runtimes = (await docker_client.info()).get("Runtimes") or {}
+        if DOCKER_RUNTIME not in runtimes:
+            raise RuntimeError(f"등록된 런타임: {', '.join(runtimes) or '없음'}")
         logger.info(f"Docker runtime '{DOCKER_RUNTIME}' 사용 가능 확인 완료")
     except Exception as e:
         logger.warning(
@@ -118,6 +215,44 @@ def _verify_and_fallback_runtime() -> None:
         DOCKER_RUNTIME = "runc"
 
 
+async def _create_sandbox_container() -> str:
+    """웜 풀에 넣을 sandbox 컨테이너를 기동합니다.
+
+    Dockerfile.sandbox에서 sandbox 유저가 /app 소유권을 가지며,
+    컨테이너는 명령 실행을 기다리도록 대기 상태로 유지됩니다.
+
+    Returns:
+        기동된 컨테이너 ID.
+    """
+    return await docker_client.run_container(
+        DOCKER_IMAGE,
+        command=["tail", "-f", "/dev/null"],  # Keep alive
+        host_config={**SANDBOX_HOST_CONFIG, "Runtime": DOCKER_RUNTIME},
+        NetworkDisabled=True,
+    )
+
+
+async def _destroy_sandbox_container(container_id: str) -> None:
+    """sandbox 컨테이너를 종료합니다 (AutoRemove로 기동되어 자동 삭제됨)."""
+    await docker_client.kill(container_id)
+
+
+async def _reset_sandbox_container(container_id: str) -> None:
+    """반납된 컨테이너에서 이전 실행의 흔적을 제거합니다.
+
+    컨테이너는 여러 사용자의 실행에 재사용되므로, sandbox 유저가 쓸 수 있는 경로를 모두 비우고
+    PID 1을 제외한 프로세스를 종료합니다. 종료되지 않은 프로세스(좀비 포함)가 남으면
+    정리에 실패한 것으로 보고 컨테이너를 폐기합니다. (put_archive로 /app에 코드를 주입하므로
+    ReadonlyRootfs + tmpfs 구성은 사용할 수 없습니다.)
+
+    Raises:
+        RuntimeError: 정리 명령이 실패한 경우 (호출 측에서 컨테이너를 폐기).
+    """
+    result = await docker_client.exec_run(container_id, ["python3", "-c", _RESET_SCRIPT])
+    if result.exit_code != 0:
+        raise RuntimeError(result.output.decode("utf-8", errors="replace"))
+
+
 app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
@@ -128,11 +263,25 @@ class ExecutionRequest(BaseModel):
         input_code: 사용자가 입력한 소스 코드.
         test_code: 검증을 위한 테스트 코드.
         language: 프로그래밍 언어 (python 등).
+        priority: 실행 우선순위 (클수록 먼저 실행, 기본값 0).
     """
 
     input_code: str
     test_code: str
     language: str
+    priority: int = Field(default=0, ge=-10, le=10)
+
+
+class PrepareRequest(BaseModel):
+    """실행 준비 요청 모델.
+
+    Attributes:
+        input_code: 곧 실행할 사용자 소스 코드.
+        language: 프로그래밍 언어 (python 등).
+    """
+
+    input_code: str
+    language: str
 
 
 def verify_token(authorization: Optional[str] = Header(None)):
@@ -161,43 +310,194 @@ def verify_token(authorization: Optional[str] = Header(None)):
         raise HTTPException(status_code=403, detail="Invalid Worker Token")
 
 
-def create_tar_archive(file_name: str, content: str) -> bytes:
-    """단일 파일을 포함하는 tar 아카이브를 생성합니다.
+def create_tar_archive(files: dict[str, str]) -> bytes:
+    """여러 파일을 포함하는 tar 아카이브를 생성합니다.
 
     Docker 컨테이너에 파일을 주입하기 위해 사용됩니다.
+    파일은 sandbox 유저(UID/GID 1000) 소유로 기록되어 pytest가 캐시 등을 쓸 수 있습니다.
 
     Args:
-        file_name: 아카이브 내 파일 이름.
-        content: 파일 내용 (문자열).
+        files: 아카이브 내 파일 이름 → 파일 내용(문자열) 매핑.
 
     Returns:
         put_archive에 사용할 수 있는 bytes 형태의 tar 데이터.
     """
-    file_data = content.encode("utf-8")
     tar_stream = io.BytesIO()
+    mtime = time.time()
 
     with tarfile.open(fileobj=tar_stream, mode="w") as tar:
-        tar_info = tarfile.TarInfo(name=file_name)
-        tar_info.size = len(file_data)
-        tar_info.mtime = time.time()
-        tar.addfile(tarinfo=tar_info, fileobj=io.BytesIO(file_data))
+        for file_name, content in files.items():
+            file_data = content.encode("utf-8")
+            tar_info = tarfile.TarInfo(name=file_name)
+            tar_info.size = len(file_data)
+            tar_info.mtime = mtime
+            tar_info.mode = 0o644
+            tar_info.uid = tar_info.gid = SANDBOX_UID
+            tar_info.uname = tar_info.gname = "sandbox"
+            tar.addfile(tarinfo=tar_info, fileobj=io.BytesIO(file_data))
 
     return tar_stream.getvalue()
 
 
+def build_sandbox_files(input_code: str, test_code: str) -> tuple[dict[str, str], str]:
+    """실행할 파일 구성과 pytest 대상 파일명을 결정합니다.
+
+    combined 레이아웃은 소스와 테스트를 한 파일로 합치고,
+    split 레이아웃은 solution.py / test_solution.py로 분리하여 테스트가 소스를 import합니다.
+
+    Args:
+        input_code: 사용자가 입력한 소스 코드.
+        test_code: 검증을 위한 테스트 코드.
+
+    Returns:
+        (파일 이름 → 내용 매핑, pytest 대상 파일명) 튜플.
+    """
+    if SANDBOX_FILE_LAYOUT == "split":
+        files = {
+            "solution.py": input_code,
+            "test_solution.py": f"from solution import *  # noqa: F401,F403\n\n{test_code}",
+        }
+        return files, "test_solution.py"
+
+    combined_code = f"{input_code}\n\n# --- Test Code ---\n\n{test_code}"
+    return {"test_run.py": combined_code}, "test_run.py"
+
+
+async def _inject_files(container_id: str, files: dict[str, str]) -> Optional[str]:
+    """컨테이너의 /app에 실행 파일을 주입합니다.
+
+    기본(archive)은 데몬이 tar를 직접 압축 해제하여 컨테이너 안에 프로세스를 띄우지 않습니다.
+    exec 모드는 컨테이너 안의 Python으로 파일을 쓰는 기존 방식(폴백)입니다.
+
+    Args:
+        container_id: 대상 컨테이너 ID.
+        files: 파일 이름 → 내용 매핑.
+
+    Returns:
+        실패 시 오류 메시지, 성공 시 None.
+    """
+    if INJECTION_MODE == "exec":
+        script = (
+            f"for name, content in {repr(files)}.items():\n    open(name, 'w').write(content)\n"
+        )
+        result = await docker_client.exec_run(
+            container_id, ["python3", "-c", script], workdir="/app"
+        )
+        if result.exit_code != 0:
+            return result.output.decode("utf-8", errors="replace")
+        return None
+
+    try:
+        await docker_client.put_archive(container_id, "/app", create_tar_archive(files))
+    except DockerEngineError as e:
+        return str(e)
+    return None
+
+
 @app.get("/health")
 def health_check():
-    """Worker 상태 및 Docker 클라이언트 상태를 확인합니다."""
+    """Worker 상태, Docker 클라이언트 상태 및 sandbox 이미지 digest를 반환합니다."""
     status = "active" if docker_client else "degraded (docker error)"
-    return {"status": "ok", "worker": status}
+    return {"status": "ok", "worker": status, "image_digest": sandbox_image_digest}
+
+
+@app.get("/metrics", dependencies=[Depends(verify_token)])
+def metrics():
+    """Prometheus 메트릭(웜 풀 크기, 대여 대기 시간, 폐기 횟수 등)을 노출합니다."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def _friendly_error_message(error: Exception) -> str:
+    """실행 중 발생한 예외를 사용자에게 보여줄 메시지로 변환합니다."""
+    error_msg = str(error)
+    if "runc" in error_msg or "runsc" in error_msg or "runtime" in error_msg.lower():
+        return "Docker 런타임 오류가 발생했습니다. 서버 설정을 확인해주세요."
+    if isinstance(error, ImageNotFoundError) or "No such image" in error_msg:
+        return "실행 환경 이미지를 찾을 수 없습니다. 서버 관리자에게 문의해주세요."
+    if "permission" in error_msg.lower():
+        return "실행 권한 오류가 발생했습니다."
+    return "코드 실행 중 내부 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+
+
+async def _run_in_container(
+    pooled: PooledContainer, files: dict[str, str], entrypoint: str
+) -> dict:
+    """대여한 컨테이너에 코드를 주입하고 pytest를 실행합니다.
+
+    주입 실패나 타임아웃처럼 컨테이너 상태를 신뢰할 수 없는 경우
+    pooled.discard를 설정하여 반납 시 폐기되도록 합니다.
+
+    Args:
+        pooled: 웜 풀에서 대여한 컨테이너.
+        files: 주입할 파일 이름 → 내용 매핑.
+        entrypoint: pytest로 실행할 테스트 파일명.
+
+    Returns:
+        실행 결과 딕셔너리 (success, output, error, exit_code).
+        exit_code는 pytest가 실제로 종료된 경우에만 포함됩니다.
+    """
+    container_id = pooled.container
+
+    # 1. 코드 주입 (기본: put_archive, 폴백: exec_run + Python write)
+    write_err = await _inject_files(container_id, files)
+    if write_err is not None:
+        pooled.discard = True
+        logger.error(f"코드 주입 실패: {write_err}")
+        return {"success": False, "error": "코드 주입에 실패했습니다.", "output": write_err}
+
+    # 2. 테스트 실행
+    run_cmd = ["timeout", "10s", "pytest", entrypoint, "--no-header", "-v"]
+    exec_result = await docker_client.exec_run(container_id, run_cmd, workdir="/app")
+
+    # 제한 시간을 넘긴 실행은 잔여 프로세스가 남아 있을 수 있으므로 재사용하지 않음
+    if exec_result.exit_code in TIMEOUT_EXIT_CODES:
+        pooled.discard = True
+
+    output_str = exec_result.output.decode("utf-8", errors="replace")
+    success = exec_result.exit_code == 0
+
+    return {
+        "success": success,
+        "output": output_str,
+        "error": "" if success else "Test execution failed",
+        "exit_code": exec_result.exit_code,
+    }
+
+
+@app.post("/prepare", dependencies=[Depends(verify_token)])
+async def prepare_execution(request: PrepareRequest):
+    """곧 들어올 실행 요청에 앞서 소스 코드 보안 검사와 sandbox 예열을 수행합니다.
+
+    백엔드가 테스트 코드를 생성하는 동안 호출하여, 생성이 끝난 뒤의 실행 요청이
+    컨테이너 기동을 기다리지 않도록 합니다. 보안 검사에 실패한 코드는 예열하지 않습니다.
+    테스트 코드는 아직 없으므로 /execute에서 소스 코드와 함께 다시 검사합니다.
+
+    Args:
+        request: 실행할 소스 코드와 언어.
+
+    Returns:
+        safe(소스 코드 보안 검사 통과 여부), error(위반 내용), warmed(예열 시작 여부).
+    """
+    if request.language.lower() != "python":
+        return {"safe": True, "error": "", "warmed": False}
+
+    try:
+        SecurityChecker().check_code(request.input_code)
+    except SecurityViolation as e:
+        return {"safe": False, "error": str(e), "warmed": False}
+
+    warmed = bool(container_pool) and await container_pool.prewarm()
+    return {"safe": True, "error": "", "warmed": warmed}
 
 
 @app.post("/execute", dependencies=[Depends(verify_token)])
 async def execute_code(request: ExecutionRequest):
     """격리된 Docker 컨테이너에서 코드를 실행합니다.
 
-    보안 검사 후 Docker Sandbox에서 코드를 실행하고 결과를 반환합니다.
-    메인 루프 차단을 방지하기 위해 별도 스레드에서 실행됩니다.
+    보안 검사 후 웜 풀에서 sandbox 컨테이너를 대여하여 코드를 실행하고 결과를 반환합니다.
+    컨테이너는 실행 후 초기화되어 풀로 반납되거나, 오염 가능성이 있으면 폐기됩니다.
+    Docker 호출은 모두 비동기로 처리되며, 동시 실행 수는 우선순위 스케줄러로 제한됩니다.
+    대기열이 가득 차면 컨테이너를 기동하지 않고 즉시 429를 반환합니다.
 
     Args:
         request: 실행할 코드 및 설정 정보.
@@ -206,114 +506,61 @@ async def execute_code(request: ExecutionRequest):
         실행 결과 객체 (성공 여부, 표준 출력, 에러 메시지).
 
     Raises:
-        HTTPException: 지원하지 않는 언어이거나 Docker 서비스 사용 불가 시.
+        HTTPException: 대기열 초과 시 (429, Retry-After 포함),
+            Docker 서비스 사용 불가 또는 컨테이너 풀 고갈 시 (503).
     """
-    if not docker_client:
+    if not docker_client or not container_pool:
         raise HTTPException(status_code=503, detail="Docker service unavailable on worker")
 
-    loop = asyncio.get_running_loop()
+    if request.language.lower() != "python":
+        return {
+            "success": False,
+            "error": f"Language runner not implemented for {request.language}",
+            "output": "",
+        }
 
-    # 블로킹 실행 로직 (동기 함수)
-    def _run_sync():
-        if request.language.lower() != "python":
-            return {
-                "success": False,
-                "error": f"Language runner not implemented for {request.language}",
-                "output": "",
-            }
+    # 0. 정적 보안 검사
+    try:
+        checker = SecurityChecker()
+        checker.check_code(request.input_code)
+        checker.check_code(request.test_code)
+    except SecurityViolation as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "output": "",
+        }
+
+    files, entrypoint = build_sandbox_files(request.input_code, request.test_code)
 
-        # 0. 정적 보안 검사
-        try:
-            checker = SecurityChecker()
-            checker.check_code(request.input_code)
-            checker.check_code(request.test_code)
-        except SecurityViolation as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "output": "",
-            }
-
-        container = None
-        try:
-            # 1. 이미지 확인 (빠른 체크)
+    try:
+        async with (
+            execution_scheduler.slot(request.priority),
+            container_pool.acquire() as pooled,
+        ):
             try:
-                docker_client.images.get(DOCKER_IMAGE)
-            except ImageNotFound:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Docker image '{DOCKER_IMAGE}' not found. Please build it.",
-                ) from None
-
-            # 2. 컨테이너 시작
-            combined_code = f"{request.input_code}\n\n# --- Test Code ---\n\n{request.test_code}"
-
-            # Dockerfile.sandbox에서 sandbox 유저가 /app 소유권을 가짐.
-            # put_archive(tar 압축해제) 방식은 tmpfs 권한/타이밍 이슈로 불안정하므로,
-            # exec_run으로 Python이 직접 파일을 쓰는 방식으로 교체.
-            container = docker_client.containers.run(
-                DOCKER_IMAGE,
-                command="tail -f /dev/null",  # Keep alive
-                detach=True,
-                mem_limit="128m",
-                nano_cpus=500000000,  # 0.5 CPU
-                network_disabled=True,
-                network_mode="none",  # 네트워크 완전 차단
-                pids_limit=50,
-                security_opt=["no-new-privileges"],
-                cap_drop=["ALL"],
-                remove=True,
-                runtime=DOCKER_RUNTIME,
-            )
-
-            # 3. 코드 주입 (exec_run + Python write 방식)
-            # put_archive 대신 Python open()으로 직접 작성 → tmpfs 불필요, 신뢰성 향상
-            write_result = container.exec_run(
-                ["python3", "-c", f"open('/app/test_run.py', 'w').write({repr(combined_code)})"],
-                workdir="/app",
-            )
-            if write_result.exit_code != 0:
-                write_err = write_result.output.decode("utf-8", errors="replace")
-                logger.error(f"코드 주입 실패: {write_err}")
-                return {"success": False, "error": "코드 주입에 실패했습니다.", "output": write_err}
-
-            # 4. 테스트 실행
-            run_cmd = ["timeout", "10s", "pytest", "test_run.py", "--no-header", "-v"]
-            exec_result = container.exec_run(run_cmd, workdir="/app")
-
-            output_str = exec_result.output.decode("utf-8", errors="replace")
-            success = exec_result.exit_code == 0
-
-            return {
-                "success": success,
-                "output": output_str,
-                "error": "" if success else "Test execution failed",
-            }
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Execution failed: {e}", exc_info=True)
-            # 에러 유형별로 사용자에게 명확한 메시지 제공
-            error_msg = str(e)
-            if "runc" in error_msg or "runsc" in error_msg or "runtime" in error_msg.lower():
-                friendly_msg = "Docker 런타임 오류가 발생했습니다. 서버 설정을 확인해주세요."
-            elif "ImageNotFound" in type(e).__name__ or "No such image" in error_msg:
-                friendly_msg = "실행 환경 이미지를 찾을 수 없습니다. 서버 관리자에게 문의해주세요."
-            elif "permission" in error_msg.lower() or "Permission" in error_msg:
-                friendly_msg = "실행 권한 오류가 발생했습니다."
-            else:
-                friendly_msg = "코드 실행 중 내부 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
-            return {"success": False, "error": friendly_msg, "output": ""}
-
-        finally:
-            # 5. 리소스 정리
-            if container:
-                try:
-                    container.kill()
-                except Exception as e:
-                    # 이미 삭제된 경우 무시
-                    logger.warning(f"Container cleanup warning: {e}")
-
-    # 스레드 풀에서 실행 (Non-blocking)
-    return await loop.run_in_executor(None, _run_sync)
+                return await asyncio.wait_for(
+                    _run_in_container(pooled, files, entrypoint), timeout=EXECUTION_HARD_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                # 멈춘 컨테이너는 반납 시 강제 종료(폐기)
+                pooled.discard = True
+                logger.warning(f"Execution exceeded {EXECUTION_HARD_TIMEOUT}s, killing sandbox")
+                return {
+                    "success": False,
+                    "error": "실행 시간이 초과되었습니다.",
+                    "output": "",
+                }
+    except QueueFullError as e:
+        logger.warning(f"Execution queue full: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail="Execution queue is full",
+            headers={"Retry-After": str(e.retry_after)},
+        ) from e
+    except PoolExhaustedError as e:
+        logger.warning(f"Sandbox pool exhausted: {e}")
+        raise HTTPException(status_code=503, detail="Sandbox pool exhausted") from e
+    except Exception as e:
+        logger.error(f"Execution failed: {e}", exc_info=True)
+        return {"success": False, "error": _friendly_error_message(e), "output": ""}
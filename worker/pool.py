@@ -0,0 +1,349 @@
+"""Sandbox 컨테이너 웜 풀(Warm Pool).
+
+요청마다 컨테이너를 생성/삭제하면 생성 비용(gVisor 환경에서는 수백 ms~수 초)이
+실행 지연의 대부분을 차지합니다. 이 모듈은 미리 기동된 sandbox 컨테이너를 보관하고
+대여(checkout) → 초기화(reset) → 반납 또는 폐기(destroy)하는 수명 주기를 관리합니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = Gauge(
+    "sandbox_pool_size",
+    "웜 풀에 보관 중인 sandbox 컨테이너 수",
+    ["state"],
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "sandbox_pool_checkout_wait_seconds",
+    "컨테이너 대여까지 대기한 시간 (초)",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+POOL_RECYCLED = Counter(
+    "sandbox_pool_recycled_total",
+    "폐기된 sandbox 컨테이너 수 (사유별)",
+    ["reason"],
+)
+
+ContainerFactory = Callable[[], Awaitable[Any]]
+ContainerHook = Callable[[Any], Awaitable[None]]
+
+
+class PoolExhaustedError(Exception):
+    """대기 시간 안에 사용 가능한 컨테이너를 확보하지 못한 경우 발생하는 예외."""
+
+
+@dataclass
+class PooledContainer:
+    """풀에서 대여된 컨테이너와 사용 이력.
+
+    Attributes:
+        container: 실제 컨테이너 핸들.
+        uses: 지금까지 실행에 사용된 횟수.
+        created_at: 컨테이너 생성 시각 (monotonic).
+        discard: True면 반납 시 초기화 없이 폐기합니다 (타임아웃, 주입 실패 등).
+    """
+
+    container: Any
+    uses: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+    discard: bool = False
+
+
+class ContainerPool:
+    """미리 기동된 sandbox 컨테이너를 관리하는 비동기 풀.
+
+    컨테이너 생성/초기화/삭제는 주입된 콜백으로 수행하므로 Docker 드라이버와 독립적입니다.
+    전체 컨테이너 수(유휴 + 대여 중 + 생성 중)는 max_size를 넘지 않으며,
+    폐기가 발생하면 백그라운드에서 min_size까지 다시 채웁니다.
+    """
+
+    def __init__(
+        self,
+        create: ContainerFactory,
+        destroy: ContainerHook,
+        reset: ContainerHook,
+        min_size: int = 2,
+        max_size: int = 8,
+        max_uses: int = 20,
+        checkout_timeout: float = 10.0,
+    ) -> None:
+        """ContainerPool 인스턴스를 초기화합니다.
+
+        Args:
+            create: 새 컨테이너를 기동하여 반환하는 코루틴 함수.
+            destroy: 컨테이너를 종료/삭제하는 코루틴 함수.
+            reset: 반납된 컨테이너를 깨끗한 상태로 되돌리는 코루틴 함수.
+                실패 시 예외를 발생시키면 해당 컨테이너는 폐기됩니다.
+            min_size: 항상 유지할 최소 컨테이너 수.
+            max_size: 동시에 존재할 수 있는 최대 컨테이너 수.
+            max_uses: 컨테이너 하나를 재사용할 최대 횟수 (초과 시 폐기).
+            checkout_timeout: 대여 대기 최대 시간 (초).
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"잘못된 풀 크기 설정: min={min_size}, max={max_size}")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+
+        self._create = create
+        self._destroy = destroy
+        self._reset = reset
+
+        self._idle: deque[PooledContainer] = deque()
+        self._total = 0
+        self._in_use = 0
+        self._closed = False
+        self._cond = asyncio.Condition()
+        self._replenish_task: Optional[asyncio.Task] = None
+        self._prewarm_tasks: set[asyncio.Task] = set()
+
+    @property
+    def idle_count(self) -> int:
+        """유휴 컨테이너 수."""
+        return len(self._idle)
+
+    @property
+    def in_use_count(self) -> int:
+        """대여 중인 컨테이너 수."""
+        return self._in_use
+
+    @property
+    def total_count(self) -> int:
+        """생성 중인 컨테이너를 포함한 전체 컨테이너 수."""
+        return self._total
+
+    async def start(self) -> None:
+        """min_size까지 컨테이너를 백그라운드에서 미리 기동합니다."""
+        self._closed = False
+        self._schedule_replenish()
+
+    async def close(self) -> None:
+        """유휴 컨테이너를 모두 폐기하고 풀을 닫습니다.
+
+        대여 중인 컨테이너는 반납 시점에 폐기됩니다.
+        """
+        self._closed = True
+        if self._replenish_task and not self._replenish_task.done():
+            self._replenish_task.cancel()
+        for task in self._prewarm_tasks:
+            task.cancel()
+
+        async with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._total -= len(idle)
+            self._cond.notify_all()
+        self._update_gauges()
+
+        for item in idle:
+            await self._safe_destroy(item, reason="shutdown")
+
+    async def checkout(self) -> PooledContainer:
+        """컨테이너를 대여합니다.
+
+        유휴 컨테이너가 있으면 즉시 반환하고, 여유 용량이 있으면 새로 생성합니다.
+        둘 다 불가능하면 반납될 때까지 checkout_timeout 동안 대기합니다.
+
+        Returns:
+            대여된 PooledContainer.
+
+        Raises:
+            PoolExhaustedError: 대기 시간 안에 컨테이너를 확보하지 못한 경우.
+        """
+        if self._closed:
+            raise PoolExhaustedError("컨테이너 풀이 종료되었습니다")
+
+        started = time.monotonic()
+        deadline = started + self.checkout_timeout
+        item: Optional[PooledContainer] = None
+
+        async with self._cond:
+            while True:
+                if self._idle:
+                    item = self._idle.popleft()
+                    break
+                if self._total < self.max_size:
+                    # 슬롯을 먼저 예약한 뒤 락 밖에서 생성
+                    self._total += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolExhaustedError(
+                        f"{self.checkout_timeout}초 안에 sandbox 컨테이너를 확보하지 못했습니다"
+                    )
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    raise PoolExhaustedError(
+                        f"{self.checkout_timeout}초 안에 sandbox 컨테이너를 확보하지 못했습니다"
+                    ) from None
+
+        if item is None:
+            try:
+                item = PooledContainer(container=await self._create())
+            except BaseException:
+                # 생성 실패뿐 아니라 요청 취소(CancelledError) 시에도 예약한 슬롯을 반환
+                async with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                raise
+
+        self._in_use += 1
+        POOL_CHECKOUT_WAIT.observe(time.monotonic() - started)
+        self._update_gauges()
+        return item
+
+    async def release(self, item: PooledContainer) -> None:
+        """대여한 컨테이너를 반납합니다.
+
+        재사용 가능하면 초기화 후 유휴 목록으로 되돌리고,
+        폐기 대상이거나 초기화에 실패하면 삭제 후 최소 크기를 다시 채웁니다.
+
+        Args:
+            item: checkout으로 대여한 컨테이너.
+        """
+        self._in_use -= 1
+        item.uses += 1
+
+        reason: Optional[str] = None
+        if self._closed:
+            reason = "shutdown"
+        elif item.discard:
+            reason = "discarded"
+        elif item.uses >= self.max_uses:
+            reason = "max_uses"
+        else:
+            try:
+                await self._reset(item.container)
+            except Exception as e:
+                logger.warning(f"Sandbox 컨테이너 초기화 실패, 폐기합니다: {e}")
+                reason = "reset_failed"
+
+        if reason is None:
+            async with self._cond:
+                self._idle.append(item)
+                self._cond.notify()
+            self._update_gauges()
+            return
+
+        async with self._cond:
+            self._total -= 1
+            self._cond.notify()
+        self._update_gauges()
+
+        await self._safe_destroy(item, reason=reason)
+        self._schedule_replenish()
+
+    async def prewarm(self) -> bool:
+        """곧 들어올 실행 요청에 대비해 유휴 컨테이너를 하나 미리 기동합니다.
+
+        유휴 컨테이너가 없고 여유 용량이 있을 때만 백그라운드에서 하나를 생성하므로,
+        여러 번 호출해도 max_size를 넘지 않습니다. 예열한 컨테이너는 min_size를 넘더라도
+        일반 컨테이너처럼 대여·반납됩니다.
+
+        Returns:
+            새 컨테이너 기동을 시작했으면 True.
+        """
+        async with self._cond:
+            if self._closed or self._idle or self._total >= self.max_size:
+                return False
+            self._total += 1
+
+        task = asyncio.create_task(self._fill_reserved())
+        self._prewarm_tasks.add(task)
+        task.add_done_callback(self._prewarm_tasks.discard)
+        return True
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[PooledContainer]:
+        """컨테이너를 대여하고 블록 종료 시 자동으로 반납하는 컨텍스트 매니저.
+
+        블록 안에서 예외가 발생하면 컨테이너 상태를 신뢰할 수 없으므로 폐기합니다.
+
+        Yields:
+            대여된 PooledContainer.
+        """
+        item = await self.checkout()
+        try:
+            yield item
+        except BaseException:
+            item.discard = True
+            raise
+        finally:
+            await self.release(item)
+
+    def _schedule_replenish(self) -> None:
+        """min_size 보충 작업을 백그라운드로 예약합니다 (중복 실행 방지)."""
+        if self._closed or self.min_size == 0:
+            return
+        if self._replenish_task and not self._replenish_task.done():
+            return
+        self._replenish_task = asyncio.create_task(self._replenish())
+
+    async def _replenish(self) -> None:
+        """전체 컨테이너 수가 min_size에 도달할 때까지 새 컨테이너를 생성합니다."""
+        while not self._closed:
+            async with self._cond:
+                if self._total >= self.min_size:
+                    return
+                self._total += 1
+
+            if not await self._fill_reserved():
+                return
+
+    async def _fill_reserved(self) -> bool:
+        """예약해 둔 슬롯에 새 컨테이너를 생성하여 유휴 목록에 넣습니다.
+
+        Returns:
+            생성에 성공했으면 True (실패 시 예약한 슬롯을 반환).
+        """
+        try:
+            item = PooledContainer(container=await self._create())
+        except BaseException as e:
+            async with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            self._update_gauges()
+            if not isinstance(e, Exception):
+                raise
+            logger.warning(f"웜 풀 컨테이너 생성 실패 (다음 요청 시 재시도): {e}")
+            return False
+
+        async with self._cond:
+            if self._closed:
+                self._total -= 1
+            else:
+                self._idle.append(item)
+                self._cond.notify()
+        self._update_gauges()
+
+        if self._closed:
+            await self._safe_destroy(item, reason="shutdown")
+        return True
+
+    async def _safe_destroy(self, item: PooledContainer, reason: str) -> None:
+        """컨테이너를 삭제하고 폐기 사유를 메트릭에 기록합니다."""
+        POOL_RECYCLED.labels(reason=reason).inc()
+        try:
+            await self._destroy(item.container)
+        except Exception as e:
+            # 이미 삭제된 경우 등은 무시
+            logger.warning(f"Container cleanup warning: {e}")
+
+    def _update_gauges(self) -> None:
+        """풀 크기 게이지를 현재 상태로 갱신합니다."""
+        POOL_SIZE.labels(state="idle").set(len(self._idle))
+        POOL_SIZE.labels(state="in_use").set(self._in_use)
@@ -0,0 +1,211 @@
+"""Sandbox 실행 요청 입장 제어(Admission Control) 스케줄러.
+
+요청이 몰리면 128MB sandbox 컨테이너가 한꺼번에 기동되어 VM이 스왑에 빠질 수 있습니다.
+이 모듈은 동시 실행 수를 제한하고, 초과 요청은 우선순위 큐에서 대기시키며,
+큐가 가득 차면 즉시 거절(QueueFullError)하여 호출 측이 429로 응답할 수 있게 합니다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+QUEUE_DEPTH = Gauge(
+    "sandbox_queue_depth",
+    "실행 슬롯을 기다리는 요청 수",
+)
+RUNNING = Gauge(
+    "sandbox_running",
+    "현재 실행 중인 요청 수",
+)
+QUEUE_WAIT = Histogram(
+    "sandbox_queue_wait_seconds",
+    "실행 슬롯을 얻기까지 큐에서 대기한 시간 (초)",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+RUN_TIME = Histogram(
+    "sandbox_run_seconds",
+    "실행 슬롯을 점유한 시간 (초)",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0),
+)
+REJECTED = Counter(
+    "sandbox_rejected_total",
+    "입장 거절된 요청 수 (사유별)",
+    ["reason"],
+)
+
+
+class QueueFullError(Exception):
+    """대기 큐가 가득 차 요청을 받을 수 없을 때 발생하는 예외.
+
+    Attributes:
+        retry_after: 재시도까지 권장 대기 시간 (초).
+    """
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class ExecutionScheduler:
+    """동시 실행 수와 대기 큐 깊이를 제한하는 우선순위 스케줄러.
+
+    priority 값이 클수록 먼저 실행되며, 같은 우선순위는 도착 순서(FIFO)를 따릅니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue_depth: int,
+        queue_timeout: float = 30.0,
+        initial_run_estimate: float = 2.0,
+    ) -> None:
+        """ExecutionScheduler 인스턴스를 초기화합니다.
+
+        Args:
+            max_concurrent: 동시에 실행할 수 있는 최대 요청 수.
+            max_queue_depth: 대기할 수 있는 최대 요청 수 (초과 시 즉시 거절).
+            queue_timeout: 큐에서 대기할 수 있는 최대 시간 (초).
+            initial_run_estimate: 실행 시간 표본이 없을 때 사용할 예상 실행 시간 (초).
+        """
+        if max_concurrent < 1 or max_queue_depth < 0:
+            raise ValueError(
+                f"잘못된 스케줄러 설정: concurrent={max_concurrent}, queue={max_queue_depth}"
+            )
+
+        self.max_concurrent = max_concurrent
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeout = queue_timeout
+
+        self._running = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        # 최근 실행 시간의 지수 이동 평균 (Retry-After 추정용)
+        self._avg_run_time = initial_run_estimate
+
+    @property
+    def running(self) -> int:
+        """현재 실행 중인 요청 수."""
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        """대기 중인 요청 수."""
+        return len(self._waiters)
+
+    def estimate_retry_after(self) -> int:
+        """현재 큐를 비우는 데 걸릴 예상 시간(초)을 계산합니다."""
+        backlog = self.queued + self._running
+        return max(1, math.ceil(backlog * self._avg_run_time / self.max_concurrent))
+
+    async def acquire(self, priority: int = 0) -> None:
+        """실행 슬롯을 확보합니다.
+
+        Args:
+            priority: 요청 우선순위 (클수록 먼저 실행).
+
+        Raises:
+            QueueFullError: 대기 큐가 가득 찼거나 대기 시간이 초과된 경우.
+        """
+        started = time.monotonic()
+
+        if self._running < self.max_concurrent and not self._waiters:
+            self._running += 1
+            QUEUE_WAIT.observe(0)
+            self._update_gauges()
+            return
+
+        if len(self._waiters) >= self.max_queue_depth:
+            REJECTED.labels(reason="queue_full").inc()
+            raise QueueFullError(
+                "실행 대기열이 가득 찼습니다", retry_after=self.estimate_retry_after()
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (-priority, next(self._counter), future)
+        heapq.heappush(self._waiters, entry)
+        self._update_gauges()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            if not self._cancel_waiter(entry):
+                # 타임아웃 직전에 슬롯을 넘겨받은 경우 그대로 진행
+                QUEUE_WAIT.observe(time.monotonic() - started)
+                return
+            REJECTED.labels(reason="queue_timeout").inc()
+            raise QueueFullError(
+                f"{self.queue_timeout}초 동안 실행 슬롯을 얻지 못했습니다",
+                retry_after=self.estimate_retry_after(),
+            ) from None
+        except asyncio.CancelledError:
+            if not self._cancel_waiter(entry):
+                # 이미 넘겨받은 슬롯은 반환
+                self.release()
+            raise
+
+        QUEUE_WAIT.observe(time.monotonic() - started)
+
+    def release(self, run_time: Optional[float] = None) -> None:
+        """실행 슬롯을 반환하고 우선순위가 가장 높은 대기 요청에 넘겨줍니다.
+
+        Args:
+            run_time: 방금 끝난 실행의 소요 시간 (초). Retry-After 추정에 반영됩니다.
+        """
+        if run_time is not None:
+            RUN_TIME.observe(run_time)
+            self._avg_run_time = 0.8 * self._avg_run_time + 0.2 * run_time
+
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # 슬롯을 그대로 넘겨주므로 _running은 변하지 않음
+                future.set_result(None)
+                self._update_gauges()
+                return
+
+        self._running -= 1
+        self._update_gauges()
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0) -> AsyncIterator[None]:
+        """실행 슬롯을 확보하고 블록 종료 시 반환하는 컨텍스트 매니저.
+
+        Args:
+            priority: 요청 우선순위 (클수록 먼저 실행).
+
+        Raises:
+            QueueFullError: 대기 큐가 가득 찼거나 대기 시간이 초과된 경우.
+        """
+        await self.acquire(priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    def _cancel_waiter(self, entry: tuple[int, int, asyncio.Future]) -> bool:
+        """대기 중인 요청을 큐에서 제거합니다.
+
+        Returns:
+            제거에 성공하면 True, 이미 슬롯을 넘겨받았다면 False.
+        """
+        future = entry[2]
+        if future.done():
+            return False
+        future.cancel()
+        self._waiters.remove(entry)
+        heapq.heapify(self._waiters)
+        self._update_gauges()
+        return True
+
+    def _update_gauges(self) -> None:
+        """큐 깊이/실행 중 게이지를 현재 상태로 갱신합니다."""
+        QUEUE_DEPTH.set(len(self._waiters))
+        RUNNING.set(self._running)
@@ -0,0 +1,83 @@
+"""코드 주입 방식별 지연 시간 벤치마크.
+
+실행 중인 Docker 데몬과 tester-sandbox 이미지가 필요합니다.
+sandbox 컨테이너 하나를 기동한 뒤, 입력 크기별로 두 가지 주입 방식의 지연을 비교합니다.
+
+- exec: 컨테이너 안에서 Python을 띄워 repr() 문자열을 파일로 쓰는 기존 방식
+- archive: tar 아카이브를 put_archive로 데몬이 직접 압축 해제하는 방식
+
+Usage:
+    cd worker && python scripts/benchmark_injection.py [반복 횟수]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("DISABLE_WORKER_AUTH", "true")
+
+from docker_engine import AsyncDockerClient  # noqa: E402
+from main import create_tar_archive  # noqa: E402
+
+IMAGE = "tester-sandbox"
+SIZES = [1_000, 10_000, 100_000]
+
+
+def make_files(size: int) -> dict[str, str]:
+    """지정한 크기의 소스/테스트 파일 쌍을 생성합니다."""
+    line = "value = 'x' * 64  # padding\n"
+    source = line * max(1, size // len(line))
+    return {"solution.py": source, "test_solution.py": "def test_ok():\n    assert True\n"}
+
+
+async def inject_exec(client: AsyncDockerClient, container_id: str, files: dict[str, str]) -> None:
+    script = f"for name, content in {repr(files)}.items():\n    open(name, 'w').write(content)\n"
+    result = await client.exec_run(container_id, ["python3", "-c", script], workdir="/app")
+    assert result.exit_code == 0, result.output
+
+
+async def inject_archive(
+    client: AsyncDockerClient, container_id: str, files: dict[str, str]
+) -> None:
+    await client.put_archive(container_id, "/app", create_tar_archive(files))
+
+
+async def measure(fn, client, container_id, files, n: int) -> tuple[float, float]:
+    """n회 실행한 지연의 중앙값과 p95(ms)를 반환합니다."""
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        await fn(client, container_id, files)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+async def main(n: int) -> None:
+    client = AsyncDockerClient()
+    container_id = await client.run_container(
+        IMAGE,
+        command=["tail", "-f", "/dev/null"],
+        host_config={"NetworkMode": "none", "AutoRemove": True},
+    )
+    try:
+        print(f"--- Benchmarking code injection (x{n}) ---")
+        for size in SIZES:
+            files = make_files(size)
+            exec_p50, exec_p95 = await measure(inject_exec, client, container_id, files, n)
+            tar_p50, tar_p95 = await measure(inject_archive, client, container_id, files, n)
+            print(
+                f"{size:>7} bytes | exec p50 {exec_p50:7.2f}ms p95 {exec_p95:7.2f}ms"
+                f" | archive p50 {tar_p50:7.2f}ms p95 {tar_p95:7.2f}ms"
+                f" ({exec_p50 / tar_p50:.1f}x)"
+            )
+    finally:
+        await client.kill(container_id)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))